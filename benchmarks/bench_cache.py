@@ -6,13 +6,19 @@ Tests:
 - L2 (PostgreSQL) cache latency - target: 300-700ms
 - Concurrent request performance (1000+ requests)
 - Hit rate measurement
+- Codec encode/decode time and bytes per entry
+- Eviction policy cost and hit ratio on Zipfian traces
 """
 
 import asyncio
+import random
 import time
 
 import pytest
 
+from fiml.cache import codec as cache_codec
+from fiml.cache.codec import CacheCodec
+from fiml.cache.eviction import EvictionPolicy, EvictionTracker
 from fiml.cache.l1_cache import L1Cache
 from fiml.cache.l2_cache import L2Cache
 from fiml.cache.manager import CacheManager
@@ -347,3 +353,152 @@ class TestCacheManagerPerformance:
 
         except Exception as e:
             pytest.skip(f"Cache not available: {e}")
+
+
+def _ohlcv_payload(candles: int = 500) -> dict:
+    """Realistic OHLCV candle list as cached for /candles"""
+    return {
+        "symbol": "AAPL",
+        "timeframe": "1m",
+        "candles": [
+            {
+                "timestamp": f"2024-01-02T{9 + i // 60 % 8:02d}:{i % 60:02d}:00+00:00",
+                "open": 185.0 + i * 0.01,
+                "high": 185.5 + i * 0.01,
+                "low": 184.5 + i * 0.01,
+                "close": 185.2 + i * 0.01,
+                "volume": 100000 + i * 37,
+            }
+            for i in range(candles)
+        ],
+    }
+
+
+def _news_payload(articles: int = 20) -> dict:
+    """Realistic news payload with free text"""
+    return {
+        "symbol": "AAPL",
+        "articles": [
+            {
+                "title": f"Apple shares move after product event coverage #{i}",
+                "summary": "Analysts weighed in on guidance, services growth and margins. " * 4,
+                "url": f"https://news.example.com/apple/{i}",
+                "source": "Example Wire",
+                "published_at": "2024-01-02T14:30:00+00:00",
+                "sentiment": 0.12 * (i % 5),
+            }
+            for i in range(articles)
+        ],
+    }
+
+
+CODEC_CONFIGS = [
+    ("json", "none"),
+    ("orjson", "none"),
+    ("msgpack", "none"),
+    ("msgpack", "zstd"),
+    ("orjson", "zstd"),
+]
+
+PAYLOADS = {
+    "price": lambda: {"price": 185.23, "change": 1.2, "change_percent": 0.65, "volume": 51234567},
+    "ohlcv": _ohlcv_payload,
+    "news": _news_payload,
+}
+
+
+def _make_codec(serializer: str, compression: str) -> CacheCodec:
+    """Build a codec, skipping configurations whose libraries are not installed"""
+    available = {
+        "json": True,
+        "orjson": cache_codec.ORJSON_AVAILABLE,
+        "msgpack": cache_codec.MSGPACK_AVAILABLE,
+    }
+    if not available[serializer]:
+        pytest.skip(f"{serializer} not installed")
+    if compression == "zstd" and not cache_codec.ZSTD_AVAILABLE:
+        pytest.skip("zstandard not installed")
+    return CacheCodec(serializer=serializer, compression=compression, compress_threshold=1024)
+
+
+class TestCacheCodecPerformance:
+    """Benchmark cache payload codecs - encode/decode time and bytes per entry"""
+
+    @pytest.mark.parametrize("payload_name", list(PAYLOADS))
+    @pytest.mark.parametrize("serializer,compression", CODEC_CONFIGS)
+    def test_codec_encode(self, benchmark, serializer, compression, payload_name):
+        """Measure encode time per entry"""
+        codec = _make_codec(serializer, compression)
+        value = PAYLOADS[payload_name]()
+
+        encoded = benchmark(codec.encode, value)
+
+        print(
+            f"\n{serializer}+{compression} {payload_name}: {len(encoded)} bytes/entry "
+            f"(json baseline: {len(CacheCodec().encode(value))} bytes)"
+        )
+
+    @pytest.mark.parametrize("payload_name", list(PAYLOADS))
+    @pytest.mark.parametrize("serializer,compression", CODEC_CONFIGS)
+    def test_codec_decode(self, benchmark, serializer, compression, payload_name):
+        """Measure decode time per entry"""
+        codec = _make_codec(serializer, compression)
+        value = PAYLOADS[payload_name]()
+        encoded = codec.encode(value)
+
+        decoded = benchmark(codec.decode, encoded)
+
+        assert decoded == value
+
+
+def _zipf_trace(keys: int = 5000, length: int = 50000, skew: float = 1.0) -> list:
+    """Key access trace where key rank r is accessed with weight 1 / r^skew"""
+    rng = random.Random(42)
+    weights = [1 / (rank + 1) ** skew for rank in range(keys)]
+    return [f"price:SYM{i}:any" for i in rng.choices(range(keys), weights=weights, k=length)]
+
+
+class _ScanLFUTracker(EvictionTracker):
+    """Previous LFU implementation (min() over all keys per eviction), for comparison"""
+
+    def track_access(self, key: str) -> None:
+        self._total_accesses += 1
+        self._lfu_tracker[key] = self._lfu_tracker.get(key, 0) + 1
+        if len(self._lfu_tracker) > self.max_entries:
+            min_key = min(self._lfu_tracker, key=lambda k: self._lfu_tracker.get(k, 0))
+            del self._lfu_tracker[min_key]
+            self._evictions += 1
+
+    def get_access_info(self, key: str):
+        return {"access_count": self._lfu_tracker[key]} if key in self._lfu_tracker else None
+
+
+EVICTION_TRACKERS = {
+    "lru": lambda n: EvictionTracker(policy=EvictionPolicy.LRU, max_entries=n),
+    "lfu_scan": lambda n: _ScanLFUTracker(policy=EvictionPolicy.LFU, max_entries=n),
+    "lfu": lambda n: EvictionTracker(policy=EvictionPolicy.LFU, max_entries=n),
+    "w_tinylfu": lambda n: EvictionTracker(policy=EvictionPolicy.W_TINYLFU, max_entries=n),
+}
+
+
+class TestEvictionPolicyPerformance:
+    """Benchmark eviction trackers on Zipfian traces - time per access and hit ratio"""
+
+    @pytest.mark.parametrize("skew", [0.8, 1.0, 1.2])
+    @pytest.mark.parametrize("tracker_name", list(EVICTION_TRACKERS))
+    def test_eviction_policy_zipf(self, benchmark, tracker_name, skew):
+        """Replay a Zipfian trace through a tracker sized at 10% of the key space"""
+        trace = _zipf_trace(skew=skew)
+
+        def replay() -> float:
+            tracker = EVICTION_TRACKERS[tracker_name](500)
+            hits = 0
+            for key in trace:
+                if tracker.get_access_info(key) is not None:
+                    hits += 1
+                tracker.track_access(key)
+            return hits / len(trace)
+
+        hit_ratio = benchmark.pedantic(replay, rounds=3, iterations=1)
+
+        print(f"\n{tracker_name} zipf(s={skew}): hit ratio {hit_ratio:.3f}")
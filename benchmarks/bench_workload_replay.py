@@ -0,0 +1,87 @@
+"""
+Workload replay harness checks
+
+Runs a small Zipf trace through the cache stack on fakeredis. The full
+comparison is run from the command line: python -m benchmarks.workload_replay
+"""
+
+from collections import Counter
+
+import pytest
+
+from benchmarks.workload_replay import (
+    SCENARIOS,
+    LatencyInjectingProvider,
+    generate_trace,
+    load_trace,
+    run_scenario,
+    save_trace,
+)
+
+
+class TestTraceGeneration:
+    """Test the synthetic workload"""
+
+    def test_reproducible(self):
+        assert generate_trace(duration_seconds=20, seed=1) == generate_trace(
+            duration_seconds=20, seed=1
+        )
+        assert generate_trace(duration_seconds=20, seed=1) != generate_trace(
+            duration_seconds=20, seed=2
+        )
+
+    def test_zipf_skew(self):
+        trace = generate_trace(num_symbols=500, duration_seconds=300, unknown_fraction=0)
+        counts = Counter(event.symbol for event in trace)
+
+        # The top 10% of symbols take most of the traffic
+        top = sum(count for _, count in counts.most_common(50))
+        assert top / len(trace) > 0.5
+        assert counts["S0001"] > counts["S0010"] > counts["S0100"]
+
+    def test_diurnal_rate(self):
+        trace = generate_trace(duration_seconds=300, day_seconds=300, diurnal_amplitude=0.8)
+        night = sum(1 for event in trace if event.t < 30 or event.t >= 270)
+        midday = sum(1 for event in trace if 120 <= event.t < 180)
+
+        assert midday > 3 * night
+
+    def test_round_trip(self, tmp_path):
+        trace = generate_trace(duration_seconds=10)
+        path = str(tmp_path / "trace.jsonl")
+        save_trace(trace, path)
+
+        assert load_trace(path) == trace
+
+
+class TestReplay:
+    """Test replaying a trace against CacheManager"""
+
+    @pytest.mark.asyncio
+    async def test_reports_cache_effect(self):
+        pytest.importorskip("fakeredis")
+        trace = generate_trace(num_symbols=100, duration_seconds=20, mean_rps=50, num_unknown=5)
+
+        baseline = await run_scenario(
+            trace,
+            SCENARIOS["baseline"],
+            speedup=20,
+            provider=LatencyInjectingProvider(p50_ms=1.0),
+        )
+        no_negative = await run_scenario(
+            trace,
+            SCENARIOS["no_negative"],
+            speedup=20,
+            provider=LatencyInjectingProvider(p50_ms=1.0),
+        )
+
+        # Each key is fetched at most once; every other lookup is a hit
+        keys = {(event.symbol, event.data_type) for event in trace}
+        assert baseline["requests"] == len(trace)
+        assert baseline["hits"] + baseline["misses"] == len(trace)
+        assert 0 < baseline["misses"] <= len(keys)
+        assert baseline["hits"] > baseline["misses"]
+        assert baseline["negative_hits"] > 0
+        assert baseline["l1_keys"] > 0
+        assert no_negative["negative_hits"] == 0
+        assert no_negative["misses"] > baseline["misses"]
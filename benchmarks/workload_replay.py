@@ -0,0 +1,531 @@
+"""
+Workload Replay - Reproducible cache benchmarks on realistic symbol traffic
+
+Generates (or loads) a trace of symbol lookups whose popularity follows a Zipf
+distribution and whose arrival rate follows a diurnal curve, then replays it
+through CacheManager.get_with_read_through - the path MCP tools use - against
+fakeredis or a scratch Redis, with a mock provider that injects latency.
+Each scenario (eviction, TTL and warming settings) runs on an empty cache with
+the same trace, so the reports can be compared directly:
+
+    python -m benchmarks.workload_replay
+    python -m benchmarks.workload_replay --scenarios baseline l0_near_cache --speedup 20
+    python -m benchmarks.workload_replay --save-trace trace.jsonl
+    python -m benchmarks.workload_replay --trace trace.jsonl --redis-url redis://localhost:6379/15
+
+Trace timestamps are in trace seconds; replay divides them by --speedup, while
+cache TTLs stay in wall-clock seconds. Compare runs at the same speedup.
+With --redis-url the database is flushed before every scenario, so point it at
+a scratch database. Redis maxmemory eviction only happens on a real Redis;
+fakeredis never evicts.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import math
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import redis.asyncio as redis
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.eviction import EvictionPolicy
+from fiml.cache.histogram import LatencyHistogram
+from fiml.cache.l1_cache import L1Cache
+from fiml.cache.manager import CacheManager
+from fiml.core import config
+from fiml.core.exceptions import SymbolNotFoundError
+from fiml.core.models import Asset, AssetType, DataType, Market
+
+# Applied under every scenario so results don't depend on the wall clock or on
+# PostgreSQL (the market calendar would change price TTLs with time of day)
+BASE_SETTINGS: Dict[str, Any] = {
+    "cache_market_calendar_enabled": False,
+    "cache_l2_tier_enabled": False,
+    "cache_snapshot_enabled": False,
+}
+
+
+@dataclass(frozen=True)
+class TraceEvent:
+    """One lookup in a workload trace"""
+
+    t: float  # Seconds since the start of the trace
+    symbol: str
+    data_type: str
+
+
+@dataclass
+class Scenario:
+    """Cache configuration to replay a trace against"""
+
+    name: str
+    settings: Dict[str, Any] = field(default_factory=dict)  # config.settings overrides
+    eviction_policy: EvictionPolicy = EvictionPolicy.LRU
+    maxmemory: Optional[str] = None  # e.g. "32mb"; real Redis only
+    warm_top_n: int = 0  # Prefetch the N most popular prices before replay
+    warm_interval_seconds: float = 0.0  # Re-warm every N trace seconds (0: once)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("baseline"),
+        Scenario(
+            "no_swr",
+            settings={"cache_stale_while_revalidate": False, "cache_xfetch_enabled": False},
+        ),
+        Scenario("no_negative", settings={"cache_negative_enabled": False}),
+        Scenario("short_price_ttl", settings={"cache_ttl_price": 5}),
+        Scenario("long_price_ttl", settings={"cache_ttl_price": 30}),
+        Scenario("l0_near_cache", settings={"cache_l0_enabled": True}),
+        Scenario(
+            "l0_small",
+            settings={"cache_l0_enabled": True, "cache_l0_max_entries": 50},
+        ),
+        Scenario("lfu_32mb", eviction_policy=EvictionPolicy.LFU, maxmemory="32mb"),
+        Scenario("warm_top_50", warm_top_n=50, warm_interval_seconds=60.0),
+    ]
+}
+
+DEFAULT_SCENARIOS = ["baseline", "no_swr", "no_negative", "l0_near_cache", "warm_top_50"]
+
+
+def generate_trace(
+    num_symbols: int = 500,
+    duration_seconds: float = 300.0,
+    mean_rps: float = 40.0,
+    zipf_s: float = 1.1,
+    day_seconds: float = 300.0,
+    diurnal_amplitude: float = 0.7,
+    unknown_fraction: float = 0.02,
+    num_unknown: int = 50,
+    data_type_mix: Optional[Dict[str, float]] = None,
+    seed: int = 42,
+) -> List[TraceEvent]:
+    """
+    Generate a Zipf-popularity, diurnal-rate lookup trace
+
+    Arrivals are a Poisson process whose rate follows
+    mean_rps * (1 - diurnal_amplitude * cos(2 * pi * t / day_seconds)), so the
+    trace starts at the overnight trough and peaks mid-"day". Symbol S0001 is
+    the most popular; unknown symbols (X0001...) model typos and are picked
+    uniformly.
+
+    Args:
+        num_symbols: Number of real symbols
+        duration_seconds: Trace length in trace seconds
+        mean_rps: Average lookups per trace second
+        zipf_s: Zipf exponent (higher is more skewed)
+        day_seconds: Length of one diurnal cycle in trace seconds
+        diurnal_amplitude: 0 for a flat rate, up to 1
+        unknown_fraction: Share of lookups for symbols no provider knows
+        num_unknown: Number of distinct unknown symbols
+        data_type_mix: Weight per DataType value (default 80% price, 20% fundamentals)
+        seed: Random seed (same arguments and seed give the same trace)
+
+    Returns:
+        Events ordered by time
+    """
+    rng = random.Random(seed)
+    mix = data_type_mix or {DataType.PRICE.value: 0.8, DataType.FUNDAMENTALS.value: 0.2}
+    data_types = list(mix)
+    data_type_weights = [mix[data_type] for data_type in data_types]
+
+    symbols = [f"S{rank:04d}" for rank in range(1, num_symbols + 1)]
+    cum_weights = list(
+        itertools.accumulate(1.0 / math.pow(rank, zipf_s) for rank in range(1, num_symbols + 1))
+    )
+    unknown = [f"X{i:04d}" for i in range(1, num_unknown + 1)]
+
+    amplitude = min(max(diurnal_amplitude, 0.0), 1.0)
+    peak_rate = mean_rps * (1 + amplitude)
+    events: List[TraceEvent] = []
+    t = 0.0
+    while True:
+        # Thinning: draw at the peak rate, keep in proportion to the current rate
+        t += rng.expovariate(peak_rate)
+        if t >= duration_seconds:
+            break
+        rate = mean_rps * (1 - amplitude * math.cos(2 * math.pi * t / day_seconds))
+        if rng.random() * peak_rate > rate:
+            continue
+
+        if unknown and rng.random() < unknown_fraction:
+            symbol = rng.choice(unknown)
+        else:
+            symbol = rng.choices(symbols, cum_weights=cum_weights)[0]
+        data_type = rng.choices(data_types, weights=data_type_weights)[0]
+        events.append(TraceEvent(round(t, 6), symbol, data_type))
+
+    return events
+
+
+def save_trace(trace: Sequence[TraceEvent], path: str) -> None:
+    """Write a trace as JSON lines ({"t", "symbol", "data_type"})"""
+    with open(path, "w") as f:
+        for event in trace:
+            f.write(json.dumps(asdict(event)) + "\n")
+
+
+def load_trace(path: str) -> List[TraceEvent]:
+    """
+    Read a JSON lines trace
+
+    Access logs converted to the same format can be replayed as-is.
+    """
+    events = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                raw = json.loads(line)
+                events.append(
+                    TraceEvent(float(raw["t"]), str(raw["symbol"]), str(raw["data_type"]))
+                )
+    return sorted(events, key=lambda event: event.t)
+
+
+class LatencyInjectingProvider:
+    """
+    Mock provider with log-normal latency
+
+    Symbols starting with "X" raise SymbolNotFoundError after the full
+    latency, like a real fallback chain where every provider lacks the symbol.
+    """
+
+    def __init__(self, p50_ms: float = 80.0, sigma: float = 0.5, seed: int = 7) -> None:
+        """
+        Initialize mock provider
+
+        Args:
+            p50_ms: Median fetch latency
+            sigma: Log-normal shape (0.5 gives p99 around 3.2x the median)
+            seed: Random seed for latencies
+        """
+        self.p50_ms = p50_ms
+        self.sigma = sigma
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.failures = 0
+
+    async def fetch(self, symbol: str, data_type: str) -> Dict[str, Any]:
+        """Fetch mock data for a symbol"""
+        self.calls += 1
+        await asyncio.sleep(self.p50_ms * self._rng.lognormvariate(0.0, self.sigma) / 1000)
+
+        if symbol.startswith("X"):
+            self.failures += 1
+            raise SymbolNotFoundError(f"No provider has data for {symbol}")
+
+        if data_type == DataType.FUNDAMENTALS.value:
+            return {"symbol": symbol, "pe_ratio": round(self._rng.uniform(5, 40), 2)}
+        return {"symbol": symbol, "price": round(self._rng.uniform(10, 500), 2)}
+
+
+@contextlib.contextmanager
+def settings_overrides(overrides: Dict[str, Any]) -> Iterator[None]:
+    """Temporarily set config.settings fields"""
+    unknown = [name for name in overrides if not hasattr(config.settings, name)]
+    if unknown:
+        raise ValueError(f"Unknown settings: {', '.join(unknown)}")
+
+    saved = {name: getattr(config.settings, name) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(config.settings, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config.settings, name, value)
+
+
+async def connect(redis_url: Optional[str] = None) -> redis.Redis:
+    """Client for a scratch Redis, or an in-process fakeredis"""
+    if redis_url:
+        return redis.from_url(redis_url, decode_responses=False)
+
+    try:
+        import fakeredis
+    except ImportError as e:
+        raise RuntimeError(
+            "fakeredis is not installed: pip install 'fiml[performance]' or pass --redis-url"
+        ) from e
+    return fakeredis.FakeAsyncRedis()
+
+
+async def memory_usage(client: redis.Redis, chunk_size: int = 500) -> Dict[str, Any]:
+    """Key count, cached payload bytes and (if reported) Redis used_memory"""
+    keys = [key async for key in client.scan_iter(count=chunk_size)]
+    payload_bytes = 0
+    for start in range(0, len(keys), chunk_size):
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys[start : start + chunk_size]:
+                pipe.strlen(key)
+            # Non-string keys (hot key sets, tag sets) answer WRONGTYPE
+            lengths = await pipe.execute(raise_on_error=False)
+        payload_bytes += sum(length for length in lengths if isinstance(length, int))
+
+    used_memory = None
+    with contextlib.suppress(Exception):
+        used_memory = (await client.info("memory")).get("used_memory")
+
+    return {"l1_keys": len(keys), "l1_payload_bytes": payload_bytes, "used_memory": used_memory}
+
+
+def _asset(symbol: str) -> Asset:
+    return Asset(symbol=symbol, asset_type=AssetType.EQUITY, market=Market.US)
+
+
+async def run_scenario(
+    trace: Sequence[TraceEvent],
+    scenario: Scenario,
+    redis_url: Optional[str] = None,
+    speedup: float = 10.0,
+    provider: Optional[LatencyInjectingProvider] = None,
+    max_concurrency: int = 512,
+) -> Dict[str, Any]:
+    """
+    Replay a trace through a fresh CacheManager
+
+    Args:
+        trace: Events to replay
+        scenario: Cache configuration
+        redis_url: Scratch Redis to use instead of fakeredis (flushed first)
+        speedup: Trace seconds per wall second (0 or less replays back to back)
+        provider: Mock provider (a default one is created per scenario)
+        max_concurrency: Cap on lookups in flight
+
+    Returns:
+        Report with hit rate, provider calls, latency percentiles and memory
+    """
+    provider = provider or LatencyInjectingProvider()
+
+    with settings_overrides({**BASE_SETTINGS, **scenario.settings}):
+        client = await connect(redis_url)
+        await client.flushdb()
+        if scenario.maxmemory:
+            with contextlib.suppress(Exception):
+                await client.config_set("maxmemory", scenario.maxmemory)
+
+        manager = CacheManager()
+        manager.analytics = CacheAnalytics(enable_prometheus=False)
+        manager.l1 = L1Cache(eviction_policy=scenario.eviction_policy)
+        await manager.l1.initialize(client)
+        if manager.l0 is not None:
+            await manager.l0.start_invalidation_listener(client)
+        manager._initialized = True
+
+        latency = LatencyHistogram()
+        counts = {"requests": 0, "fetched": 0, "empty": 0, "warming_calls": 0}
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        popular = _most_popular(trace, scenario.warm_top_n)
+
+        async def lookup(event: TraceEvent) -> None:
+            data_type = DataType(event.data_type)
+            fetched = False
+
+            async def fetch_fn() -> Dict[str, Any]:
+                nonlocal fetched
+                fetched = True
+                return await provider.fetch(event.symbol, event.data_type)
+
+            async with semaphore:
+                start = time.perf_counter()
+                result = await manager.get_with_read_through(
+                    key=manager.l1.build_key(data_type.value, event.symbol, "any"),
+                    data_type=data_type,
+                    fetch_fn=fetch_fn,
+                    asset=_asset(event.symbol),
+                )
+                latency.record((time.perf_counter() - start) * 1000)
+
+            counts["requests"] += 1
+            counts["fetched"] += fetched
+            counts["empty"] += result is None
+
+        async def warm() -> None:
+            if not popular:
+                return
+            calls_before = provider.calls
+            start = time.perf_counter()
+            prices = await asyncio.gather(
+                *(provider.fetch(symbol, DataType.PRICE.value) for symbol in popular)
+            )
+            fetch_ms = (time.perf_counter() - start) * 1000
+            await manager.set_prices_batch(
+                [
+                    (_asset(symbol), "any", price)
+                    for symbol, price in zip(popular, prices, strict=False)
+                ],
+                fetch_ms=fetch_ms,
+            )
+            counts["warming_calls"] += provider.calls - calls_before
+
+        async def warm_loop() -> None:
+            while True:
+                await asyncio.sleep(scenario.warm_interval_seconds / speedup)
+                await warm()
+
+        await warm()
+        warmer = None
+        if popular and scenario.warm_interval_seconds > 0 and speedup > 0:
+            warmer = asyncio.create_task(warm_loop())
+
+        loop = asyncio.get_running_loop()
+        tasks = set()
+        replay_start = loop.time()
+        calls_before = provider.calls
+        for event in trace:
+            if speedup > 0:
+                delay = replay_start + event.t / speedup - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            task = asyncio.create_task(lookup(event))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+        wall_seconds = loop.time() - replay_start
+
+        if warmer is not None:
+            warmer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await warmer
+
+        memory = await memory_usage(client)
+        l0_stats = manager.l0.get_stats() if manager.l0 is not None else None
+        analytics = manager.analytics.get_overall_stats()
+        await manager.shutdown()
+
+    requests = counts["requests"]
+    provider_calls = provider.calls - calls_before - counts["warming_calls"]
+    stats = latency.get_stats()
+    return {
+        "scenario": scenario.name,
+        "requests": requests,
+        "hits": requests - counts["fetched"],
+        "misses": counts["fetched"],
+        "hit_rate_percent": round((1 - counts["fetched"] / requests) * 100, 2) if requests else 0,
+        "provider_calls": provider_calls,
+        "warming_calls": counts["warming_calls"],
+        "calls_per_request": round(provider_calls / requests, 4) if requests else 0,
+        "empty_results": counts["empty"],
+        "coalesced": analytics["coalesced_requests"],
+        "background_refreshes": analytics["background_refreshes"],
+        "negative_hits": analytics["negative_hits"],
+        "p50_ms": round(stats["p50"], 2),
+        "p95_ms": round(stats["p95"], 2),
+        "p99_ms": round(stats["p99"], 2),
+        "max_ms": round(stats["max"], 2),
+        "wall_seconds": round(wall_seconds, 2),
+        **memory,
+        "l0_entries": l0_stats["entries"] if l0_stats else None,
+        "l0_evictions": l0_stats["evictions"] if l0_stats else None,
+    }
+
+
+def _most_popular(trace: Sequence[TraceEvent], n: int) -> List[str]:
+    """The n most requested price symbols in a trace"""
+    if n <= 0:
+        return []
+    counts: Dict[str, int] = {}
+    for event in trace:
+        if event.data_type == DataType.PRICE.value:
+            counts[event.symbol] = counts.get(event.symbol, 0) + 1
+    return sorted(counts, key=lambda symbol: (-counts[symbol], symbol))[:n]
+
+
+def format_reports(reports: Sequence[Dict[str, Any]]) -> str:
+    """Render reports as a fixed-width table"""
+    columns = [
+        ("scenario", "scenario", 16),
+        ("hit_rate_percent", "hit %", 7),
+        ("provider_calls", "calls", 7),
+        ("warming_calls", "warm", 6),
+        ("coalesced", "joined", 7),
+        ("negative_hits", "neg", 6),
+        ("p50_ms", "p50 ms", 8),
+        ("p99_ms", "p99 ms", 8),
+        ("l1_keys", "keys", 7),
+        ("l1_payload_bytes", "bytes", 10),
+        ("l0_entries", "l0", 6),
+    ]
+    lines = ["  ".join(f"{title:>{width}}" for _, title, width in columns)]
+    for report in reports:
+        lines.append(
+            "  ".join(
+                f"{'-' if report.get(name) is None else report[name]!s:>{width}}"
+                for name, _, width in columns
+            )
+        )
+    return "\n".join(lines)
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--trace", help="Replay a JSON lines trace instead of generating one")
+    parser.add_argument("--save-trace", help="Write the generated trace to this path")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=300.0, help="Trace seconds")
+    parser.add_argument("--rps", type=float, default=40.0, help="Mean lookups per trace second")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--day", type=float, default=300.0, help="Diurnal cycle, trace seconds")
+    parser.add_argument("--unknown-fraction", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--speedup", type=float, default=10.0)
+    parser.add_argument("--provider-p50-ms", type=float, default=80.0)
+    parser.add_argument("--redis-url", help="Scratch Redis (FLUSHED per scenario)")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        default=DEFAULT_SCENARIOS,
+        choices=sorted(SCENARIOS),
+        metavar="NAME",
+        help=f"Any of: {', '.join(sorted(SCENARIOS))}",
+    )
+    parser.add_argument("--json", help="Write the reports to this path")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        trace = load_trace(args.trace)
+    else:
+        trace = generate_trace(
+            num_symbols=args.symbols,
+            duration_seconds=args.duration,
+            mean_rps=args.rps,
+            zipf_s=args.zipf,
+            day_seconds=args.day,
+            unknown_fraction=args.unknown_fraction,
+            seed=args.seed,
+        )
+        if args.save_trace:
+            save_trace(trace, args.save_trace)
+    print(f"Replaying {len(trace)} lookups at {args.speedup}x")
+
+    reports = []
+    for name in args.scenarios:
+        report = await run_scenario(
+            trace,
+            SCENARIOS[name],
+            redis_url=args.redis_url,
+            speedup=args.speedup,
+            provider=LatencyInjectingProvider(p50_ms=args.provider_p50_ms, seed=args.seed),
+        )
+        reports.append(report)
+        print(f"  {name}: {report['hit_rate_percent']}% hits, {report['provider_calls']} calls")
+
+    print()
+    print(format_reports(reports))
+    if args.json:
+        Path(args.json).write_text(json.dumps(reports, indent=2))
+    return reports
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
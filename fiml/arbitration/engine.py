@@ -6,16 +6,33 @@ Intelligently routes data requests to optimal providers with:
 - Auto-fallback strategies
 - Conflict resolution
 - Weighted data merging
+- Plan caching per asset class, invalidated when provider state changes
+- Hedged requests when the primary provider is slower than its p95
+- Quorum pricing with outlier rejection for high-value symbols
 """
 
+import asyncio
+import re
+import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import numpy as np
 
-from fiml.core.exceptions import NoProviderAvailableError
+from fiml.arbitration.hedging import HedgeBudget
+from fiml.arbitration.ohlcv_merge import merge_candles
+from fiml.arbitration.quorum import largest_agreeing, mad_inliers
+from fiml.cache.coalescing import RequestCoalescer
+from fiml.cache.resample import session_for
+from fiml.core import config
+from fiml.core.exceptions import (
+    NoProviderAvailableError,
+    ProviderSymbolNotFoundError,
+    RateLimitError,
+    SymbolNotFoundError,
+)
 from fiml.core.logging import get_logger
-from fiml.core.models import ArbitrationPlan, Asset, DataType, ProviderScore
+from fiml.core.models import ArbitrationPlan, Asset, DataLineage, DataType, ProviderScore
 from fiml.providers.base import BaseProvider, ProviderResponse
 from fiml.providers.registry import provider_registry
 
@@ -32,12 +49,33 @@ class DataArbitrationEngine:
     3. Execute with automatic fallback
     4. Merge data from multiple sources
     5. Resolve conflicts when providers disagree
+
+    Plans are cached per (asset type, market, data type, region) for
+    arbitration_plan_cache_ttl_seconds. A cached plan is dropped as soon as
+    a provider is registered or removed, or one of its candidates (the
+    providers it scored, plus those disabled when it was built) is
+    enabled/disabled, enters or leaves cooldown, or changes state_version.
+    An expired plan is served while it is rebuilt in the background.
     """
 
     def __init__(self, providers: Optional[List[BaseProvider]] = None) -> None:
         self.provider_registry = provider_registry
         self.custom_providers = providers
 
+        # key -> (candidate providers, their fingerprint, expires_at monotonic, plan)
+        self._plan_cache: Dict[
+            str, Tuple[Tuple[str, ...], Tuple[Any, ...], float, ArbitrationPlan]
+        ] = {}
+        self._plan_coalescer = RequestCoalescer()
+        self._plan_refresh_tasks: Dict[str, asyncio.Task] = {}
+        self.plan_cache_hits = 0
+        self.plan_cache_misses = 0
+        self.plan_cache_invalidations = 0
+
+        self._hedge_budgets: Dict[DataType, HedgeBudget] = {}
+        self.hedges_launched = 0
+        self.hedge_wins = 0
+
     async def arbitrate_request(
         self,
         asset: Asset,
@@ -48,6 +86,9 @@ class DataArbitrationEngine:
         """
         Create an execution plan for a data request
 
+        Served from the plan cache while the providers it was scored on are
+        unchanged; otherwise built by scoring every compatible provider.
+
         Args:
             asset: Asset to query
             data_type: Type of data needed
@@ -57,6 +98,47 @@ class DataArbitrationEngine:
         Returns:
             ArbitrationPlan specifying primary provider, fallbacks, and merge strategy
         """
+        ttl = config.settings.arbitration_plan_cache_ttl_seconds
+        if ttl <= 0 or not isinstance(getattr(self.provider_registry, "providers", None), dict):
+            plan, _ = await self._build_plan(asset, data_type, user_region, max_staleness_seconds)
+            return plan
+
+        key = await self._plan_key(asset, data_type, user_region, max_staleness_seconds)
+        cached = self._plan_cache.get(key)
+        if cached is not None:
+            candidates, fingerprint, expires_at, plan = cached
+            if fingerprint == self._provider_fingerprint(candidates):
+                self.plan_cache_hits += 1
+                if time.monotonic() >= expires_at:
+                    self._schedule_plan_refresh(
+                        key, asset, data_type, user_region, max_staleness_seconds
+                    )
+                return cast(ArbitrationPlan, plan.model_copy())
+            self.plan_cache_invalidations += 1
+            self._plan_cache.pop(key, None)
+
+        self.plan_cache_misses += 1
+        plan = await self._plan_coalescer.run(
+            key,
+            lambda: self._build_and_cache_plan(
+                key, asset, data_type, user_region, max_staleness_seconds
+            ),
+        )
+        return cast(ArbitrationPlan, plan.model_copy())
+
+    async def _build_plan(
+        self,
+        asset: Asset,
+        data_type: DataType,
+        user_region: str,
+        max_staleness_seconds: int,
+    ) -> Tuple[ArbitrationPlan, List[str]]:
+        """
+        Score the compatible providers and build a plan (uncached)
+
+        Returns:
+            The plan and the names of the providers it scored
+        """
         logger.info(
             "Arbitrating request",
             asset=asset.symbol,
@@ -100,7 +182,7 @@ class DataArbitrationEngine:
         merge_strategy = self._get_merge_strategy(data_type) if len(healthy_providers) > 1 else None
 
         # Estimate latency based on primary provider
-        estimated_latency_ms = int(await primary_provider.get_latency_p95(user_region))
+        estimated_latency_ms = int(await primary_provider.get_latency_p95(user_region, data_type))
 
         plan = ArbitrationPlan(
             primary_provider=primary_provider.name,
@@ -117,93 +199,465 @@ class DataArbitrationEngine:
             estimated_latency=estimated_latency_ms,
         )
 
+        return plan, [provider.name for provider in compatible_providers]
+
+    async def _build_and_cache_plan(
+        self,
+        key: str,
+        asset: Asset,
+        data_type: DataType,
+        user_region: str,
+        max_staleness_seconds: int,
+    ) -> ArbitrationPlan:
+        """Build a plan and cache it against the state of its candidate providers"""
+        providers = self.provider_registry.providers
+        snapshot = self._provider_fingerprint(providers)
+        # A disabled provider may be a candidate once it comes back
+        disabled = [name for name, provider in providers.items() if not provider.is_enabled]
+
+        plan, scored = await self._build_plan(asset, data_type, user_region, max_staleness_seconds)
+        if snapshot == self._provider_fingerprint(providers):
+            candidates = tuple(dict.fromkeys(scored + disabled))
+            ttl = config.settings.arbitration_plan_cache_ttl_seconds
+            self._plan_cache[key] = (
+                candidates,
+                self._provider_fingerprint(candidates),
+                time.monotonic() + ttl,
+                plan,
+            )
         return plan
 
+    def _schedule_plan_refresh(
+        self,
+        key: str,
+        asset: Asset,
+        data_type: DataType,
+        user_region: str,
+        max_staleness_seconds: int,
+    ) -> None:
+        """Rebuild an expired plan in the background unless already rebuilding"""
+        if key in self._plan_refresh_tasks or self._plan_coalescer.is_inflight(key):
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._plan_coalescer.run(
+                    key,
+                    lambda: self._build_and_cache_plan(
+                        key, asset, data_type, user_region, max_staleness_seconds
+                    ),
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # No usable plan any more; the next request rebuilds it inline
+                logger.warning(f"Arbitration plan refresh failed: {e}", key=key)
+                self._plan_cache.pop(key, None)
+            finally:
+                self._plan_refresh_tasks.pop(key, None)
+
+        self._plan_refresh_tasks[key] = asyncio.create_task(refresh())
+
+    def _provider_fingerprint(self, names: Iterable[str]) -> Tuple[Any, ...]:
+        """
+        Snapshot of the provider state a plan depends on
+
+        Args:
+            names: Providers whose health the plan depends on
+
+        Returns:
+            Tuple that changes whenever any provider is added or removed, or
+            one of names is enabled, disabled, put in or out of cooldown, or
+            bumps its state_version
+        """
+        providers = self.provider_registry.providers
+        members = tuple((name, id(provider)) for name, provider in providers.items())
+        states = []
+        for name in names:
+            provider = providers.get(name)
+            if provider is not None:
+                states.append((name, provider.is_enabled, provider.state_version))
+        return members, tuple(states)
+
+    async def _plan_key(
+        self,
+        asset: Asset,
+        data_type: DataType,
+        user_region: str,
+        max_staleness_seconds: int,
+    ) -> str:
+        """
+        Plan cache key for a request
+
+        Providers whose support depends on the symbol are asked directly,
+        and the ones that accept this asset become part of the key.
+        """
+        per_symbol = []
+        for provider in self.provider_registry.providers.values():
+            if provider.asset_support_by_type or not provider.is_enabled:
+                continue
+            try:
+                if await provider.supports_asset(asset):
+                    per_symbol.append(provider.name)
+            except Exception as e:
+                logger.error(f"Error checking provider {provider.name} compatibility: {e}")
+
+        return ":".join(
+            [
+                asset.asset_type.value,
+                asset.market.value,
+                data_type.value,
+                user_region,
+                str(max_staleness_seconds),
+                ",".join(per_symbol),
+            ]
+        )
+
+    def invalidate_plans(self) -> None:
+        """Drop every cached arbitration plan"""
+        self.plan_cache_invalidations += len(self._plan_cache)
+        self._plan_cache.clear()
+
+    def get_plan_cache_stats(self) -> Dict[str, Any]:
+        """Plan cache hit/miss statistics"""
+        lookups = self.plan_cache_hits + self.plan_cache_misses
+        return {
+            "size": len(self._plan_cache),
+            "hits": self.plan_cache_hits,
+            "misses": self.plan_cache_misses,
+            "invalidations": self.plan_cache_invalidations,
+            "hit_rate": self.plan_cache_hits / lookups if lookups else 0.0,
+            "coalesced_builds": self._plan_coalescer.coalesced,
+        }
+
     async def execute_with_fallback(
-        self, plan: ArbitrationPlan, asset: Asset, data_type: DataType
+        self,
+        plan: ArbitrationPlan,
+        asset: Asset,
+        data_type: DataType,
+        timeframe: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> ProviderResponse:
         """
         Execute data request with automatic fallback
 
+        Providers are tried in plan order. For data types with a hedging
+        budget, if the running provider has not answered within its observed
+        p95 (or arbitration_hedge_delay_ms), the next fallback is started in
+        parallel; the first valid, fresh response wins and the other is
+        cancelled. At most one hedge is launched per request.
+
+        Prices of symbols in arbitration_quorum_symbols go through
+        execute_quorum instead.
+
         Args:
             plan: Arbitration plan
             asset: Asset to query
             data_type: Data type to fetch
+            timeframe: Candle timeframe (OHLCV only)
+            limit: Number of candles (OHLCV only)
 
         Returns:
             ProviderResponse from successful provider
         """
+        if data_type == DataType.PRICE and self._use_quorum(plan, asset):
+            return await self.execute_quorum(plan, asset)
+
         # Build provider list: primary + fallbacks
         provider_names = [plan.primary_provider] + plan.fallback_providers
-        providers = [self.provider_registry.providers.get(name) for name in provider_names]
-        providers = [p for p in providers if p is not None]
-
-        for i, provider in enumerate(providers):
-            if provider is None:
-                continue
-
-            try:
-                logger.info(
-                    f"Attempting provider {i + 1}/{len(providers)}",
-                    provider=provider.name,
-                    asset=asset.symbol,
+        registered = [self.provider_registry.providers.get(name) for name in provider_names]
+        providers: List[BaseProvider] = [p for p in registered if p is not None]
+
+        budget = self._hedge_budget(data_type) if len(providers) > 1 else None
+        if budget is not None:
+            budget.deposit()
+
+        running: Dict[asyncio.Task, BaseProvider] = {}
+        next_index = 0
+        hedge_considered = False
+        hedge_started = False
+        # Stays True while every provider answered that it has no data for the
+        # symbol, either by raising ProviderSymbolNotFoundError or with an
+        # invalid response
+        not_found = True
+
+        def launch() -> None:
+            nonlocal next_index
+            provider = providers[next_index]
+            logger.info(
+                f"Attempting provider {next_index + 1}/{len(providers)}",
+                provider=provider.name,
+                asset=asset.symbol,
+            )
+            task = asyncio.create_task(
+                self._fetch_from_provider(
+                    provider, asset, data_type, timeframe=timeframe, limit=limit
+                )
+            )
+            running[task] = provider
+            next_index += 1
+
+        try:
+            while running or next_index < len(providers):
+                if not running:
+                    launch()
+
+                # One hedge per request: the next fallback starts if the
+                # running provider is slower than its usual p95
+                delay_ms = None
+                if budget is not None and not hedge_considered and next_index < len(providers):
+                    delay_ms = await self._hedge_delay_ms(running[next(iter(running))], data_type)
+
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=delay_ms / 1000 if delay_ms is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
 
-                # Fetch data based on type
-                response = await self._fetch_from_provider(provider, asset, data_type)
-
-                # Validate response
-                if response.is_valid and response.is_fresh:
-                    provider_name = provider.name if provider else "unknown"
-                    logger.info(
-                        "Provider succeeded",
-                        provider=provider_name,
-                        asset=asset.symbol,
-                        confidence=response.confidence,
-                    )
-                    return response
-                else:
-                    provider_name = provider.name if provider else "unknown"
+                if not done:
+                    hedge_considered = True
+                    if budget is not None and budget.try_spend():
+                        hedge_started = True
+                        self.hedges_launched += 1
+                        logger.info(
+                            "Primary provider slow, hedging",
+                            provider=running[next(iter(running))].name,
+                            delay_ms=delay_ms,
+                        )
+                        launch()
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        response = cast(ProviderResponse, task.result())
+                    except Exception as e:
+                        not_found = not_found and isinstance(e, ProviderSymbolNotFoundError)
+                        self._handle_provider_error(provider, e)
+                        logger.warning(
+                            "Provider failed, falling back",
+                            provider=provider.name,
+                            error=str(e),
+                            fallback_available=bool(running) or next_index < len(providers),
+                        )
+                        continue
+
+                    # Validate response
+                    if response.is_valid and response.is_fresh:
+                        logger.info(
+                            "Provider succeeded",
+                            provider=provider.name,
+                            asset=asset.symbol,
+                            confidence=response.confidence,
+                        )
+                        if hedge_started and provider is not providers[0]:
+                            self.hedge_wins += 1
+                        return response
+
+                    not_found = not_found and not response.is_valid
                     logger.warning(
                         "Provider returned invalid/stale data",
-                        provider=provider_name,
+                        provider=provider.name,
                         valid=response.is_valid,
                         fresh=response.is_fresh,
                     )
+        finally:
+            # Cancel the losing side of a hedge (or everything, if we were cancelled)
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
-            except Exception as e:
-                error_msg = str(e).lower()
+        # All providers failed
+        if not_found and providers:
+            raise SymbolNotFoundError(f"No provider has data for {asset.symbol} ({data_type})")
+        raise NoProviderAvailableError(f"All providers failed for {asset.symbol} ({data_type})")
 
-                # Check for rate limits
-                if "rate limit" in error_msg:
-                    # Default cooldown: 60 seconds
-                    cooldown_seconds = 60
+    async def execute_quorum(self, plan: ArbitrationPlan, asset: Asset) -> ProviderResponse:
+        """
+        Price an asset from several plan providers at once and merge the answers
 
-                    # Try to parse wait time from error message
-                    # Example: "Wait 18.5s"
-                    import re
-                    match = re.search(r"wait (\d+(\.\d+)?)s", error_msg)
-                    if match:
-                        cooldown_seconds = int(float(match.group(1))) + 1
+        The top arbitration_quorum_size providers are queried concurrently
+        under one deadline (arbitration_quorum_deadline_ms). As soon as
+        size - 1 valid prices (and at least two, if two providers are
+        available) agree within arbitration_quorum_tolerance, the rest are
+        cancelled. Whatever arrived is merged by _merge_price, which drops
+        outliers before taking the confidence-weighted average. If the quorum
+        is not reached, the answers that did arrive are used and the lineage
+        records quorum_reached=False.
 
-                    provider.set_cooldown(cooldown_seconds)
+        Args:
+            plan: Arbitration plan
+            asset: Asset to price
+
+        Returns:
+            ProviderResponse with provenance in data["lineage"]: merged, or
+            the single response if only one provider answered
+
+        Raises:
+            NoProviderAvailableError: If no provider returned a valid price
+        """
+        size = max(1, config.settings.arbitration_quorum_size)
+        providers = [
+            provider
+            for provider in (self.provider_registry.providers.get(name) for name in plan.providers)
+            if provider is not None
+        ][:size]
+        needed = max(min(2, len(providers)), len(providers) - 1)
+        tolerance = config.settings.arbitration_quorum_tolerance
+
+        running: Dict[asyncio.Task, BaseProvider] = {
+            asyncio.create_task(
+                self._fetch_from_provider(provider, asset, DataType.PRICE)
+            ): provider
+            for provider in providers
+        }
+        responses: List[ProviderResponse] = []
+        deadline = time.monotonic() + config.settings.arbitration_quorum_deadline_ms / 1000
+
+        try:
+            while running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     logger.warning(
-                        "Provider rate limited, setting cooldown",
-                        provider=provider.name,
-                        cooldown_seconds=cooldown_seconds
+                        "Quorum deadline reached",
+                        asset=asset.symbol,
+                        responses=len(responses),
+                        pending=[p.name for p in running.values()],
                     )
+                    break
 
-                provider_name = provider.name if provider else "unknown"
-                logger.warning(
-                    "Provider failed, falling back",
-                    provider=provider_name,
-                    error=str(e),
-                    fallback_available=i < len(providers) - 1,
+                done, _ = await asyncio.wait(
+                    running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
                 )
-                continue
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        response = cast(ProviderResponse, task.result())
+                    except Exception as e:
+                        self._handle_provider_error(provider, e)
+                        logger.warning(
+                            "Quorum provider failed", provider=provider.name, error=str(e)
+                        )
+                        continue
+                    if response.is_valid and response.is_fresh and response.data.get("price"):
+                        responses.append(response)
+
+                if len(responses) >= needed and self._agreeing(responses, tolerance) >= needed:
+                    break
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
-        # All providers failed
-        raise NoProviderAvailableError(f"All providers failed for {asset.symbol} ({data_type})")
+        if not responses:
+            raise NoProviderAvailableError(f"No provider priced {asset.symbol} for the quorum")
+
+        quorum_reached = self._agreeing(responses, tolerance) >= needed
+        if not quorum_reached:
+            logger.warning(
+                "Quorum not reached, using the prices that arrived",
+                asset=asset.symbol,
+                needed=needed,
+                responses=len(responses),
+            )
+        if len(responses) == 1:
+            response = responses[0]
+            lineage = DataLineage(
+                providers=[response.provider],
+                arbitration_score=round(response.confidence * 100, 2),
+                source_count=1,
+                quorum_reached=quorum_reached,
+            )
+            return response.model_copy(
+                update={
+                    "data": {**response.data, "lineage": lineage.model_dump(mode="json")},
+                    "metadata": {**response.metadata, "lineage": lineage.model_dump()},
+                }
+            )
+        return await self._merge_price(responses, quorum_reached=quorum_reached)
+
+    @staticmethod
+    def _agreeing(responses: List[ProviderResponse], tolerance: float) -> int:
+        """Size of the largest group of response prices within tolerance"""
+        prices = np.asarray([r.data["price"] for r in responses], dtype=float)
+        return largest_agreeing(prices, tolerance)
+
+    def _use_quorum(self, plan: ArbitrationPlan, asset: Asset) -> bool:
+        """Whether a price request should go through execute_quorum"""
+        symbols = config.settings.arbitration_quorum_symbols
+        return (
+            bool(symbols)
+            and config.settings.arbitration_quorum_size > 1
+            and len(plan.providers) > 1
+            and asset.symbol.upper() in {symbol.upper() for symbol in symbols}
+        )
+
+    def _handle_provider_error(self, provider: BaseProvider, error: Exception) -> None:
+        """Put a rate-limited provider in cooldown"""
+        error_msg = str(error).lower()
+
+        # Check for rate limits
+        if isinstance(error, RateLimitError) or "rate limit" in error_msg:
+            # Default cooldown: 60 seconds
+            cooldown_seconds = 60
+
+            # Prefer the limiter's time until the next token, else parse the
+            # wait time from the error message. Example: "Wait 18.5s"
+            match = re.search(r"wait (\d+(\.\d+)?)s", error_msg)
+            if isinstance(error, RateLimitError):
+                cooldown_seconds = error.retry_after
+            elif match:
+                cooldown_seconds = int(float(match.group(1))) + 1
+
+            provider.set_cooldown(cooldown_seconds)
+            logger.warning(
+                "Provider rate limited, setting cooldown",
+                provider=provider.name,
+                cooldown_seconds=cooldown_seconds
+            )
+
+    def _hedge_budget(self, data_type: DataType) -> Optional[HedgeBudget]:
+        """Hedging budget for a data type, or None if it must not hedge"""
+        if not config.settings.arbitration_hedge_enabled:
+            return None
+        ratio = config.settings.arbitration_hedge_budgets.get(data_type.value, 0.0)
+        if ratio <= 0:
+            return None
+
+        budget = self._hedge_budgets.get(data_type)
+        if budget is None or budget.ratio != ratio:
+            budget = self._hedge_budgets[data_type] = HedgeBudget(ratio)
+        return budget
+
+    async def _hedge_delay_ms(self, provider: BaseProvider, data_type: DataType) -> Optional[float]:
+        """
+        How long to wait on provider before launching a hedge
+
+        None (no hedge) while the provider has fewer than
+        arbitration_hedge_min_samples latency samples for the data type:
+        the neutral p95 assumed for untried providers would hedge most
+        cold-start requests.
+        """
+        if config.settings.arbitration_hedge_delay_ms > 0:
+            return float(config.settings.arbitration_hedge_delay_ms)
+        samples = provider.telemetry.latency_histogram(data_type).count
+        if samples < config.settings.arbitration_hedge_min_samples:
+            return None
+        p95 = await provider.get_latency_p95(data_type=data_type)
+        return max(float(config.settings.arbitration_hedge_min_delay_ms), p95)
+
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """Hedged request statistics"""
+        return {
+            "launched": self.hedges_launched,
+            "wins": self.hedge_wins,
+            "budgets": {
+                data_type.value: budget.get_stats()
+                for data_type, budget in self._hedge_budgets.items()
+            },
+        }
 
     async def merge_multi_provider(
         self, responses: List[ProviderResponse], data_type: DataType
@@ -250,10 +704,10 @@ class DataArbitrationEngine:
 
         Scoring factors:
         - Freshness (30%): How recent is the data
-        - Latency (25%): Response time
+        - Latency (25%): Rolling p95 response time for this data type
         - Uptime (20%): Availability over last 24h
         - Completeness (15%): Data field coverage
-        - Reliability (10%): Success rate over last N requests
+        - Reliability (10%): Rolling success rate for this data type
 
         Special rules:
         - NewsAPI gets bonus score for NEWS and SENTIMENT data types
@@ -275,7 +729,7 @@ class DataArbitrationEngine:
         freshness_score = max(0, 100 * (1 - age_seconds / max_staleness_seconds))
 
         # Latency score
-        latency_p95 = await provider.get_latency_p95(region)
+        latency_p95 = await provider.get_latency_p95(region, data_type)
         max_acceptable_latency = 5000  # 5 seconds
         latency_score = max(0, 100 * (1 - latency_p95 / max_acceptable_latency))
 
@@ -286,7 +740,7 @@ class DataArbitrationEngine:
         completeness_score = await provider.get_completeness(data_type) * 100
 
         # Reliability score
-        reliability_score = await provider.get_success_rate() * 100
+        reliability_score = await provider.get_success_rate(data_type) * 100
 
         # Weighted total
         total_score = (
@@ -316,13 +770,20 @@ class DataArbitrationEngine:
         )
 
     async def _fetch_from_provider(
-        self, provider: BaseProvider, asset: Asset, data_type: DataType
+        self,
+        provider: BaseProvider,
+        asset: Asset,
+        data_type: DataType,
+        timeframe: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> ProviderResponse:
         """Fetch data from specific provider based on data type"""
         if data_type == DataType.PRICE:
             return await provider.fetch_price(asset)
         elif data_type == DataType.OHLCV:
-            return await provider.fetch_ohlcv(asset)
+            return await provider.fetch_ohlcv(
+                asset, timeframe=timeframe or "1d", limit=limit or 100
+            )
         elif data_type == DataType.FUNDAMENTALS:
             return await provider.fetch_fundamentals(asset)
         elif data_type == DataType.NEWS:
@@ -343,28 +804,68 @@ class DataArbitrationEngine:
         }
         return strategy_map.get(data_type, "take_most_recent")
 
-    async def _merge_price(self, responses: List[ProviderResponse]) -> ProviderResponse:
+    async def _merge_price(
+        self, responses: List[ProviderResponse], quorum_reached: Optional[bool] = None
+    ) -> ProviderResponse:
         """
         Merge price data using weighted average
 
-        Weights are based on provider confidence scores
+        Prices that are outliers by median absolute deviation are dropped
+        first; weights are based on provider confidence scores. quorum_reached
+        is recorded in the lineage when the prices come from execute_quorum.
         """
-        prices = [r.data.get("price", 0.0) for r in responses]
-        weights = [r.confidence for r in responses]
+        prices = np.array([r.data.get("price", 0.0) for r in responses], dtype=float)
+        weights = np.array([r.confidence for r in responses], dtype=float)
+
+        usable = np.isfinite(prices) & (prices > 0)
+        if not usable.any():
+            usable[:] = True
+        inliers = usable.copy()
+        inliers[usable] = mad_inliers(
+            prices[usable], tolerance=config.settings.arbitration_quorum_tolerance
+        )
+
+        kept = prices[inliers]
+        kept_weights = weights[inliers] if weights[inliers].sum() > 0 else None
+        sources = [r.provider for r, keep in zip(responses, inliers, strict=False) if keep]
+        rejected = [r.provider for r, keep in zip(responses, inliers, strict=False) if not keep]
 
         # Calculate weighted average
-        weighted_price = np.average(prices, weights=weights)
+        weighted_price = float(np.average(kept, weights=kept_weights))
 
         # Calculate confidence based on agreement
-        std_dev = np.std(prices)
-        agreement_confidence = 1.0 / (1.0 + std_dev / weighted_price)
-
+        std_dev = float(np.std(kept))
+        agreement_confidence = 1.0 / (1.0 + std_dev / weighted_price) if weighted_price else 0.0
+        confidence = agreement_confidence * float(np.average(weights[inliers]))
+
+        lineage = DataLineage(
+            providers=sources,
+            arbitration_score=round(confidence * 100, 2),
+            conflict_resolved=bool(rejected),
+            source_count=len(sources),
+            rejected_providers=rejected,
+            quorum_reached=quorum_reached,
+        )
         merged_data = {
             "price": weighted_price,
-            "sources": [r.provider for r in responses],
-            "source_count": len(responses),
-            "price_range": {"min": min(prices), "max": max(prices)},
+            "sources": sources,
+            "source_count": len(sources),
+            "price_range": {"min": float(kept.min()), "max": float(kept.max())},
+            "rejected": {
+                r.provider: r.data.get("price")
+                for r, keep in zip(responses, inliers, strict=False)
+                if not keep
+            },
+            "lineage": lineage.model_dump(mode="json"),
         }
+        for field in ("change", "change_percent", "volume"):
+            values = [
+                r.data[field]
+                for r, keep in zip(responses, inliers, strict=False)
+                if keep and r.data.get(field) is not None
+            ]
+            if values:
+                merged_data[field] = float(np.median(values))
 
         return ProviderResponse(
             provider="arbitration_engine",
@@ -374,32 +875,38 @@ class DataArbitrationEngine:
             timestamp=datetime.now(timezone.utc),
             is_valid=True,
             is_fresh=True,
-            confidence=agreement_confidence,
-            metadata={"merge_strategy": "weighted_average"},
+            confidence=confidence,
+            metadata={"merge_strategy": "weighted_average", "lineage": lineage.model_dump()},
         )
 
     async def _merge_ohlcv(self, responses: List[ProviderResponse]) -> ProviderResponse:
         """
         Merge OHLCV data
 
-        - Open: Take from earliest timestamp
+        Candles are aligned on the timeframe's grid and de-duplicated (see
+        merge_candles):
+        - Open: From the most confident provider
         - High: Max of all highs
         - Low: Min of all lows
-        - Close: Take from latest timestamp
-        - Volume: Sum (deduplicate exchanges)
+        - Close: Confidence-weighted average
+        - Volume: Largest report (never summed)
+        Bars missing from one provider are filled from the others.
         """
-        all_candles = []
-        for response in responses:
-            candles = response.data.get("candles", [])
-            all_candles.extend(candles)
-
-        if not all_candles:
+        ranked = sorted(responses, key=lambda r: r.confidence, reverse=True)
+        series = [(r.data.get("candles") or [], r.confidence) for r in ranked]
+        if not any(candles for candles, _ in series):
             return responses[0]
 
+        timeframe = next((r.data["timeframe"] for r in ranked if r.data.get("timeframe")), None)
+        candles, stats = merge_candles(series, timeframe, session_for(ranked[0].asset))
+
         merged_data = {
-            "candles": all_candles,  # TODO: Implement proper OHLCV merge logic
-            "sources": [r.provider for r in responses],
-            "source_count": len(responses),
+            "candles": candles,
+            "timeframe": timeframe,
+            "sources": [r.provider for r in ranked],
+            "source_count": len(ranked),
+            "overlapping_bars": stats["overlapping"],
+            "gaps_filled": stats["gaps_filled"],
         }
 
         return ProviderResponse(
@@ -410,7 +917,7 @@ class DataArbitrationEngine:
             timestamp=datetime.now(timezone.utc),
             is_valid=True,
             is_fresh=True,
-            confidence=0.95,
+            confidence=float(np.mean([r.confidence for r in ranked])),
             metadata={"merge_strategy": "aggregate_candles"},
         )
 
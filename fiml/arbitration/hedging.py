@@ -0,0 +1,59 @@
+"""
+Hedging Budget - Caps how many requests may launch a hedged fallback
+
+A hedge starts the next fallback provider while the primary is still running,
+so every hedge spends upstream quota twice. The budget is a token bucket per
+data type: each request deposits `ratio` tokens and each hedge spends one, so
+at most `ratio` of requests hedge over time, with short bursts up to `burst`.
+"""
+
+from typing import Any, Dict
+
+
+class HedgeBudget:
+    """
+    Token bucket limiting hedges to a share of requests
+
+    Args:
+        ratio: Hedges allowed per request (0.1 = one hedge per 10 requests)
+        burst: Most tokens that can accumulate while nothing is slow
+    """
+
+    def __init__(self, ratio: float, burst: float = 10.0) -> None:
+        self.ratio = max(0.0, ratio)
+        self.burst = max(1.0, burst)
+        self._tokens = 0.0
+
+        # Statistics
+        self.requests = 0
+        self.granted = 0
+        self.denied = 0
+
+    def deposit(self) -> None:
+        """Credit one request"""
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Take one hedge from the budget
+
+        Returns:
+            True if the hedge may be launched
+        """
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.granted += 1
+            return True
+        self.denied += 1
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Budget usage"""
+        return {
+            "ratio": self.ratio,
+            "tokens": round(self._tokens, 3),
+            "requests": self.requests,
+            "granted": self.granted,
+            "denied": self.denied,
+        }
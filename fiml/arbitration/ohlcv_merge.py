@@ -0,0 +1,152 @@
+"""
+OHLCV Merge - Combine candle series from several providers into one
+
+Candles from every provider are aligned on a shared timestamp grid and
+reduced per grid slot with NumPy after a single sort (O(n log n)):
+
+- open: from the most confident provider quoting the slot
+- high / low: max of highs / min of lows
+- close: confidence-weighted average of closes
+- volume: the largest reported volume, since feeds that cover fewer venues
+  under-report rather than over-report; volumes are never summed
+- timestamp: as labelled by the most confident provider
+
+Slots only one provider quotes are kept, so gaps in one series are filled
+from another.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fiml.cache.ohlcv_range import TIMEFRAME_SECONDS
+from fiml.cache.resample import UTC_SESSION, SessionAlignment, candle_ms, local_bucket_starts
+
+# Candle series and the confidence of the provider that returned it
+CandleSeries = Tuple[Sequence[Dict[str, Any]], float]
+
+
+def _series_arrays(
+    candles: Sequence[Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Timestamps (ms), OHLC rows and volumes of the candles that parse"""
+    rows = [(ms, c) for c in candles if (ms := candle_ms(c)) is not None]
+    ts = np.fromiter((ms for ms, _ in rows), dtype=np.int64, count=len(rows))
+    ohlc = np.array(
+        [
+            [
+                c.get("open", np.nan),
+                c.get("high", np.nan),
+                c.get("low", np.nan),
+                c.get("close", np.nan),
+            ]
+            for _, c in rows
+        ],
+        dtype=np.float64,
+    ).reshape(len(rows), 4)
+    volume = np.array(
+        [c.get("volume") if c.get("volume") is not None else np.nan for _, c in rows],
+        dtype=np.float64,
+    )
+    return ts, ohlc, volume
+
+
+def grid_keys(
+    ts: np.ndarray, timeframe: Optional[str], session: SessionAlignment = UTC_SESSION
+) -> np.ndarray:
+    """
+    Grid slot of each candle
+
+    Candles are assigned to the nearest bar of the timeframe in exchange
+    time, so a daily bar labelled at UTC midnight, local midnight or the
+    session open lands in the same slot. Unknown timeframes align on exact
+    timestamps.
+    """
+    if timeframe not in TIMEFRAME_SECONDS:
+        return ts
+    half_bar_ms = TIMEFRAME_SECONDS[timeframe] * 500
+    return local_bucket_starts(ts + half_bar_ms, timeframe, session)
+
+
+def merge_candles(
+    series: Sequence[CandleSeries],
+    timeframe: Optional[str] = None,
+    session: SessionAlignment = UTC_SESSION,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Merge candle series from several providers
+
+    Args:
+        series: (candles, provider confidence) per provider, most trusted
+            first; candles in provider format (timestamp in ms, s or ISO)
+        timeframe: Bar timeframe (e.g. "1m", "1d") used to align the grid
+        session: Exchange alignment for the grid (see session_for)
+
+    Returns:
+        Merged candles oldest first, and counts of bars quoted by several
+        providers (overlapping) and bars only a secondary provider had
+        (gaps_filled)
+    """
+    parts = [(*_series_arrays(candles), float(confidence)) for candles, confidence in series]
+    sizes = [len(ts) for ts, _, _, _ in parts]
+    if not sum(sizes):
+        return [], {"overlapping": 0, "gaps_filled": 0}
+
+    ts = np.concatenate([p[0] for p in parts])
+    ohlc = np.concatenate([p[1] for p in parts])
+    volume = np.concatenate([p[2] for p in parts])
+    source = np.repeat(np.arange(len(parts)), sizes)
+    # Zero-confidence providers still count when nobody else quotes the slot
+    weight = np.repeat(np.array([max(p[3], 1e-6) for p in parts]), sizes)
+
+    usable = np.isfinite(ohlc[:, 3])
+    ts, ohlc, volume, source, weight = (
+        ts[usable],
+        ohlc[usable],
+        volume[usable],
+        source[usable],
+        weight[usable],
+    )
+    if not len(ts):
+        return [], {"overlapping": 0, "gaps_filled": 0}
+
+    keys = grid_keys(ts, timeframe, session)
+
+    # Slot order, then most confident (and earliest listed) provider first
+    order = np.lexsort((source, -weight, keys))
+    keys, ts, ohlc, volume, source, weight = (
+        keys[order],
+        ts[order],
+        ohlc[order],
+        volume[order],
+        source[order],
+        weight[order],
+    )
+    first = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    counts = np.diff(np.append(first, len(keys)))
+
+    high = np.fmax.reduceat(np.fmax(ohlc[:, 1], ohlc[:, 3]), first)
+    low = np.fmin.reduceat(np.fmin(ohlc[:, 2], ohlc[:, 3]), first)
+    close = np.add.reduceat(weight * ohlc[:, 3], first) / np.add.reduceat(weight, first)
+    open_ = ohlc[first, 0]
+    open_ = np.where(np.isfinite(open_), open_, ohlc[first, 3])
+    high = np.fmax(high, open_)
+    low = np.fmin(low, open_)
+    merged_volume = np.fmax.reduceat(volume, first)
+
+    merged = [
+        {
+            "timestamp": int(ts[f]),
+            "open": float(open_[i]),
+            "high": float(high[i]),
+            "low": float(low[i]),
+            "close": float(close[i]),
+            "volume": float(merged_volume[i]) if np.isfinite(merged_volume[i]) else None,
+        }
+        for i, f in enumerate(first)
+    ]
+    stats = {
+        "overlapping": int(np.count_nonzero(counts > 1)),
+        "gaps_filled": int(np.count_nonzero((counts == 1) & (source[first] != 0))),
+    }
+    return merged, stats
@@ -0,0 +1,65 @@
+"""
+Quorum Consensus - Robust agreement checks across provider prices
+
+Prices from several providers are compared with the median absolute deviation
+(MAD), which a single bad quote cannot drag the way it drags a mean or standard
+deviation. MAD is zero when most providers agree exactly, so deviations are
+also allowed up to a relative tolerance of the median.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+# Scales MAD to the standard deviation of normally distributed data
+MAD_SCALE = 1.4826
+
+
+def mad_inliers(
+    values: npt.ArrayLike, threshold: float = 3.5, tolerance: float = 0.005
+) -> npt.NDArray[np.bool_]:
+    """
+    Mask of values that are not outliers
+
+    A value is an outlier when it is more than threshold robust standard
+    deviations (MAD * 1.4826) and more than tolerance * |median| from the
+    median.
+
+    Args:
+        values: Observations (e.g. prices)
+        threshold: Modified z-score cutoff
+        tolerance: Deviation always accepted, relative to the median
+
+    Returns:
+        Boolean array, True for inliers
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return np.zeros(0, dtype=bool)
+
+    median = np.median(values)
+    deviation = np.abs(values - median)
+    limit = max(threshold * MAD_SCALE * float(np.median(deviation)), tolerance * abs(median))
+    return np.asarray(deviation <= limit, dtype=bool)
+
+
+def largest_agreeing(values: npt.ArrayLike, tolerance: float = 0.005) -> int:
+    """
+    Size of the largest group of values within tolerance of each other
+
+    Values agree when the group's spread is at most 2 * tolerance of the
+    median, i.e. every member is within tolerance of the group's midpoint.
+
+    Args:
+        values: Observations (e.g. prices)
+        tolerance: Allowed deviation, relative to the median
+
+    Returns:
+        Number of values in the largest agreeing group
+    """
+    values = np.sort(np.asarray(values, dtype=float))
+    if values.size == 0:
+        return 0
+
+    span = 2 * tolerance * abs(float(np.median(values)))
+    ends = np.searchsorted(values, values + span, side="right")
+    return int(np.max(ends - np.arange(values.size)))
@@ -531,19 +531,23 @@ class FIMLEducationalDataAdapter:
 
         return results
 
-    async def get_ohlcv(self, symbol: str, timeframe: str = "1d") -> list[Dict[str, Any]]:
+    async def get_ohlcv(
+        self, symbol: str, timeframe: str = "1d", limit: int = 100
+    ) -> list[Dict[str, Any]]:
         """
         Get historical OHLCV data for a symbol
 
         Args:
             symbol: Asset symbol
             timeframe: Candle timeframe (default: "1d")
+            limit: Number of candles (default: 100)
 
         Returns:
             List of OHLCV candles
         """
         try:
             from fiml.arbitration.engine import arbitration_engine
+            from fiml.cache.manager import cache_manager
             from fiml.core.models import Asset, DataType, Market
 
             asset_type = self._detect_asset_type(symbol)
@@ -556,19 +560,28 @@ class FIMLEducationalDataAdapter:
                 market=Market.US if asset_type == AssetType.EQUITY else Market.CRYPTO,
             )
 
-            # Arbitrate request
-            plan = await arbitration_engine.arbitrate_request(
-                asset=asset, data_type=DataType.OHLCV, user_region="US"
-            )
+            async def fetch_candles(limit: int) -> tuple[str, list[Dict[str, Any]]]:
+                # Arbitrate request
+                plan = await arbitration_engine.arbitrate_request(
+                    asset=asset, data_type=DataType.OHLCV, user_region="US"
+                )
 
-            # Execute request
-            response = await arbitration_engine.execute_with_fallback(
-                plan=plan, asset=asset, data_type=DataType.OHLCV
-            )
+                # Execute request
+                response = await arbitration_engine.execute_with_fallback(
+                    plan=plan,
+                    asset=asset,
+                    data_type=DataType.OHLCV,
+                    timeframe=timeframe,
+                    limit=limit,
+                )
+
+                # ProviderResponse.data for OHLCV should contain "candles" list
+                return response.provider, cast(
+                    list[Dict[str, Any]], response.data.get("candles", [])
+                )
 
-            # Extract candles from response
-            # ProviderResponse.data for OHLCV should contain "candles" list
-            return cast(list[Dict[str, Any]], response.data.get("candles", []))
+            # Only spans missing from the L2 candle cache reach the providers
+            return await cache_manager.get_ohlcv(asset, timeframe, fetch_candles, limit=limit)
 
         except Exception as e:
             logger.error("Failed to get OHLCV data", symbol=symbol, error=str(e))
@@ -2,47 +2,84 @@
 Cache module - Multi-layer caching system with advanced optimizations
 
 Components:
+- L0 Cache: Optional in-process near-cache with pub/sub invalidation (<1ms target)
 - L1 Cache: Redis with LRU/LFU/Hybrid eviction (10-100ms target)
 - L2 Cache: PostgreSQL + TimescaleDB (300-700ms target)
+- Asset Index: In-memory symbol/market -> assets.id map for L2 lookups
 - Cache Manager: Coordinates L1/L2 with intelligent TTL and read-through caching
+- Request Coalescer: Single-flight fetches for concurrent misses on the same key
+- Cache Entry: Soft/hard TTL envelope for stale-while-revalidate reads
+- Hot Key Tracker: Bounded cluster-wide top-k of accessed keys via Redis
+- Count-Min Sketch: Aged frequency estimates for W-TinyLFU admission
+- Latency Histogram: Fixed-memory, mergeable latency percentiles
+- Trading Calendar: Exchange sessions and holidays for market-hours TTLs
+- Cache Snapshotter: Hot working set saved on shutdown and reloaded on startup
+- Cache Codec: Pluggable payload serialization (json/orjson/msgpack + zstd)
 - Predictive Warmer: Pre-fetches based on query patterns
+- Warming Planner: Hour-of-week demand forecasts under per-provider budgets
 - Batch Scheduler: Groups and schedules cache updates
 - Analytics: Comprehensive performance monitoring with Prometheus metrics
 - Utils: Shared utilities
 """
 
 from fiml.cache.analytics import CacheAnalytics, cache_analytics
+from fiml.cache.asset_index import AssetIndex
+from fiml.cache.coalescing import RequestCoalescer
+from fiml.cache.codec import CacheCodec
+from fiml.cache.entry import CacheEntry, NegativeEntry
 from fiml.cache.eviction import EvictionPolicy, EvictionTracker, eviction_tracker
+from fiml.cache.histogram import LatencyHistogram
+from fiml.cache.hot_keys import HotKeyTracker
+from fiml.cache.l0_cache import L0Cache
 from fiml.cache.l1_cache import L1Cache, l1_cache
 from fiml.cache.l2_cache import L2Cache, l2_cache
 from fiml.cache.manager import CacheManager, cache_manager
 from fiml.cache.scheduler import BatchUpdateScheduler, UpdateRequest
+from fiml.cache.sketch import CountMinSketch
+from fiml.cache.snapshot import CacheSnapshotter
+from fiml.cache.trading_calendar import TradingCalendar, calendar_for
 from fiml.cache.utils import calculate_percentile
 from fiml.cache.warmer import CacheWarmer, cache_warmer
 from fiml.cache.warming import PredictiveCacheWarmer, QueryPattern
+from fiml.cache.warming_planner import DemandForecaster, WarmingPlanner, WarmTask
 
 __all__ = [
     # Core caching
+    "L0Cache",
     "L1Cache",
     "l1_cache",
     "L2Cache",
     "l2_cache",
+    "AssetIndex",
     "CacheManager",
     "cache_manager",
+    "RequestCoalescer",
+    "CacheEntry",
+    "NegativeEntry",
+    "CacheCodec",
+    "CacheSnapshotter",
+    "TradingCalendar",
+    "calendar_for",
     # Legacy warmer
     "CacheWarmer",
     "cache_warmer",
     # Advanced features
     "PredictiveCacheWarmer",
     "QueryPattern",
+    "WarmingPlanner",
+    "DemandForecaster",
+    "WarmTask",
     "BatchUpdateScheduler",
     "UpdateRequest",
     "CacheAnalytics",
     "cache_analytics",
+    "LatencyHistogram",
     # Eviction
     "EvictionTracker",
     "EvictionPolicy",
     "eviction_tracker",
+    "CountMinSketch",
+    "HotKeyTracker",
     # Utils
     "calculate_percentile",
 ]
@@ -7,6 +7,7 @@ from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from fiml.cache.histogram import LatencyHistogram
 from fiml.core.logging import get_logger
 from fiml.core.models import DataType
 
@@ -22,6 +23,12 @@ except ImportError:
     PROMETHEUS_AVAILABLE = False
     logger.warning("prometheus_client not available - metrics export disabled")
 
+# Quarter-power-of-two buckets from 0.125ms to 4s, so histogram_quantile()
+# across pods lands within ~10% of the true latency
+LATENCY_BUCKETS_SECONDS = [2 ** (step / 4) / 1000 for step in range(-12, 49)]
+
+CACHE_LEVELS = ("l0", "l1", "l2")
+
 
 class DataTypeMetrics:
     """Metrics for a specific data type"""
@@ -30,17 +37,13 @@ class DataTypeMetrics:
         self.data_type = data_type
         self.hits = 0
         self.misses = 0
-        self.latencies: List[float] = []
+        self.latency = LatencyHistogram()
         self.errors = 0
 
     def record_hit(self, latency_ms: float) -> None:
         """Record a cache hit"""
         self.hits += 1
-        self.latencies.append(latency_ms)
-
-        # Keep only last 10000 measurements
-        if len(self.latencies) > 10000:
-            self.latencies.pop(0)
+        self.latency.record(latency_ms)
 
     def record_miss(self) -> None:
         """Record a cache miss"""
@@ -57,39 +60,7 @@ class DataTypeMetrics:
 
     def get_latency_stats(self) -> Dict[str, float]:
         """Calculate latency statistics"""
-        if not self.latencies:
-            return {
-                "count": 0,
-                "mean": 0.0,
-                "p50": 0.0,
-                "p95": 0.0,
-                "p99": 0.0,
-                "min": 0.0,
-                "max": 0.0,
-            }
-
-        sorted_latencies = sorted(self.latencies)
-        count = len(sorted_latencies)
-
-        return {
-            "count": count,
-            "mean": sum(sorted_latencies) / count,
-            "p50": self._percentile(sorted_latencies, 50),
-            "p95": self._percentile(sorted_latencies, 95),
-            "p99": self._percentile(sorted_latencies, 99),
-            "min": sorted_latencies[0],
-            "max": sorted_latencies[-1],
-        }
-
-    @staticmethod
-    def _percentile(sorted_values: List[float], percentile: int) -> float:
-        """Calculate percentile from sorted values"""
-        if not sorted_values:
-            return 0.0
-
-        index = int(len(sorted_values) * percentile / 100)
-        index = min(index, len(sorted_values) - 1)
-        return sorted_values[index]
+        return self.latency.get_stats()
 
 
 class CacheAnalytics:
@@ -98,7 +69,7 @@ class CacheAnalytics:
 
     Features:
     - Hit/miss rate tracking per data type
-    - Latency monitoring (p50, p95, p99)
+    - Latency monitoring (p50, p95, p99) in mergeable fixed-memory histograms
     - Cache pollution detection
     - Optimization recommendations
     - Prometheus metrics export
@@ -118,14 +89,29 @@ class CacheAnalytics:
             data_type: DataTypeMetrics(data_type) for data_type in DataType
         }
 
+        # Hit latency per cache level
+        self.level_latency: Dict[str, LatencyHistogram] = {
+            level: LatencyHistogram() for level in CACHE_LEVELS
+        }
+
         # Overall metrics
         self.total_hits = 0
         self.total_misses = 0
         self.total_errors = 0
+        self.l0_hits = 0
+        self.l0_misses = 0
         self.l1_hits = 0
         self.l1_misses = 0
         self.l2_hits = 0
         self.l2_misses = 0
+        self.coalesced_requests = 0
+        self.stale_hits = 0
+        self.background_refreshes = 0
+        self.early_refreshes = 0
+        self.negative_hits = 0
+        self.negative_writes = 0
+        self.l2_rows_written = 0
+        self.l2_rows_failed = 0
 
         # Cache pollution tracking
         self.single_access_keys: Dict[str, datetime] = {}
@@ -159,7 +145,14 @@ class CacheAnalytics:
             "fiml_cache_latency_seconds",
             "Cache operation latency",
             ["data_type", "cache_level", "operation"],
-            buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+            buckets=LATENCY_BUCKETS_SECONDS,
+        )
+
+        # Per-worker percentiles from the in-process histograms
+        self.prom_latency_quantile = Gauge(
+            "fiml_cache_hit_latency_quantile_seconds",
+            "Cache hit latency percentile on this worker",
+            ["cache_level", "quantile"],
         )
 
         # Hit rate gauge
@@ -172,6 +165,49 @@ class CacheAnalytics:
             "fiml_cache_size_bytes", "Cache size in bytes", ["cache_level"]
         )
 
+        # Read-through requests that joined an in-flight fetch
+        self.prom_coalesced = Counter(
+            "fiml_cache_coalesced_requests_total",
+            "Cache misses served by an in-flight fetch for the same key",
+            ["data_type"],
+        )
+
+        # Stale-while-revalidate
+        self.prom_stale_hits = Counter(
+            "fiml_cache_stale_hits_total",
+            "Cache hits served past their soft TTL while a refresh runs",
+            ["data_type"],
+        )
+
+        # Probabilistic early expiration (XFetch)
+        self.prom_early_refreshes = Counter(
+            "fiml_cache_early_refreshes_total",
+            "Fresh cache entries refreshed early to avoid synchronized expiry",
+            ["data_type"],
+        )
+
+        # Negative caching of unknown symbols
+        self.prom_negative_hits = Counter(
+            "fiml_cache_negative_hits_total",
+            "Lookups answered by a tombstone instead of calling providers",
+            ["data_type"],
+        )
+
+        # L2 write-behind
+        self.prom_l2_flush_latency = Histogram(
+            "fiml_cache_l2_flush_latency_seconds",
+            "L2 write-behind batch flush latency",
+            buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+        )
+
+        self.prom_l2_queue_depth = Gauge(
+            "fiml_cache_l2_write_queue_depth", "Writes waiting in the L2 write-behind queue"
+        )
+
+        self.prom_l2_rows = Counter(
+            "fiml_cache_l2_rows_written_total", "Rows flushed to L2 by write-behind", ["status"]
+        )
+
         # Evictions
         self.prom_evictions = Counter(
             "fiml_cache_evictions_total", "Total cache evictions", ["cache_level", "reason"]
@@ -186,6 +222,7 @@ class CacheAnalytics:
         latency_ms: float,
         cache_level: str = "l1",
         key: Optional[str] = None,
+        falls_through: bool = False,
     ) -> None:
         """
         Record a cache access
@@ -194,14 +231,33 @@ class CacheAnalytics:
             data_type: Type of data accessed
             is_hit: Whether it was a cache hit
             latency_ms: Access latency in milliseconds
-            cache_level: Cache level (l1/l2)
+            cache_level: Cache level (l0/l1/l2)
             key: Cache key (for pollution tracking)
+            falls_through: A miss will be retried on a lower tier (always
+                the case for L0)
         """
+        # A miss that falls through to a lower tier, which records the
+        # request's outcome, only counts toward its own tier
+        if not is_hit and (cache_level == "l0" or falls_through):
+            if cache_level == "l0":
+                self.l0_misses += 1
+            elif cache_level == "l1":
+                self.l1_misses += 1
+            if self.enable_prometheus:
+                self.prom_cache_misses.labels(
+                    data_type=data_type.value, cache_level=cache_level
+                ).inc()
+            return
+
         # Update data type metrics
         if is_hit:
             self.data_type_metrics[data_type].record_hit(latency_ms)
+            if cache_level in self.level_latency:
+                self.level_latency[cache_level].record(latency_ms)
             self.total_hits += 1
-            if cache_level == "l1":
+            if cache_level == "l0":
+                self.l0_hits += 1
+            elif cache_level == "l1":
                 self.l1_hits += 1
             elif cache_level == "l2":
                 self.l2_hits += 1
@@ -252,6 +308,62 @@ class CacheAnalytics:
         self.data_type_metrics[data_type].record_error()
         self.total_errors += 1
 
+    def record_coalesced_request(self, data_type: DataType) -> None:
+        """Record a cache miss that joined an already in-flight fetch"""
+        self.coalesced_requests += 1
+
+        if self.enable_prometheus:
+            self.prom_coalesced.labels(data_type=data_type.value).inc()
+
+    def record_stale_hit(self, data_type: DataType, refresh_started: bool) -> None:
+        """Record a stale value served while a background refresh runs"""
+        self.stale_hits += 1
+        if refresh_started:
+            self.background_refreshes += 1
+
+        if self.enable_prometheus:
+            self.prom_stale_hits.labels(data_type=data_type.value).inc()
+
+    def record_early_refresh(self, data_type: DataType) -> None:
+        """Record a still-fresh entry chosen for early refresh"""
+        self.early_refreshes += 1
+
+        if self.enable_prometheus:
+            self.prom_early_refreshes.labels(data_type=data_type.value).inc()
+
+    def record_negative_hit(self, data_type: DataType) -> None:
+        """Record a lookup answered by a tombstone"""
+        self.negative_hits += 1
+
+        if self.enable_prometheus:
+            self.prom_negative_hits.labels(data_type=data_type.value).inc()
+
+    def record_negative_write(self, data_type: DataType) -> None:
+        """Record a tombstone written after no provider could serve a request"""
+        self.negative_writes += 1
+
+    def record_l2_flush(
+        self, rows: int, latency_ms: float, queue_depth: int, success: bool
+    ) -> None:
+        """
+        Record an L2 write-behind flush
+
+        Args:
+            rows: Rows in the flushed batch
+            latency_ms: Flush latency in milliseconds
+            queue_depth: Writes still queued after the flush
+            success: Whether the batch was written
+        """
+        if success:
+            self.l2_rows_written += rows
+        else:
+            self.l2_rows_failed += rows
+
+        if self.enable_prometheus:
+            self.prom_l2_flush_latency.observe(latency_ms / 1000)
+            self.prom_l2_queue_depth.set(queue_depth)
+            self.prom_l2_rows.labels(status="ok" if success else "failed").inc(rows)
+
     def record_eviction(self, key: str, reason: str = "lru", cache_level: str = "l1") -> None:
         """
         Record a cache eviction
@@ -280,6 +392,12 @@ class CacheAnalytics:
             "total_hits": self.total_hits,
             "total_misses": self.total_misses,
             "total_errors": self.total_errors,
+            "coalesced_requests": self.coalesced_requests,
+            "stale_hits": self.stale_hits,
+            "background_refreshes": self.background_refreshes,
+            "early_refreshes": self.early_refreshes,
+            "negative_hits": self.negative_hits,
+            "negative_writes": self.negative_writes,
             "hit_rate_percent": round(hit_rate, 2),
         }
 
@@ -311,6 +429,83 @@ class CacheAnalytics:
 
         return stats
 
+    @staticmethod
+    def _rounded_latency(histogram: LatencyHistogram) -> Dict[str, float]:
+        """Latency summary rounded for reports"""
+        return {
+            name: value if name == "count" else round(value, 2)
+            for name, value in histogram.get_stats().items()
+        }
+
+    def get_level_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get hit latency percentiles per cache level
+
+        Returns:
+            Dict of cache level -> count/mean/p50/p95/p99/min/max in ms
+        """
+        stats = {}
+        for level, histogram in self.level_latency.items():
+            stats[level] = self._rounded_latency(histogram)
+
+            if self.enable_prometheus and histogram.count:
+                for quantile in ("p50", "p95", "p99"):
+                    self.prom_latency_quantile.labels(cache_level=level, quantile=quantile[1:]).set(
+                        stats[level][quantile] / 1000
+                    )
+
+        return stats
+
+    def get_latency_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get serializable latency histograms for cross-worker aggregation
+
+        Returns:
+            Histogram snapshots by cache level and by data type
+        """
+        return {
+            "by_level": {
+                level: histogram.snapshot() for level, histogram in self.level_latency.items()
+            },
+            "by_data_type": {
+                data_type.value: metrics.latency.snapshot()
+                for data_type, metrics in self.data_type_metrics.items()
+                if metrics.latency.count
+            },
+        }
+
+    @staticmethod
+    def merge_latency_snapshots(
+        snapshots: List[Dict[str, Dict[str, Any]]],
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Combine get_latency_snapshot() results from several workers or pods
+
+        Args:
+            snapshots: Latency snapshots, e.g. scraped from every pod's
+                /api/metrics/cache "latency_histograms"
+
+        Returns:
+            Cluster-wide latency stats by cache level and by data type
+        """
+        merged: Dict[str, Dict[str, LatencyHistogram]] = {"by_level": {}, "by_data_type": {}}
+        for snapshot in snapshots:
+            for group, histograms in merged.items():
+                for name, data in snapshot.get(group, {}).items():
+                    histogram = LatencyHistogram.from_snapshot(data)
+                    if name in histograms:
+                        histograms[name].merge(histogram)
+                    else:
+                        histograms[name] = histogram
+
+        return {
+            group: {
+                name: CacheAnalytics._rounded_latency(histogram)
+                for name, histogram in histograms.items()
+            }
+            for group, histograms in merged.items()
+        }
+
     def detect_cache_pollution(self) -> Dict[str, Any]:
         """
         Detect cache pollution issues
@@ -419,9 +614,22 @@ class CacheAnalytics:
 
     def get_comprehensive_report(self) -> Dict[str, Any]:
         """Get comprehensive analytics report"""
+        level_latency = self.get_level_latency_stats()
+
         return {
             "timestamp": datetime.now(UTC).isoformat(),
             "overall": self.get_overall_stats(),
+            "l0_cache": {
+                "hits": self.l0_hits,
+                "misses": self.l0_misses,
+                "hit_rate": (
+                    (self.l0_hits / (self.l0_hits + self.l0_misses))
+                    if (self.l0_hits + self.l0_misses) > 0
+                    else 0.0
+                ),
+                "avg_latency_ms": level_latency["l0"]["mean"],
+                "latency_ms": level_latency["l0"],
+            },
             "l1_cache": {
                 "hits": self.l1_hits,
                 "misses": self.l1_misses,
@@ -430,7 +638,8 @@ class CacheAnalytics:
                     if (self.l1_hits + self.l1_misses) > 0
                     else 0.0
                 ),
-                "avg_latency_ms": 0.0,  # TODO: Track per-level latency
+                "avg_latency_ms": level_latency["l1"]["mean"],
+                "latency_ms": level_latency["l1"],
             },
             "l2_cache": {
                 "hits": self.l2_hits,
@@ -440,9 +649,13 @@ class CacheAnalytics:
                     if (self.l2_hits + self.l2_misses) > 0
                     else 0.0
                 ),
-                "avg_latency_ms": 0.0,
+                "avg_latency_ms": level_latency["l2"]["mean"],
+                "latency_ms": level_latency["l2"],
+                "rows_written": self.l2_rows_written,
+                "rows_failed": self.l2_rows_failed,
             },
             "by_data_type": self.get_data_type_stats(),
+            "latency_histograms": self.get_latency_snapshot(),
             "pollution": self.detect_cache_pollution(),
             "hourly_trends": self.get_hourly_trends(24),
             "recommendations": self.generate_recommendations(),
@@ -454,10 +667,20 @@ class CacheAnalytics:
         self.total_hits = 0
         self.total_misses = 0
         self.total_errors = 0
+        self.l0_hits = 0
+        self.l0_misses = 0
         self.l1_hits = 0
         self.l1_misses = 0
         self.l2_hits = 0
         self.l2_misses = 0
+        self.coalesced_requests = 0
+        self.stale_hits = 0
+        self.background_refreshes = 0
+        self.early_refreshes = 0
+        self.negative_hits = 0
+        self.negative_writes = 0
+        self.l2_rows_written = 0
+        self.l2_rows_failed = 0
         self.single_access_keys.clear()
         self.evicted_before_use = 0
         self.hourly_stats.clear()
@@ -466,7 +689,10 @@ class CacheAnalytics:
             metrics.hits = 0
             metrics.misses = 0
             metrics.errors = 0
-            metrics.latencies.clear()
+            metrics.latency.reset()
+
+        for histogram in self.level_latency.values():
+            histogram.reset()
 
         logger.info("Cache analytics stats reset")
 
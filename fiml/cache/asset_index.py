@@ -0,0 +1,190 @@
+"""
+Asset Index - In-memory symbol/market -> assets.id mapping
+
+L2 tables are keyed by the integer assets.id, while callers work with Asset
+models. The index resolves (symbol, market) pairs once and then answers from
+memory. It is bulk-loaded from the assets table at startup and filled lazily
+afterwards; symbols missing from the table are remembered for a short time so
+repeated L1 misses for unknown symbols do not each query PostgreSQL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fiml.cache.coalescing import RequestCoalescer
+from fiml.core.logging import get_logger
+from fiml.core.models import Asset
+
+logger = get_logger(__name__)
+
+AssetKey = Tuple[str, str]
+
+
+class AssetIndex:
+    """
+    Lazily filled (symbol, market) -> asset_id map backed by the assets table
+
+    Features:
+    - Bulk preload at startup
+    - Single-flight lookups per asset
+    - Short-lived negative entries for unknown symbols
+    - Optional creation of missing assets on the write path
+    """
+
+    def __init__(
+        self, l2: Any, negative_ttl_seconds: float = 60.0, max_negative_entries: int = 10000
+    ) -> None:
+        """
+        Initialize asset index
+
+        Args:
+            l2: L2Cache providing get_asset_id/create_asset/load_asset_ids
+            negative_ttl_seconds: How long an unknown symbol is remembered
+            max_negative_entries: Unknown symbols remembered at most (oldest go first)
+        """
+        self.l2 = l2
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_negative_entries = max_negative_entries
+
+        self._ids: Dict[AssetKey, int] = {}
+        # key -> expiry; in insertion order, which is also expiry order
+        self._missing: "OrderedDict[AssetKey, float]" = OrderedDict()
+        self._coalescer = RequestCoalescer()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.created = 0
+        self.preloaded = 0
+
+    @staticmethod
+    def key_for(asset: Asset) -> AssetKey:
+        """Build the index key for an asset"""
+        market = getattr(asset.market, "value", asset.market)
+        return (asset.symbol.upper(), str(market))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def preload(self) -> int:
+        """
+        Bulk load every known asset
+
+        Returns:
+            Number of assets indexed
+        """
+        rows = await self.l2.load_asset_ids()
+        for asset_id, symbol, market in rows:
+            # Rows are ordered by id: keep the oldest row for duplicate symbols
+            self._ids.setdefault((symbol.upper(), market), asset_id)
+
+        self._missing.clear()
+        self.preloaded = len(rows)
+        logger.info("Asset index preloaded", assets=len(self._ids))
+        return len(rows)
+
+    def get_cached(self, asset: Asset) -> Optional[int]:
+        """Return the asset ID if already indexed, without touching the database"""
+        return self._ids.get(self.key_for(asset))
+
+    async def get_asset_id(self, asset: Asset, create: bool = False) -> Optional[int]:
+        """
+        Resolve the asset ID for an asset
+
+        Args:
+            asset: Asset to resolve
+            create: Insert the asset into the assets table if it is unknown
+
+        Returns:
+            Asset ID or None if unknown (and not created)
+        """
+        key = self.key_for(asset)
+
+        asset_id = self._ids.get(key)
+        if asset_id is not None:
+            self.hits += 1
+            return asset_id
+
+        if not create:
+            expires_at = self._missing.get(key)
+            if expires_at is not None:
+                if expires_at > time.monotonic():
+                    self.negative_hits += 1
+                    return None
+                del self._missing[key]
+
+        self.misses += 1
+        flight_key = f"{key[0]}:{key[1]}:{'create' if create else 'lookup'}"
+        result: Optional[int] = await self._coalescer.run(
+            flight_key, lambda: self._resolve(asset, key, create)
+        )
+        return result
+
+    async def _resolve(self, asset: Asset, key: AssetKey, create: bool) -> Optional[int]:
+        """Query (or create) the asset row and record the outcome"""
+        if create:
+            asset_type = getattr(asset.asset_type, "value", asset.asset_type)
+            asset_id = await self.l2.create_asset(
+                symbol=key[0],
+                market=key[1],
+                asset_type=str(asset_type),
+                name=asset.name,
+                exchange=asset.exchange,
+                currency=asset.currency,
+            )
+            if asset_id is not None:
+                self.created += 1
+        else:
+            asset_id = await self.l2.get_asset_id(key[0], key[1])
+
+        if asset_id is None:
+            if not create:
+                self._remember_missing(key)
+            return None
+
+        self._ids[key] = asset_id
+        self._missing.pop(key, None)
+        return int(asset_id)
+
+    def _remember_missing(self, key: AssetKey) -> None:
+        """Add a negative entry, dropping expired ones and the oldest over the cap"""
+        now = time.monotonic()
+        self._missing.pop(key, None)
+        self._missing[key] = now + self.negative_ttl_seconds
+        while self._missing:
+            oldest, expires_at = next(iter(self._missing.items()))
+            if expires_at > now and len(self._missing) <= self.max_negative_entries:
+                break
+            del self._missing[oldest]
+
+    def invalidate(self, asset: Optional[Asset] = None) -> None:
+        """
+        Forget one asset, or the whole index
+
+        Args:
+            asset: Asset to forget (None clears everything)
+        """
+        if asset is None:
+            self._ids.clear()
+            self._missing.clear()
+            return
+
+        key = self.key_for(asset)
+        self._ids.pop(key, None)
+        self._missing.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get asset index statistics"""
+        lookups = self.hits + self.misses + self.negative_hits
+        return {
+            "size": len(self._ids),
+            "negative_entries": len(self._missing),
+            "preloaded": self.preloaded,
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+            "created": self.created,
+            "hit_rate_percent": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
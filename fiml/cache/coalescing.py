@@ -0,0 +1,93 @@
+"""
+Request Coalescing - Single-flight execution per cache key
+
+When many concurrent callers miss the cache for the same key, only the first
+one runs the fetch; later callers await the same in-flight task instead of
+issuing duplicate provider calls.
+"""
+
+import asyncio
+from typing import Any, Callable, Coroutine, Dict
+
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestCoalescer:
+    """
+    Deduplicates concurrent fetches for the same key
+
+    Semantics:
+    - The first caller for a key starts the fetch as a task (the leader)
+    - Concurrent callers for the same key await that task (the waiters)
+    - Exceptions raised by the fetch propagate to every caller
+    - Cancelling one caller does not cancel the shared fetch for the others
+    - If the shared fetch itself is cancelled, every caller sees CancelledError
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+
+        # Statistics
+        self.leaders = 0
+        self.coalesced = 0
+        self.max_waiters = 0
+
+    async def run(self, key: str, fetch_fn: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+        """
+        Run fetch_fn for key, or join the fetch already in flight
+
+        Args:
+            key: Coalescing key (usually the cache key)
+            fetch_fn: Coroutine function performing the fetch
+
+        Returns:
+            Result of the (shared) fetch
+        """
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.create_task(fetch_fn())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t: self._on_done(key, t))
+            self.leaders += 1
+        else:
+            self._waiters[key] += 1
+            self.coalesced += 1
+            self.max_waiters = max(self.max_waiters, self._waiters[key])
+            logger.debug("Coalesced cache fetch", key=key, waiters=self._waiters[key])
+
+        return await asyncio.shield(task)
+
+    def is_inflight(self, key: str) -> bool:
+        """Check whether a fetch is currently running for key"""
+        return key in self._inflight
+
+    def get_waiters(self, key: str) -> int:
+        """Number of callers currently waiting on the leader for key"""
+        return self._waiters.get(key, 0)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget the finished task so the next miss starts a fresh fetch"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._waiters.pop(key, None)
+
+        # Mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        total = self.leaders + self.coalesced
+        return {
+            "in_flight": len(self._inflight),
+            "waiting": sum(self._waiters.values()),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "max_waiters": self.max_waiters,
+            "coalesced_percent": round(self.coalesced / total * 100, 2) if total > 0 else 0.0,
+        }
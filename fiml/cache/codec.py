@@ -0,0 +1,219 @@
+"""
+Cache Codec - Pluggable serialization for cache payloads
+
+Encodes cache values as bytes with a small version header so the format can
+change without flushing the cache:
+
+    magic (0xFC) | version | format id | flags | body
+
+Payloads without the header are legacy JSON text and still decode. Plain JSON
+without compression is written header-less so older readers can decode it.
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+from fiml.core import config
+from fiml.core.exceptions import CacheError
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Optional fast serializers
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class CacheCodec:
+    """
+    Serializer for cache values with optional compression
+
+    Formats:
+    - json: standard library JSON (header-less unless compressed)
+    - orjson: JSON via orjson (faster, same wire format)
+    - msgpack: binary MessagePack
+
+    Compression (zstd) is applied only to payloads at or above
+    compress_threshold bytes, where it pays for itself.
+    """
+
+    MAGIC = 0xFC
+    VERSION = 1
+    HEADER_SIZE = 4
+    FLAG_ZSTD = 0x01
+
+    FORMAT_IDS: Dict[str, int] = {"json": 0, "orjson": 1, "msgpack": 2}
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: str = "none",
+        compress_threshold: int = 1024,
+        compress_level: int = 3,
+    ) -> None:
+        if serializer not in self.FORMAT_IDS:
+            raise CacheError(f"Unknown cache codec format: {serializer}")
+
+        if serializer == "orjson" and not ORJSON_AVAILABLE:
+            logger.warning("orjson not installed, falling back to json cache codec")
+            serializer = "json"
+        elif serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed, falling back to json cache codec")
+            serializer = "json"
+
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not installed, cache compression disabled")
+            compression = "none"
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+        self._compressor: Optional[Any] = None
+        self._decompressor: Optional[Any] = None
+        if compression == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=compress_level)
+            self._decompressor = zstandard.ZstdDecompressor()
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize a value for storage
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Encoded bytes
+        """
+        format_name = self.serializer
+        try:
+            body = self._serialize(value, format_name)
+        except (TypeError, ValueError, OverflowError):
+            # e.g. integers beyond 64 bits: fall back to the lenient JSON path
+            format_name = "json"
+            body = self._serialize(value, format_name)
+
+        flags = 0
+        if self._compressor is not None and len(body) >= self.compress_threshold:
+            compressed = self._compressor.compress(body)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= self.FLAG_ZSTD
+
+        if format_name == "json" and flags == 0:
+            return body
+
+        header = bytes((self.MAGIC, self.VERSION, self.FORMAT_IDS[format_name], flags))
+        return header + body
+
+    def decode(self, raw: Union[bytes, str]) -> Any:
+        """
+        Deserialize a stored payload
+
+        Args:
+            raw: Bytes (or legacy JSON text) read from the cache
+
+        Returns:
+            Decoded value
+        """
+        if isinstance(raw, str):
+            return self._loads_json(raw)
+
+        if len(raw) < self.HEADER_SIZE or raw[0] != self.MAGIC:
+            return self._loads_json(raw)
+
+        version, format_id, flags = raw[1], raw[2], raw[3]
+        if version != self.VERSION:
+            raise CacheError(f"Unsupported cache payload version: {version}")
+
+        body = raw[self.HEADER_SIZE :]
+        if flags & self.FLAG_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise CacheError("Cache payload is zstd-compressed but zstandard is not installed")
+            decompressor = self._decompressor or zstandard.ZstdDecompressor()
+            body = decompressor.decompress(body)
+
+        if format_id == self.FORMAT_IDS["msgpack"]:
+            if not MSGPACK_AVAILABLE:
+                raise CacheError("Cache payload is msgpack but msgpack is not installed")
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+        if format_id in (self.FORMAT_IDS["json"], self.FORMAT_IDS["orjson"]):
+            return self._loads_json(body)
+
+        raise CacheError(f"Unknown cache payload format id: {format_id}")
+
+    def dumps_json(self, value: Any) -> str:
+        """Serialize a value to JSON text (for JSONB columns)"""
+        if ORJSON_AVAILABLE:
+            try:
+                return str(
+                    orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS), "utf-8"
+                )
+            except (TypeError, ValueError):
+                pass
+        return json.dumps(value, default=str)
+
+    def _serialize(self, value: Any, format_name: str) -> bytes:
+        """Serialize without header or compression"""
+        if format_name == "msgpack":
+            result: bytes = msgpack.packb(value, default=str, use_bin_type=True)
+            return result
+        if format_name == "orjson":
+            return bytes(
+                orjson.dumps(
+                    value,
+                    default=str,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+        return json.dumps(value, default=str).encode("utf-8")
+
+    @staticmethod
+    def _loads_json(raw: Union[bytes, str]) -> Any:
+        """Parse JSON text, using orjson when available"""
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # json.dumps emits NaN/Infinity, which orjson rejects
+                pass
+        return json.loads(raw)
+
+    def get_info(self) -> Dict[str, Any]:
+        """Describe the active codec configuration"""
+        return {
+            "serializer": self.serializer,
+            "compression": self.compression,
+            "compress_threshold": self.compress_threshold,
+            "compress_level": self.compress_level,
+        }
+
+
+def create_codec_from_settings() -> CacheCodec:
+    """Build a CacheCodec from application settings"""
+    return CacheCodec(
+        serializer=config.settings.cache_codec,
+        compression=config.settings.cache_compression,
+        compress_threshold=config.settings.cache_compression_threshold_bytes,
+        compress_level=config.settings.cache_compression_level,
+    )
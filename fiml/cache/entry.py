@@ -0,0 +1,172 @@
+"""
+Cache Entry - Envelope carrying freshness metadata alongside cached values
+
+Read-through writes store values wrapped in an envelope so readers can tell
+how old an entry is, whether it has passed its soft TTL and how long it took
+to fetch. Values written without an envelope (legacy entries, set_* calls
+without a fetch duration) are treated as fresh.
+
+Negative entries (tombstones) record that no provider could serve a key, so
+repeated lookups of an unknown symbol are answered without calling providers
+again. They carry their own marker and unwrap to None.
+"""
+
+import math
+import random
+import time
+from typing import Any, Dict, Optional
+
+
+class CacheEntry:
+    """
+    Cached value with soft/hard TTL metadata
+
+    - soft_ttl: after this many seconds the value is stale and should be
+      refreshed in the background, but may still be served
+    - hard_ttl: after this many seconds the value is gone (Redis TTL)
+    - fetch_ms: how long producing the value took, used to refresh popular
+      keys probabilistically before their soft TTL (XFetch)
+    """
+
+    MARKER = "__fiml_entry__"
+
+    def __init__(
+        self,
+        value: Any,
+        soft_ttl: int,
+        hard_ttl: int,
+        cached_at: Optional[float] = None,
+        fetch_ms: float = 0.0,
+    ) -> None:
+        self.value = value
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.cached_at = cached_at if cached_at is not None else time.time()
+        self.fetch_ms = max(0.0, fetch_ms)
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        """Seconds since the value was cached"""
+        now = now if now is not None else time.time()
+        return max(0.0, now - self.cached_at)
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        """Whether the value has passed its soft TTL"""
+        return self.age_seconds(now) >= self.soft_ttl
+
+    def ttl_remaining(self, now: Optional[float] = None) -> int:
+        """Seconds until the soft TTL is reached (0 when stale)"""
+        return max(0, int(self.soft_ttl - self.age_seconds(now)))
+
+    def should_refresh_early(
+        self, beta: float = 1.0, now: Optional[float] = None, rand: Optional[float] = None
+    ) -> bool:
+        """
+        XFetch: decide whether this read should refresh a still-fresh value
+
+        The chance rises as the soft TTL approaches and with the fetch
+        duration, so one reader refreshes a hot key before it expires instead
+        of every reader missing at once.
+
+        Args:
+            beta: Eagerness (1.0 is the standard XFetch setting)
+            now: Current time (for testing)
+            rand: Uniform (0, 1] sample (for testing)
+
+        Returns:
+            True if the caller should refresh now
+        """
+        if beta <= 0 or self.fetch_ms <= 0:
+            return False
+
+        remaining = self.soft_ttl - self.age_seconds(now)
+        if remaining <= 0:
+            # Already stale: handled by stale-while-revalidate
+            return False
+
+        sample = rand if rand is not None else 1.0 - random.random()
+        return -(self.fetch_ms / 1000) * beta * math.log(sample) >= remaining
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Serializable representation stored in the cache"""
+        return {
+            self.MARKER: 1,
+            "value": self.value,
+            "cached_at": self.cached_at,
+            "soft_ttl": self.soft_ttl,
+            "hard_ttl": self.hard_ttl,
+            "fetch_ms": self.fetch_ms,
+        }
+
+    def describe(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Freshness summary for API responses"""
+        return {
+            "cached_at": self.cached_at,
+            "age_seconds": round(self.age_seconds(now), 3),
+            "is_stale": self.is_stale(now),
+            "ttl_seconds": self.ttl_remaining(now),
+        }
+
+    @classmethod
+    def from_payload(cls, raw: Any) -> Optional["CacheEntry"]:
+        """Parse an envelope, returning None for values stored without one"""
+        if not isinstance(raw, dict) or raw.get(cls.MARKER) != 1:
+            return None
+
+        try:
+            return cls(
+                value=raw.get("value"),
+                soft_ttl=int(raw["soft_ttl"]),
+                hard_ttl=int(raw["hard_ttl"]),
+                cached_at=float(raw["cached_at"]),
+                fetch_ms=float(raw.get("fetch_ms") or 0.0),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def unwrap(cls, raw: Any) -> Any:
+        """Return the bare value whether or not raw is an envelope (None for tombstones)"""
+        if NegativeEntry.is_negative(raw):
+            return None
+        entry = cls.from_payload(raw)
+        return entry.value if entry is not None else raw
+
+
+class NegativeEntry:
+    """
+    Tombstone for a key that no provider could serve
+
+    Stored under the same key as the data it stands in for, so the first
+    successful write replaces it.
+    """
+
+    MARKER = "__fiml_negative__"
+
+    def __init__(self, reason: str, cached_at: Optional[float] = None) -> None:
+        self.reason = reason
+        self.cached_at = cached_at if cached_at is not None else time.time()
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        """Seconds since the tombstone was written"""
+        now = now if now is not None else time.time()
+        return max(0.0, now - self.cached_at)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Serializable representation stored in the cache"""
+        return {self.MARKER: 1, "reason": self.reason, "cached_at": self.cached_at}
+
+    @classmethod
+    def is_negative(cls, raw: Any) -> bool:
+        """Whether a cached value is a tombstone"""
+        return isinstance(raw, dict) and raw.get(cls.MARKER) == 1
+
+    @classmethod
+    def from_payload(cls, raw: Any) -> Optional["NegativeEntry"]:
+        """Parse a tombstone, returning None for any other value"""
+        if not cls.is_negative(raw):
+            return None
+
+        try:
+            return cls(reason=str(raw.get("reason", "")), cached_at=float(raw["cached_at"]))
+        except (KeyError, TypeError, ValueError):
+            return cls(reason=str(raw.get("reason", "")))
@@ -3,7 +3,8 @@ Cache Eviction Policies
 
 Implements intelligent cache eviction strategies:
 - LRU (Least Recently Used)
-- LFU (Least Frequently Used)
+- LFU (Least Frequently Used) with O(1) frequency buckets
+- W-TinyLFU (window LRU + frequency-sketch admission + segmented LRU)
 - TTL-based eviction
 - Memory pressure-based eviction
 """
@@ -13,6 +14,7 @@ from collections import OrderedDict
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from fiml.cache.sketch import CountMinSketch
 from fiml.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +22,11 @@ logger = get_logger(__name__)
 # Memory pressure threshold constant
 DEFAULT_MEMORY_PRESSURE_THRESHOLD = 0.9  # 90%
 
+# W-TinyLFU segment sizing (fractions of max_entries)
+TINYLFU_WINDOW_FRACTION = 0.01  # Admission window (LRU)
+TINYLFU_PROTECTED_FRACTION = 0.8  # Share of the main region that is protected
+TINYLFU_SAMPLE_FACTOR = 10  # Sketch is aged every max_entries * factor accesses
+
 
 class EvictionPolicy(str, Enum):
     """Cache eviction policy types"""
@@ -29,6 +36,7 @@ class EvictionPolicy(str, Enum):
     TTL = "ttl"  # Time To Live
     FIFO = "fifo"  # First In First Out
     HYBRID = "hybrid"  # Combination of LRU and LFU
+    W_TINYLFU = "w_tinylfu"  # Window LRU + TinyLFU admission + segmented LRU
 
 
 class EvictionTracker:
@@ -37,7 +45,9 @@ class EvictionTracker:
 
     Features:
     - Access time tracking (LRU)
-    - Access frequency tracking (LFU)
+    - Access frequency tracking (LFU), O(1) per access via frequency buckets
+    - W-TinyLFU admission: a new key only displaces the main-region victim
+      if the frequency sketch has seen it more often
     - Memory pressure monitoring
     - Eviction statistics
     """
@@ -49,8 +59,26 @@ class EvictionTracker:
         # LRU tracking - OrderedDict maintains insertion/access order
         self._lru_tracker: OrderedDict[str, float] = OrderedDict()
 
-        # LFU tracking - access counts
+        # LFU tracking - access counts, plus keys grouped by count so the
+        # least frequently used key (oldest first) is found without a scan
         self._lfu_tracker: Dict[str, int] = {}
+        self._freq_buckets: Dict[int, OrderedDict[str, None]] = {}
+        self._min_freq = 0
+
+        # W-TinyLFU tracking - new keys enter the window; window victims must
+        # beat the probation victim's sketch estimate to enter the main region
+        self._window_max = max(1, int(max_entries * TINYLFU_WINDOW_FRACTION))
+        self._main_max = max(0, max_entries - self._window_max)
+        self._protected_max = int(self._main_max * TINYLFU_PROTECTED_FRACTION)
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+        self._sketch: Optional[CountMinSketch] = None
+        self._rejections = 0
+        if policy == EvictionPolicy.W_TINYLFU:
+            self._sketch = CountMinSketch(
+                width=max_entries, sample_size=max_entries * TINYLFU_SAMPLE_FACTOR
+            )
 
         # Statistics
         self._evictions = 0
@@ -80,15 +108,90 @@ class EvictionTracker:
                 self._evictions += 1
 
         elif self.policy == EvictionPolicy.LFU:
-            # Increment access count
-            self._lfu_tracker[key] = self._lfu_tracker.get(key, 0) + 1
-
-            # Limit size by removing least frequently used
-            if len(self._lfu_tracker) > self.max_entries:
-                # Find key with minimum access count
-                min_key = min(self._lfu_tracker, key=lambda k: self._lfu_tracker.get(k, 0))
-                del self._lfu_tracker[min_key]
-                self._evictions += 1
+            self._track_lfu(key)
+
+        elif self.policy == EvictionPolicy.W_TINYLFU:
+            self._track_tinylfu(key)
+
+    def _track_lfu(self, key: str) -> None:
+        """Increment key's count, evicting the least frequently used key if full"""
+        count = self._lfu_tracker.get(key, 0)
+
+        if count:
+            self._unlink_lfu(key, count)
+        elif len(self._lfu_tracker) >= self.max_entries:
+            # Limit size by removing the oldest key among the least frequently used
+            bucket = self._freq_buckets[self._lowest_freq()]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._freq_buckets[self._min_freq]
+            del self._lfu_tracker[victim]
+            self._evictions += 1
+
+        count += 1
+        self._lfu_tracker[key] = count
+        self._freq_buckets.setdefault(count, OrderedDict())[key] = None
+        if count == 1 or count <= self._min_freq:
+            self._min_freq = count
+
+    def _unlink_lfu(self, key: str, count: int) -> None:
+        """Remove key from its frequency bucket"""
+        bucket = self._freq_buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._freq_buckets[count]
+            if count == self._min_freq:
+                self._min_freq = count + 1
+
+    def _lowest_freq(self) -> int:
+        """Smallest populated frequency (re-derived after arbitrary removals)"""
+        if self._min_freq not in self._freq_buckets:
+            self._min_freq = min(self._freq_buckets)
+        return self._min_freq
+
+    def _track_tinylfu(self, key: str) -> None:
+        """Record an access under W-TinyLFU"""
+        assert self._sketch is not None
+        self._sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            # Second hit in the main region: promote, demoting protected's LRU
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_max:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        else:
+            self._window[key] = None
+            if len(self._window) > self._window_max:
+                candidate, _ = self._window.popitem(last=False)
+                self._admit(candidate)
+
+    def _admit(self, candidate: str) -> None:
+        """Move a window victim into the main region if it beats the main victim"""
+        assert self._sketch is not None
+
+        if len(self._probation) + len(self._protected) < self._main_max:
+            self._probation[candidate] = None
+            return
+
+        segment = self._probation if self._probation else self._protected
+        if not segment:
+            # No main region (tiny max_entries): the window victim just leaves
+            self._evictions += 1
+            return
+
+        victim = next(iter(segment))
+        if self._sketch.estimate(candidate) > self._sketch.estimate(victim):
+            del segment[victim]
+            self._probation[candidate] = None
+        else:
+            self._rejections += 1
+        self._evictions += 1
 
     def should_evict(
         self, current_size: int, max_size: int, threshold: Optional[float] = None
@@ -124,9 +227,23 @@ class EvictionTracker:
             return candidates
 
         elif self.policy == EvictionPolicy.LFU:
-            # Return least frequently accessed keys
-            sorted_keys = sorted(self._lfu_tracker.items(), key=lambda x: x[1])
-            candidates = [key for key, _ in sorted_keys[:count]]
+            # Return least frequently accessed keys, walking buckets lowest first
+            candidates = []
+            for freq in sorted(self._freq_buckets):
+                for key in self._freq_buckets[freq]:
+                    if len(candidates) >= count:
+                        return candidates
+                    candidates.append(key)
+            return candidates
+
+        elif self.policy == EvictionPolicy.W_TINYLFU:
+            # Probation is evicted first, then the window, then protected
+            candidates = []
+            for segment in (self._probation, self._window, self._protected):
+                for key in segment:
+                    if len(candidates) >= count:
+                        return candidates
+                    candidates.append(key)
             return candidates
 
         return []
@@ -142,7 +259,10 @@ class EvictionTracker:
             del self._lru_tracker[key]
 
         if key in self._lfu_tracker:
-            del self._lfu_tracker[key]
+            self._unlink_lfu(key, self._lfu_tracker.pop(key))
+
+        for segment in (self._window, self._probation, self._protected):
+            segment.pop(key, None)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -151,18 +271,29 @@ class EvictionTracker:
         Returns:
             Statistics dictionary
         """
-        return {
+        if self.policy == EvictionPolicy.LRU:
+            tracked_keys = len(self._lru_tracker)
+        elif self.policy == EvictionPolicy.W_TINYLFU:
+            tracked_keys = len(self._window) + len(self._probation) + len(self._protected)
+        else:
+            tracked_keys = len(self._lfu_tracker)
+
+        stats: Dict[str, Any] = {
             "policy": self.policy.value,
             "max_entries": self.max_entries,
-            "tracked_keys": (
-                len(self._lru_tracker)
-                if self.policy == EvictionPolicy.LRU
-                else len(self._lfu_tracker)
-            ),
+            "tracked_keys": tracked_keys,
             "total_evictions": self._evictions,
             "total_accesses": self._total_accesses,
         }
 
+        if self.policy == EvictionPolicy.W_TINYLFU:
+            stats["window_keys"] = len(self._window)
+            stats["probation_keys"] = len(self._probation)
+            stats["protected_keys"] = len(self._protected)
+            stats["admission_rejections"] = self._rejections
+
+        return stats
+
     def get_access_info(self, key: str) -> Optional[Dict[str, Any]]:
         """
         Get access information for a specific key
@@ -184,12 +315,29 @@ class EvictionTracker:
             if key in self._lfu_tracker:
                 return {"access_count": self._lfu_tracker[key]}
 
+        elif self.policy == EvictionPolicy.W_TINYLFU and self._sketch is not None:
+            for name, segment in (
+                ("window", self._window),
+                ("probation", self._probation),
+                ("protected", self._protected),
+            ):
+                if key in segment:
+                    return {"access_count": self._sketch.estimate(key), "segment": name}
+
         return None
 
     def clear(self) -> None:
         """Clear all tracking data"""
         self._lru_tracker.clear()
         self._lfu_tracker.clear()
+        self._freq_buckets.clear()
+        self._min_freq = 0
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        if self._sketch is not None:
+            self._sketch.clear()
+        self._rejections = 0
         self._evictions = 0
         self._total_accesses = 0
 
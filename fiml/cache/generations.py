@@ -0,0 +1,183 @@
+"""
+Generation Store - O(1) namespace invalidation through Redis counters
+
+Every cache key that belongs to a namespace (e.g. all data for one symbol)
+embeds that namespace's generation counter. Invalidating the namespace is a
+single INCR: readers build keys for the new generation and never see the old
+entries again, which simply age out through their TTL. This replaces walking
+the keyspace with SCAN and deleting every match.
+
+Workers keep a short-lived local copy of each generation so the counter is
+not read from Redis on every cache access.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class GenerationStore:
+    """
+    Per-namespace generation counters shared through Redis
+
+    Features:
+    - invalidate() is one INCR regardless of how many keys are affected
+    - Batched MGET for the generations of many namespaces
+    - Bounded local copy, trusted for local_ttl_seconds (0 to always read)
+    - Generation 0 keeps the bare key, so nothing changes until the first
+      invalidation
+    - Falls back to the last known generation if Redis is unavailable
+    """
+
+    def __init__(
+        self,
+        key_prefix: str = "fiml:gen",
+        local_ttl_seconds: float = 1.0,
+        max_local_entries: int = 10000,
+    ) -> None:
+        self.key_prefix = key_prefix
+        self.local_ttl_seconds = local_ttl_seconds
+        self.max_local_entries = max(1, max_local_entries)
+
+        # namespace -> (generation, monotonic time it was read)
+        self._local: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._redis: Optional[Any] = None
+
+        # Statistics
+        self.lookups = 0
+        self.local_hits = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    def start(self, redis_client: Any) -> None:
+        """Use redis_client for the shared counters"""
+        self._redis = redis_client
+
+    def counter_key(self, namespace: str) -> str:
+        """Redis key holding a namespace's generation"""
+        return f"{self.key_prefix}:{namespace}"
+
+    @staticmethod
+    def versioned(key: str, generations: Sequence[int]) -> str:
+        """
+        Embed generations into a key
+
+        Args:
+            key: Base cache key
+            generations: Generation of each namespace the key belongs to
+
+        Returns:
+            The bare key while every generation is 0, else key:g<gen>[.<gen>...]
+        """
+        if not any(generations):
+            return key
+        return f"{key}:g{'.'.join(str(generation) for generation in generations)}"
+
+    def _remember(self, namespace: str, generation: int) -> None:
+        self._local[namespace] = (generation, time.monotonic())
+        self._local.move_to_end(namespace)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    def _cached(self, namespace: str) -> Optional[int]:
+        """Locally known generation if it is recent enough to trust"""
+        cached = self._local.get(namespace)
+        if cached is None or time.monotonic() - cached[1] >= self.local_ttl_seconds:
+            return None
+        return cached[0]
+
+    async def get_many(self, namespaces: Sequence[str]) -> Dict[str, int]:
+        """
+        Current generation of each namespace
+
+        Args:
+            namespaces: Namespaces to look up
+
+        Returns:
+            Dict of namespace -> generation
+        """
+        self.lookups += len(namespaces)
+        generations: Dict[str, int] = {}
+        missing: List[str] = []
+        for namespace in dict.fromkeys(namespaces):
+            cached = self._cached(namespace)
+            if cached is None:
+                missing.append(namespace)
+            else:
+                generations[namespace] = cached
+                self.local_hits += 1
+
+        if not missing:
+            return generations
+
+        try:
+            if self._redis is None:
+                return self._last_known(missing, generations)
+            values = await self._redis.mget([self.counter_key(ns) for ns in missing])
+            for namespace, value in zip(missing, values, strict=False):
+                generation = int(value) if value else 0
+                self._remember(namespace, generation)
+                generations[namespace] = generation
+            for namespace in missing:
+                generations.setdefault(namespace, 0)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Generation lookup failed, using last known values: {e}")
+            return self._last_known(missing, generations)
+
+        return generations
+
+    def _last_known(self, namespaces: List[str], generations: Dict[str, int]) -> Dict[str, int]:
+        """Fill in generations from the local copy regardless of age"""
+        for namespace in namespaces:
+            known = self._local.get(namespace)
+            generations[namespace] = known[0] if known else 0
+        return generations
+
+    async def get(self, namespace: str) -> int:
+        """Current generation of a namespace"""
+        return (await self.get_many([namespace]))[namespace]
+
+    async def invalidate(self, *namespaces: str) -> Dict[str, int]:
+        """
+        Move namespaces to a new generation
+
+        Args:
+            namespaces: Namespaces whose keys should stop being served
+
+        Returns:
+            Dict of namespace -> new generation (empty if Redis is unavailable)
+        """
+        if not namespaces or self._redis is None:
+            return {}
+
+        try:
+            async with self._redis.pipeline() as pipe:
+                for namespace in namespaces:
+                    pipe.incr(self.counter_key(namespace))
+                values = await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Generation invalidation failed: {e}", namespaces=list(namespaces))
+            return {}
+
+        generations = {}
+        for namespace, value in zip(namespaces, values, strict=False):
+            generations[namespace] = int(value)
+            self._remember(namespace, int(value))
+        self.invalidations += len(generations)
+        return generations
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get generation lookup statistics"""
+        return {
+            "lookups": self.lookups,
+            "local_hits": self.local_hits,
+            "local_entries": len(self._local),
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
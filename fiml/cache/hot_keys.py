@@ -0,0 +1,280 @@
+"""
+Hot Key Tracker - Cluster-wide approximate top-k of cache accesses
+
+Each worker counts accesses in a count-min sketch and keeps only the
+`capacity` most frequent keys seen since its last flush. Every flush merges
+those counts into a per-time-bucket Redis sorted set that is trimmed to
+`capacity` members and expires after the retention window, so every worker
+reads the same cluster-wide view and memory stays flat regardless of how many
+distinct keys are requested.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from fiml.cache.sketch import CountMinSketch
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class HotKeyTracker:
+    """
+    Bounded heavy-hitter tracking shared through Redis
+
+    Features:
+    - O(1) sketch update per access; the top-k is only touched (an
+      amortized O(log k) heap update) when a key overtakes the current minimum
+    - Per-bucket Redis sorted sets (ZINCRBY + trim + EXPIRE), merged on read
+    - Local bucket history as a fallback when Redis is unavailable
+    - "Top N keys by access rate over the last M minutes" queries
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        bucket_seconds: int = 60,
+        retention_minutes: int = 60,
+        flush_interval_seconds: float = 10.0,
+        key_prefix: str = "fiml:hotkeys",
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.retention_minutes = max(1, retention_minutes)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.key_prefix = key_prefix
+
+        # Counts since the last flush; the sketch is cleared on every flush so
+        # it never needs aging and counters never saturate in practice
+        self._sketch = CountMinSketch(width=self.capacity * 4, sample_size=2**62, max_count=2**62)
+        self._pending: Dict[str, int] = {}
+        # Min-heap of (count, key), one entry per pending key. Counts only
+        # grow, so an entry may lag its key's count; it is fixed when it
+        # reaches the top
+        self._heap: List[Tuple[int, str]] = []
+        self._floor = 0
+
+        # bucket id -> top counts, kept for retention_minutes (local view)
+        self._history: "OrderedDict[int, Dict[str, float]]" = OrderedDict()
+
+        # Shared state
+        self._redis: Optional[Any] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.recorded = 0
+        self.flushes = 0
+        self.flush_errors = 0
+
+    def record(self, key: str) -> None:
+        """Record one access to key"""
+        self.recorded += 1
+        self._sketch.increment(key)
+        count = self._sketch.estimate(key)
+
+        if key in self._pending:
+            self._pending[key] = count
+            return
+        if len(self._pending) < self.capacity:
+            self._pending[key] = count
+            heapq.heappush(self._heap, (count, key))
+            return
+
+        # Space-saving: only replace the weakest key if this one overtook it.
+        # _floor is a lower bound on the pending minimum, so the long tail of
+        # one-off keys is rejected without touching the heap
+        if count <= self._floor:
+            return
+        floor, victim = self._pending_min()
+        if count > floor:
+            heapq.heapreplace(self._heap, (count, key))
+            del self._pending[victim]
+            self._pending[key] = count
+            floor, _ = self._pending_min()
+        self._floor = floor
+
+    def _pending_min(self) -> Tuple[int, str]:
+        """Weakest pending key and its count, refreshing lagging heap entries"""
+        while True:
+            count, key = self._heap[0]
+            current = self._pending[key]
+            if current == count:
+                return count, key
+            heapq.heapreplace(self._heap, (current, key))
+
+    def _bucket(self, now: Optional[float] = None) -> int:
+        """Bucket id for a timestamp"""
+        return int((now if now is not None else time.time()) // self.bucket_seconds)
+
+    def _bucket_key(self, bucket: int) -> str:
+        """Redis key for a bucket"""
+        return f"{self.key_prefix}:{bucket}"
+
+    def _window(self, minutes: int, now: Optional[float] = None) -> List[int]:
+        """Bucket ids covering the last `minutes` minutes, newest last"""
+        current = self._bucket(now)
+        count = max(1, math.ceil(min(minutes, self.retention_minutes) * 60 / self.bucket_seconds))
+        return list(range(current - count + 1, current + 1))
+
+    def _drain(self, now: Optional[float] = None) -> Tuple[int, Dict[str, int]]:
+        """Move pending counts into the local history and reset the sketch"""
+        bucket = self._bucket(now)
+        snapshot = self._pending
+        self._pending = {}
+        self._heap = []
+        self._floor = 0
+        self._sketch.clear()
+
+        if snapshot:
+            counts = self._history.setdefault(bucket, {})
+            for key, count in snapshot.items():
+                counts[key] = counts.get(key, 0) + count
+            if len(counts) > self.capacity:
+                top = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+                self._history[bucket] = dict(top[: self.capacity])
+
+        oldest = self._window(self.retention_minutes, now)[0]
+        while self._history and next(iter(self._history)) < oldest:
+            self._history.popitem(last=False)
+
+        return bucket, snapshot
+
+    async def flush(self, now: Optional[float] = None) -> int:
+        """
+        Publish counts gathered since the last flush
+
+        Args:
+            now: Current time (for testing)
+
+        Returns:
+            Number of keys flushed
+        """
+        bucket, snapshot = self._drain(now)
+        if not snapshot or self._redis is None:
+            return len(snapshot)
+
+        bucket_key = self._bucket_key(bucket)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, count in snapshot.items():
+                    pipe.zincrby(bucket_key, count, key)
+                # Keep only the top `capacity` members of the bucket
+                pipe.zremrangebyrank(bucket_key, 0, -(self.capacity + 1))
+                pipe.expire(bucket_key, self.retention_minutes * 60 + self.bucket_seconds)
+                await pipe.execute()
+            self.flushes += 1
+        except Exception as e:
+            # The local history still has these counts
+            self.flush_errors += 1
+            logger.warning(f"Hot key flush failed: {e}", keys=len(snapshot))
+
+        return len(snapshot)
+
+    async def top(
+        self, n: int = 10, minutes: int = 15, now: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Most accessed keys over the last `minutes` minutes
+
+        Uses the cluster-wide Redis buckets when connected, otherwise this
+        worker's local history. Counts not yet flushed are included.
+
+        Args:
+            n: Number of keys to return
+            minutes: Lookback window (capped at retention_minutes)
+            now: Current time (for testing)
+
+        Returns:
+            List of (key, accesses per minute) tuples, highest first
+        """
+        buckets = self._window(minutes, now)
+        totals: Dict[str, float] = {}
+
+        merged = False
+        if self._redis is not None:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for bucket in buckets:
+                        pipe.zrevrange(
+                            self._bucket_key(bucket), 0, self.capacity - 1, withscores=True
+                        )
+                    results = await pipe.execute()
+                for members in results:
+                    for member, score in members or []:
+                        key = member.decode() if isinstance(member, bytes) else str(member)
+                        totals[key] = totals.get(key, 0.0) + float(score)
+                merged = True
+            except Exception as e:
+                logger.warning(f"Hot key read failed, using local view: {e}")
+                totals.clear()
+
+        if not merged:
+            for bucket in buckets:
+                for key, count in self._history.get(bucket, {}).items():
+                    totals[key] = totals.get(key, 0.0) + count
+
+        for key, count in self._pending.items():
+            totals[key] = totals.get(key, 0.0) + count
+
+        window_minutes = len(buckets) * self.bucket_seconds / 60
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:n]
+        return [(key, round(count / window_minutes, 3)) for key, count in ranked]
+
+    def start(self, redis_client: Any) -> None:
+        """
+        Share counts through Redis and flush them periodically
+
+        Args:
+            redis_client: Connected redis.asyncio client
+        """
+        self._redis = redis_client
+        if self._flush_task is not None:
+            return
+
+        async def flush_loop() -> None:
+            while True:
+                await asyncio.sleep(self.flush_interval_seconds)
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.warning(f"Hot key flush loop error: {e}")
+
+        self._flush_task = asyncio.create_task(flush_loop())
+        logger.info("Hot key tracking started", capacity=self.capacity)
+
+    async def stop(self) -> None:
+        """Stop periodic flushing after a final flush"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+
+        if self._redis is not None:
+            await self.flush()
+        self._redis = None
+
+    def clear(self) -> None:
+        """Drop all local counts"""
+        self._pending.clear()
+        self._heap.clear()
+        self._floor = 0
+        self._sketch.clear()
+        self._history.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker statistics"""
+        return {
+            "capacity": self.capacity,
+            "pending_keys": len(self._pending),
+            "history_buckets": len(self._history),
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors,
+            "shared": self._redis is not None,
+        }
@@ -0,0 +1,246 @@
+"""
+L0 Cache - In-Process Near-Cache
+Target: <1ms latency
+
+Sits in front of the Redis L1 cache inside each worker process. Entries are
+bounded in number and lifetime, evicted LRU, and invalidated across replicas
+through a Redis pub/sub channel.
+"""
+
+import asyncio
+import contextlib
+import fnmatch
+import json
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class L0Cache:
+    """
+    Bounded in-process cache with TTL and LRU eviction
+
+    Features:
+    - Sub-millisecond lookups for hot keys
+    - Per-entry TTL capped by a global maximum
+    - LRU eviction once max_entries is reached
+    - Values stored serialized so callers always get a private copy
+    - Cross-replica invalidation via Redis pub/sub
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_ttl_seconds: int = 5,
+        channel: str = "fiml:cache:invalidate",
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        self.channel = channel
+
+        # Unique id so a worker ignores its own invalidation messages
+        self.instance_id = uuid.uuid4().hex
+
+        # key -> (expires_at monotonic, serialized value)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        # Invalidation listener state
+        self._pubsub: Optional[Any] = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from the near-cache
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing/expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(payload)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        Set value in the near-cache
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be JSON serializable)
+            ttl_seconds: Requested TTL, capped at max_ttl_seconds
+
+        Returns:
+            True if stored
+        """
+        if value is None:
+            return False
+
+        ttl = min(ttl_seconds, self.max_ttl_seconds) if ttl_seconds else self.max_ttl_seconds
+        if ttl <= 0:
+            return False
+
+        try:
+            payload = json.dumps(value, default=str)
+        except Exception as e:
+            logger.error(f"L0 cache serialization error: {e}", key=key)
+            return False
+
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Delete key from the near-cache"""
+        return self._entries.pop(key, None) is not None
+
+    def invalidate(self, keys: Optional[List[str]] = None, pattern: Optional[str] = None) -> int:
+        """
+        Invalidate keys locally
+
+        Args:
+            keys: Exact keys to drop
+            pattern: Glob pattern (e.g., "*:AAPL:*") to drop
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+
+        for key in keys or []:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+
+        if pattern:
+            matching = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in matching:
+                del self._entries[key]
+            removed += len(matching)
+
+        self.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def build_invalidation_message(
+        self, keys: Optional[List[str]] = None, pattern: Optional[str] = None
+    ) -> str:
+        """Build a pub/sub invalidation payload originating from this instance"""
+        return json.dumps({"origin": self.instance_id, "keys": keys or [], "pattern": pattern})
+
+    def handle_invalidation_message(self, data: Any) -> int:
+        """
+        Apply an invalidation message received from the pub/sub channel
+
+        Messages published by this instance are ignored, since the local
+        entry was already updated by the write that triggered them.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            message = json.loads(data)
+        except Exception as e:
+            logger.warning(f"Invalid L0 invalidation message: {e}")
+            return 0
+
+        if not isinstance(message, dict) or message.get("origin") == self.instance_id:
+            return 0
+
+        return self.invalidate(keys=message.get("keys"), pattern=message.get("pattern"))
+
+    async def start_invalidation_listener(self, redis_client: Any) -> None:
+        """
+        Subscribe to the invalidation channel and apply remote invalidations
+
+        Args:
+            redis_client: Connected redis.asyncio client
+        """
+        if self._listener_task is not None:
+            return
+
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        self._pubsub = pubsub
+
+        async def listen_loop() -> None:
+            while True:
+                try:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self.handle_invalidation_message(message.get("data"))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Connection hiccup: drop everything rather than serve stale data
+                    logger.warning(f"L0 invalidation listener error: {e}")
+                    self.clear()
+                    await asyncio.sleep(1.0)
+
+        self._listener_task = asyncio.create_task(listen_loop())
+        logger.info("L0 invalidation listener started", channel=self.channel)
+
+    async def stop_invalidation_listener(self) -> None:
+        """Stop the invalidation listener"""
+        if self._listener_task:
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
+            self._listener_task = None
+
+        if self._pubsub is not None:
+            with contextlib.suppress(Exception):
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            self._pubsub = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get near-cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "max_ttl_seconds": self.max_ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_percent": round(self.hits / total * 100, 2) if total > 0 else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "listening": self._listener_task is not None,
+        }
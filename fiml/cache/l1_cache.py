@@ -3,14 +3,18 @@ L1 Cache - Redis In-Memory Cache
 Target: 10-100ms latency
 """
 
-import json
+import heapq
 from collections import defaultdict
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import redis.asyncio as redis
 
+from fiml.cache.codec import CacheCodec, create_codec_from_settings
 from fiml.cache.eviction import EvictionPolicy
+from fiml.cache.generations import GenerationStore
+from fiml.cache.hot_keys import HotKeyTracker
+from fiml.cache.utils import jitter_ttl
 from fiml.core import config
 from fiml.core.exceptions import CacheError
 from fiml.core.logging import get_logger
@@ -25,34 +29,64 @@ class L1Cache:
     Features:
     - 10-100ms latency target
     - Automatic TTL management
-    - JSON serialization
+    - Pluggable serialization (JSON, orjson, msgpack, optional zstd)
     - Connection pooling
     - LFU/LRU/Hybrid eviction policies
     - Protected keys (never evicted)
     - Access frequency tracking
+    - O(1) per-symbol invalidation through generation counters, with an
+      optional tag index for eager purges
     """
 
     def __init__(
         self,
         eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
         protected_patterns: Optional[List[str]] = None,
+        codec: Optional[CacheCodec] = None,
     ) -> None:
         self._redis: Optional[redis.Redis] = None
+        self.codec = codec or create_codec_from_settings()
         self._initialized = False
         self.eviction_policy = eviction_policy
         self.protected_patterns = protected_patterns or []
 
-        # LFU tracking (in-memory, synced to Redis)
+        # LFU tracking (in-memory, capped at cache_max_tracked_entries)
         self._access_counts: Dict[str, int] = defaultdict(int)
         self._last_access: Dict[str, datetime] = {}
         self._protected_keys: Set[str] = set()
 
+        # Cluster-wide access counts shared through Redis
+        self.hot_keys = HotKeyTracker(
+            capacity=config.settings.cache_hot_keys_capacity,
+            bucket_seconds=config.settings.cache_hot_keys_bucket_seconds,
+            retention_minutes=config.settings.cache_hot_keys_retention_minutes,
+            flush_interval_seconds=config.settings.cache_hot_keys_flush_interval_seconds,
+        )
+
+        # Per-namespace generations embedded in keys (invalidation is one INCR)
+        self.generations = GenerationStore(
+            local_ttl_seconds=config.settings.cache_generation_local_ttl_seconds,
+            max_local_entries=config.settings.cache_generation_max_local_entries,
+        )
+        self.tag_prefix = "fiml:tag"
+
         # Eviction statistics
         self._eviction_count = 0
         self._eviction_log: List[Dict[str, Any]] = []
 
-    async def initialize(self) -> None:
-        """Initialize Redis connection pool"""
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        """Redis client once the cache is initialized, else None"""
+        return self._redis if self._initialized else None
+
+    async def initialize(self, client: Optional[redis.Redis] = None) -> None:
+        """
+        Initialize Redis connection pool
+
+        Args:
+            client: Use an existing client (decode_responses=False) instead of
+                connecting from settings, e.g. fakeredis in benchmarks
+        """
         if self._initialized:
             logger.warning("L1 cache already initialized")
             return
@@ -61,12 +95,13 @@ class L1Cache:
             # Configure Redis eviction policy
             maxmemory_policy = self._get_redis_eviction_policy()
 
-            self._redis = redis.Redis(
+            self._redis = client or redis.Redis(
                 host=config.settings.redis_host,
                 port=config.settings.redis_port,
                 db=config.settings.redis_db,
                 password=config.settings.redis_password,
-                decode_responses=True,
+                # Payloads may be binary (msgpack/zstd); the codec decodes them
+                decode_responses=False,
                 max_connections=config.settings.redis_max_connections,
                 socket_timeout=config.settings.redis_socket_timeout,
             )
@@ -76,8 +111,15 @@ class L1Cache:
             if not ping_result:
                 raise CacheError("Redis ping failed")
 
-            # Configure Redis eviction policy
-            await self._redis.config_set("maxmemory-policy", maxmemory_policy)
+            # Configure Redis eviction policy (managed Redis may refuse CONFIG)
+            try:
+                await self._redis.config_set("maxmemory-policy", maxmemory_policy)
+            except Exception as e:
+                logger.warning(f"Could not set Redis maxmemory-policy: {e}")
+
+            if config.settings.cache_hot_keys_enabled:
+                self.hot_keys.start(self._redis)
+            self.generations.start(self._redis)
 
             self._initialized = True
             logger.info(
@@ -95,6 +137,7 @@ class L1Cache:
     async def shutdown(self) -> None:
         """Close Redis connections"""
         if self._redis:
+            await self.hot_keys.stop()
             await self._redis.aclose()
             self._initialized = False
             logger.info("L1 cache shutdown")
@@ -119,8 +162,7 @@ class L1Cache:
                 self._track_access(key)
 
                 logger.debug("L1 cache hit", key=key)
-                result: Any = json.loads(value)
-                return result
+                return self.codec.decode(value)
             else:
                 logger.debug("L1 cache miss", key=key)
                 return None
@@ -129,7 +171,9 @@ class L1Cache:
             logger.error(f"L1 cache get error: {e}", key=key)
             return None
 
-    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+    async def set(
+        self, key: str, value: Any, ttl_seconds: Optional[int] = None, nx: bool = False
+    ) -> bool:
         """
         Set value in cache with optional TTL
 
@@ -137,17 +181,21 @@ class L1Cache:
             key: Cache key
             value: Value to cache (must be JSON serializable)
             ttl_seconds: Time to live in seconds
+            nx: Only write if the key does not exist
 
         Returns:
-            True if successful
+            True if successful (False if nx and the key exists)
         """
         if not self._initialized or self._redis is None:
             raise CacheError("L1 cache not initialized")
 
         try:
-            serialized = json.dumps(value, default=str)
+            serialized = self.codec.encode(value)
 
-            if ttl_seconds:
+            if nx:
+                if not await self._redis.set(key, serialized, ex=ttl_seconds or None, nx=True):
+                    return False
+            elif ttl_seconds:
                 await self._redis.setex(key, ttl_seconds, serialized)
             else:
                 await self._redis.set(key, serialized)
@@ -196,6 +244,34 @@ class L1Cache:
             logger.error(f"L1 cache get_ttl error: {e}", key=key)
             return None
 
+    async def get_ttls(self, keys: List[str]) -> List[Optional[int]]:
+        """
+        Remaining TTLs for many keys in one round trip
+
+        Args:
+            keys: List of cache keys
+
+        Returns:
+            TTL in seconds per key: -1 if the key never expires, None if it
+            does not exist (or the lookup failed)
+        """
+        if not self._initialized or self._redis is None:
+            raise CacheError("L1 cache not initialized")
+
+        if not keys:
+            return []
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+        except Exception as e:
+            logger.error(f"L1 cache get_ttls error: {e}")
+            return [None] * len(keys)
+
+        return [None if ttl is None or ttl == -2 else int(ttl) for ttl in ttls]
+
     async def clear_pattern(self, pattern: str) -> int:
         """
         Delete all keys matching pattern
@@ -224,6 +300,151 @@ class L1Cache:
             logger.error(f"L1 cache clear_pattern error: {e}", pattern=pattern)
             return 0
 
+    @staticmethod
+    def symbol_namespace(symbol: str) -> str:
+        """Generation/tag namespace holding every key for a symbol"""
+        return f"symbol:{symbol.upper()}"
+
+    async def versioned_key(self, key: str, *namespaces: str) -> str:
+        """
+        Embed the current generation of each namespace into a key
+
+        Args:
+            key: Base cache key
+            namespaces: Namespaces the key belongs to
+
+        Returns:
+            Key for the current generations (the bare key until the first
+            invalidation, or when generation invalidation is disabled)
+        """
+        return (await self.versioned_keys([key], [namespaces]))[0]
+
+    async def versioned_keys(self, keys: List[str], namespaces: List[Sequence[str]]) -> List[str]:
+        """
+        Embed generations into many keys with a single lookup
+
+        Args:
+            keys: Base cache keys
+            namespaces: Namespaces of each key
+
+        Returns:
+            Versioned keys, in order
+        """
+        if not config.settings.cache_generation_invalidation_enabled:
+            return list(keys)
+
+        generations = await self.generations.get_many(
+            [namespace for key_namespaces in namespaces for namespace in key_namespaces]
+        )
+        return [
+            self.generations.versioned(key, [generations[ns] for ns in key_namespaces])
+            for key, key_namespaces in zip(keys, namespaces, strict=False)
+        ]
+
+    async def invalidate_namespaces(self, *namespaces: str) -> Dict[str, int]:
+        """
+        Stop serving every key in the given namespaces with one INCR each
+
+        Old entries are orphaned and expire through their TTL.
+
+        Args:
+            namespaces: Namespaces to invalidate
+
+        Returns:
+            Dict of namespace -> new generation
+        """
+        if not self._initialized or self._redis is None:
+            raise CacheError("L1 cache not initialized")
+
+        generations = await self.generations.invalidate(*namespaces)
+        logger.info("L1 namespaces invalidated", generations=generations)
+        return generations
+
+    def tag_key(self, namespace: str) -> str:
+        """Redis set listing the keys written under a namespace"""
+        return f"{self.tag_prefix}:{namespace}"
+
+    async def index_tags(self, items: List[Tuple[str, Sequence[str], Optional[int]]]) -> None:
+        """
+        Record written keys in their namespaces' tag sets (cache_tag_index_enabled)
+
+        Args:
+            items: List of (key, namespaces, ttl_seconds) tuples
+        """
+        if (
+            not items
+            or not config.settings.cache_tag_index_enabled
+            or not self._initialized
+            or self._redis is None
+        ):
+            return
+
+        tag_ttls: Dict[str, int] = {}
+        min_ttl = config.settings.cache_tag_index_ttl_seconds
+        try:
+            async with self._redis.pipeline() as pipe:
+                for key, namespaces, ttl_seconds in items:
+                    for namespace in namespaces:
+                        tag_key = self.tag_key(namespace)
+                        pipe.sadd(tag_key, key)
+                        tag_ttls[tag_key] = max(tag_ttls.get(tag_key, 0), ttl_seconds or 0)
+                for tag_key, ttl_seconds in tag_ttls.items():
+                    pipe.expire(tag_key, max(ttl_seconds, min_ttl))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"L1 tag index error: {e}")
+
+    async def purge_tag(self, namespace: str, chunk_size: int = 500) -> int:
+        """
+        Eagerly delete every indexed key of a namespace
+
+        Only keys written while cache_tag_index_enabled was on are known.
+
+        Args:
+            namespace: Namespace to purge
+            chunk_size: Keys per DEL command
+
+        Returns:
+            Number of keys deleted
+        """
+        if not self._initialized or self._redis is None:
+            raise CacheError("L1 cache not initialized")
+
+        tag_key = self.tag_key(namespace)
+        try:
+            members = list(await self._redis.smembers(tag_key))
+            deleted = 0
+            for start in range(0, len(members), chunk_size):
+                deleted += int(await self._redis.delete(*members[start : start + chunk_size]))
+            await self._redis.delete(tag_key)
+            logger.info("L1 cache purged tag", namespace=namespace, count=deleted)
+            return deleted
+
+        except Exception as e:
+            logger.error(f"L1 cache purge_tag error: {e}", namespace=namespace)
+            return 0
+
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message on a Redis pub/sub channel
+
+        Args:
+            channel: Channel name
+            message: Message payload
+
+        Returns:
+            Number of subscribers that received the message
+        """
+        if not self._initialized or self._redis is None:
+            return 0
+
+        try:
+            receivers = await self._redis.publish(channel, message)
+            return int(receivers) if receivers else 0
+        except Exception as e:
+            logger.warning(f"L1 cache publish error: {e}", channel=channel)
+            return 0
+
     async def get_stats(self) -> dict:
         """Get cache statistics"""
         if not self._initialized or self._redis is None:
@@ -254,12 +475,13 @@ class L1Cache:
         """Build cache key from parts"""
         return ":".join(str(part) for part in parts)
 
-    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+    async def get_many(self, keys: List[str], track_access: bool = True) -> List[Optional[Any]]:
         """
         Get multiple values from cache in a single operation (pipeline optimization)
 
         Args:
             keys: List of cache keys
+            track_access: Count the reads as accesses (off for maintenance reads)
 
         Returns:
             List of cached values (None for missing keys)
@@ -281,7 +503,9 @@ class L1Cache:
             for key, value in zip(keys, values, strict=False):
                 if value:
                     try:
-                        results.append(json.loads(value))
+                        results.append(self.codec.decode(value))
+                        if track_access:
+                            self._track_access(key)
                         logger.debug("L1 cache hit", key=key)
                     except Exception as e:
                         logger.error(f"L1 cache parse error: {e}", key=key)
@@ -296,12 +520,20 @@ class L1Cache:
             logger.error(f"L1 cache get_many error: {e}")
             return [None] * len(keys)
 
-    async def set_many(self, items: List[tuple[str, Any, Optional[int]]]) -> int:
+    async def set_many(
+        self,
+        items: List[tuple[str, Any, Optional[int]]],
+        jitter_fraction: Optional[float] = None,
+    ) -> int:
         """
         Set multiple values in cache in a single operation (pipeline optimization)
 
+        TTLs are jittered so keys written in one batch do not expire together.
+
         Args:
             items: List of (key, value, ttl_seconds) tuples
+            jitter_fraction: Relative TTL spread (default: cache_ttl_jitter_fraction,
+                0 to keep TTLs exact)
 
         Returns:
             Number of successfully set items
@@ -312,12 +544,16 @@ class L1Cache:
         if not items:
             return 0
 
+        if jitter_fraction is None:
+            jitter_fraction = config.settings.cache_ttl_jitter_fraction
+
         try:
             # Use pipeline for batch set operations
             async with self._redis.pipeline() as pipe:
                 for key, value, ttl_seconds in items:
                     try:
-                        serialized = json.dumps(value, default=str)
+                        serialized = self.codec.encode(value)
+                        ttl_seconds = jitter_ttl(ttl_seconds, jitter_fraction)
                         if ttl_seconds:
                             pipe.setex(key, ttl_seconds, serialized)
                         else:
@@ -339,7 +575,8 @@ class L1Cache:
         """Map our eviction policy to Redis config"""
         if self.eviction_policy == EvictionPolicy.LRU:
             return "allkeys-lru"
-        elif self.eviction_policy == EvictionPolicy.LFU:
+        elif self.eviction_policy in (EvictionPolicy.LFU, EvictionPolicy.W_TINYLFU):
+            # Redis LFU uses decaying counters, the closest server-side match
             return "allkeys-lfu"
         else:  # HYBRID
             return "volatile-lfu"  # LFU for keys with TTL
@@ -348,6 +585,35 @@ class L1Cache:
         """Track key access for LFU policy"""
         self._access_counts[key] += 1
         self._last_access[key] = datetime.now(UTC)
+        self.hot_keys.record(key)
+
+        if len(self._access_counts) > config.settings.cache_max_tracked_entries:
+            self._prune_access_tracking()
+
+    def _prune_access_tracking(self) -> None:
+        """Keep the most accessed half of the tracked keys so memory stays bounded"""
+        keep = heapq.nlargest(
+            config.settings.cache_max_tracked_entries // 2,
+            self._access_counts.items(),
+            key=lambda item: item[1],
+        )
+        self._access_counts = defaultdict(int, keep)
+        self._last_access = {
+            key: self._last_access[key] for key, _ in keep if key in self._last_access
+        }
+
+    async def get_hot_keys(self, n: int = 10, minutes: int = 15) -> List[Tuple[str, float]]:
+        """
+        Most accessed keys across all workers
+
+        Args:
+            n: Number of keys to return
+            minutes: Lookback window
+
+        Returns:
+            List of (key, accesses per minute) tuples, highest first
+        """
+        return await self.hot_keys.top(n=n, minutes=minutes)
 
     def protect_key(self, key: str) -> None:
         """
@@ -408,6 +674,9 @@ class L1Cache:
         # Sort keys by access count (ascending)
         sorted_keys = sorted(self._access_counts.items(), key=lambda x: x[1])
 
+        # Keys hot on other workers may be rarely read by this one
+        cluster_hot = {key for key, _ in await self.hot_keys.top(n=self.hot_keys.capacity)}
+
         evicted = 0
         for key, access_count in sorted_keys[:count]:
             # Skip protected keys
@@ -415,6 +684,10 @@ class L1Cache:
                 logger.debug("Skipping eviction of protected key", key=key)
                 continue
 
+            if key in cluster_hot:
+                logger.debug("Skipping eviction of cluster-hot key", key=key)
+                continue
+
             # Check if key still exists
             if await self.exists(key):
                 success = await self.delete(key)
@@ -461,6 +734,18 @@ class L1Cache:
             "eviction_policy": self.eviction_policy.value,
         }
 
+    def get_most_accessed(self, n: int = 10) -> List[Tuple[str, int]]:
+        """
+        Most accessed keys seen by this worker
+
+        Args:
+            n: Number of keys to return
+
+        Returns:
+            List of (key, access count) tuples, highest first
+        """
+        return heapq.nlargest(n, self._access_counts.items(), key=lambda item: item[1])
+
     def get_access_stats(self) -> Dict[str, Any]:
         """Get access frequency statistics"""
         if not self._access_counts:
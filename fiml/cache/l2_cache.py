@@ -3,8 +3,8 @@ L2 Cache - PostgreSQL + TimescaleDB Persistent Cache
 Target: 300-700ms latency
 """
 
-import json
-from typing import Any, Dict, List, Optional
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -14,12 +14,60 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from fiml.cache.analytics import cache_analytics
+from fiml.cache.codec import CacheCodec, create_codec_from_settings
+from fiml.cache.ohlcv_range import timeframe_to_seconds
+from fiml.cache.resample import UTC_SESSION, SessionAlignment, resample_candles
+from fiml.cache.write_behind import L2WriteBuffer, PendingWrite
 from fiml.core import config
 from fiml.core.exceptions import CacheError
 from fiml.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# TimescaleDB continuous aggregates over 1m candles (see scripts/init-db.sql)
+_CONTINUOUS_AGGREGATES: Dict[Tuple[str, str], str] = {
+    ("1m", "1h"): "ohlcv_cache_1h",
+    ("1m", "1d"): "ohlcv_cache_1d",
+}
+
+# Multi-row insert templates for write-behind flushes: (columns, conflict clause)
+_BATCH_INSERTS: Dict[str, Tuple[List[str], str]] = {
+    "price_cache": (
+        [
+            "time",
+            "asset_id",
+            "provider",
+            "price",
+            "change",
+            "change_percent",
+            "volume",
+            "confidence",
+            "session_metadata",
+        ],
+        "ON CONFLICT (time, asset_id, provider) DO NOTHING",
+    ),
+    "fundamentals_cache": (
+        ["asset_id", "provider", "data", "timestamp", "ttl_seconds"],
+        """ON CONFLICT (asset_id, provider)
+        DO UPDATE SET
+            data = EXCLUDED.data,
+            timestamp = EXCLUDED.timestamp,
+            ttl_seconds = EXCLUDED.ttl_seconds""",
+    ),
+    "generic_cache": (
+        ["key", "value", "timestamp", "ttl_seconds"],
+        """ON CONFLICT (key)
+        DO UPDATE SET
+            value = EXCLUDED.value,
+            timestamp = EXCLUDED.timestamp,
+            ttl_seconds = EXCLUDED.ttl_seconds""",
+    ),
+}
+
+# PostgreSQL allows at most 32767 bind parameters per statement
+_MAX_BIND_PARAMS = 32767
+
 
 class L2Cache:
     """
@@ -30,13 +78,20 @@ class L2Cache:
     - Time-series optimized with TimescaleDB
     - Automatic data retention policies
     - Historical data queries
+    - Optional write-behind batching of set_price/set_fundamentals/set
     """
 
-    def __init__(self) -> None:
+    def __init__(self, codec: Optional[CacheCodec] = None) -> None:
         self._engine: Optional[AsyncEngine] = None
         self._session_maker: Optional[async_sessionmaker[AsyncSession]] = None
         self._initialized = False
 
+        # JSONB columns stay JSON; the codec only provides fast JSON text encoding
+        self.codec = codec or create_codec_from_settings()
+
+        # Write-behind buffer (started in initialize() when enabled)
+        self._write_buffer: Optional[L2WriteBuffer] = None
+
     async def initialize(self) -> None:
         """Initialize PostgreSQL connection pool"""
         if self._initialized:
@@ -65,17 +120,144 @@ class L2Cache:
             self._initialized = True
             logger.info("L2 cache initialized", url=config.settings.database_url.split("@")[-1])
 
+            if config.settings.cache_l2_write_behind_enabled:
+                await self.start_write_behind()
+
         except Exception as e:
             logger.error(f"Failed to initialize L2 cache: {e}")
             raise CacheError(f"L2 cache initialization failed: {e}")
 
     async def shutdown(self) -> None:
         """Close database connections"""
+        await self.stop_write_behind()
+
         if self._engine:
             await self._engine.dispose()
             self._initialized = False
             logger.info("L2 cache shutdown")
 
+    async def get_asset_id(self, symbol: str, market: str) -> Optional[int]:
+        """
+        Look up the assets.id for a symbol on a market
+
+        Args:
+            symbol: Asset symbol
+            market: Market code (e.g. 'US', 'CRYPTO')
+
+        Returns:
+            Asset ID or None if the asset is unknown
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        try:
+            async with self._session_maker() as session:
+                query = text(
+                    """
+                    SELECT id
+                    FROM assets
+                    WHERE symbol = :symbol AND market = :market
+                    ORDER BY id
+                    LIMIT 1
+                """
+                )
+
+                result = await session.execute(query, {"symbol": symbol, "market": market})
+                row = result.fetchone()
+                return int(row[0]) if row else None
+
+        except Exception as e:
+            logger.error(f"L2 cache get_asset_id error: {e}", symbol=symbol)
+            return None
+
+    async def create_asset(
+        self,
+        symbol: str,
+        market: str,
+        asset_type: str,
+        name: Optional[str] = None,
+        exchange: Optional[str] = None,
+        currency: str = "USD",
+    ) -> Optional[int]:
+        """
+        Get the assets.id for a symbol on a market, inserting the asset if needed
+
+        Returns:
+            Asset ID or None on error
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        try:
+            async with self._session_maker() as session:
+                # UNIQUE(symbol, market, exchange) does not cover NULL exchanges,
+                # so reuse any existing row for the symbol/market first
+                query = text(
+                    """
+                    WITH existing AS (
+                        SELECT id FROM assets
+                        WHERE symbol = :symbol AND market = :market
+                        ORDER BY id
+                        LIMIT 1
+                    ), inserted AS (
+                        INSERT INTO assets (symbol, name, asset_type, market, exchange, currency)
+                        SELECT :symbol, :name, CAST(:asset_type AS asset_type), :market,
+                               :exchange, :currency
+                        WHERE NOT EXISTS (SELECT 1 FROM existing)
+                        ON CONFLICT DO NOTHING
+                        RETURNING id
+                    )
+                    SELECT id FROM existing
+                    UNION ALL
+                    SELECT id FROM inserted
+                """
+                )
+
+                result = await session.execute(
+                    query,
+                    {
+                        "symbol": symbol,
+                        "market": market,
+                        "asset_type": asset_type,
+                        "name": name,
+                        "exchange": exchange,
+                        "currency": currency,
+                    },
+                )
+                row = result.fetchone()
+                await session.commit()
+
+                if row:
+                    return int(row[0])
+
+            # Lost an insert race on (symbol, market, exchange): read the winner
+            return await self.get_asset_id(symbol, market)
+
+        except Exception as e:
+            logger.error(f"L2 cache create_asset error: {e}", symbol=symbol)
+            return None
+
+    async def load_asset_ids(self) -> List[Tuple[int, str, str]]:
+        """
+        Load every known asset for index preloading
+
+        Returns:
+            List of (asset_id, symbol, market) tuples ordered by id
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        try:
+            async with self._session_maker() as session:
+                result = await session.execute(
+                    text("SELECT id, symbol, market FROM assets ORDER BY id")
+                )
+                return [(int(row[0]), row[1], row[2]) for row in result.fetchall()]
+
+        except Exception as e:
+            logger.error(f"L2 cache load_asset_ids error: {e}")
+            return []
+
     async def get_price(
         self,
         asset_id: int,
@@ -101,11 +283,11 @@ class L2Cache:
                 query = text(
                     """
                     SELECT time, asset_id, provider, price, change, change_percent,
-                           volume, confidence, metadata
+                           volume, confidence, session_metadata
                     FROM price_cache
                     WHERE asset_id = :asset_id
-                        AND time >= NOW() - INTERVAL ':minutes minutes'
-                        AND (:provider IS NULL OR provider = :provider)
+                        AND time >= NOW() - INTERVAL '1 minute' * :minutes
+                        AND (CAST(:provider AS VARCHAR) IS NULL OR provider = :provider)
                     ORDER BY time DESC
                     LIMIT 1
                 """
@@ -154,13 +336,36 @@ class L2Cache:
         if not self._initialized or self._session_maker is None:
             raise CacheError("L2 cache not initialized")
 
+        metadata_json = self.codec.dumps_json(metadata) if metadata is not None else None
+
+        if self._write_buffer is not None:
+            now = datetime.now(UTC)
+            await self._write_buffer.enqueue(
+                PendingWrite(
+                    "price_cache",
+                    {
+                        "time": now,
+                        "asset_id": asset_id,
+                        "provider": provider,
+                        "price": price,
+                        "change": change,
+                        "change_percent": change_percent,
+                        "volume": volume,
+                        "confidence": confidence,
+                        "session_metadata": metadata_json,
+                    },
+                    key=(now, asset_id, provider),
+                )
+            )
+            return True
+
         try:
             async with self._session_maker() as session:
                 query = text(
                     """
                     INSERT INTO price_cache
                     (time, asset_id, provider, price, change, change_percent,
-                     volume, confidence, metadata)
+                     volume, confidence, session_metadata)
                     VALUES (NOW(), :asset_id, :provider, :price, :change,
                             :change_percent, :volume, :confidence, :metadata)
                 """
@@ -176,7 +381,7 @@ class L2Cache:
                         "change_percent": change_percent,
                         "volume": volume,
                         "confidence": confidence,
-                        "metadata": metadata,
+                        "metadata": metadata_json,
                     },
                 )
 
@@ -208,7 +413,7 @@ class L2Cache:
                     FROM ohlcv_cache
                     WHERE asset_id = :asset_id
                         AND timeframe = :timeframe
-                        AND (:provider IS NULL OR provider = :provider)
+                        AND (CAST(:provider AS VARCHAR) IS NULL OR provider = :provider)
                     ORDER BY time DESC
                     LIMIT :limit
                 """
@@ -244,6 +449,301 @@ class L2Cache:
             logger.error(f"L2 cache get_ohlcv error: {e}", asset_id=asset_id)
             return []
 
+    async def get_ohlcv_range(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get OHLCV candles with start <= time < end, oldest first
+
+        Candles stored by several providers for the same time are collapsed
+        to one row (first provider by name).
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        try:
+            async with self._session_maker() as session:
+                query = text(
+                    """
+                    SELECT DISTINCT ON (time)
+                           time, provider, open, high, low, close, volume
+                    FROM ohlcv_cache
+                    WHERE asset_id = :asset_id
+                        AND timeframe = :timeframe
+                        AND time >= :start
+                        AND time < :end
+                    ORDER BY time, provider
+                """
+                )
+
+                result = await session.execute(
+                    query,
+                    {"asset_id": asset_id, "timeframe": timeframe, "start": start, "end": end},
+                )
+                return [
+                    {
+                        "time": row[0],
+                        "provider": row[1],
+                        "open": row[2],
+                        "high": row[3],
+                        "low": row[4],
+                        "close": row[5],
+                        "volume": row[6],
+                    }
+                    for row in result.fetchall()
+                ]
+
+        except Exception as e:
+            logger.error(f"L2 cache get_ohlcv_range error: {e}", asset_id=asset_id)
+            return []
+
+    async def get_ohlcv_resampled(
+        self,
+        asset_id: int,
+        source_timeframe: str,
+        target_timeframe: str,
+        start: datetime,
+        end: datetime,
+        session: SessionAlignment = UTC_SESSION,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get target_timeframe candles derived from cached source_timeframe rows
+
+        Uses a TimescaleDB continuous aggregate for complete buckets when
+        enabled and the buckets are plain UTC ones. The open bucket, and any
+        the aggregate has not materialized yet, are resampled from the source
+        rows in process, as is everything when the aggregate is not used.
+
+        Args:
+            asset_id: assets.id
+            source_timeframe: Finer timeframe stored in ohlcv_cache
+            target_timeframe: Coarser timeframe to build
+            start: Source rows with time >= start are included
+            end: Source rows with time < end are included
+            session: Exchange alignment of the buckets
+
+        Returns:
+            Candles in provider format (epoch ms timestamp), oldest first
+        """
+        view = _CONTINUOUS_AGGREGATES.get((source_timeframe, target_timeframe))
+        if view and session.is_utc and config.settings.cache_ohlcv_continuous_aggregates:
+            bucket_seconds = timeframe_to_seconds(target_timeframe)
+            candles = await self._get_continuous_aggregate(
+                view, asset_id, start, end, bucket_seconds
+            )
+            if candles is not None:
+                if candles:
+                    last_end = candles[-1]["timestamp"] / 1000 + bucket_seconds
+                    start = max(start, datetime.fromtimestamp(last_end, tz=UTC))
+                rows = await self.get_ohlcv_range(asset_id, source_timeframe, start, end)
+                return candles + resample_candles(rows, source_timeframe, target_timeframe, session)
+
+        rows = await self.get_ohlcv_range(asset_id, source_timeframe, start, end)
+        return resample_candles(rows, source_timeframe, target_timeframe, session)
+
+    async def _get_continuous_aggregate(
+        self, view: str, asset_id: int, start: datetime, end: datetime, bucket_seconds: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read the complete buckets of a continuous aggregate view
+
+        Buckets are aggregated per provider; like get_ohlcv_range, one
+        provider is picked per bucket (the first by name) rather than mixing
+        feeds. Buckets ending after end are still open and are left out.
+
+        Returns:
+            Candles oldest first, or None if the view is unavailable
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        try:
+            async with self._session_maker() as session:
+                query = text(
+                    f"""
+                    SELECT DISTINCT ON (bucket) bucket, open, high, low, close, volume
+                    FROM {view}
+                    WHERE asset_id = :asset_id
+                        AND bucket >= :start
+                        AND bucket <= :last_start
+                    ORDER BY bucket, provider
+                """
+                )
+
+                result = await session.execute(
+                    query,
+                    {
+                        "asset_id": asset_id,
+                        "start": start,
+                        "last_start": end - timedelta(seconds=bucket_seconds),
+                    },
+                )
+                return [
+                    {
+                        "timestamp": int(row[0].timestamp() * 1000),
+                        "open": row[1],
+                        "high": row[2],
+                        "low": row[3],
+                        "close": row[4],
+                        "volume": row[5],
+                    }
+                    for row in result.fetchall()
+                ]
+
+        except Exception as e:
+            logger.warning(f"Continuous aggregate {view} unavailable: {e}", asset_id=asset_id)
+            return None
+
+    async def get_ohlcv_coverage(
+        self, asset_id: int, timeframe: str
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Get the [start, end) spans of ohlcv_cache known to be complete
+
+        Returns:
+            List of (start, end) tuples ordered by start
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        try:
+            async with self._session_maker() as session:
+                query = text(
+                    """
+                    SELECT start_time, end_time
+                    FROM ohlcv_coverage
+                    WHERE asset_id = :asset_id AND timeframe = :timeframe
+                    ORDER BY start_time
+                """
+                )
+
+                result = await session.execute(
+                    query, {"asset_id": asset_id, "timeframe": timeframe}
+                )
+                return [(row[0], row[1]) for row in result.fetchall()]
+
+        except Exception as e:
+            logger.error(f"L2 cache get_ohlcv_coverage error: {e}", asset_id=asset_id)
+            return []
+
+    async def store_ohlcv_range(
+        self,
+        asset_id: int,
+        provider: str,
+        timeframe: str,
+        candles: List[Dict[str, Any]],
+        covered_start: datetime,
+        covered_end: datetime,
+    ) -> bool:
+        """
+        Upsert candles and record [covered_start, covered_end) as complete
+
+        Both happen in one transaction so coverage never points at candles
+        that were not written. Overlapping or adjacent coverage spans are
+        merged into one.
+
+        Args:
+            asset_id: Asset ID
+            provider: Provider the candles came from
+            timeframe: Candle timeframe
+            candles: Dicts with time (datetime), open, high, low, close, volume
+            covered_start: Start of the span the fetch covered
+            covered_end: End of the span the fetch covered (exclusive)
+
+        Returns:
+            True if successful
+        """
+        if not self._initialized or self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        # volume is BIGINT in the schema
+        rows = [
+            {
+                "time": candle["time"],
+                "asset_id": asset_id,
+                "provider": provider,
+                "open": candle["open"],
+                "high": candle["high"],
+                "low": candle["low"],
+                "close": candle["close"],
+                "volume": (
+                    int(round(candle["volume"])) if candle.get("volume") is not None else None
+                ),
+                "timeframe": timeframe,
+            }
+            for candle in candles
+        ]
+
+        try:
+            async with self._session_maker() as session:
+                if rows:
+                    await self._insert_rows(
+                        session,
+                        "ohlcv_cache",
+                        list(rows[0].keys()),
+                        rows,
+                        """ON CONFLICT (time, asset_id, provider, timeframe)
+                        DO UPDATE SET
+                            open = EXCLUDED.open,
+                            high = EXCLUDED.high,
+                            low = EXCLUDED.low,
+                            close = EXCLUDED.close,
+                            volume = EXCLUDED.volume""",
+                    )
+
+                # Absorb every span overlapping or touching the new one
+                merged = await session.execute(
+                    text(
+                        """
+                        DELETE FROM ohlcv_coverage
+                        WHERE asset_id = :asset_id
+                            AND timeframe = :timeframe
+                            AND start_time <= :end
+                            AND end_time >= :start
+                        RETURNING start_time, end_time
+                    """
+                    ),
+                    {
+                        "asset_id": asset_id,
+                        "timeframe": timeframe,
+                        "start": covered_start,
+                        "end": covered_end,
+                    },
+                )
+                spans = merged.fetchall()
+                start = min([covered_start, *(row[0] for row in spans)])
+                end = max([covered_end, *(row[1] for row in spans)])
+
+                await session.execute(
+                    text(
+                        """
+                        INSERT INTO ohlcv_coverage (asset_id, timeframe, start_time, end_time)
+                        VALUES (:asset_id, :timeframe, :start, :end)
+                        ON CONFLICT (asset_id, timeframe, start_time)
+                        DO UPDATE SET
+                            end_time = GREATEST(ohlcv_coverage.end_time, EXCLUDED.end_time)
+                    """
+                    ),
+                    {"asset_id": asset_id, "timeframe": timeframe, "start": start, "end": end},
+                )
+
+                await session.commit()
+                logger.debug(
+                    "L2 cache OHLCV range stored",
+                    asset_id=asset_id,
+                    timeframe=timeframe,
+                    candles=len(rows),
+                )
+                return True
+
+        except Exception as e:
+            logger.error(f"L2 cache store_ohlcv_range error: {e}", asset_id=asset_id)
+            return False
+
     async def get_fundamentals(
         self, asset_id: int, provider: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
@@ -258,7 +758,7 @@ class L2Cache:
                     SELECT id, asset_id, provider, data, timestamp, ttl_seconds
                     FROM fundamentals_cache
                     WHERE asset_id = :asset_id
-                        AND (:provider IS NULL OR provider = :provider)
+                        AND (CAST(:provider AS VARCHAR) IS NULL OR provider = :provider)
                         AND timestamp >= NOW() - INTERVAL '1 second' * ttl_seconds
                     ORDER BY timestamp DESC
                     LIMIT 1
@@ -294,6 +794,22 @@ class L2Cache:
         if not self._initialized or self._session_maker is None:
             raise CacheError("L2 cache not initialized")
 
+        if self._write_buffer is not None:
+            await self._write_buffer.enqueue(
+                PendingWrite(
+                    "fundamentals_cache",
+                    {
+                        "asset_id": asset_id,
+                        "provider": provider,
+                        "data": self.codec.dumps_json(data),
+                        "timestamp": datetime.now(UTC),
+                        "ttl_seconds": ttl_seconds,
+                    },
+                    key=(asset_id, provider),
+                )
+            )
+            return True
+
         try:
             async with self._session_maker() as session:
                 # Upsert using ON CONFLICT
@@ -315,7 +831,7 @@ class L2Cache:
                     {
                         "asset_id": asset_id,
                         "provider": provider,
-                        "data": data,
+                        "data": self.codec.dumps_json(data),
                         "ttl_seconds": ttl_seconds,
                     },
                 )
@@ -368,6 +884,21 @@ class L2Cache:
         if not self._initialized or self._session_maker is None:
             raise CacheError("L2 cache not initialized")
 
+        if self._write_buffer is not None:
+            await self._write_buffer.enqueue(
+                PendingWrite(
+                    "generic_cache",
+                    {
+                        "key": key,
+                        "value": self.codec.dumps_json(value),
+                        "timestamp": datetime.now(UTC),
+                        "ttl_seconds": ttl_seconds or 3600,
+                    },
+                    key=(key,),
+                )
+            )
+            return True
+
         try:
             async with self._session_maker() as session:
                 # Use generic cache table for key-value storage
@@ -388,7 +919,7 @@ class L2Cache:
                     query,
                     {
                         "key": key,
-                        "value": json.dumps(value),
+                        "value": self.codec.dumps_json(value),
                         "ttl_seconds": ttl_seconds or 3600,
                     },
                 )
@@ -451,6 +982,9 @@ class L2Cache:
         if not self._initialized or self._session_maker is None:
             raise CacheError("L2 cache not initialized")
 
+        # Queued writes must not resurrect rows deleted here
+        await self.flush_writes()
+
         try:
             async with self._session_maker() as session:
                 query = text(
@@ -513,6 +1047,9 @@ class L2Cache:
         if not self._initialized or self._session_maker is None:
             raise CacheError("L2 cache not initialized")
 
+        # Queued writes must not resurrect rows deleted here
+        await self.flush_writes()
+
         try:
             async with self._session_maker() as session:
                 query = text("DELETE FROM generic_cache")
@@ -540,6 +1077,9 @@ class L2Cache:
         if not self._initialized or self._session_maker is None:
             raise CacheError("L2 cache not initialized")
 
+        # Queued writes must not resurrect rows deleted here
+        await self.flush_writes()
+
         try:
             async with self._session_maker() as session:
                 query = text(
@@ -560,6 +1100,100 @@ class L2Cache:
             logger.error(f"L2 cache clear_pattern error: {e}", pattern=pattern)
             return 0
 
+    async def start_write_behind(self) -> None:
+        """Start batching writes through the write-behind buffer"""
+        if self._write_buffer is not None:
+            return
+
+        buffer = L2WriteBuffer(
+            flush_fn=self._write_batch,
+            batch_size=config.settings.cache_l2_write_batch_size,
+            flush_interval_ms=config.settings.cache_l2_write_flush_interval_ms,
+            max_queue=config.settings.cache_l2_write_queue_max,
+            analytics=cache_analytics,
+        )
+        await buffer.start()
+        self._write_buffer = buffer
+
+    async def stop_write_behind(self) -> None:
+        """Flush outstanding writes and return to direct writes"""
+        if self._write_buffer is None:
+            return
+
+        buffer = self._write_buffer
+        await buffer.stop()
+        self._write_buffer = None
+
+    async def flush_writes(self) -> int:
+        """
+        Flush queued write-behind writes immediately
+
+        Returns:
+            Number of rows written
+        """
+        if self._write_buffer is None:
+            return 0
+        return await self._write_buffer.flush()
+
+    def get_write_behind_stats(self) -> Dict[str, Any]:
+        """Get write-behind queue statistics"""
+        if self._write_buffer is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._write_buffer.get_stats()}
+
+    async def _write_batch(self, writes: List[PendingWrite]) -> None:
+        """
+        Persist a batch of buffered writes in one transaction
+
+        Writes are grouped per table, deduplicated by conflict key (last write
+        wins) and sent as multi-row INSERT statements.
+        """
+        if self._session_maker is None:
+            raise CacheError("L2 cache not initialized")
+
+        rows_by_table: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        for i, write in enumerate(writes):
+            rows = rows_by_table.setdefault(write.table, {})
+            rows[write.key if write.key is not None else i] = write.params
+
+        async with self._session_maker() as session:
+            for table, rows in rows_by_table.items():
+                columns, conflict_clause = _BATCH_INSERTS[table]
+                await self._insert_rows(
+                    session, table, columns, list(rows.values()), conflict_clause
+                )
+
+            await session.commit()
+
+    @staticmethod
+    async def _insert_rows(
+        session: AsyncSession,
+        table: str,
+        columns: List[str],
+        rows: List[Dict[str, Any]],
+        conflict_clause: str,
+    ) -> None:
+        """Execute multi-row INSERT statements, chunked to the bind parameter limit"""
+        chunk_size = max(1, _MAX_BIND_PARAMS // len(columns))
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            params: Dict[str, Any] = {}
+            values_sql = []
+            for n, row in enumerate(chunk):
+                placeholders = []
+                for column in columns:
+                    name = f"{column}_{n}"
+                    params[name] = row.get(column)
+                    placeholders.append(f":{name}")
+                values_sql.append(f"({', '.join(placeholders)})")
+
+            query = text(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES {', '.join(values_sql)} {conflict_clause}"
+            )
+            await session.execute(query, params)
+
     async def get_stats(self) -> Dict[str, Any]:
         """
         Get L2 cache statistics
@@ -597,6 +1231,7 @@ class L2Cache:
                     "total_entries": total_entries,
                     "expired_entries": expired_entries,
                     "active_entries": total_entries - expired_entries,
+                    "write_behind": self.get_write_behind_stats(),
                 }
 
         except Exception as e:
@@ -2,16 +2,27 @@
 Cache Manager - Coordinates L1 and L2 caches
 """
 
+import asyncio
+import math
+import random
 import time
 from datetime import UTC, datetime
-from datetime import time as time_obj
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fiml.cache.analytics import cache_analytics
+from fiml.cache.asset_index import AssetIndex
+from fiml.cache.coalescing import RequestCoalescer
+from fiml.cache.entry import CacheEntry, NegativeEntry
+from fiml.cache.histogram import LatencyHistogram
+from fiml.cache.l0_cache import L0Cache
 from fiml.cache.l1_cache import l1_cache
 from fiml.cache.l2_cache import l2_cache
-from fiml.cache.utils import calculate_percentile
+from fiml.cache.ohlcv_range import OHLCVFetchFn, OHLCVRangeCache
+from fiml.cache.snapshot import CacheSnapshotter
+from fiml.cache.trading_calendar import TradingCalendar, calendar_for
+from fiml.cache.utils import calculate_percentile, jitter_ttl
 from fiml.core import config
+from fiml.core.exceptions import NoProviderAvailableError, SymbolNotFoundError
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, DataType
 
@@ -20,21 +31,31 @@ logger = get_logger(__name__)
 
 class CacheManager:
     """
-    Coordinates L1 (Redis) and L2 (PostgreSQL) caches
+    Coordinates L0 (in-process), L1 (Redis) and L2 (PostgreSQL) caches
 
     Strategy:
+    0. Check the optional L0 near-cache (<1ms)
     1. Check L1 first (10-100ms)
     2. If miss, check L2 (300-700ms)
-    3. If hit in L2, populate L1
+    3. If hit in L2, populate L1 with the remaining TTL
     4. If miss in both, return None
     5. On write, update both L1 and L2
 
+    L2 rows are keyed by assets.id; the asset index maps (symbol, market)
+    to that ID in memory.
+
     Features:
     - Latency tracking for L1 and L2 operations
     - Hit rate measurement
     - Eviction statistics
-    - Dynamic TTL based on data volatility and market hours
+    - Dynamic TTL based on data volatility and exchange calendars
     - Read-through cache pattern
+    - Single-flight coalescing of concurrent misses for the same key
+    - Stale-while-revalidate: read-through entries past their soft TTL are
+      served immediately while one background refresh runs
+    - Optional snapshot of the hot L1 working set, reloaded on startup
+    - Negative caching: short-lived tombstones for symbols no provider
+      can serve, so repeated junk lookups skip arbitration
     - Integrated analytics
     """
 
@@ -43,30 +64,111 @@ class CacheManager:
         self.l2 = l2_cache
         self._initialized = False
 
+        # Optional in-process near-cache in front of L1
+        self.l0: Optional[L0Cache] = None
+        if config.settings.cache_l0_enabled:
+            self.l0 = L0Cache(
+                max_entries=config.settings.cache_l0_max_entries,
+                max_ttl_seconds=config.settings.cache_l0_ttl_seconds,
+                channel=config.settings.cache_l0_invalidation_channel,
+            )
+
         # Metrics tracking
         self._l1_hits = 0
         self._l1_misses = 0
         self._l2_hits = 0
         self._l2_misses = 0
-        self._l1_latencies: List[float] = []
-        self._l2_latencies: List[float] = []
+        self._l1_latency = LatencyHistogram()
+        self._l2_latency = LatencyHistogram()
 
         # Analytics integration
         self.analytics = cache_analytics
 
-        # Market hours configuration (NYSE default: 9:30 AM - 4:00 PM ET)
-        self.market_open = time_obj(9, 30)
-        self.market_close = time_obj(16, 0)
+        # Single-flight coalescing of concurrent read-through misses
+        self.coalescer = RequestCoalescer()
+
+        # Background stale-while-revalidate refreshes
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+
+        # Called with (symbol, data_type) on every symbol lookup (demand forecasting)
+        self._access_listeners: List[Callable[[str, DataType], None]] = []
+
+        # (symbol, market) -> assets.id for the L2 tables
+        self.asset_index = AssetIndex(
+            self.l2,
+            negative_ttl_seconds=config.settings.cache_asset_index_negative_ttl_seconds,
+            max_negative_entries=config.settings.cache_asset_index_max_negative_entries,
+        )
+
+        # Gap-aware OHLCV candles in L2
+        self.ohlcv = OHLCVRangeCache(
+            self.l2,
+            self.asset_index,
+            tail_tolerance_seconds=config.settings.cache_ohlcv_tail_tolerance_seconds,
+            tail_tolerance_fraction=config.settings.cache_ohlcv_tail_tolerance_fraction,
+            max_fetch_candles=config.settings.cache_ohlcv_max_fetch_candles,
+            resample_sources=(
+                config.settings.cache_ohlcv_resample_sources
+                if config.settings.cache_ohlcv_resample_enabled
+                else ()
+            ),
+            max_resample_source_candles=config.settings.cache_ohlcv_resample_max_source_candles,
+        )
+
+        # Hot working set carried across restarts
+        self.snapshot = CacheSnapshotter(
+            self.l1,
+            path=config.settings.cache_snapshot_path,
+            max_keys=config.settings.cache_snapshot_max_keys,
+            min_ttl_seconds=config.settings.cache_snapshot_min_ttl_seconds,
+        )
 
     async def initialize(self) -> None:
         """Initialize both cache layers"""
         await self.l1.initialize()
         await self.l2.initialize()
+
+        if self._l2_enabled() and config.settings.cache_asset_index_preload:
+            try:
+                await self.asset_index.preload()
+            except Exception as e:
+                # The index still fills lazily on demand
+                logger.warning(f"Asset index preload failed: {e}")
+
+        if config.settings.cache_snapshot_enabled:
+            try:
+                await self.snapshot.restore()
+            except Exception as e:
+                # A cold start is slower, not broken
+                logger.warning(f"Cache snapshot restore failed: {e}")
+            self.snapshot.start(config.settings.cache_snapshot_interval_seconds)
+
+        if self.l0 is not None and self.l1._redis is not None:
+            try:
+                await self.l0.start_invalidation_listener(self.l1._redis)
+            except Exception as e:
+                # Without invalidations L0 could serve values overwritten elsewhere
+                logger.warning(f"L0 invalidation listener unavailable, disabling L0: {e}")
+                self.l0 = None
+
         self._initialized = True
-        logger.info("Cache manager initialized")
+        logger.info("Cache manager initialized", l0_enabled=self.l0 is not None)
 
     async def shutdown(self) -> None:
         """Shutdown both cache layers"""
+        refreshes = list(self._refresh_tasks.values())
+        for task in refreshes:
+            task.cancel()
+        if refreshes:
+            await asyncio.gather(*refreshes, return_exceptions=True)
+            self._refresh_tasks.clear()
+
+        if config.settings.cache_snapshot_enabled and self.l1._initialized:
+            await self.snapshot.stop()
+
+        if self.l0 is not None:
+            await self.l0.stop_invalidation_listener()
+            self.l0.clear()
         await self.l1.shutdown()
         await self.l2.shutdown()
         self._initialized = False
@@ -85,42 +187,67 @@ class CacheManager:
         Returns:
             Price data or None
         """
+        self._notify_access(asset.symbol, DataType.PRICE)
+
         # Build cache key
-        l1_key = self.l1.build_key("price", asset.symbol, provider or "any")
+        l1_key = await self._asset_key(asset, "price", asset.symbol, provider or "any")
 
-        # Try L1 first
+        # Try L0 near-cache
+        l0_raw = self._l0_get(l1_key, DataType.PRICE)
+        if l0_raw is not None and self._expires_early(l0_raw, DataType.PRICE, l1_key):
+            return None
+        l0_result = CacheEntry.unwrap(l0_raw)
+        if l0_result is not None:
+            return dict(l0_result) if isinstance(l0_result, dict) else l0_result
+
+        # Try L1 next
+        start = time.perf_counter()
         l1_result = await self.l1.get(l1_key)
+        l1_latency_ms = (time.perf_counter() - start) * 1000
+        self._track_l1_latency(l1_latency_ms)
+        if l1_result and self._expires_early(l1_result, DataType.PRICE, l1_key):
+            return None
         if l1_result:
             logger.debug("Price from L1 cache", asset=asset.symbol)
+            self._l0_set(l1_key, l1_result)
+            l1_result = CacheEntry.unwrap(l1_result)
             self.analytics.record_cache_access(
                 data_type=DataType.PRICE,
                 is_hit=True,
-                latency_ms=0.0,  # TODO: Track actual latency
+                latency_ms=l1_latency_ms,
                 cache_level="l1",
                 key=l1_key,
             )
             return dict(l1_result) if isinstance(l1_result, dict) else l1_result
 
         self.analytics.record_cache_access(
-            data_type=DataType.PRICE, is_hit=False, latency_ms=0.0, cache_level="l1", key=l1_key
+            data_type=DataType.PRICE,
+            is_hit=False,
+            latency_ms=l1_latency_ms,
+            cache_level="l1",
+            key=l1_key,
+            falls_through=self._l2_enabled(),
         )
 
         # Try L2
-        # Note: Would need asset_id lookup first in production
+        if not self._l2_enabled():
+            return None
+
         logger.debug("Price L1 miss, trying L2", asset=asset.symbol)
-        # l2_result = await self.l2.get_price(asset_id, provider)
-        # if l2_result:
-        #     # Populate L1
-        #     await self.l1.set(l1_key, l2_result, self._get_ttl(DataType.PRICE))
-        #     return l2_result
+        l2_result = await self._get_price_from_l2(asset, provider, l1_key)
+        if l2_result is None:
+            return None
 
-        return None
+        price_data, ttl_remaining = l2_result
+        await self._backfill_l1(l1_key, price_data, ttl_remaining)
+        return price_data
 
     async def set_price(
         self,
         asset: Asset,
         provider: str,
         price_data: Dict[str, Any],
+        fetch_ms: Optional[float] = None,
     ) -> bool:
         """
         Set price in both caches with dynamic TTL
@@ -129,37 +256,64 @@ class CacheManager:
             asset: Asset
             provider: Provider name
             price_data: Price data dictionary
+            fetch_ms: How long the provider fetch took; enables early refresh
 
         Returns:
             True if successful
         """
-        l1_key = self.l1.build_key("price", asset.symbol, provider)
+        l1_key = await self._asset_key(asset, "price", asset.symbol, provider)
         ttl = self._get_ttl(DataType.PRICE, asset)
+        value = self._wrap_timed(price_data, ttl, fetch_ms)
 
         # Set in L1
-        l1_success = await self.l1.set(l1_key, price_data, ttl)
+        l1_success = await self.l1.set(l1_key, value, ttl)
+        if l1_success:
+            await self._index_asset_keys([(asset, l1_key, ttl)])
+            await self._l0_write(l1_key, value, ttl)
 
-        # Set in L2 (async, don't wait)
-        # In production, would insert into PostgreSQL
-        # l2_success = await self.l2.set_price(asset_id, provider, ...)
+        # Set in L2 (queued when write-behind is enabled)
+        l2_success = await self._set_price_in_l2(asset, provider, price_data)
 
-        logger.debug("Price cached", asset=asset.symbol, provider=provider, l1=l1_success, ttl=ttl)
+        logger.debug(
+            "Price cached",
+            asset=asset.symbol,
+            provider=provider,
+            l1=l1_success,
+            l2=l2_success,
+            ttl=ttl,
+        )
         return bool(l1_success)
 
     async def get_fundamentals(
         self, asset: Asset, provider: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get fundamentals with L1 -> L2 fallback"""
-        l1_key = self.l1.build_key("fundamentals", asset.symbol, provider or "any")
+        self._notify_access(asset.symbol, DataType.FUNDAMENTALS)
+        l1_key = await self._asset_key(asset, "fundamentals", asset.symbol, provider or "any")
+
+        # Try L0 near-cache
+        l0_raw = self._l0_get(l1_key, DataType.FUNDAMENTALS)
+        if l0_raw is not None and self._expires_early(l0_raw, DataType.FUNDAMENTALS, l1_key):
+            return None
+        l0_result = CacheEntry.unwrap(l0_raw)
+        if l0_result is not None:
+            return dict(l0_result) if isinstance(l0_result, dict) else l0_result
 
         # Try L1
+        start = time.perf_counter()
         l1_result = await self.l1.get(l1_key)
+        l1_latency_ms = (time.perf_counter() - start) * 1000
+        self._track_l1_latency(l1_latency_ms)
+        if l1_result and self._expires_early(l1_result, DataType.FUNDAMENTALS, l1_key):
+            return None
         if l1_result:
             logger.debug("Fundamentals from L1 cache", asset=asset.symbol)
+            self._l0_set(l1_key, l1_result)
+            l1_result = CacheEntry.unwrap(l1_result)
             self.analytics.record_cache_access(
                 data_type=DataType.FUNDAMENTALS,
                 is_hit=True,
-                latency_ms=0.0,
+                latency_ms=l1_latency_ms,
                 cache_level="l1",
                 key=l1_key,
             )
@@ -168,40 +322,128 @@ class CacheManager:
         self.analytics.record_cache_access(
             data_type=DataType.FUNDAMENTALS,
             is_hit=False,
-            latency_ms=0.0,
+            latency_ms=l1_latency_ms,
             cache_level="l1",
             key=l1_key,
+            falls_through=self._l2_enabled(),
         )
 
         # Try L2
+        if not self._l2_enabled():
+            return None
+
         logger.debug("Fundamentals L1 miss, trying L2", asset=asset.symbol)
-        # In production: l2_result = await self.l2.get_fundamentals(asset_id, provider)
+        start = time.perf_counter()
+        row = None
+        asset_id = await self.asset_index.get_asset_id(asset)
+        if asset_id is not None:
+            row = await self.l2.get_fundamentals(asset_id, provider)
+
+        ttl_remaining = 0
+        if row is not None and isinstance(row.get("data"), dict):
+            ttl_remaining = self._remaining_ttl(row.get("timestamp"), row.get("ttl_seconds") or 0)
+        hit = ttl_remaining > 0
+        self._record_l2_access(DataType.FUNDAMENTALS, hit, start, l1_key)
+
+        if not hit or row is None:
+            return None
 
-        return None
+        data: Dict[str, Any] = row["data"]
+        await self._backfill_l1(l1_key, data, ttl_remaining)
+        return dict(data)
 
     async def set_fundamentals(
         self,
         asset: Asset,
         provider: str,
         data: Dict[str, Any],
+        fetch_ms: Optional[float] = None,
     ) -> bool:
         """Set fundamentals in both caches with dynamic TTL"""
-        l1_key = self.l1.build_key("fundamentals", asset.symbol, provider)
+        l1_key = await self._asset_key(asset, "fundamentals", asset.symbol, provider)
         ttl = self._get_ttl(DataType.FUNDAMENTALS, asset)
+        value = self._wrap_timed(data, ttl, fetch_ms)
 
         # Set in L1
-        l1_success = await self.l1.set(l1_key, data, ttl)
+        l1_success = await self.l1.set(l1_key, value, ttl)
+        if l1_success:
+            await self._index_asset_keys([(asset, l1_key, ttl)])
+            await self._l0_write(l1_key, value, ttl)
 
         # Set in L2
-        # In production: await self.l2.set_fundamentals(asset_id, provider, data, ttl)
+        if self._l2_enabled():
+            try:
+                asset_id = await self.asset_index.get_asset_id(asset, create=True)
+                if asset_id is not None:
+                    await self.l2.set_fundamentals(asset_id, provider, data, ttl)
+            except Exception as e:
+                logger.warning(f"L2 fundamentals write failed: {e}", asset=asset.symbol)
 
         logger.debug("Fundamentals cached", asset=asset.symbol, provider=provider, ttl=ttl)
         return bool(l1_success)
 
-    async def invalidate_asset(self, asset: Asset) -> int:
-        """Invalidate all cached data for an asset"""
+    async def get_ohlcv(
+        self,
+        asset: Asset,
+        timeframe: str,
+        fetch_fn: OHLCVFetchFn,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the latest candles, fetching only the spans missing from L2
+
+        Args:
+            asset: Asset to query
+            timeframe: Candle timeframe
+            fetch_fn: Coroutine taking a candle limit and returning
+                (provider name, candles) from the providers
+            limit: Number of candle periods ending now
+
+        Returns:
+            Candles (timestamp in epoch ms, open, high, low, close, volume)
+        """
+        if not (config.settings.cache_ohlcv_range_enabled and self._l2_enabled()):
+            _, candles = await fetch_fn(limit)
+            return list(candles)
+
+        try:
+            return await self.ohlcv.get_candles(asset, timeframe, limit, fetch_fn)
+        except ValueError:
+            # Timeframe without a fixed length: not range-cacheable
+            _, candles = await fetch_fn(limit)
+            return list(candles)
+
+    async def invalidate_asset(self, asset: Asset, purge: bool = False) -> int:
+        """
+        Invalidate all cached data for an asset
+
+        With generation invalidation (the default) this is a single INCR of
+        the symbol's generation: keys for the old generation are never read
+        again and expire through their TTL. Otherwise, or with purge=True,
+        existing keys are also deleted now, through the tag index when it is
+        enabled and a keyspace scan when it is not.
+
+        Args:
+            asset: Asset to invalidate
+            purge: Eagerly delete the existing L1 entries as well
+
+        Returns:
+            Number of L1 keys deleted
+        """
         pattern = f"*:{asset.symbol}:*"
-        deleted = await self.l1.clear_pattern(pattern)
+        await self._l0_invalidate(pattern=pattern)
+
+        deleted = 0
+        if config.settings.cache_generation_invalidation_enabled:
+            namespace = self.l1.symbol_namespace(asset.symbol)
+            await self.l1.invalidate_namespaces(namespace)
+            if purge and config.settings.cache_tag_index_enabled:
+                deleted = await self.l1.purge_tag(namespace)
+            elif purge:
+                deleted = await self.l1.clear_pattern(pattern)
+        else:
+            deleted = await self.l1.clear_pattern(pattern)
+
         logger.info("Invalidated cache for asset", asset=asset.symbol, deleted=deleted)
         return int(deleted) if deleted else 0
 
@@ -213,6 +455,7 @@ class CacheManager:
             Comprehensive statistics including hit rates and latencies
         """
         l1_stats = await self.l1.get_stats()
+        l0_stats = self.l0.get_stats() if self.l0 is not None else {"enabled": False}
 
         # Calculate hit rates
         total_l1_ops = self._l1_hits + self._l1_misses
@@ -221,36 +464,47 @@ class CacheManager:
         total_l2_ops = self._l2_hits + self._l2_misses
         l2_hit_rate = (self._l2_hits / total_l2_ops * 100) if total_l2_ops > 0 else 0.0
 
-        # Calculate average latencies
-        avg_l1_latency = (
-            sum(self._l1_latencies) / len(self._l1_latencies) if self._l1_latencies else 0.0
-        )
-        avg_l2_latency = (
-            sum(self._l2_latencies) / len(self._l2_latencies) if self._l2_latencies else 0.0
-        )
-
-        # Calculate percentiles for L1 latency
-        l1_p50 = calculate_percentile(self._l1_latencies, 50)
-        l1_p95 = calculate_percentile(self._l1_latencies, 95)
-        l1_p99 = calculate_percentile(self._l1_latencies, 99)
+        l1_latency = self._l1_latency.get_stats()
+        l2_latency = self._l2_latency.get_stats()
 
         return {
+            "l0": l0_stats,
             "l1": {
                 **l1_stats,
                 "hits": self._l1_hits,
                 "misses": self._l1_misses,
                 "hit_rate_percent": round(l1_hit_rate, 2),
-                "avg_latency_ms": round(avg_l1_latency, 2),
-                "p50_latency_ms": round(l1_p50, 2),
-                "p95_latency_ms": round(l1_p95, 2),
-                "p99_latency_ms": round(l1_p99, 2),
+                "avg_latency_ms": round(l1_latency["mean"], 2),
+                "p50_latency_ms": round(l1_latency["p50"], 2),
+                "p95_latency_ms": round(l1_latency["p95"], 2),
+                "p99_latency_ms": round(l1_latency["p99"], 2),
             },
             "l2": {
                 "status": "initialized" if self.l2._initialized else "not_initialized",
                 "hits": self._l2_hits,
                 "misses": self._l2_misses,
                 "hit_rate_percent": round(l2_hit_rate, 2),
-                "avg_latency_ms": round(avg_l2_latency, 2),
+                "avg_latency_ms": round(l2_latency["mean"], 2),
+                "p50_latency_ms": round(l2_latency["p50"], 2),
+                "p95_latency_ms": round(l2_latency["p95"], 2),
+                "p99_latency_ms": round(l2_latency["p99"], 2),
+                "write_behind": self.l2.get_write_behind_stats(),
+                "asset_index": self.asset_index.get_stats(),
+            },
+            "ohlcv_range": self.ohlcv.get_stats(),
+            "generations": self.l1.generations.get_stats(),
+            "snapshot": self.snapshot.get_stats(),
+            "coalescing": self.coalescer.get_stats(),
+            "negative": {
+                "enabled": config.settings.cache_negative_enabled,
+                "ttl_seconds": config.settings.cache_negative_ttl_seconds,
+                "hits": self.analytics.negative_hits,
+                "writes": self.analytics.negative_writes,
+            },
+            "stale_while_revalidate": {
+                "enabled": config.settings.cache_stale_while_revalidate,
+                "hard_ttl_multiplier": config.settings.cache_hard_ttl_multiplier,
+                "refreshing": len(self._refresh_tasks),
             },
             "overall": {
                 "total_requests": total_l1_ops,
@@ -260,16 +514,12 @@ class CacheManager:
         }
 
     def _track_l1_latency(self, latency_ms: float) -> None:
-        """Track L1 latency (keep last 1000 measurements)"""
-        self._l1_latencies.append(latency_ms)
-        if len(self._l1_latencies) > 1000:
-            self._l1_latencies.pop(0)
+        """Track L1 latency in a fixed-memory histogram"""
+        self._l1_latency.record(latency_ms)
 
     def _track_l2_latency(self, latency_ms: float) -> None:
-        """Track L2 latency (keep last 1000 measurements)"""
-        self._l2_latencies.append(latency_ms)
-        if len(self._l2_latencies) > 1000:
-            self._l2_latencies.pop(0)
+        """Track L2 latency in a fixed-memory histogram"""
+        self._l2_latency.record(latency_ms)
 
     def _calculate_percentile(self, values: List[float], percentile: int) -> float:
         """
@@ -294,6 +544,11 @@ class CacheManager:
         Returns:
             Cached value or None
         """
+        if self.l0 is not None:
+            l0_value = self.l0.get(key)
+            if l0_value is not None:
+                return CacheEntry.unwrap(l0_value)
+
         # Try L1 first
         start = time.perf_counter()
         value = await self.l1.get(key)
@@ -302,10 +557,11 @@ class CacheManager:
 
         if value is not None:
             self._l1_hits += 1
+            self._l0_set(key, value)
             # We don't know the data type here easily, so we might skip detailed analytics
             # or use a generic type if available. For now, let's skip to avoid noise
             # or we could add an optional data_type arg to get()
-            return value
+            return CacheEntry.unwrap(value)
 
         self._l1_misses += 1
         return None
@@ -327,10 +583,14 @@ class CacheManager:
         l1_latency_ms = (time.perf_counter() - start) * 1000
         self._track_l1_latency(l1_latency_ms)
 
+        if success:
+            await self._l0_write(key, value, ttl_seconds)
+
         return bool(success)
 
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
+        await self._l0_invalidate(keys=[key])
         result = await self.l1.delete(key)
         return bool(result)
 
@@ -341,18 +601,231 @@ class CacheManager:
 
     async def clear_pattern(self, pattern: str) -> int:
         """Clear keys matching pattern"""
+        await self._l0_invalidate(pattern=pattern)
         result = await self.l1.clear_pattern(pattern)
         return int(result) if result else 0
 
-    def _get_ttl(self, data_type: DataType, asset: Optional[Asset] = None) -> int:
+    def add_access_listener(self, listener: Callable[[str, DataType], None]) -> None:
+        """
+        Register a callback invoked with (symbol, data_type) on every lookup
+
+        Listeners run inline on the request path and must be cheap; errors
+        are logged and ignored.
+
+        Args:
+            listener: Callback, e.g. PredictiveCacheWarmer.record_cache_access
+        """
+        if listener not in self._access_listeners:
+            self._access_listeners.append(listener)
+
+    def remove_access_listener(self, listener: Callable[[str, DataType], None]) -> None:
+        """Unregister a callback added with add_access_listener"""
+        if listener in self._access_listeners:
+            self._access_listeners.remove(listener)
+
+    def _notify_access(self, symbol: str, data_type: DataType) -> None:
+        """Tell access listeners about a lookup"""
+        for listener in self._access_listeners:
+            try:
+                listener(symbol, data_type)
+            except Exception as e:
+                logger.debug(f"Cache access listener failed: {e}")
+
+    def _l0_get(self, key: str, data_type: DataType) -> Optional[Any]:
+        """Look up a key in the L0 near-cache and record the access"""
+        if self.l0 is None:
+            return None
+
+        start = time.perf_counter()
+        value = self.l0.get(key)
+        latency_ms = (time.perf_counter() - start) * 1000
+        if value is not None:
+            # L0 hits never reach Redis; count them toward the cluster-wide view
+            self.l1.hot_keys.record(key)
+
+        self.analytics.record_cache_access(
+            data_type=data_type,
+            is_hit=value is not None,
+            latency_ms=latency_ms,
+            cache_level="l0",
+            key=key,
+        )
+        return value
+
+    def _l0_set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """Populate L0 from a value read out of a lower tier"""
+        if self.l0 is not None:
+            self.l0.set(key, value, ttl_seconds)
+
+    async def _asset_key(self, asset: Asset, *parts: str) -> str:
+        """L1 key for an asset's data, versioned by the symbol's generation"""
+        return await self.l1.versioned_key(
+            self.l1.build_key(*parts), self.l1.symbol_namespace(asset.symbol)
+        )
+
+    async def _index_asset_keys(self, items: List[Tuple[Asset, str, Optional[int]]]) -> None:
+        """Add written keys to their symbol's tag set (no-op unless the tag index is on)"""
+        await self.l1.index_tags(
+            [(key, (self.l1.symbol_namespace(asset.symbol),), ttl) for asset, key, ttl in items]
+        )
+
+    async def _l0_write(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """Populate L0 after a write and tell other replicas to drop their copy"""
+        if self.l0 is None:
+            return
+        self.l0.set(key, value, ttl_seconds)
+        await self._publish_l0_invalidation(keys=[key])
+
+    async def _l0_invalidate(
+        self, keys: Optional[List[str]] = None, pattern: Optional[str] = None
+    ) -> None:
+        """Drop keys from the local L0 and from every other replica"""
+        if self.l0 is None:
+            return
+        self.l0.invalidate(keys=keys, pattern=pattern)
+        await self._publish_l0_invalidation(keys=keys, pattern=pattern)
+
+    async def _publish_l0_invalidation(
+        self, keys: Optional[List[str]] = None, pattern: Optional[str] = None
+    ) -> None:
+        """Publish an invalidation message on the L0 channel"""
+        if self.l0 is None:
+            return
+
+        message = self.l0.build_invalidation_message(keys=keys, pattern=pattern)
+        await self.l1.publish(self.l0.channel, message)
+
+    def _l2_enabled(self) -> bool:
+        """Whether the PostgreSQL tier is configured and connected"""
+        return bool(config.settings.cache_l2_tier_enabled and self.l2._initialized)
+
+    @staticmethod
+    def _remaining_ttl(written_at: Any, ttl_seconds: int) -> int:
+        """Seconds an L2 row written at written_at stays fresh (0 if expired)"""
+        if not isinstance(written_at, datetime):
+            return 0
+        if written_at.tzinfo is None:
+            written_at = written_at.replace(tzinfo=UTC)
+        age = (datetime.now(UTC) - written_at).total_seconds()
+        return max(0, int(ttl_seconds - age))
+
+    def _record_l2_access(self, data_type: DataType, hit: bool, start: float, key: str) -> None:
+        """Record the outcome of an L2 lookup"""
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._track_l2_latency(latency_ms)
+        if hit:
+            self._l2_hits += 1
+        else:
+            self._l2_misses += 1
+        self.analytics.record_cache_access(
+            data_type=data_type,
+            is_hit=hit,
+            latency_ms=latency_ms,
+            cache_level="l2",
+            key=key,
+        )
+
+    async def _backfill_l1(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Populate L1 (and L0) from an L2 hit for the row's remaining lifetime"""
+        if await self.l1.set(key, value, ttl_seconds):
+            self._l0_set(key, value, ttl_seconds)
+
+    async def _get_price_from_l2(
+        self, asset: Asset, provider: Optional[str], key: str
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Look up the latest still-fresh price row for an asset in L2
+
+        Returns:
+            (price_data, remaining TTL in seconds) or None on a miss
+        """
+        start = time.perf_counter()
+        ttl = self._get_ttl(DataType.PRICE, asset)
+
+        row = None
+        asset_id = await self.asset_index.get_asset_id(asset)
+        if asset_id is not None:
+            row = await self.l2.get_price(
+                asset_id, provider, time_range_minutes=max(1, math.ceil(ttl / 60))
+            )
+
+        ttl_remaining = self._remaining_ttl(row["time"], ttl) if row is not None else 0
+        hit = ttl_remaining > 0
+        self._record_l2_access(DataType.PRICE, hit, start, key)
+
+        if not hit or row is None:
+            return None
+
+        # set_price stores the original payload; fall back to the typed columns
+        metadata = row.get("metadata")
+        if isinstance(metadata, dict) and "price" in metadata:
+            price_data = dict(metadata)
+        else:
+            price_data = {
+                "price": row["price"],
+                "change": row["change"],
+                "change_percent": row["change_percent"],
+                "volume": row["volume"],
+                "confidence": row["confidence"],
+                "provider": row["provider"],
+                "timestamp": row["time"].isoformat(),
+            }
+        return price_data, ttl_remaining
+
+    async def _set_price_in_l2(self, asset: Asset, provider: str, price_data: Any) -> bool:
+        """Persist a price payload to L2; failures never fail the caller"""
+        if not self._l2_enabled() or not isinstance(price_data, dict):
+            return False
+
+        price = price_data.get("price")
+        if not isinstance(price, (int, float)) or isinstance(price, bool):
+            return False
+
+        try:
+            asset_id = await self.asset_index.get_asset_id(asset, create=True)
+            if asset_id is None:
+                return False
+
+            volume = price_data.get("volume")
+            return bool(
+                await self.l2.set_price(
+                    asset_id,
+                    provider,
+                    float(price),
+                    change=price_data.get("change"),
+                    change_percent=price_data.get("change_percent"),
+                    volume=int(volume) if isinstance(volume, (int, float)) else None,
+                    confidence=float(price_data.get("confidence") or 1.0),
+                    metadata=price_data,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"L2 price write failed: {e}", asset=asset.symbol)
+            return False
+
+    def _get_ttl(
+        self,
+        data_type: DataType,
+        asset: Optional[Asset] = None,
+        jitter_fraction: float = 0.0,
+    ) -> int:
         """
         Get intelligent TTL for data type with dynamic adjustments
 
         Factors:
         - Data type volatility
-        - Market hours (shorter TTL during trading)
+        - Exchange calendar of the asset's market: while it is closed (nights,
+          weekends, holidays), prices live until shortly after the next open
         - Asset type (crypto vs stocks)
-        - Weekend/holiday extended TTL
+        - Non-trading days extend fundamentals and news TTLs
+
+        Args:
+            data_type: Type of data being cached
+            asset: Asset the data belongs to (selects the market calendar)
+            jitter_fraction: Relative spread for TTLs not pinned to a market open
+
+        Returns:
+            TTL in seconds
         """
         # Base TTL from settings
         ttl_map = {
@@ -363,37 +836,59 @@ class CacheManager:
             DataType.MACRO: config.settings.cache_ttl_macro,
         }
         base_ttl = ttl_map.get(data_type, 300)
+        ttl = base_ttl
 
-        # Check if market is currently open
         now = datetime.now(UTC)
-        current_time = now.time()
-        is_weekday = now.weekday() < 5  # Monday = 0, Sunday = 6
+        calendar = self._calendar_for(asset)
 
         # Dynamic adjustments for price data
         if data_type == DataType.PRICE:
             # Crypto trades 24/7 - shorter TTL always
             if asset and asset.asset_type == "crypto":
-                return min(base_ttl, 60)  # Max 1 minute for crypto
-
-            # Stock market hours
-            if is_weekday and self.market_open <= current_time <= self.market_close:
-                # During market hours - use base TTL (shorter)
-                return base_ttl
-            else:
-                # After hours or weekends - extend TTL by 4x
-                return base_ttl * 4
-
-        # Fundamentals have longer TTL on weekends
+                ttl = min(base_ttl, 60)  # Max 1 minute for crypto
+            elif calendar is not None:
+                until_open = calendar.seconds_until_open(now)
+                if until_open > 0:
+                    # Closed: nothing changes until the open. The spread keeps
+                    # every key from refreshing in the opening second
+                    return int(
+                        min(
+                            until_open + random.uniform(0, base_ttl),
+                            config.settings.cache_ttl_market_closed_max,
+                        )
+                    )
+
+        # Fundamentals have longer TTL on non-trading days
         elif data_type == DataType.FUNDAMENTALS:
-            if not is_weekday:
-                return base_ttl * 2  # Double TTL on weekends
+            if not self._is_trading_day(calendar, now):
+                ttl = base_ttl * 2  # Double TTL on weekends and holidays
 
-        # News can be extended on weekends
+        # News can be extended on non-trading days
         elif data_type == DataType.NEWS:
-            if not is_weekday:
-                return int(base_ttl * 1.5)
+            if not self._is_trading_day(calendar, now):
+                ttl = int(base_ttl * 1.5)
 
-        return base_ttl
+        return jitter_ttl(ttl, jitter_fraction) or ttl
+
+    @staticmethod
+    def _calendar_for(asset: Optional[Asset]) -> Optional[TradingCalendar]:
+        """Trading calendar for an asset, if calendar-aware TTLs apply to it"""
+        if asset is None or not config.settings.cache_market_calendar_enabled:
+            return None
+        return calendar_for(asset)
+
+    @staticmethod
+    def _is_trading_day(calendar: Optional[TradingCalendar], now: datetime) -> bool:
+        """Whether the exchange trades today (any weekday without a calendar)"""
+        if calendar is None:
+            return now.weekday() < 5
+        return calendar.is_trading_day(now.astimezone(calendar.tz).date())
+
+    def _get_hard_ttl(self, soft_ttl: int) -> int:
+        """Get how long a read-through entry may be served once stale"""
+        if not config.settings.cache_stale_while_revalidate:
+            return soft_ttl
+        return max(soft_ttl, int(soft_ttl * config.settings.cache_hard_ttl_multiplier))
 
     async def get_with_read_through(
         self,
@@ -401,27 +896,105 @@ class CacheManager:
         data_type: DataType,
         fetch_fn: Callable[[], Any],
         asset: Optional[Asset] = None,
+        include_freshness: bool = False,
     ) -> Optional[Any]:
         """
         Read-through cache pattern: fetch from source if not in cache
 
+        Entries past their soft TTL are returned as-is while a single
+        background refresh replaces them; entries past their hard TTL have
+        expired from Redis and are fetched synchronously.
+
         Args:
             key: Cache key
             data_type: Type of data
             fetch_fn: Async function to fetch data if cache miss
             asset: Asset (for TTL calculation)
+            include_freshness: Add a "_cache" dict (cached_at, age_seconds,
+                is_stale, ttl_seconds) to dict results
 
         Returns:
             Cached or fetched data
         """
-        # Try cache first
-        start = time.perf_counter()
-        value = await self.l1.get(key)
-        l1_latency_ms = (time.perf_counter() - start) * 1000
 
-        if value is not None:
+        async def fetch_and_store() -> Any:
+            fetch_start = time.perf_counter()
+            fetched_value = await fetch_fn()
+            fetch_ms = (time.perf_counter() - fetch_start) * 1000
+
+            if fetched_value is not None:
+                # Store in cache with dynamic soft TTL; Redis keeps it until the hard TTL
+                ttl = self._get_ttl(data_type, asset)
+                entry = CacheEntry(
+                    fetched_value,
+                    soft_ttl=ttl,
+                    hard_ttl=self._get_hard_ttl(ttl),
+                    fetch_ms=fetch_ms,
+                )
+                payload = entry.to_payload()
+                if await self.l1.set(key, payload, entry.hard_ttl):
+                    if asset is not None:
+                        await self._index_asset_keys([(asset, key, entry.hard_ttl)])
+                    await self._l0_write(key, payload, ttl)
+
+                logger.debug(
+                    "Read-through cache populated",
+                    key=key,
+                    data_type=data_type.value,
+                    ttl=ttl,
+                    hard_ttl=entry.hard_ttl,
+                )
+
+            return fetched_value
+
+        if asset is not None:
+            self._notify_access(asset.symbol, data_type)
+            key = await self.l1.versioned_key(key, self.l1.symbol_namespace(asset.symbol))
+
+        # Try the in-process near-cache first, then L1
+        value = self._l0_get(key, data_type)
+        if value is None:
+            start = time.perf_counter()
+            value = await self.l1.get(key)
+            l1_latency_ms = (time.perf_counter() - start) * 1000
+
+            if value is None:
+                self._l1_misses += 1
+
+                # Record analytics for miss
+                self.analytics.record_cache_access(
+                    data_type=data_type,
+                    is_hit=False,
+                    latency_ms=l1_latency_ms,
+                    cache_level="l1",
+                    key=key,
+                )
+
+                # Fetch from source, joining any identical fetch already in flight
+                try:
+                    if self.coalescer.is_inflight(key):
+                        self.analytics.record_coalesced_request(data_type)
+                    fetched = await self.coalescer.run(key, fetch_and_store)
+                except NoProviderAvailableError as e:
+                    logger.info(f"Read-through fetch found no provider: {e}", key=key)
+                    self.analytics.record_error(data_type)
+                    # Only a definitive "no such symbol" is cached, not an outage
+                    if asset is not None and isinstance(e, SymbolNotFoundError):
+                        await self.set_negative(asset, data_type, str(e), key=key)
+                    return None
+                except Exception as e:
+                    logger.error(f"Read-through fetch error: {e}", key=key)
+                    self.analytics.record_error(data_type)
+                    return None
+
+                if include_freshness and isinstance(fetched, dict):
+                    ttl = self._get_ttl(data_type, asset)
+                    fetched = {**fetched, "_cache": CacheEntry(fetched, ttl, ttl).describe()}
+                return fetched
+
             self._l1_hits += 1
             self._track_l1_latency(l1_latency_ms)
+            self._l0_set(key, value)
 
             # Record analytics
             self.analytics.record_cache_access(
@@ -432,40 +1005,198 @@ class CacheManager:
                 key=key,
             )
 
+        negative = NegativeEntry.from_payload(value)
+        if negative is not None:
+            # A recent fetch found no provider for this key: don't ask again yet
+            self.analytics.record_negative_hit(data_type)
+            logger.debug("Negative cache hit", key=key, reason=negative.reason)
+            return None
+
+        entry = CacheEntry.from_payload(value)
+        if entry is None:
+            # Written without freshness metadata: treat as fresh
             return value
 
-        self._l1_misses += 1
+        if entry.is_stale():
+            refresh_started = self._schedule_refresh(key, data_type, fetch_and_store)
+            self.analytics.record_stale_hit(data_type, refresh_started)
+            logger.debug(
+                "Serving stale cache entry",
+                key=key,
+                age_seconds=round(entry.age_seconds(), 1),
+                refresh_started=refresh_started,
+            )
+        elif self._should_refresh_early(entry):
+            # Refresh a hot key before its soft TTL instead of all readers at once
+            if self._schedule_refresh(key, data_type, fetch_and_store):
+                self.analytics.record_early_refresh(data_type)
+                logger.debug(
+                    "Refreshing cache entry early",
+                    key=key,
+                    ttl_remaining=entry.ttl_remaining(),
+                    fetch_ms=round(entry.fetch_ms, 1),
+                )
 
-        # Record analytics for miss
-        self.analytics.record_cache_access(
-            data_type=data_type, is_hit=False, latency_ms=l1_latency_ms, cache_level="l1", key=key
-        )
+        if include_freshness and isinstance(entry.value, dict):
+            return {**entry.value, "_cache": entry.describe()}
+        return entry.value
+
+    async def get_negative_many(
+        self, assets: List[Asset], data_type: DataType
+    ) -> List[Optional[NegativeEntry]]:
+        """
+        Look up tombstones for several assets in one round trip
+
+        Used by callers that go to the arbitration engine without a
+        read-through (e.g. WebSocket streams) to skip symbols that recently
+        had no provider.
+
+        Args:
+            assets: Assets to check
+            data_type: Type of data
+
+        Returns:
+            Tombstone per asset (None where the key holds data or nothing)
+        """
+        results: List[Optional[NegativeEntry]] = [None] * len(assets)
+        if not config.settings.cache_negative_enabled or not assets:
+            return results
 
-        # Fetch from source
         try:
-            fetched_value = await fetch_fn()
+            keys = await self.l1.versioned_keys(
+                [self.l1.build_key(data_type.value, asset.symbol, "any") for asset in assets],
+                [(self.l1.symbol_namespace(asset.symbol),) for asset in assets],
+            )
 
-            if fetched_value is not None:
-                # Store in cache with dynamic TTL
-                ttl = self._get_ttl(data_type, asset)
-                await self.l1.set(key, fetched_value, ttl)
+            pending: List[int] = []
+            for i, key in enumerate(keys):
+                l0_value = self.l0.get(key) if self.l0 is not None else None
+                if l0_value is not None:
+                    results[i] = NegativeEntry.from_payload(l0_value)
+                else:
+                    pending.append(i)
+
+            if pending:
+                values = await self.l1.get_many([keys[i] for i in pending], track_access=False)
+                for i, value in zip(pending, values, strict=False):
+                    results[i] = NegativeEntry.from_payload(value)
+        except Exception as e:
+            # Without the cache every symbol is simply fetched
+            logger.debug(f"Negative cache lookup failed: {e}")
+            return [None] * len(assets)
 
-                logger.debug(
-                    "Read-through cache populated", key=key, data_type=data_type.value, ttl=ttl
-                )
+        for result in results:
+            if result is not None:
+                self.analytics.record_negative_hit(data_type)
+        return results
 
-            return fetched_value
+    async def set_negative(
+        self,
+        asset: Asset,
+        data_type: DataType,
+        reason: str,
+        key: Optional[str] = None,
+    ) -> bool:
+        """
+        Write a tombstone after every provider reported no data for a symbol
+
+        The tombstone is stored under the data's own key and only if that key
+        is empty, so it never hides real (even stale) data and the next
+        successful write replaces it. Bumping the symbol's generation
+        (invalidate_asset) drops it as well.
 
+        Args:
+            asset: Asset that could not be served
+            data_type: Type of data
+            reason: Why no provider could serve it
+            key: Versioned key to write (defaults to the data type's "any" key)
+
+        Returns:
+            True if a tombstone was written
+        """
+        if not config.settings.cache_negative_enabled:
+            return False
+
+        ttl = max(1, config.settings.cache_negative_ttl_seconds)
+        payload = NegativeEntry(reason).to_payload()
+        try:
+            if key is None:
+                key = await self._asset_key(asset, data_type.value, asset.symbol, "any")
+            if not await self.l1.set(key, payload, ttl, nx=True):
+                return False
+            await self._index_asset_keys([(asset, key, ttl)])
+            await self._l0_write(key, payload, ttl)
         except Exception as e:
-            logger.error(f"Read-through fetch error: {e}", key=key)
-            self.analytics.record_error(data_type)
-            return None
+            logger.debug(f"Negative cache write failed: {e}", symbol=asset.symbol)
+            return False
+
+        self.analytics.record_negative_write(data_type)
+        logger.info("Negative cache entry written", key=key, ttl=ttl, reason=reason)
+        return True
+
+    @staticmethod
+    def _should_refresh_early(entry: CacheEntry) -> bool:
+        """XFetch check for a fresh entry (see CacheEntry.should_refresh_early)"""
+        if not config.settings.cache_xfetch_enabled:
+            return False
+        return entry.should_refresh_early(config.settings.cache_xfetch_beta)
+
+    def _expires_early(self, raw: Any, data_type: DataType, key: str) -> bool:
+        """
+        Whether a cached value should be reported as a miss so the caller refetches
+
+        Only values written with a fetch duration can expire early.
+        """
+        entry = CacheEntry.from_payload(raw)
+        if entry is None or not self._should_refresh_early(entry):
+            return False
+
+        self.analytics.record_early_refresh(data_type)
+        logger.debug("Cache entry expired early", key=key, ttl_remaining=entry.ttl_remaining())
+        return True
+
+    @staticmethod
+    def _wrap_timed(value: Any, ttl: int, fetch_ms: Optional[float]) -> Any:
+        """Envelope a value with its fetch duration, or keep it bare if unknown"""
+        if fetch_ms is None:
+            return value
+        return CacheEntry(value, soft_ttl=ttl, hard_ttl=ttl, fetch_ms=fetch_ms).to_payload()
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        data_type: DataType,
+        fetch_and_store: Callable[[], Any],
+    ) -> bool:
+        """
+        Start a background refresh for a stale key unless one is already running
+
+        Returns:
+            True if a new refresh was started
+        """
+        if key in self._refresh_tasks or self.coalescer.is_inflight(key):
+            return False
+
+        async def refresh() -> None:
+            try:
+                await self.coalescer.run(key, fetch_and_store)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The stale value keeps being served until its hard TTL
+                logger.warning(f"Background cache refresh failed: {e}", key=key)
+                self.analytics.record_error(data_type)
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.create_task(refresh())
+        return True
 
     async def get_prices_batch(
         self, assets: List[Asset], provider: Optional[str] = None
     ) -> List[Optional[Dict[str, Any]]]:
         """
-        Get multiple prices with L1 cache batch optimization
+        Get multiple prices with L1 cache batch optimization and L2 fallback
 
         Args:
             assets: List of assets to query
@@ -474,33 +1205,82 @@ class CacheManager:
         Returns:
             List of price data (None for misses)
         """
-        # Build cache keys for all assets
-        l1_keys = [self.l1.build_key("price", asset.symbol, provider or "any") for asset in assets]
+        for asset in assets:
+            self._notify_access(asset.symbol, DataType.PRICE)
 
-        # Try L1 batch get with latency tracking
-        start = time.perf_counter()
-        results = await self.l1.get_many(l1_keys)
-        l1_latency_ms = (time.perf_counter() - start) * 1000
-        self._track_l1_latency(l1_latency_ms)
+        # Build cache keys for all assets (one generation lookup for the batch)
+        all_keys = await self.l1.versioned_keys(
+            [self.l1.build_key("price", asset.symbol, provider or "any") for asset in assets],
+            [(self.l1.symbol_namespace(asset.symbol),) for asset in assets],
+        )
+
+        # Serve what we can from the L0 near-cache, send the rest to L1
+        results: List[Optional[Any]] = [None] * len(all_keys)
+        pending: List[int] = []
+        for i, key in enumerate(all_keys):
+            l0_value = self._l0_get(key, DataType.PRICE)
+            if l0_value is not None:
+                results[i] = CacheEntry.unwrap(l0_value)
+            else:
+                pending.append(i)
+
+        l1_keys = [all_keys[i] for i in pending]
+        l1_results: List[Optional[Any]] = []
+        l1_latency_ms = 0.0
+
+        if l1_keys:
+            # Try L1 batch get with latency tracking
+            start = time.perf_counter()
+            l1_results = await self.l1.get_many(l1_keys)
+            l1_latency_ms = (time.perf_counter() - start) * 1000
+            self._track_l1_latency(l1_latency_ms)
+
+        for i, value in zip(pending, l1_results, strict=False):
+            results[i] = CacheEntry.unwrap(value)
+            if value is not None:
+                self._l0_set(all_keys[i], value)
 
-        hits = sum(1 for r in results if r is not None)
+        hits = sum(1 for r in l1_results if r is not None)
         self._l1_hits += hits
-        self._l1_misses += len(results) - hits
+        self._l1_misses += len(l1_results) - hits
 
         # Record analytics for batch
         # This is an approximation - we record one "hit" or "miss" for the batch?
         # Or we should iterate. Iterating is better for accuracy.
-        for i, result in enumerate(results):
+        l2_enabled = self._l2_enabled()
+        per_key_latency_ms = l1_latency_ms / len(l1_results) if l1_results else 0.0
+        for i, result in enumerate(l1_results):
             self.analytics.record_cache_access(
                 data_type=DataType.PRICE,
                 is_hit=result is not None,
-                latency_ms=l1_latency_ms / len(results) if results else 0,  # Distribute latency
+                latency_ms=per_key_latency_ms,  # Distribute latency
                 cache_level="l1",
                 key=l1_keys[i],
+                falls_through=l2_enabled,
             )
 
+        # Fall through to L2 for the remaining misses
+        l2_hits = 0
+        misses = [i for i in pending if results[i] is None]
+        if l2_enabled and misses:
+            l2_results = await asyncio.gather(
+                *(self._get_price_from_l2(assets[i], provider, all_keys[i]) for i in misses)
+            )
+            for i, l2_result in zip(misses, l2_results, strict=True):
+                if l2_result is None:
+                    continue
+                price_data, ttl_remaining = l2_result
+                results[i] = price_data
+                l2_hits += 1
+                await self._backfill_l1(all_keys[i], price_data, ttl_remaining)
+
         logger.debug(
-            "Batch price lookup", total=len(assets), l1_hits=hits, latency_ms=f"{l1_latency_ms:.2f}"
+            "Batch price lookup",
+            total=len(assets),
+            l0_hits=len(all_keys) - len(l1_keys),
+            l1_hits=hits,
+            l2_hits=l2_hits,
+            latency_ms=f"{l1_latency_ms:.2f}",
         )
 
         # Ensure proper typing for return value
@@ -512,26 +1292,51 @@ class CacheManager:
     async def set_prices_batch(
         self,
         items: List[tuple[Asset, str, Dict[str, Any]]],
+        fetch_ms: Optional[float] = None,
     ) -> int:
         """
-        Set multiple prices in L1 cache using batch optimization with dynamic TTL
+        Set multiple prices in L1 (batched) and L2 with dynamic TTL
+
+        TTLs are jittered so a batch of keys does not expire in the same second.
 
         Args:
             items: List of (asset, provider, price_data) tuples
+            fetch_ms: How long the batch fetch took; enables early refresh
 
         Returns:
             Number of successfully cached items
         """
-        # Build cache items with dynamic TTL per asset
+        # Build cache items with dynamic, jittered TTL per asset
         cache_items: List[Tuple[str, Any, Optional[int]]] = []
+        jitter = config.settings.cache_ttl_jitter_fraction
+        keys = await self.l1.versioned_keys(
+            [self.l1.build_key("price", asset.symbol, provider) for asset, provider, _ in items],
+            [(self.l1.symbol_namespace(asset.symbol),) for asset, _, _ in items],
+        )
+
+        for (asset, _, price_data), key in zip(items, keys, strict=False):
+            # Closed-market TTLs already end just after the open and are not jittered
+            ttl = self._get_ttl(DataType.PRICE, asset, jitter_fraction=jitter)
+            cache_items.append((key, self._wrap_timed(price_data, ttl, fetch_ms), ttl))
+
+        # Batch set in L1 (TTLs are already jittered)
+        success_count = await self.l1.set_many(cache_items, jitter_fraction=0.0)
+        if success_count:
+            await self._index_asset_keys(
+                [
+                    (asset, key, ttl)
+                    for (asset, _, _), (key, _, ttl) in zip(items, cache_items, strict=False)
+                ]
+            )
 
-        for asset, provider, price_data in items:
-            ttl = self._get_ttl(DataType.PRICE, asset)
-            key = self.l1.build_key("price", asset.symbol, provider)
-            cache_items.append((key, price_data, ttl))
+        if self.l0 is not None and success_count:
+            for item_key, item_value, item_ttl in cache_items:
+                self.l0.set(item_key, item_value, item_ttl)
+            await self._publish_l0_invalidation(keys=[k for k, _, _ in cache_items])
 
-        # Batch set in L1
-        success_count = await self.l1.set_many(cache_items)
+        if self._l2_enabled():
+            for asset, provider, price_data in items:
+                await self._set_price_in_l2(asset, provider, price_data)
 
         logger.debug("Batch price set", total=len(items), success=success_count)
         return int(success_count) if success_count else 0
@@ -0,0 +1,512 @@
+"""
+OHLCV Range Cache - Gap-aware candle caching on top of L2
+
+Candles are stored row-by-row in ohlcv_cache, and ohlcv_coverage records
+which [start, end) spans per asset and timeframe are complete. A request is
+split into covered and missing spans; only the missing part is fetched from
+providers and the answer is read back from L2 as one contiguous series.
+
+Providers only expose "the latest N candles", so the gaps are fetched as a
+single tail fetch sized to reach back to the earliest gap.
+
+When a finer timeframe already covers the requested window (e.g. a 1m feed
+for a 1h chart), the answer is resampled from it instead of fetching the
+coarser timeframe separately.
+
+For exchange-traded assets the window is measured in trading time: "the
+latest 100 1m candles" on a Saturday are Friday's last 100 minutes, and
+spans without a trading session are never reported as gaps.
+"""
+
+import math
+from datetime import UTC, datetime, time, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from fiml.cache.asset_index import AssetIndex
+from fiml.cache.coalescing import RequestCoalescer
+from fiml.cache.trading_calendar import TradingCalendar, calendar_for
+from fiml.core.logging import get_logger
+from fiml.core.models import Asset
+
+logger = get_logger(__name__)
+
+# Candle length per supported timeframe
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+    "1w": 604800,
+}
+
+Span = Tuple[datetime, datetime]
+
+# fetch_fn(limit) -> (provider name, candles)
+OHLCVFetchFn = Callable[[int], Awaitable[Tuple[str, List[Dict[str, Any]]]]]
+
+_DAY_SECONDS = 86400
+# How far back to look for trading sessions before giving up
+_MAX_LOOKBACK_YEARS = 30
+
+
+def timeframe_to_seconds(timeframe: str) -> int:
+    """
+    Get the candle length of a timeframe
+
+    Raises:
+        ValueError: If the timeframe is not supported
+    """
+    try:
+        return TIMEFRAME_SECONDS[timeframe]
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {timeframe}") from None
+
+
+def parse_candle_time(value: Any) -> Optional[datetime]:
+    """
+    Normalize a provider candle timestamp to an aware UTC datetime
+
+    Accepts epoch milliseconds or seconds, ISO 8601 strings and datetimes.
+    """
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Epoch seconds are < 1e11 until the year 5138
+        seconds = value / 1000 if value >= 1e11 else value
+        return datetime.fromtimestamp(seconds, tz=UTC)
+
+    if isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+    return None
+
+
+def merge_spans(spans: Sequence[Span]) -> List[Span]:
+    """Merge overlapping or touching [start, end) spans"""
+    merged: List[Span] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_spans(requested: Span, covered: Sequence[Span]) -> List[Span]:
+    """
+    Get the parts of a requested [start, end) span not inside covered spans
+
+    Args:
+        requested: Span being asked for
+        covered: Spans already cached
+
+    Returns:
+        Ordered list of uncovered spans
+    """
+    start, end = requested
+    gaps: List[Span] = []
+    cursor = start
+
+    for cov_start, cov_end in merge_spans(covered):
+        if cov_end <= cursor:
+            continue
+        if cov_start >= end:
+            break
+        if cov_start > cursor:
+            gaps.append((cursor, cov_start))
+        cursor = max(cursor, cov_end)
+        if cursor >= end:
+            break
+
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _sessions_before(calendar: TradingCalendar, end: datetime) -> Iterator[Span]:
+    """Trading sessions opening before end, newest first, clipped to end"""
+    year = end.astimezone(calendar.tz).year
+    for session_year in range(year, year - _MAX_LOOKBACK_YEARS, -1):
+        for open_, close in reversed(calendar.sessions(session_year)):
+            if open_ < end:
+                yield open_, min(close, end)
+
+
+def latest_window_start(
+    now: datetime, limit: int, tf_seconds: int, calendar: Optional[TradingCalendar] = None
+) -> datetime:
+    """
+    Start of the window holding the latest `limit` candle periods up to now
+
+    With a calendar, intraday periods count trading time only and daily
+    periods count trading days, so nights, weekends and holidays do not
+    shrink the window. Weekly candles and assets without a calendar use
+    calendar time.
+    """
+    fallback = datetime.fromtimestamp(now.timestamp() - limit * tf_seconds, tz=UTC)
+    if calendar is None or tf_seconds > _DAY_SECONDS or limit <= 0:
+        return fallback
+
+    if tf_seconds < _DAY_SECONDS:
+        remaining = float(limit * tf_seconds)
+        for open_, close in _sessions_before(calendar, now):
+            span = (close - open_).total_seconds()
+            if span >= remaining:
+                return close - timedelta(seconds=remaining)
+            remaining -= span
+        return fallback
+
+    days = 0
+    last_day = None
+    for open_, _ in _sessions_before(calendar, now):
+        day = open_.astimezone(calendar.tz).date()
+        if day == last_day:
+            continue
+        days += 1
+        last_day = day
+        if days == limit:
+            # Daily candles are labelled at UTC or exchange midnight (or the open)
+            return min(
+                datetime.combine(day, time(0), UTC),
+                datetime.combine(day, time(0), calendar.tz).astimezone(UTC),
+            )
+    return fallback
+
+
+def periods_between(
+    start: datetime, end: datetime, tf_seconds: int, calendar: Optional[TradingCalendar] = None
+) -> int:
+    """Candle periods in [start, end), in trading time when there is a calendar"""
+    if calendar is None or tf_seconds > _DAY_SECONDS:
+        return math.ceil((end - start).total_seconds() / tf_seconds)
+
+    periods = 0
+    last_day = None
+    for open_, close in _sessions_before(calendar, end):
+        if close <= start:
+            break
+        if tf_seconds < _DAY_SECONDS:
+            periods += math.ceil((close - max(open_, start)).total_seconds() / tf_seconds)
+        elif open_.astimezone(calendar.tz).date() != last_day:
+            periods += 1
+            last_day = open_.astimezone(calendar.tz).date()
+    return periods
+
+
+def _trades_between(calendar: TradingCalendar, start: datetime, end: datetime) -> bool:
+    """Whether a trading session overlaps [start, end)"""
+    if calendar.is_open(start):
+        return True
+    next_open = calendar.next_open(start)
+    return next_open is not None and next_open < end
+
+
+def normalize_candles(candles: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert provider candles to L2 rows (time as datetime), dropping bad rows
+
+    Returns:
+        Candles sorted by time with duplicates collapsed (last wins)
+    """
+    by_time: Dict[datetime, Dict[str, Any]] = {}
+    for candle in candles:
+        candle_time = parse_candle_time(candle.get("timestamp"))
+        if candle_time is None:
+            continue
+        try:
+            by_time[candle_time] = {
+                "time": candle_time,
+                "open": float(candle["open"]),
+                "high": float(candle["high"]),
+                "low": float(candle["low"]),
+                "close": float(candle["close"]),
+                "volume": float(candle["volume"]) if candle.get("volume") is not None else None,
+            }
+        except (KeyError, TypeError, ValueError):
+            continue
+    return [by_time[t] for t in sorted(by_time)]
+
+
+def to_provider_candle(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an L2 row back to the provider candle format (epoch ms)"""
+    return {
+        "timestamp": int(row["time"].timestamp() * 1000),
+        "open": row["open"],
+        "high": row["high"],
+        "low": row["low"],
+        "close": row["close"],
+        "volume": row["volume"],
+    }
+
+
+class OHLCVRangeCache:
+    """
+    Serves "latest N candles" requests from L2, fetching only missing spans
+
+    Features:
+    - Per asset/timeframe coverage spans stored next to the candles
+    - Tail gaps shorter than the tolerance are served from cache
+    - Single-flight gap fetches per asset/timeframe
+    - Hit/partial/miss statistics
+    """
+
+    def __init__(
+        self,
+        l2: Any,
+        asset_index: AssetIndex,
+        tail_tolerance_seconds: int = 60,
+        tail_tolerance_fraction: float = 0.05,
+        max_fetch_candles: int = 5000,
+        resample_sources: Sequence[str] = (),
+        max_resample_source_candles: int = 20000,
+    ) -> None:
+        """
+        Initialize range cache
+
+        Args:
+            l2: L2Cache with the OHLCV range methods
+            asset_index: Index resolving assets to assets.id
+            tail_tolerance_seconds: How far behind "now" coverage may end
+                before the latest candles are refetched (capped at one candle)
+            tail_tolerance_fraction: Share of a candle the tail may lag instead,
+                when larger, so daily candles are not refetched every minute
+            max_fetch_candles: Upper bound on the limit of a single gap fetch
+            resample_sources: Finer timeframes to derive requests from when
+                their coverage spans the requested window
+            max_resample_source_candles: Skip a source needing more rows
+        """
+        self.l2 = l2
+        self.asset_index = asset_index
+        self.tail_tolerance_seconds = tail_tolerance_seconds
+        self.tail_tolerance_fraction = tail_tolerance_fraction
+        self.max_fetch_candles = max_fetch_candles
+        self.resample_sources = list(resample_sources)
+        self.max_resample_source_candles = max_resample_source_candles
+        self._coalescer = RequestCoalescer()
+
+        # Statistics
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.resampled = 0
+        self.candles_fetched = 0
+        self.candles_served = 0
+
+    async def get_candles(
+        self,
+        asset: Asset,
+        timeframe: str,
+        limit: int,
+        fetch_fn: OHLCVFetchFn,
+        now: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the latest `limit` candle periods for an asset
+
+        Args:
+            asset: Asset to query
+            timeframe: Candle timeframe (see TIMEFRAME_SECONDS)
+            limit: Number of candle periods to cover, ending now (in trading
+                time for exchange-traded assets)
+            fetch_fn: Coroutine fetching the latest N candles from providers
+            now: Current time (for testing)
+
+        Returns:
+            At most `limit` candles in provider format, oldest first
+        """
+        tf_seconds = timeframe_to_seconds(timeframe)
+        now = now or datetime.now(UTC)
+        calendar = calendar_for(asset)
+        start = latest_window_start(now, limit, tf_seconds, calendar)
+
+        asset_id = await self.asset_index.get_asset_id(asset, create=True)
+        if asset_id is None:
+            _, candles = await fetch_fn(limit)
+            return list(candles)
+
+        covered = await self.l2.get_ohlcv_coverage(asset_id, timeframe)
+        gaps = self._uncovered(covered, start, now, tf_seconds, calendar)
+
+        if gaps:
+            resampled = await self._from_finer(
+                asset, asset_id, timeframe, limit, start, now, calendar
+            )
+            if resampled is not None:
+                return resampled
+
+        if not gaps:
+            self.hits += 1
+        else:
+            if gaps[0][0] == start and gaps[0][1] == now:
+                self.misses += 1
+            else:
+                self.partial_hits += 1
+
+            fetched: Optional[List[Dict[str, Any]]] = await self._coalescer.run(
+                f"{asset_id}:{timeframe}",
+                lambda: self._fetch_gaps(
+                    asset_id, timeframe, tf_seconds, gaps[0][0], now, fetch_fn, calendar
+                ),
+            )
+            if fetched is not None:
+                # Nothing could be stored: serve the fetched candles as-is
+                return fetched
+
+        # Include the forming candle, which starts before now
+        rows = await self.l2.get_ohlcv_range(
+            asset_id,
+            timeframe,
+            start,
+            datetime.fromtimestamp(now.timestamp() + tf_seconds, tz=UTC),
+        )
+        rows = rows[-limit:]
+        self.candles_served += len(rows)
+        return [to_provider_candle(row) for row in rows]
+
+    def _uncovered(
+        self,
+        covered: Sequence[Span],
+        start: datetime,
+        now: datetime,
+        tf_seconds: int,
+        calendar: Optional[TradingCalendar] = None,
+    ) -> List[Span]:
+        """Missing spans of [start, now), ignoring a short tail gap and closed markets"""
+        gaps = missing_spans((start, now), covered)
+        if calendar is not None:
+            gaps = [gap for gap in gaps if _trades_between(calendar, *gap)]
+
+        # A short tail gap is the still-forming candle: serve it from cache
+        tolerance = min(
+            max(self.tail_tolerance_seconds, tf_seconds * self.tail_tolerance_fraction),
+            tf_seconds,
+        )
+        if gaps and gaps[-1][1] == now and (now - gaps[-1][0]).total_seconds() < tolerance:
+            gaps.pop()
+        return gaps
+
+    async def _from_finer(
+        self,
+        asset: Asset,
+        asset_id: int,
+        timeframe: str,
+        limit: int,
+        start: datetime,
+        now: datetime,
+        calendar: Optional[TradingCalendar] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Build the answer from a finer timeframe whose coverage spans the window
+
+        Returns:
+            Resampled candles, or None when no source timeframe qualifies
+        """
+        # Imported here: resample depends on this module's helpers
+        from fiml.cache.resample import can_resample, session_for
+
+        tf_seconds = timeframe_to_seconds(timeframe)
+        # Reach back one extra bucket so the first returned bucket is complete
+        window_start = datetime.fromtimestamp(start.timestamp() - tf_seconds, tz=UTC)
+
+        for source in self.resample_sources:
+            if not can_resample(source, timeframe):
+                continue
+            source_seconds = timeframe_to_seconds(source)
+            if (limit + 1) * tf_seconds // source_seconds > self.max_resample_source_candles:
+                continue
+
+            covered = await self.l2.get_ohlcv_coverage(asset_id, source)
+            if self._uncovered(covered, window_start, now, source_seconds, calendar):
+                continue
+
+            candles = await self.l2.get_ohlcv_resampled(
+                asset_id,
+                source,
+                timeframe,
+                window_start,
+                datetime.fromtimestamp(now.timestamp() + source_seconds, tz=UTC),
+                session_for(asset),
+            )
+            # Drop the leading bucket that started before the source window
+            cutoff = window_start.timestamp() * 1000
+            candles = [c for c in candles if c["timestamp"] >= cutoff][-limit:]
+
+            self.resampled += 1
+            self.candles_served += len(candles)
+            logger.debug(
+                "OHLCV served by resampling",
+                asset_id=asset_id,
+                source=source,
+                timeframe=timeframe,
+                candles=len(candles),
+            )
+            return candles
+
+        return None
+
+    async def _fetch_gaps(
+        self,
+        asset_id: int,
+        timeframe: str,
+        tf_seconds: int,
+        gap_start: datetime,
+        now: datetime,
+        fetch_fn: OHLCVFetchFn,
+        calendar: Optional[TradingCalendar] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch everything from gap_start to now and store it
+
+        Returns:
+            None once stored in L2, otherwise the raw fetched candles
+        """
+        needed = periods_between(gap_start, now, tf_seconds, calendar) + 1
+        fetch_limit = min(needed, self.max_fetch_candles)
+
+        provider, raw_candles = await fetch_fn(fetch_limit)
+        candles = normalize_candles(raw_candles)
+        self.candles_fetched += len(candles)
+
+        if not candles:
+            return list(raw_candles)
+
+        # A short answer means the provider has nothing older: the gap is covered
+        covered_start = candles[0]["time"]
+        if len(candles) < fetch_limit:
+            covered_start = min(covered_start, gap_start)
+
+        stored = await self.l2.store_ohlcv_range(
+            asset_id, provider, timeframe, candles, covered_start, now
+        )
+
+        logger.debug(
+            "OHLCV gap fetched",
+            asset_id=asset_id,
+            timeframe=timeframe,
+            limit=fetch_limit,
+            candles=len(candles),
+            stored=stored,
+        )
+        return None if stored else list(raw_candles)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get range cache statistics"""
+        requests = self.hits + self.partial_hits + self.misses
+        return {
+            "requests": requests,
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "resampled": self.resampled,
+            "hit_rate_percent": round(self.hits / requests * 100, 2) if requests else 0.0,
+            "candles_fetched": self.candles_fetched,
+            "candles_served": self.candles_served,
+        }
@@ -0,0 +1,234 @@
+"""
+OHLCV Resampling - Derive coarser candles from finer ones
+
+Candles are grouped into buckets of the target timeframe and aggregated
+with NumPy (open=first, high=max, low=min, close=last, volume=sum), so a
+single 1m series can serve every chart timeframe.
+
+Buckets follow the exchange session: intraday buckets are anchored at the
+session open in the exchange time zone (a US equity 1h bar runs 09:30-10:30
+New York time, across DST changes), daily buckets are local calendar days
+and weekly buckets start on Monday. Crypto trades around the clock and is
+bucketed on UTC boundaries.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from fiml.cache.ohlcv_range import TIMEFRAME_SECONDS, parse_candle_time, timeframe_to_seconds
+from fiml.core.models import Asset, AssetType, Market
+
+_HOUR_MS = 3_600_000
+_DAY_MS = 86_400_000
+_WEEK_MS = 7 * _DAY_MS
+# 1970-01-01 was a Thursday; shifting by 3 days puts week boundaries on Monday
+_MONDAY_SHIFT_MS = 3 * _DAY_MS
+
+
+@dataclass(frozen=True)
+class SessionAlignment:
+    """Exchange time zone and session open used to align buckets"""
+
+    timezone: str = "UTC"
+    open_offset_seconds: int = 0  # Session open, seconds after local midnight
+
+    @property
+    def is_utc(self) -> bool:
+        """Whether buckets fall on plain UTC boundaries"""
+        return self.timezone == "UTC" and self.open_offset_seconds == 0
+
+
+UTC_SESSION = SessionAlignment()
+
+# Regular trading session per market (equities, ETFs, indices)
+MARKET_SESSIONS: Dict[Market, SessionAlignment] = {
+    Market.US: SessionAlignment("America/New_York", 9 * 3600 + 30 * 60),
+    Market.UK: SessionAlignment("Europe/London", 8 * 3600),
+    Market.EU: SessionAlignment("Europe/Berlin", 9 * 3600),
+    Market.JP: SessionAlignment("Asia/Tokyo", 9 * 3600),
+    Market.CN: SessionAlignment("Asia/Shanghai", 9 * 3600 + 30 * 60),
+    Market.HK: SessionAlignment("Asia/Hong_Kong", 9 * 3600 + 30 * 60),
+}
+
+_SESSION_ASSET_TYPES = {AssetType.EQUITY, AssetType.ETF, AssetType.INDEX, AssetType.OPTION}
+
+
+def session_for(asset: Asset) -> SessionAlignment:
+    """
+    Get the bucket alignment for an asset
+
+    Exchange-traded assets follow their market's session; crypto, forex and
+    everything else is bucketed in UTC.
+    """
+    if asset.asset_type in _SESSION_ASSET_TYPES:
+        return MARKET_SESSIONS.get(asset.market, UTC_SESSION)
+    return UTC_SESSION
+
+
+def can_resample(source_timeframe: str, target_timeframe: str) -> bool:
+    """Whether target candles can be built from whole source candles"""
+    source = TIMEFRAME_SECONDS.get(source_timeframe)
+    target = TIMEFRAME_SECONDS.get(target_timeframe)
+    if source is None or target is None or target <= source:
+        return False
+    return target % source == 0
+
+
+@lru_cache(maxsize=32)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _offset_ms(zone: ZoneInfo, epoch_seconds: int) -> int:
+    offset = datetime.fromtimestamp(epoch_seconds, tz=zone).utcoffset()
+    return int(offset.total_seconds() * 1000) if offset is not None else 0
+
+
+def _utc_offsets_ms(ts: np.ndarray, timezone: str) -> np.ndarray:
+    """UTC offset in ms at each timestamp, evaluated once per distinct hour"""
+    if timezone == "UTC":
+        return np.zeros_like(ts)
+
+    zone = _zone(timezone)
+    hours, inverse = np.unique(ts // _HOUR_MS, return_inverse=True)
+    offsets = np.fromiter(
+        (_offset_ms(zone, int(h) * 3600) for h in hours),
+        dtype=np.int64,
+        count=len(hours),
+    )
+    return offsets[inverse]
+
+
+def candle_ms(candle: Dict[str, Any]) -> Optional[int]:
+    """Open time of a candle in epoch ms (provider timestamp or L2 time field)"""
+    value = candle.get("timestamp", candle.get("time"))
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 1e11:
+        return value
+    parsed = parse_candle_time(value)
+    return int(parsed.timestamp() * 1000) if parsed is not None else None
+
+
+def _local_to_utc_ms(local_ms: np.ndarray, timezone: str) -> np.ndarray:
+    """Convert local wall-clock epoch ms in a time zone to UTC epoch ms"""
+    if timezone == "UTC":
+        return local_ms
+
+    zone = _zone(timezone)
+    return np.fromiter(
+        (
+            int(
+                datetime.fromtimestamp(int(ms) / 1000, tz=UTC).replace(tzinfo=zone).timestamp()
+                * 1000
+            )
+            for ms in local_ms
+        ),
+        dtype=np.int64,
+        count=len(local_ms),
+    )
+
+
+def local_bucket_starts(
+    ts: np.ndarray,
+    target_timeframe: str,
+    session: SessionAlignment = UTC_SESSION,
+) -> np.ndarray:
+    """
+    Map epoch-ms timestamps to the local wall-clock start of their bucket
+
+    Args:
+        ts: Candle open times in epoch ms
+        target_timeframe: Bucket timeframe
+        session: Exchange alignment
+
+    Returns:
+        Bucket start per timestamp, as epoch ms of the exchange wall clock
+    """
+    target_ms = timeframe_to_seconds(target_timeframe) * 1000
+    local: np.ndarray = ts + _utc_offsets_ms(ts, session.timezone)
+
+    if target_ms >= _WEEK_MS:
+        starts = (local + _MONDAY_SHIFT_MS) // _WEEK_MS * _WEEK_MS - _MONDAY_SHIFT_MS
+    elif target_ms >= _DAY_MS:
+        starts = local // target_ms * target_ms
+    else:
+        anchor = session.open_offset_seconds * 1000
+        starts = (local - anchor) // target_ms * target_ms + anchor
+    return starts
+
+
+def resample_candles(
+    candles: Sequence[Dict[str, Any]],
+    source_timeframe: str,
+    target_timeframe: str,
+    session: SessionAlignment = UTC_SESSION,
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate candles into a coarser timeframe
+
+    Args:
+        candles: Source candles, provider format (timestamp) or L2 rows (time)
+        source_timeframe: Timeframe of the source candles
+        target_timeframe: Timeframe to build
+        session: Exchange alignment (see session_for)
+
+    Returns:
+        Target candles in provider format, oldest first. Each has an
+        is_closed flag that is False while the source does not yet reach
+        the end of the bucket.
+
+    Raises:
+        ValueError: If the target is not a whole multiple of the source
+    """
+    if source_timeframe == target_timeframe:
+        return [dict(c) for c in candles]
+    if not can_resample(source_timeframe, target_timeframe):
+        raise ValueError(f"Cannot resample {source_timeframe} candles to {target_timeframe}")
+
+    rows = [(ms, c) for c in candles if (ms := candle_ms(c)) is not None]
+    if not rows:
+        return []
+    rows.sort(key=lambda row: row[0])
+
+    ts = np.fromiter((ms for ms, _ in rows), dtype=np.int64, count=len(rows))
+    ohlc = np.array(
+        [[c["open"], c["high"], c["low"], c["close"]] for _, c in rows], dtype=np.float64
+    )
+    volume = np.array(
+        [c.get("volume") if c.get("volume") is not None else np.nan for _, c in rows],
+        dtype=np.float64,
+    )
+
+    buckets = local_bucket_starts(ts, target_timeframe, session)
+    first = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    last = np.concatenate((first[1:], [len(ts)])) - 1
+
+    high = np.maximum.reduceat(ohlc[:, 1], first)
+    low = np.minimum.reduceat(ohlc[:, 2], first)
+    has_volume = np.logical_or.reduceat(~np.isnan(volume), first)
+    total_volume = np.add.reduceat(np.nan_to_num(volume), first)
+
+    # Bucket bounds in UTC; a DST day is 23 or 25 hours long
+    target_ms = timeframe_to_seconds(target_timeframe) * 1000
+    starts = _local_to_utc_ms(buckets[first], session.timezone)
+    ends = _local_to_utc_ms(buckets[first] + target_ms, session.timezone)
+
+    # A bucket is closed once the source reaches its end
+    source_end = ts[-1] + timeframe_to_seconds(source_timeframe) * 1000
+
+    return [
+        {
+            "timestamp": int(starts[i]),
+            "open": float(ohlc[f, 0]),
+            "high": float(high[i]),
+            "low": float(low[i]),
+            "close": float(ohlc[last[i], 3]),
+            "volume": float(total_volume[i]) if has_volume[i] else None,
+            "is_closed": bool(ends[i] <= source_end),
+        }
+        for i, f in enumerate(first)
+    ]
@@ -5,12 +5,14 @@ Reduces API calls by batching similar requests during low-load periods
 
 import asyncio
 import contextlib
+import time
 from collections import defaultdict
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, DataType
+from fiml.providers.rate_limiter import Priority, rate_limit_priority
 
 logger = get_logger(__name__)
 
@@ -176,6 +178,8 @@ class BatchUpdateScheduler:
         Returns:
             Stats dict with success/failure counts
         """
+        from fiml.providers.base import BaseProvider
+
         stats = {"success": 0, "failed": 0, "api_calls": 0}
 
         # Group by batch key to optimize API calls
@@ -197,11 +201,23 @@ class BatchUpdateScheduler:
 
                 # Batch fetch data from provider
                 if data_type == DataType.PRICE:
-                    # Check if provider supports batch operations
-                    if hasattr(provider, "get_prices_batch"):
+                    prices: Optional[List[Optional[Dict[str, Any]]]] = None
+                    calls = 1
+                    fetch_start = time.perf_counter()
+
+                    if isinstance(provider, BaseProvider):
+                        # Multi-symbol upstream requests where the provider has them
+                        responses = await provider.fetch_prices_batch(assets)
+                        if responses:
+                            calls = max(1, responses[0].metadata.get("batch_calls", 1))
+                        prices = [r.data if r.is_valid else None for r in responses]
+                    elif hasattr(provider, "get_prices_batch"):
                         # Single API call for all assets
                         prices = await provider.get_prices_batch(assets)
-                        stats["api_calls"] += 1
+
+                    if prices is not None:
+                        fetch_ms = (time.perf_counter() - fetch_start) * 1000
+                        stats["api_calls"] += calls
 
                         # Update cache for each asset
                         cache_items = [
@@ -210,24 +226,31 @@ class BatchUpdateScheduler:
                             if price is not None
                         ]
 
+                        success_count = 0
                         if cache_items:
-                            success_count = await self.cache_manager.set_prices_batch(cache_items)
-                            stats["success"] += success_count
-                            stats["failed"] += len(requests) - success_count
+                            success_count = await self.cache_manager.set_prices_batch(
+                                cache_items, fetch_ms=fetch_ms
+                            )
+                        stats["success"] += success_count
+                        stats["failed"] += len(requests) - success_count
 
-                            # Calculate API calls saved
-                            stats["api_calls_saved"] = len(requests) - 1
+                        # Calculate API calls saved
+                        stats["api_calls_saved"] = stats.get("api_calls_saved", 0) + max(
+                            0, len(requests) - calls
+                        )
 
                     else:
                         # Fall back to individual calls
                         for request in requests:
                             try:
+                                fetch_start = time.perf_counter()
                                 price = await provider.get_price(request.asset)
+                                fetch_ms = (time.perf_counter() - fetch_start) * 1000
                                 stats["api_calls"] += 1
 
                                 if price:
                                     await self.cache_manager.set_price(
-                                        request.asset, provider_name, price
+                                        request.asset, provider_name, price, fetch_ms=fetch_ms
                                     )
                                     stats["success"] += 1
                                 else:
@@ -243,12 +266,14 @@ class BatchUpdateScheduler:
                     # Similar pattern for fundamentals
                     for request in requests:
                         try:
+                            fetch_start = time.perf_counter()
                             fundamentals = await provider.get_fundamentals(request.asset)
+                            fetch_ms = (time.perf_counter() - fetch_start) * 1000
                             stats["api_calls"] += 1
 
                             if fundamentals:
                                 await self.cache_manager.set_fundamentals(
-                                    request.asset, provider_name, fundamentals
+                                    request.asset, provider_name, fundamentals, fetch_ms=fetch_ms
                                 )
                                 stats["success"] += 1
                             else:
@@ -298,8 +323,9 @@ class BatchUpdateScheduler:
             is_low_load=is_low_load,
         )
 
-        # Process batch
-        stats = await self._process_batch(batch)
+        # Process batch, behind interactive requests for upstream quota
+        with rate_limit_priority(Priority.BACKGROUND):
+            stats = await self._process_batch(batch)
 
         # Update statistics
         self.batches_processed += 1
@@ -0,0 +1,89 @@
+"""
+Count-Min Sketch - Approximate access frequencies in fixed memory
+
+Used by the W-TinyLFU eviction policy to decide whether a new key is worth
+admitting over the current eviction victim. Counters are periodically halved
+(aging) so keys that were popular long ago lose their advantage.
+"""
+
+from typing import List
+
+_MASK64 = (1 << 64) - 1
+
+# Odd 64-bit multipliers, one per sketch row
+_ROW_SEEDS = [
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD,
+    0xC4CEB9FE1A85EC53,
+    0x94D049BB133111EB,
+    0xBF58476D1CE4E5B9,
+]
+
+
+class CountMinSketch:
+    """
+    Approximate frequency counter with periodic aging
+
+    Features:
+    - Fixed memory: depth rows (at most 8) of width counters
+    - Estimates never under-count (only over-count on hash collisions)
+    - Counters saturate at max_count, as in TinyLFU's 4-bit counters
+    - All counters are halved after sample_size increments
+    """
+
+    def __init__(
+        self,
+        width: int = 1024,
+        depth: int = 4,
+        sample_size: int = 10240,
+        max_count: int = 15,
+    ) -> None:
+        # Round width up to a power of two so rows are indexed by the top hash bits
+        self.width = 1 << max(1, (max(1, width) - 1).bit_length())
+        self.depth = min(max(1, depth), len(_ROW_SEEDS))
+        self.sample_size = max(1, sample_size)
+        self.max_count = max_count
+        self._shift = 64 - (self.width.bit_length() - 1)
+        self._seeds = _ROW_SEEDS[: self.depth]
+        self._rows: List[List[int]] = [[0] * self.width for _ in range(self.depth)]
+        self._additions = 0
+        self._resets = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        """Column index of key in each row"""
+        h = hash(key)
+        # Multiplicative hashing with a distinct odd seed per row keeps rows
+        # independent (double hashing collides in every row for small widths)
+        return [((h * seed) & _MASK64) >> self._shift for seed in self._seeds]
+
+    def increment(self, key: str) -> None:
+        """Record one access to key"""
+        for row, index in zip(self._rows, self._indexes(key), strict=False):
+            if row[index] < self.max_count:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key: str) -> int:
+        """Estimated access count for key"""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key), strict=False))
+
+    def reset(self) -> None:
+        """Age the sketch by halving every counter"""
+        for row in self._rows:
+            for i, count in enumerate(row):
+                if count:
+                    row[i] = count >> 1
+        self._additions //= 2
+        self._resets += 1
+
+    def clear(self) -> None:
+        """Zero all counters"""
+        self._rows = [[0] * self.width for _ in range(self.depth)]
+        self._additions = 0
+        self._resets = 0
@@ -0,0 +1,255 @@
+"""
+Cache Snapshot - Carry the hot L1 working set across restarts
+
+The most accessed L1 keys are written, with their absolute expiry times, to a
+compact local file on shutdown and optionally on a timer. At startup the file
+is reloaded with pipelined writes. A deploy or Redis failover therefore starts
+with the working set in place instead of re-fetching it from providers.
+Entries that expired while the process was down are skipped. Keys that
+already exist in Redis are left alone, because they are at least as fresh as
+the snapshot.
+"""
+
+import asyncio
+import contextlib
+import gzip
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from fiml.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from fiml.cache.l1_cache import L1Cache
+
+logger = get_logger(__name__)
+
+
+class CacheSnapshotter:
+    """
+    Dump and restore the hottest L1 entries
+
+    Features:
+    - Picks keys from the cluster-wide hot key view, then this worker's
+      access counts
+    - Batched reads (get_many + pipelined TTL) and writes (set_many)
+    - Remaining TTLs are preserved; expired and soon-to-expire entries are
+      dropped
+    - Atomic file replacement, so a crash mid-write keeps the last snapshot
+    - Payloads use the L1 codec, gzip-compressed
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        l1: "L1Cache",
+        path: str,
+        max_keys: int = 5000,
+        min_ttl_seconds: int = 5,
+        chunk_size: int = 500,
+    ) -> None:
+        """
+        Initialize cache snapshotter
+
+        Args:
+            l1: L1 cache to snapshot and restore
+            path: Snapshot file location
+            max_keys: Maximum number of keys per snapshot
+            min_ttl_seconds: Entries with less remaining TTL are not kept
+            chunk_size: Keys per Redis pipeline
+        """
+        self.l1 = l1
+        self.path = Path(path)
+        self.max_keys = max(1, max_keys)
+        self.min_ttl_seconds = max(0, min_ttl_seconds)
+        self.chunk_size = max(1, chunk_size)
+
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.saves = 0
+        self.saved_entries = 0
+        self.restored_entries = 0
+        self.skipped_expired = 0
+        self.skipped_existing = 0
+        self.errors = 0
+        self.last_saved_at: Optional[float] = None
+        self.last_restored_at: Optional[float] = None
+
+    async def select_keys(self) -> List[str]:
+        """Hottest keys, cluster-wide view first, then local access counts"""
+        hot = await self.l1.get_hot_keys(
+            n=self.max_keys, minutes=self.l1.hot_keys.retention_minutes
+        )
+        ranked: Dict[str, None] = dict.fromkeys(key for key, _ in hot)
+        for key, _ in self.l1.get_most_accessed(self.max_keys):
+            ranked.setdefault(key, None)
+        return list(ranked)[: self.max_keys]
+
+    async def save(self) -> int:
+        """
+        Write the hot working set to the snapshot file
+
+        Returns:
+            Number of entries written
+        """
+        keys = await self.select_keys()
+        if not keys:
+            return 0
+
+        now = time.time()
+        entries: List[Tuple[str, Optional[float], Any]] = []
+        for start in range(0, len(keys), self.chunk_size):
+            chunk = keys[start : start + self.chunk_size]
+            values = await self.l1.get_many(chunk, track_access=False)
+            ttls = await self.l1.get_ttls(chunk)
+            for key, value, ttl in zip(chunk, values, ttls, strict=False):
+                if value is None or ttl is None:
+                    continue
+                if ttl == -1:
+                    entries.append((key, None, value))
+                elif ttl >= self.min_ttl_seconds:
+                    entries.append((key, now + ttl, value))
+
+        document = {
+            "version": self.FORMAT_VERSION,
+            "created_at": now,
+            "entries": [[key, expires_at, value] for key, expires_at, value in entries],
+        }
+        try:
+            payload = self.l1.codec.encode(document)
+            await asyncio.to_thread(self._write, payload)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Cache snapshot write failed: {e}", path=str(self.path))
+            return 0
+
+        self.saves += 1
+        self.saved_entries = len(entries)
+        self.last_saved_at = now
+        logger.info("Cache snapshot saved", entries=len(entries), path=str(self.path))
+        return len(entries)
+
+    def _write(self, payload: bytes) -> None:
+        """Replace the snapshot file atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(gzip.compress(payload, compresslevel=1))
+        os.replace(tmp_path, self.path)
+
+    def _read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return gzip.decompress(f.read())
+
+    async def restore(self) -> int:
+        """
+        Reload the snapshot into L1
+
+        Returns:
+            Number of entries restored
+        """
+        try:
+            document = self.l1.codec.decode(await asyncio.to_thread(self._read))
+        except FileNotFoundError:
+            logger.info("No cache snapshot to restore", path=str(self.path))
+            return 0
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache snapshot unreadable, starting cold: {e}", path=str(self.path))
+            return 0
+
+        if not isinstance(document, dict) or document.get("version") != self.FORMAT_VERSION:
+            logger.warning("Unsupported cache snapshot format, starting cold", path=str(self.path))
+            return 0
+
+        now = time.time()
+        items: List[Tuple[str, Any, Optional[int]]] = []
+        for key, expires_at, value in document.get("entries", []):
+            if expires_at is None:
+                items.append((key, value, None))
+                continue
+            remaining = int(expires_at - now)
+            if remaining < max(1, self.min_ttl_seconds):
+                self.skipped_expired += 1
+                continue
+            items.append((key, value, remaining))
+
+        restored = 0
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start : start + self.chunk_size]
+            existing = await self.l1.get_ttls([key for key, _, _ in chunk])
+            missing = [item for item, ttl in zip(chunk, existing, strict=False) if ttl is None]
+            self.skipped_existing += len(chunk) - len(missing)
+            if missing:
+                # TTLs are already spread out by the original writes
+                restored += await self.l1.set_many(missing, jitter_fraction=0.0)
+
+        self.restored_entries += restored
+        self.last_restored_at = now
+        logger.info(
+            "Cache snapshot restored",
+            restored=restored,
+            skipped_expired=self.skipped_expired,
+            skipped_existing=self.skipped_existing,
+            age_seconds=round(now - float(document.get("created_at", now)), 1),
+        )
+        return restored
+
+    def start(self, interval_seconds: float) -> None:
+        """
+        Save a snapshot every interval_seconds
+
+        Args:
+            interval_seconds: Time between snapshots (0 or less to disable)
+        """
+        if interval_seconds <= 0 or self._task is not None:
+            return
+
+        async def snapshot_loop() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    await self.save()
+                except Exception as e:
+                    self.errors += 1
+                    logger.warning(f"Cache snapshot loop error: {e}")
+
+        self._task = asyncio.create_task(snapshot_loop())
+        logger.info("Periodic cache snapshots started", interval_seconds=interval_seconds)
+
+    async def stop(self, final_save: bool = True) -> None:
+        """
+        Stop periodic snapshots
+
+        Args:
+            final_save: Write one last snapshot before returning
+        """
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if final_save:
+            try:
+                await self.save()
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Final cache snapshot failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot statistics"""
+        return {
+            "path": str(self.path),
+            "saves": self.saves,
+            "saved_entries": self.saved_entries,
+            "restored_entries": self.restored_entries,
+            "skipped_expired": self.skipped_expired,
+            "skipped_existing": self.skipped_existing,
+            "errors": self.errors,
+            "last_saved_at": self.last_saved_at,
+            "last_restored_at": self.last_restored_at,
+        }
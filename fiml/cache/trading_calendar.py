@@ -0,0 +1,398 @@
+"""
+Trading Calendar - Exchange sessions, holidays and half-days per market
+
+Each market has regular hours in its exchange time zone, an optional lunch
+break, rule-based holidays (fixed dates, nth-weekday rules, Easter and
+equinox formulas, weekend substitution) and early closes. Session boundaries
+for a whole year are precomputed once as sorted UTC timestamps. Questions
+like "is the market open?" and "when does it next open?" are then a bisect.
+
+Lunar-calendar holidays (Lunar New Year, Mid-Autumn, ...) cannot be derived
+from rules. They, and any unscheduled closures, are supplied through the
+cache_market_holidays setting.
+"""
+
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from fiml.core import config
+from fiml.core.models import Asset, AssetType, Market
+
+_MON, _TUE, _WED, _THU, _FRI, _SAT, _SUN = range(7)
+
+# Asset types that trade on their market's exchange sessions
+SESSION_ASSET_TYPES = {AssetType.EQUITY, AssetType.ETF, AssetType.INDEX, AssetType.OPTION}
+
+
+@dataclass(frozen=True)
+class MarketHours:
+    """Regular trading hours of an exchange, in its local time zone"""
+
+    timezone: str
+    open: time
+    close: time
+    break_start: Optional[time] = None  # Lunch break, if the exchange has one
+    break_end: Optional[time] = None
+    early_close: Optional[time] = None  # Close on half-days
+
+
+MARKET_HOURS: Dict[Market, MarketHours] = {
+    Market.US: MarketHours("America/New_York", time(9, 30), time(16, 0), early_close=time(13, 0)),
+    Market.UK: MarketHours("Europe/London", time(8, 0), time(16, 30), early_close=time(12, 30)),
+    Market.EU: MarketHours("Europe/Berlin", time(9, 0), time(17, 30)),
+    Market.JP: MarketHours("Asia/Tokyo", time(9, 0), time(15, 30), time(11, 30), time(12, 30)),
+    Market.CN: MarketHours("Asia/Shanghai", time(9, 30), time(15, 0), time(11, 30), time(13, 0)),
+    Market.HK: MarketHours(
+        "Asia/Hong_Kong", time(9, 30), time(16, 0), time(12, 0), time(13, 0), time(12, 0)
+    ),
+}
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th given weekday of a month (n=-1 for the last one)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nearest_weekday(day: date) -> date:
+    """US rule: Saturday holidays move to Friday, Sunday ones to Monday"""
+    if day.weekday() == _SAT:
+        return day - timedelta(days=1)
+    if day.weekday() == _SUN:
+        return day + timedelta(days=1)
+    return day
+
+
+def _substitute(
+    days: Iterable[date],
+    taken: Iterable[date] = (),
+    weekend: Tuple[int, ...] = (_SAT, _SUN),
+) -> Set[date]:
+    """
+    Observe holidays that fall on `weekend` days on the next free weekday
+
+    Args:
+        days: Holiday dates
+        taken: Other holidays a substitute day may not land on
+        weekend: Weekdays whose holidays are moved (Sunday only in JP/HK)
+
+    Returns:
+        Observed dates
+    """
+    ordered = sorted(days)
+    # Holidays already on a weekday keep their date; substitutes go around them
+    blocked = set(taken) | {day for day in ordered if day.weekday() not in weekend}
+    observed: Set[date] = set()
+    for day in ordered:
+        if day.weekday() in weekend:
+            while day.weekday() >= _SAT or day in blocked or day in observed:
+                day += timedelta(days=1)
+        observed.add(day)
+    return observed
+
+
+def _us_holidays(year: int) -> Tuple[Set[date], Set[date]]:
+    """NYSE holidays and early closes"""
+    holidays = {
+        _nth_weekday(year, 1, _MON, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, _MON, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, _MON, -1),  # Memorial Day
+        _nearest_weekday(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, _MON, 1),  # Labor Day
+        _nth_weekday(year, 11, _THU, 4),  # Thanksgiving
+        _nearest_weekday(date(year, 12, 25)),  # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the Friday before
+    if date(year, 1, 1).weekday() != _SAT:
+        holidays.add(_nearest_weekday(date(year, 1, 1)))
+    if year >= 2022:
+        holidays.add(_nearest_weekday(date(year, 6, 19)))  # Juneteenth
+
+    early = {_nth_weekday(year, 11, _THU, 4) + timedelta(days=1)}
+    if date(year, 7, 4).weekday() in (_TUE, _WED, _THU, _FRI):
+        early.add(date(year, 7, 3))
+    if date(year, 12, 24).weekday() < _SAT:
+        early.add(date(year, 12, 24))
+    return holidays, early - holidays
+
+
+def _uk_holidays(year: int) -> Tuple[Set[date], Set[date]]:
+    """London Stock Exchange holidays and early closes"""
+    easter = _easter(year)
+    holidays = _substitute([date(year, 1, 1)])
+    holidays |= _substitute([date(year, 12, 25), date(year, 12, 26)])
+    holidays |= {
+        easter - timedelta(days=2),  # Good Friday
+        easter + timedelta(days=1),  # Easter Monday
+        _nth_weekday(year, 5, _MON, 1),  # Early May bank holiday
+        _nth_weekday(year, 5, _MON, -1),  # Spring bank holiday
+        _nth_weekday(year, 8, _MON, -1),  # Summer bank holiday
+    }
+    early = {day for day in (date(year, 12, 24), date(year, 12, 31)) if day.weekday() < _SAT}
+    return holidays, early - holidays
+
+
+def _eu_holidays(year: int) -> Tuple[Set[date], Set[date]]:
+    """Xetra (Frankfurt) holidays"""
+    easter = _easter(year)
+    holidays = {
+        date(year, 1, 1),
+        easter - timedelta(days=2),  # Good Friday
+        easter + timedelta(days=1),  # Easter Monday
+        date(year, 5, 1),
+        date(year, 12, 24),
+        date(year, 12, 25),
+        date(year, 12, 26),
+        date(year, 12, 31),
+    }
+    return holidays, set()
+
+
+def _equinox(year: int, base: float) -> int:
+    """Day of March/September of the equinox in Japan (valid 1980-2099)"""
+    return int(base + 0.242194 * (year - 1980) - (year - 1980) // 4)
+
+
+def _jp_holidays(year: int) -> Tuple[Set[date], Set[date]]:
+    """Tokyo Stock Exchange holidays (national holidays plus year-end closure)"""
+    national = [
+        date(year, 1, 1),
+        _nth_weekday(year, 1, _MON, 2),  # Coming of Age Day
+        date(year, 2, 11),  # National Foundation Day
+        date(year, 3, _equinox(year, 20.8431)),  # Vernal Equinox Day
+        date(year, 4, 29),  # Showa Day
+        date(year, 5, 3),  # Constitution Memorial Day
+        date(year, 5, 4),  # Greenery Day
+        date(year, 5, 5),  # Children's Day
+        _nth_weekday(year, 7, _MON, 3),  # Marine Day
+        date(year, 8, 11),  # Mountain Day
+        _nth_weekday(year, 9, _MON, 3),  # Respect for the Aged Day
+        date(year, 9, _equinox(year, 23.2488)),  # Autumnal Equinox Day
+        _nth_weekday(year, 10, _MON, 2),  # Sports Day
+        date(year, 11, 3),  # Culture Day
+        date(year, 11, 23),  # Labor Thanksgiving Day
+    ]
+    if year >= 2020:
+        national.append(date(year, 2, 23))  # Emperor's Birthday
+
+    # Only Sunday holidays get a substitute; Saturday ones are simply lost
+    holidays = _substitute(national, taken=national, weekend=(_SUN,))
+    # A day sandwiched between two holidays is a holiday too
+    for day in national:
+        between = day + timedelta(days=1)
+        if between not in holidays and between + timedelta(days=1) in national:
+            holidays.add(between)
+    holidays |= {date(year, 1, 2), date(year, 1, 3), date(year, 12, 31)}
+    return holidays, set()
+
+
+def _cn_holidays(year: int) -> Tuple[Set[date], Set[date]]:
+    """Shanghai/Shenzhen closures with fixed dates (lunar ones come from settings)"""
+    holidays = {date(year, 1, 1)}
+    holidays |= {date(year, 5, day) for day in range(1, 6)}  # Labour Day week
+    holidays |= {date(year, 10, day) for day in range(1, 8)}  # National Day week
+    return holidays, set()
+
+
+def _hk_holidays(year: int) -> Tuple[Set[date], Set[date]]:
+    """HKEX holidays with fixed or Easter-based dates (lunar ones come from settings)"""
+    easter = _easter(year)
+    easter_days = {easter - timedelta(days=2), easter + timedelta(days=1)}
+    fixed = [date(year, 1, 1), date(year, 5, 1), date(year, 7, 1), date(year, 10, 1)]
+    fixed += [date(year, 12, 25), date(year, 12, 26)]
+    holidays = _substitute(fixed, taken=easter_days, weekend=(_SUN,)) | easter_days
+    early = {day for day in (date(year, 12, 24), date(year, 12, 31)) if day.weekday() < _SAT}
+    return holidays, early - holidays
+
+
+_HOLIDAY_RULES = {
+    Market.US: _us_holidays,
+    Market.UK: _uk_holidays,
+    Market.EU: _eu_holidays,
+    Market.JP: _jp_holidays,
+    Market.CN: _cn_holidays,
+    Market.HK: _hk_holidays,
+}
+
+
+class TradingCalendar:
+    """
+    Trading sessions of one market
+
+    Features:
+    - Weekends, holidays, half-days and lunch breaks
+    - Sessions precomputed per year as sorted UTC timestamps (bisect lookups)
+    - Extra closures (lunar holidays, unscheduled closures) on top of the rules
+    - next_open/next_close across weekends, holidays and year ends
+    """
+
+    def __init__(
+        self,
+        market: Market,
+        hours: MarketHours,
+        extra_holidays: Iterable[date] = (),
+    ) -> None:
+        """
+        Initialize trading calendar
+
+        Args:
+            market: Market the calendar describes
+            hours: Regular trading hours
+            extra_holidays: Additional full-day closures
+        """
+        self.market = market
+        self.hours = hours
+        self.tz = ZoneInfo(hours.timezone)
+        self.extra_holidays: FrozenSet[date] = frozenset(extra_holidays)
+        self._rules = _HOLIDAY_RULES.get(market)
+        self._years: Dict[int, List[float]] = {}
+
+    def holidays(self, year: int) -> Tuple[Set[date], Set[date]]:
+        """
+        Full-day closures and early closes in a year
+
+        Returns:
+            (holidays, early close days)
+        """
+        holidays, early = self._rules(year) if self._rules else (set(), set())
+        holidays = holidays | {day for day in self.extra_holidays if day.year == year}
+        return holidays, early - holidays
+
+    def is_trading_day(self, day: date) -> bool:
+        """Whether the exchange opens at all on a (local) date"""
+        return day.weekday() < _SAT and day not in self.holidays(day.year)[0]
+
+    def _boundaries(self, year: int) -> List[float]:
+        """Flat sorted [open, close, open, close, ...] UTC timestamps for a year"""
+        bounds = self._years.get(year)
+        if bounds is not None:
+            return bounds
+
+        holidays, early = self.holidays(year)
+        hours = self.hours
+        bounds = []
+        day = date(year, 1, 1)
+        while day.year == year:
+            if day.weekday() < _SAT and day not in holidays:
+                close = hours.early_close if day in early and hours.early_close else hours.close
+                if hours.break_start and hours.break_end and close > hours.break_start:
+                    spans = [(hours.open, hours.break_start), (hours.break_end, close)]
+                else:
+                    spans = [(hours.open, min(close, hours.break_start or close))]
+                for start, end in spans:
+                    bounds.append(datetime.combine(day, start, self.tz).timestamp())
+                    bounds.append(datetime.combine(day, end, self.tz).timestamp())
+            day += timedelta(days=1)
+
+        self._years[year] = bounds
+        return bounds
+
+    def sessions(self, year: int) -> List[Tuple[datetime, datetime]]:
+        """
+        Trading sessions of a year (a lunch break splits a day in two)
+
+        Returns:
+            List of (open, close) UTC datetimes
+        """
+        bounds = self._boundaries(year)
+        return [
+            (datetime.fromtimestamp(bounds[i], UTC), datetime.fromtimestamp(bounds[i + 1], UTC))
+            for i in range(0, len(bounds), 2)
+        ]
+
+    def _locate(self, at: Optional[datetime]) -> Tuple[float, List[float], int]:
+        """Timestamp, boundaries covering it and what follows, and its bisect position"""
+        now = at or datetime.now(UTC)
+        year = now.astimezone(self.tz).year
+        bounds = self._boundaries(year) + self._boundaries(year + 1)
+        ts = now.timestamp()
+        return ts, bounds, bisect_right(bounds, ts)
+
+    def is_open(self, at: Optional[datetime] = None) -> bool:
+        """Whether the market is in a trading session"""
+        _, _, position = self._locate(at)
+        return position % 2 == 1
+
+    def next_open(self, at: Optional[datetime] = None) -> Optional[datetime]:
+        """Start of the next session after `at` (None if none is scheduled)"""
+        _, bounds, position = self._locate(at)
+        index = position + 1 if position % 2 else position
+        return datetime.fromtimestamp(bounds[index], UTC) if index < len(bounds) else None
+
+    def next_close(self, at: Optional[datetime] = None) -> Optional[datetime]:
+        """End of the current or next session"""
+        _, bounds, position = self._locate(at)
+        index = position if position % 2 else position + 1
+        return datetime.fromtimestamp(bounds[index], UTC) if index < len(bounds) else None
+
+    def seconds_until_open(self, at: Optional[datetime] = None) -> float:
+        """
+        Time until trading resumes
+
+        Returns:
+            0 while the market is open, else seconds until the next session
+            (inf if none is scheduled)
+        """
+        ts, bounds, position = self._locate(at)
+        if position % 2:
+            return 0.0
+        return bounds[position] - ts if position < len(bounds) else math.inf
+
+
+def _parse_holidays(values: Iterable[str]) -> List[date]:
+    return [date.fromisoformat(value) for value in values]
+
+
+@lru_cache(maxsize=None)
+def get_calendar(market: Market) -> Optional[TradingCalendar]:
+    """
+    Shared calendar for a market
+
+    Args:
+        market: Market
+
+    Returns:
+        TradingCalendar, or None for markets without exchange sessions
+        (crypto, global)
+    """
+    hours = MARKET_HOURS.get(market)
+    if hours is None:
+        return None
+    extra = config.settings.cache_market_holidays.get(market.value, [])
+    return TradingCalendar(market, hours, _parse_holidays(extra))
+
+
+def calendar_for(asset: Asset) -> Optional[TradingCalendar]:
+    """
+    Calendar governing an asset's trading hours
+
+    Exchange-traded assets follow their market's calendar. Crypto, forex,
+    commodities and futures have no session calendar.
+    """
+    if asset.asset_type not in SESSION_ASSET_TYPES:
+        return None
+    return get_calendar(asset.market)
@@ -4,7 +4,8 @@ Cache utility functions
 Shared utilities for cache operations
 """
 
-from typing import List
+import random
+from typing import List, Optional
 
 
 def calculate_percentile(data: List[float], percentile: int) -> float:
@@ -50,3 +51,20 @@ def calculate_percentile(data: List[float], percentile: int) -> float:
     index = max(0, min(index, n - 1))
 
     return sorted_data[index]
+
+
+def jitter_ttl(ttl_seconds: Optional[int], fraction: float) -> Optional[int]:
+    """
+    Spread a TTL uniformly by +/- fraction so keys written together expire apart
+
+    Args:
+        ttl_seconds: Base TTL (None or 0 means no expiry and is returned as-is)
+        fraction: Maximum relative deviation, e.g. 0.1 for +/-10%
+
+    Returns:
+        Jittered TTL, at least 1 second
+    """
+    if not ttl_seconds or fraction <= 0:
+        return ttl_seconds
+    spread = ttl_seconds * fraction
+    return max(1, round(ttl_seconds + random.uniform(-spread, spread)))
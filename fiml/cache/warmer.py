@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fiml.cache.manager import cache_manager
+from fiml.core import config
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, Market
 
@@ -223,11 +224,19 @@ class CacheWarmer:
         Warm cache on application startup
 
         This should be called during application initialization
-        to pre-populate cache with frequently accessed data.
+        to pre-populate cache with frequently accessed data. Skipped when the
+        cache manager already restored a snapshot of the working set.
 
         Returns:
             Warming statistics
         """
+        restored = (
+            cache_manager.snapshot.restored_entries if config.settings.cache_snapshot_enabled else 0
+        )
+        if restored:
+            logger.info("Skipping startup cache warming, snapshot restored", restored=restored)
+            return {"status": "skipped", "reason": "snapshot_restored", "restored": restored}
+
         logger.info("Performing startup cache warming")
         return await self.warm_cache()
 
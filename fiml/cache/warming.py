@@ -1,19 +1,28 @@
 """
 Cache Warming - Predictive Cache Pre-fetching
-Analyzes query patterns and pre-warms cache during off-peak hours
+Forecasts demand from query patterns and pre-warms the cache within
+per-provider request budgets
 """
 
 import asyncio
 import contextlib
+import heapq
+import time
 from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from fiml.cache.warming_planner import DemandForecaster, DemandKey, WarmingPlanner, WarmTask
+from fiml.core import config
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType
+from fiml.providers.rate_limiter import Priority, rate_limit_priority
 
 logger = get_logger(__name__)
 
+# Data types warm_symbol knows how to fetch
+WARMABLE_DATA_TYPES = (DataType.PRICE, DataType.FUNDAMENTALS)
+
 
 class QueryPattern:
     """Tracks query patterns for a symbol"""
@@ -76,6 +85,10 @@ class PredictiveCacheWarmer:
     - Prioritizes based on request frequency, time patterns, and market events
     - Configurable warming schedules
     - Monitors warming effectiveness
+    - Adds symbols that are hot across all workers (L1 hot key tracker)
+    - Bounded pattern tracking (least requested symbols are dropped)
+    - Hour-of-week demand forecasts pick what to warm (WarmingPlanner)
+    - Per-provider daily request budgets, hit-after-warm feedback
     """
 
     def __init__(
@@ -85,6 +98,9 @@ class PredictiveCacheWarmer:
         warming_schedule: Optional[List[int]] = None,  # Hours to warm cache
         min_request_threshold: int = 10,  # Minimum requests to qualify for warming
         max_symbols_per_batch: int = 50,
+        max_tracked_symbols: int = 10000,
+        hot_window_minutes: int = 60,
+        planner: Optional[WarmingPlanner] = None,
     ):
         """
         Initialize cache warmer
@@ -95,12 +111,17 @@ class PredictiveCacheWarmer:
             warming_schedule: List of hours (0-23) to run warming
             min_request_threshold: Minimum requests to qualify for warming
             max_symbols_per_batch: Maximum symbols to warm per batch
+            max_tracked_symbols: Maximum symbols kept in query_patterns
+            hot_window_minutes: Lookback for cluster-wide hot symbols
+            planner: Warming planner (default: built from settings)
         """
         self.cache_manager = cache_manager
         self.provider_registry = provider_registry
         self.warming_schedule = warming_schedule or [0, 6, 12, 18]  # Every 6 hours
         self.min_request_threshold = min_request_threshold
         self.max_symbols_per_batch = max_symbols_per_batch
+        self.max_tracked_symbols = max_tracked_symbols
+        self.hot_window_minutes = hot_window_minutes
 
         # Pattern tracking
         self.query_patterns: Dict[str, QueryPattern] = {}
@@ -108,6 +129,19 @@ class PredictiveCacheWarmer:
         # Market events (earnings dates, etc.)
         self.market_events: Set[str] = set()
 
+        # Demand forecasting and provider budgets
+        settings = config.settings
+        self.planner = planner or WarmingPlanner(
+            DemandForecaster(
+                half_life_days=settings.cache_warming_demand_half_life_days,
+                max_keys=settings.cache_warming_max_forecast_keys,
+            ),
+            daily_budgets=settings.cache_warming_daily_budgets,
+            default_daily_budget=settings.cache_warming_default_daily_budget,
+            min_gain=settings.cache_warming_min_gain,
+        )
+        self.lead_minutes = settings.cache_warming_lead_minutes
+
         # Warming statistics
         self.total_warmed = 0
         self.successful_warms = 0
@@ -125,6 +159,9 @@ class PredictiveCacheWarmer:
 
         self.cache_manager = cache_manager
         self.provider_registry = provider_registry
+
+        # Learn demand from real lookups
+        cache_manager.add_access_listener(self.record_cache_access)
         logger.info("Predictive cache warmer initialized")
 
     def record_cache_access(
@@ -139,6 +176,8 @@ class PredictiveCacheWarmer:
             timestamp: Access timestamp (default: now)
         """
         if symbol not in self.query_patterns:
+            if len(self.query_patterns) >= self.max_tracked_symbols:
+                self._prune_patterns()
             self.query_patterns[symbol] = QueryPattern(symbol)
 
         timestamp = timestamp or datetime.now(UTC)
@@ -146,12 +185,70 @@ class PredictiveCacheWarmer:
 
         self.query_patterns[symbol].record_access(data_type, hour)
 
+        if data_type in WARMABLE_DATA_TYPES and self.planner.record_access(
+            symbol, data_type, timestamp
+        ):
+            self.warming_hits += 1
+
         logger.debug("Cache access recorded", symbol=symbol, data_type=data_type.value, hour=hour)
 
+    def _prune_patterns(self) -> None:
+        """Keep the most requested half of the tracked symbols"""
+        keep = heapq.nlargest(
+            self.max_tracked_symbols // 2,
+            self.query_patterns.items(),
+            key=lambda item: (item[1].request_count, item[1].last_accessed),
+        )
+        self.query_patterns = dict(keep)
+
+    async def get_cluster_hot_symbols(
+        self, limit: Optional[int] = None, minutes: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Symbols most requested across all workers, from the L1 hot key tracker
+
+        Args:
+            limit: Maximum symbols to return
+            minutes: Lookback window (default: hot_window_minutes)
+
+        Returns:
+            List of (symbol, accesses per minute) tuples, highest first
+        """
+        limit = limit or self.max_symbols_per_batch
+
+        rates: Dict[str, float] = defaultdict(float)
+        for (symbol, _), rate in (await self._cluster_demand(limit * 4, minutes)).items():
+            rates[symbol] += rate
+
+        ranked = sorted(rates.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    async def _cluster_demand(
+        self, n: int, minutes: Optional[int] = None
+    ) -> Dict[Tuple[str, DataType], float]:
+        """Accesses per minute of the cluster's hottest symbol/data type pairs"""
+        try:
+            hot_keys = await self.cache_manager.l1.get_hot_keys(
+                n=n, minutes=minutes or self.hot_window_minutes
+            )
+        except Exception as e:
+            logger.debug(f"Cluster hot keys unavailable: {e}")
+            return {}
+
+        # Cache keys look like "price:AAPL:provider" / "fundamentals:AAPL:provider"
+        rates: Dict[Tuple[str, DataType], float] = defaultdict(float)
+        for key, rate in hot_keys:
+            parts = key.split(":")
+            if len(parts) >= 2 and parts[0] in ("price", "fundamentals"):
+                rates[(parts[1], DataType(parts[0]))] += rate
+        return rates
+
     def add_market_event(self, symbol: str, event_type: str = "earnings") -> None:
         """
         Add a market event for a symbol (e.g., earnings date)
 
+        Event symbols are planned for warming even without recorded accesses.
+
         Args:
             symbol: Asset symbol
             event_type: Type of event
@@ -159,6 +256,105 @@ class PredictiveCacheWarmer:
         self.market_events.add(symbol)
         logger.info("Market event added", symbol=symbol, event_type=event_type)
 
+    def _warm_ttl(self, data_type: DataType) -> int:
+        """Configured TTL of a warmed value"""
+        if data_type == DataType.FUNDAMENTALS:
+            return config.settings.cache_ttl_fundamentals
+        return config.settings.cache_ttl_price
+
+    async def _warming_provider(self, asset: Asset, data_type: DataType) -> Optional[Any]:
+        """Highest priority provider that serves asset/data_type, if any"""
+        if data_type not in WARMABLE_DATA_TYPES:
+            return None
+        try:
+            providers = await self.provider_registry.get_providers_for_asset(asset, data_type)
+        except Exception as e:
+            logger.debug(f"No warming provider for {asset.symbol}: {e}", data_type=data_type.value)
+            return None
+        return providers[0] if providers else None
+
+    async def _provider_names(self, keys: Set[DemandKey]) -> Dict[DemandKey, Optional[str]]:
+        """Name of the provider a warm of each symbol/data type would use"""
+        names: Dict[DemandKey, Optional[str]] = {}
+        for symbol, data_type in keys:
+            asset = Asset(symbol=symbol, asset_type=AssetType.EQUITY)
+            provider = await self._warming_provider(asset, data_type)
+            names[(symbol, data_type)] = provider.name if provider else None
+        return names
+
+    async def plan_warming(
+        self, now: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[WarmTask]:
+        """
+        Plan the warms with the highest expected hit gain within provider budgets
+
+        Demand comes from the hour-of-week forecast of recorded accesses and,
+        as a floor, the current cluster-wide hot key rates and market events.
+
+        Args:
+            now: Current timestamp (default: utcnow)
+            limit: Maximum tasks to plan
+
+        Returns:
+            Planned warms, highest gain first
+        """
+        now = now or datetime.now(UTC)
+        limit = limit or self.max_symbols_per_batch
+
+        # Hot key rates are per minute; the planner works in requests per hour
+        cluster = await self._cluster_demand(limit * 4)
+        extra_demand = {key: rate * 60 for key, rate in cluster.items()}
+
+        # A market event counts as at least one request while a warmed value lives
+        for symbol in self.market_events:
+            for data_type in WARMABLE_DATA_TYPES:
+                key = (symbol, data_type)
+                event_rate = 3600 / max(1, self._warm_ttl(data_type))
+                extra_demand[key] = max(extra_demand.get(key, 0.0), event_rate)
+
+        candidates = set(self.planner.forecaster.keys()) | set(extra_demand)
+        provider_names = await self._provider_names(candidates)
+
+        return self.planner.plan(
+            now,
+            ttl_for=self._warm_ttl,
+            provider_for=lambda symbol, data_type: provider_names.get((symbol, data_type)),
+            limit=limit,
+            lead_minutes=self.lead_minutes,
+            extra_demand=extra_demand,
+        )
+
+    async def warm_planned(self, tasks: List[WarmTask], concurrency: int = 10) -> int:
+        """
+        Execute planned warms and follow up on whether they get read
+
+        Args:
+            tasks: Tasks from plan_warming
+            concurrency: Maximum concurrent warming operations
+
+        Returns:
+            Number of successful warms
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(task: WarmTask) -> bool:
+            async with semaphore:
+                success = await self.warm_symbol(task.symbol, [task.data_type])
+            if success:
+                self.planner.track_warm(task)
+            return success
+
+        results = await asyncio.gather(*(run(task) for task in tasks), return_exceptions=True)
+        successful = sum(1 for result in results if result is True)
+
+        logger.info(
+            "Planned cache warming complete",
+            total=len(tasks),
+            successful=successful,
+            failed=len(tasks) - successful,
+        )
+        return successful
+
     def get_symbols_to_warm(
         self, now: Optional[datetime] = None, limit: Optional[int] = None
     ) -> List[Tuple[str, float]]:
@@ -212,29 +408,27 @@ class PredictiveCacheWarmer:
 
         for data_type in data_types:
             try:
-                # Fetch fresh data from provider
-                if data_type == DataType.PRICE:
-                    # Get price from primary provider
-                    provider = self.provider_registry.get_provider_for_data_type(data_type, asset)
-                    if provider:
-                        price_data = await provider.get_price(asset)
-                        if price_data:
-                            await self.cache_manager.set_price(asset, provider.name, price_data)
-                            logger.debug("Warmed price cache", symbol=symbol)
-                        else:
-                            success = False
-
-                elif data_type == DataType.FUNDAMENTALS:
-                    provider = self.provider_registry.get_provider_for_data_type(data_type, asset)
-                    if provider:
-                        fundamentals = await provider.get_fundamentals(asset)
-                        if fundamentals:
-                            await self.cache_manager.set_fundamentals(
-                                asset, provider.name, fundamentals
-                            )
-                            logger.debug("Warmed fundamentals cache", symbol=symbol)
-                        else:
-                            success = False
+                provider = await self._warming_provider(asset, data_type)
+                if provider is None or not self._spend_budget(provider.name, symbol):
+                    success = False
+                    continue
+
+                fetch_start = time.perf_counter()
+                response = await self._fetch_in_background(provider, asset, data_type)
+                fetch_ms = (time.perf_counter() - fetch_start) * 1000
+
+                if not response.is_valid or not response.data:
+                    success = False
+                elif data_type == DataType.PRICE:
+                    await self.cache_manager.set_price(
+                        asset, provider.name, response.data, fetch_ms=fetch_ms
+                    )
+                    logger.debug("Warmed price cache", symbol=symbol)
+                else:
+                    await self.cache_manager.set_fundamentals(
+                        asset, provider.name, response.data, fetch_ms=fetch_ms
+                    )
+                    logger.debug("Warmed fundamentals cache", symbol=symbol)
 
             except Exception as e:
                 logger.error(f"Failed to warm cache for {symbol}: {e}", data_type=data_type.value)
@@ -249,6 +443,22 @@ class PredictiveCacheWarmer:
 
         return success
 
+    @staticmethod
+    async def _fetch_in_background(provider: Any, asset: Asset, data_type: DataType) -> Any:
+        """Fetch at background priority, so warming does not take interactive quota"""
+        with rate_limit_priority(Priority.BACKGROUND):
+            if data_type == DataType.PRICE:
+                return await provider.fetch_price(asset)
+            return await provider.fetch_fundamentals(asset)
+
+    def _spend_budget(self, provider: str, symbol: str) -> bool:
+        """Charge one warm request to provider; False if its daily budget is spent"""
+        if self.planner.remaining_budget(provider) <= 0:
+            logger.debug("Warming budget exhausted", provider=provider, symbol=symbol)
+            return False
+        self.planner.charge(provider)
+        return True
+
     async def warm_cache_batch(self, symbols: List[str], concurrency: int = 10) -> Dict[str, bool]:
         """
         Warm cache for multiple symbols concurrently
@@ -300,21 +510,18 @@ class PredictiveCacheWarmer:
 
         logger.info("Starting cache warming cycle", hour=now.hour)
 
-        # Get symbols to warm
-        symbols_to_warm = self.get_symbols_to_warm(now)
-
-        if not symbols_to_warm:
+        tasks = await self.plan_warming(now)
+        if not tasks:
             logger.info("No symbols to warm")
             return
 
-        # Extract just the symbols
-        symbols = [symbol for symbol, _ in symbols_to_warm]
-
-        # Log top symbols
-        logger.info("Top symbols for warming", symbols=symbols[:10], total=len(symbols))
+        # Log top tasks
+        logger.info(
+            "Top keys for warming", tasks=[repr(task) for task in tasks[:10]], total=len(tasks)
+        )
 
         # Warm cache
-        await self.warm_cache_batch(symbols)
+        await self.warm_planned(tasks)
 
         logger.info(
             "Cache warming cycle complete",
@@ -375,6 +582,7 @@ class PredictiveCacheWarmer:
             "tracked_symbols": len(self.query_patterns),
             "market_events": len(self.market_events),
             "is_running": self.is_running,
+            "planner": self.planner.get_stats(),
         }
 
     def clear_old_patterns(self, days: int = 7) -> int:
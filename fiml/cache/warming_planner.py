@@ -0,0 +1,398 @@
+"""
+Warming Planner - Demand forecasting and quota-aware warm planning
+
+Forecasts per-(symbol, data type) demand by hour of week from recorded cache
+accesses, ranks candidates by the expected number of misses a warm would
+avoid, and spends a per-provider daily request budget on the best ones.
+Warmed keys are followed up: the share that is actually read before expiring
+(hit-after-warm) calibrates future gain estimates.
+"""
+
+import math
+from array import array
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fiml.core.logging import get_logger
+from fiml.core.models import DataType
+
+logger = get_logger(__name__)
+
+HOURS_PER_WEEK = 168
+SECONDS_PER_WEEK = HOURS_PER_WEEK * 3600
+
+DemandKey = Tuple[str, DataType]
+
+
+def _utc(when: datetime) -> datetime:
+    """when as an aware UTC datetime (naive values are taken as UTC)"""
+    return when.astimezone(UTC) if when.tzinfo else when.replace(tzinfo=UTC)
+
+
+def hour_of_week(when: datetime) -> int:
+    """Hour of week in UTC (0 = Monday 00:00)"""
+    when = _utc(when)
+    return when.weekday() * 24 + when.hour
+
+
+class DemandForecaster:
+    """
+    Hour-of-week demand model with exponential decay
+
+    Features:
+    - O(1) per recorded access (weights grow instead of decaying every bin)
+    - Forecasts in requests per hour for any hour of the week
+    - Bounded: least requested keys are dropped past max_keys
+    """
+
+    # Rescale stored weights before they overflow float precision
+    _MAX_EXPONENT = 50.0
+
+    def __init__(self, half_life_days: float = 14.0, max_keys: int = 2000) -> None:
+        self.half_life_seconds = max(1.0, half_life_days * 86400)
+        self.max_keys = max(1, max_keys)
+
+        # key -> 168 decayed counts, stored scaled by 2^((t - _epoch) / half_life)
+        self._bins: Dict[DemandKey, array] = {}
+        self._totals: Dict[DemandKey, float] = {}
+        self._epoch: Optional[float] = None
+        self._first_seen: Optional[float] = None
+
+    def _weight(self, ts: float) -> float:
+        """Scaled weight of an access at ts"""
+        if self._epoch is None:
+            self._epoch = ts
+        exponent = (ts - self._epoch) / self.half_life_seconds
+        if exponent > self._MAX_EXPONENT:
+            self._rescale(ts)
+            exponent = 0.0
+        return float(2.0**exponent)
+
+    def _rescale(self, ts: float) -> None:
+        """Move the epoch to ts, shrinking all stored weights accordingly"""
+        assert self._epoch is not None
+        factor = 2.0 ** (-(ts - self._epoch) / self.half_life_seconds)
+        for key, bins in self._bins.items():
+            for i in range(HOURS_PER_WEEK):
+                bins[i] *= factor
+            self._totals[key] *= factor
+        self._epoch = ts
+
+    def record(self, symbol: str, data_type: DataType, when: Optional[datetime] = None) -> None:
+        """Record one request for symbol/data_type"""
+        when = when or datetime.now(UTC)
+        ts = when.timestamp()
+        if self._first_seen is None or ts < self._first_seen:
+            self._first_seen = ts
+
+        key = (symbol, data_type)
+        bins = self._bins.get(key)
+        if bins is None:
+            if len(self._bins) >= self.max_keys:
+                self._prune()
+            bins = array("d", [0.0] * HOURS_PER_WEEK)
+            self._bins[key] = bins
+            self._totals[key] = 0.0
+
+        weight = self._weight(ts)
+        bins[hour_of_week(when)] += weight
+        self._totals[key] += weight
+
+    def _prune(self) -> None:
+        """Keep the most requested half of the keys"""
+        keep = sorted(self._totals, key=self._totals.__getitem__, reverse=True)
+        for key in keep[self.max_keys // 2 :]:
+            del self._bins[key]
+            del self._totals[key]
+
+    def _scale(self, how: int, now: datetime) -> float:
+        """
+        Divisor turning a stored bin into requests per hour
+
+        Undoes the growth of the stored weights and divides by the decayed
+        number of times hour-of-week `how` was observed since the first access
+        (past occurrences plus the elapsed part of a current one). Floored at
+        one occurrence so a young history is not over-forecast.
+        """
+        now = _utc(now)
+        ts = now.timestamp()
+        growth = 2.0 ** ((ts - self._epoch) / self.half_life_seconds) if self._epoch else 1.0
+
+        # Start of the current or latest occurrence of this hour of week
+        offset = (hour_of_week(now) - how) % HOURS_PER_WEEK
+        latest = now.replace(minute=0, second=0, microsecond=0).timestamp() - offset * 3600
+
+        exposure = 0.0
+        if ts - latest < 3600:
+            exposure += (ts - latest) / 3600
+            latest -= SECONDS_PER_WEEK
+
+        first = self._first_seen if self._first_seen is not None else ts
+        first_hour = first - first % 3600
+        if latest >= first_hour:
+            # Completed occurrences, each weighted by the age of its midpoint
+            count = int((latest - first_hour) // SECONDS_PER_WEEK) + 1
+            weekly_decay = 0.5 ** (SECONDS_PER_WEEK / self.half_life_seconds)
+            newest = 0.5 ** ((ts - latest - 1800) / self.half_life_seconds)
+            exposure += newest * (1 - weekly_decay**count) / (1 - weekly_decay)
+
+        return growth * max(1.0, exposure)
+
+    def forecast(self, symbol: str, data_type: DataType, when: datetime) -> float:
+        """Expected requests per hour for symbol/data_type in when's hour of week"""
+        bins = self._bins.get((symbol, data_type))
+        if bins is None:
+            return 0.0
+        how = hour_of_week(when)
+        return float(bins[how] / self._scale(how, when))
+
+    def expected_requests(
+        self, symbol: str, data_type: DataType, start: datetime, seconds: float
+    ) -> float:
+        """Expected requests for symbol/data_type during [start, start + seconds)"""
+        bins = self._bins.get((symbol, data_type))
+        if bins is None or seconds <= 0:
+            return 0.0
+
+        total = 0.0
+        cursor = _utc(start)
+        end = cursor + timedelta(seconds=seconds)
+        while cursor < end:
+            next_hour = cursor.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            span = (min(next_hour, end) - cursor).total_seconds()
+            how = hour_of_week(cursor)
+            if bins[how]:
+                # Rates as known now, even for hours later in the window
+                total += bins[how] / self._scale(how, start) * span / 3600
+            cursor = next_hour
+        return total
+
+    def keys(self) -> Iterable[DemandKey]:
+        """Tracked (symbol, data_type) keys"""
+        return list(self._bins)
+
+    def __len__(self) -> int:
+        return len(self._bins)
+
+
+class WarmTask:
+    """A planned warm of one symbol/data type through one provider"""
+
+    def __init__(
+        self, symbol: str, data_type: DataType, provider: str, gain: float, ttl_seconds: int
+    ):
+        self.symbol = symbol
+        self.data_type = data_type
+        self.provider = provider
+        self.gain = gain
+        self.ttl_seconds = ttl_seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"WarmTask({self.symbol}, {self.data_type.value}, {self.provider}, "
+            f"gain={self.gain:.2f})"
+        )
+
+
+class WarmingPlanner:
+    """
+    Chooses what to warm under per-provider daily request budgets
+
+    The gain of warming a key is the probability it is requested at least
+    once while the warmed value is still cached, 1 - exp(-expected requests),
+    i.e. the expected misses avoided per provider request. It is scaled per
+    data type by observed hit-after-warm / predicted gain.
+    """
+
+    # Pseudo-observations keeping calibration near 1.0 until data accumulates
+    _CALIBRATION_PRIOR = 5.0
+
+    def __init__(
+        self,
+        forecaster: DemandForecaster,
+        daily_budgets: Optional[Dict[str, int]] = None,
+        default_daily_budget: int = 500,
+        min_gain: float = 0.2,
+        max_pending: int = 10000,
+    ) -> None:
+        self.forecaster = forecaster
+        self.daily_budgets = daily_budgets or {}
+        self.default_daily_budget = default_daily_budget
+        self.min_gain = min_gain
+        self.max_pending = max_pending
+
+        # Budget spent per provider on the current UTC day
+        self._budget_day: Optional[str] = None
+        self._spent: Dict[str, int] = {}
+
+        # Warmed keys awaiting their first read: key -> (expires_at, predicted gain)
+        self._pending: Dict[DemandKey, Tuple[datetime, float]] = {}
+
+        # Outcomes per data type
+        self._warm_hits: Dict[DataType, int] = {}
+        self._warm_misses: Dict[DataType, int] = {}
+        self._predicted: Dict[DataType, float] = {}
+
+    def _roll_budget_day(self, now: datetime) -> None:
+        day = now.astimezone(UTC).date().isoformat()
+        if day != self._budget_day:
+            self._budget_day = day
+            self._spent.clear()
+
+    def remaining_budget(self, provider: str, now: Optional[datetime] = None) -> int:
+        """Requests the provider may still spend on warming today"""
+        self._roll_budget_day(now or datetime.now(UTC))
+        budget = self.daily_budgets.get(provider, self.default_daily_budget)
+        return max(0, budget - self._spent.get(provider, 0))
+
+    def calibration(self, data_type: DataType) -> float:
+        """Observed hit-after-warm rate relative to predicted gain"""
+        hits = self._warm_hits.get(data_type, 0)
+        predicted = self._predicted.get(data_type, 0.0)
+        prior = self._CALIBRATION_PRIOR
+        return (hits + prior) / (predicted + prior)
+
+    def expected_gain(
+        self,
+        symbol: str,
+        data_type: DataType,
+        start: datetime,
+        ttl_seconds: int,
+        extra_rate_per_hour: float = 0.0,
+    ) -> float:
+        """
+        Calibrated probability that a warmed value is read before it expires
+
+        Args:
+            symbol: Asset symbol
+            data_type: Data type
+            start: When the warmed value would become available
+            ttl_seconds: How long it stays cached
+            extra_rate_per_hour: Demand seen outside the forecaster (e.g. cluster-wide)
+        """
+        requests = self.forecaster.expected_requests(symbol, data_type, start, ttl_seconds)
+        requests = max(requests, extra_rate_per_hour * ttl_seconds / 3600)
+        gain = 1.0 - math.exp(-requests)
+        return min(1.0, gain * self.calibration(data_type))
+
+    def plan(
+        self,
+        now: datetime,
+        ttl_for: Callable[[DataType], int],
+        provider_for: Callable[[str, DataType], Optional[str]],
+        limit: int,
+        lead_minutes: int = 0,
+        extra_demand: Optional[Dict[DemandKey, float]] = None,
+    ) -> List[WarmTask]:
+        """
+        Pick the keys with the highest expected gain within provider budgets
+
+        Args:
+            now: Current time
+            ttl_for: TTL in seconds of a warmed value per data type
+            provider_for: Provider name that would serve symbol/data_type (None to skip)
+            limit: Maximum tasks in this plan
+            lead_minutes: Plan for demand starting this far ahead (e.g. before the open)
+            extra_demand: Additional requests-per-hour estimates per key
+
+        Returns:
+            Tasks ordered by gain, highest first
+        """
+        self.settle(now)
+        start = now + timedelta(minutes=lead_minutes)
+        extra_demand = extra_demand or {}
+
+        scored: List[Tuple[float, DemandKey]] = []
+        for key in set(self.forecaster.keys()) | set(extra_demand):
+            if key in self._pending:
+                continue  # Still cached from an earlier warm
+            symbol, data_type = key
+            gain = self.expected_gain(
+                symbol, data_type, start, ttl_for(data_type), extra_demand.get(key, 0.0)
+            )
+            if gain >= self.min_gain:
+                scored.append((gain, key))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        tasks: List[WarmTask] = []
+        reserved: Dict[str, int] = {}
+        for gain, (symbol, data_type) in scored:
+            if len(tasks) >= limit:
+                break
+            provider = provider_for(symbol, data_type)
+            if provider is None:
+                continue
+            if reserved.get(provider, 0) >= self.remaining_budget(provider, now):
+                continue
+            reserved[provider] = reserved.get(provider, 0) + 1
+            tasks.append(WarmTask(symbol, data_type, provider, gain, ttl_for(data_type)))
+
+        return tasks
+
+    def charge(self, provider: str, now: Optional[datetime] = None) -> None:
+        """Spend one request of the provider's daily warming budget"""
+        self._roll_budget_day(now or datetime.now(UTC))
+        self._spent[provider] = self._spent.get(provider, 0) + 1
+
+    def track_warm(self, task: WarmTask, now: Optional[datetime] = None) -> None:
+        """Follow a warmed key until it is read or expires"""
+        now = now or datetime.now(UTC)
+        if len(self._pending) >= self.max_pending:
+            self.settle(now)
+            if len(self._pending) >= self.max_pending:
+                return
+        expires_at = now + timedelta(seconds=task.ttl_seconds)
+        # Undo calibration so the calibration ratio compares like with like
+        raw_gain = task.gain / self.calibration(task.data_type)
+        self._pending[(task.symbol, task.data_type)] = (expires_at, raw_gain)
+
+    def record_access(
+        self, symbol: str, data_type: DataType, now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Note a request; returns True if it was served by a warm
+
+        Args:
+            symbol: Asset symbol requested
+            data_type: Data type requested
+            now: Request time (default: now)
+        """
+        now = now or datetime.now(UTC)
+        self.forecaster.record(symbol, data_type, now)
+
+        pending = self._pending.pop((symbol, data_type), None)
+        if pending is None:
+            return False
+
+        expires_at, predicted = pending
+        hit = now < expires_at
+        self._record_outcome(data_type, hit, predicted)
+        return hit
+
+    def settle(self, now: datetime) -> None:
+        """Count warmed keys that expired without being read"""
+        expired = [key for key, (expires_at, _) in self._pending.items() if expires_at <= now]
+        for key in expired:
+            _, predicted = self._pending.pop(key)
+            self._record_outcome(key[1], False, predicted)
+
+    def _record_outcome(self, data_type: DataType, hit: bool, predicted: float) -> None:
+        outcomes = self._warm_hits if hit else self._warm_misses
+        outcomes[data_type] = outcomes.get(data_type, 0) + 1
+        self._predicted[data_type] = self._predicted.get(data_type, 0.0) + predicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Planner statistics"""
+        hits = sum(self._warm_hits.values())
+        misses = sum(self._warm_misses.values())
+        settled = hits + misses
+        data_types = set(self._warm_hits) | set(self._warm_misses)
+        return {
+            "forecast_keys": len(self.forecaster),
+            "pending_warms": len(self._pending),
+            "warm_hits": hits,
+            "warm_misses": misses,
+            "hit_after_warm_rate_percent": round(hits / settled * 100, 2) if settled else 0.0,
+            "calibration": {dt.value: round(self.calibration(dt), 3) for dt in data_types},
+            "budget_spent_today": dict(self._spent),
+        }
@@ -0,0 +1,242 @@
+"""
+L2 Write-Behind Buffer - Batches PostgreSQL cache writes
+
+Instead of one transaction per cached value, L2 writes are queued and
+flushed as multi-row inserts once the batch is full or the flush interval
+elapses. The queue is bounded: when it is full, writers wait until the next
+flush makes room.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fiml.cache.histogram import LatencyHistogram
+from fiml.core.exceptions import CacheError
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PendingWrite:
+    """A buffered L2 row write"""
+
+    __slots__ = ("table", "params", "key")
+
+    def __init__(
+        self,
+        table: str,
+        params: Dict[str, Any],
+        key: Optional[Tuple[Any, ...]] = None,
+    ) -> None:
+        """
+        Args:
+            table: Target table
+            params: Column values for the row
+            key: Conflict key; later writes with the same key replace earlier ones
+        """
+        self.table = table
+        self.params = params
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"PendingWrite({self.table}, key={self.key})"
+
+
+class L2WriteBuffer:
+    """
+    Bounded async write-behind queue with size/time based flushing
+
+    Features:
+    - Flush when batch_size writes are queued or flush_interval_ms elapses
+    - Backpressure: enqueue waits while the queue is full
+    - Final flush on stop()
+    - Queue depth and flush latency statistics
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[PendingWrite]], Awaitable[None]],
+        batch_size: int = 500,
+        flush_interval_ms: int = 200,
+        max_queue: int = 10000,
+        analytics: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize write buffer
+
+        Args:
+            flush_fn: Coroutine persisting a batch of writes
+            batch_size: Maximum writes per flush
+            flush_interval_ms: Maximum time a write waits before being flushed
+            max_queue: Queue capacity before writers are blocked
+            analytics: CacheAnalytics instance for metrics export (optional)
+        """
+        self.flush_fn = flush_fn
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.max_queue = max_queue
+        self.analytics = analytics
+
+        self._queue: asyncio.Queue[PendingWrite] = asyncio.Queue(maxsize=max_queue)
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        # Statistics
+        self.enqueued = 0
+        self.rows_flushed = 0
+        self.rows_failed = 0
+        self.flushes = 0
+        self.backpressure_waits = 0
+        self._flush_latency = LatencyHistogram()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is running"""
+        return self._task is not None
+
+    def queue_depth(self) -> int:
+        """Number of writes waiting to be flushed"""
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """Start the background flusher"""
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "L2 write-behind started",
+            batch_size=self.batch_size,
+            flush_interval_ms=self.flush_interval_ms,
+            max_queue=self.max_queue,
+        )
+
+    async def stop(self) -> None:
+        """Stop the flusher after writing out everything still queued"""
+        if self._task is None:
+            return
+
+        # Let the loop finish its current flush instead of cancelling mid-batch
+        self._stopping = True
+        self._flush_requested.set()
+        await self._task
+        self._task = None
+        self._stopping = False
+
+        await self.flush()
+        logger.info("L2 write-behind stopped", rows_flushed=self.rows_flushed)
+
+    async def enqueue(self, write: PendingWrite) -> None:
+        """
+        Queue a write, waiting for room if the queue is full
+
+        Args:
+            write: Row write to buffer
+        """
+        if self._task is None:
+            raise CacheError("L2 write-behind buffer not started")
+
+        if self._queue.full():
+            self.backpressure_waits += 1
+            self._flush_requested.set()
+            logger.debug("L2 write-behind queue full, waiting", depth=self._queue.qsize())
+
+        await self._queue.put(write)
+        self.enqueued += 1
+
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_requested.set()
+
+    async def flush(self) -> int:
+        """
+        Flush all queued writes now
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        while not self._queue.empty():
+            written += await self._flush_batch()
+        return written
+
+    async def _flush_loop(self) -> None:
+        """Flush on size or time threshold until stopped"""
+        interval = self.flush_interval_ms / 1000
+        while not self._stopping:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=interval)
+            self._flush_requested.clear()
+
+            try:
+                await self._flush_batch()
+                # Keep draining while a full batch is waiting
+                while self._queue.qsize() >= self.batch_size:
+                    await self._flush_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"L2 write-behind loop error: {e}")
+
+    async def _flush_batch(self) -> int:
+        """Take up to batch_size writes off the queue and persist them"""
+        async with self._flush_lock:
+            batch: List[PendingWrite] = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            if not batch:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                await self.flush_fn(batch)
+                success = True
+            except Exception as e:
+                # Cache data: drop the batch rather than retry indefinitely
+                logger.error(f"L2 write-behind flush failed: {e}", rows=len(batch))
+                success = False
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            self.flushes += 1
+            self._flush_latency.record(latency_ms)
+            if success:
+                self.rows_flushed += len(batch)
+            else:
+                self.rows_failed += len(batch)
+
+            if self.analytics is not None:
+                self.analytics.record_l2_flush(
+                    rows=len(batch),
+                    latency_ms=latency_ms,
+                    queue_depth=self._queue.qsize(),
+                    success=success,
+                )
+
+            logger.debug(
+                "L2 write-behind flush",
+                rows=len(batch),
+                latency_ms=f"{latency_ms:.2f}",
+                remaining=self._queue.qsize(),
+            )
+            return len(batch) if success else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write-behind statistics"""
+        flush_latency = self._flush_latency.get_stats()
+        return {
+            "running": self.is_running,
+            "queue_depth": self._queue.qsize(),
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval_ms": self.flush_interval_ms,
+            "enqueued": self.enqueued,
+            "rows_flushed": self.rows_flushed,
+            "rows_failed": self.rows_failed,
+            "flushes": self.flushes,
+            "backpressure_waits": self.backpressure_waits,
+            "avg_flush_latency_ms": round(flush_latency["mean"], 2),
+            "p95_flush_latency_ms": round(flush_latency["p95"], 2),
+        }
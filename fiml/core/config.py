@@ -3,7 +3,7 @@ Core configuration using Pydantic Settings
 """
 
 from functools import lru_cache
-from typing import List, Literal
+from typing import Dict, List, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -77,6 +77,36 @@ class Settings(BaseSettings):
     newsapi_daily_limit: int = 100  # Free tier default (can be 1000 for paid)
     newsapi_enabled: bool = True
 
+    # Provider Telemetry (rolling windows scored by the arbitration engine)
+    provider_latency_window_seconds: int = 300  # Span of the latency p95
+    provider_outcome_window_seconds: int = 900  # Span of the success rate
+
+    # Provider rate limits (token buckets shared by all workers through Redis)
+    provider_rate_limit_enabled: bool = True
+    provider_rate_limit_burst_seconds: float = 60.0  # Seconds of quota usable at once
+    provider_rate_limit_max_wait_seconds: float = 5.0  # Interactive wait for a token
+    provider_rate_limit_background_max_wait_seconds: float = 60.0  # Warmers, scheduler
+    provider_rate_limit_background_reserve: float = 0.2  # Bucket share kept for interactive
+
+    # Arbitration Plan Cache
+    arbitration_plan_cache_ttl_seconds: int = 5  # Plan reuse per asset class (0 disables)
+
+    # Hedged requests: start the next fallback when the primary is slow
+    arbitration_hedge_enabled: bool = True
+    arbitration_hedge_delay_ms: int = 0  # 0 = the primary's observed p95 for the data type
+    arbitration_hedge_min_delay_ms: int = 50  # Floor on the p95-based delay
+    arbitration_hedge_min_samples: int = 20  # Latency samples needed before p95-based hedging
+    # Share of requests per data type that may hedge; other data types never hedge
+    arbitration_hedge_budgets: Dict[str, float] = Field(
+        default_factory=lambda: {"price": 0.1, "ohlcv": 0.05}
+    )
+
+    # Quorum price fetch: symbols priced from several providers at once, outliers rejected
+    arbitration_quorum_symbols: List[str] = Field(default_factory=list)
+    arbitration_quorum_size: int = 3  # Providers queried; returns once size - 1 agree
+    arbitration_quorum_deadline_ms: int = 1500
+    arbitration_quorum_tolerance: float = 0.005  # Relative deviation still counted as agreeing
+
     # Azure OpenAI Configuration
     azure_openai_endpoint: str | None = None
     azure_openai_api_key: str | None = None
@@ -133,13 +163,97 @@ class Settings(BaseSettings):
     cache_ttl_news: int = 600  # 10 minutes
     cache_ttl_macro: int = 86400  # 24 hours
 
+    # Exchange calendars (prices of closed markets are kept until the next open)
+    cache_market_calendar_enabled: bool = True
+    cache_ttl_market_closed_max: int = 604800  # Cap on a closed-market price TTL (7 days)
+    # Extra closures per market on top of the built-in rules, e.g. lunar holidays:
+    # {"HK": ["2026-02-17", "2026-02-18"], "CN": ["2026-02-16"]}
+    cache_market_holidays: Dict[str, List[str]] = Field(default_factory=dict)
+
     # Cache Optimization Settings
     cache_warming_enabled: bool = True
     cache_warming_interval_seconds: int = 300  # 5 minutes
-    cache_eviction_policy: Literal["lru", "lfu", "ttl", "fifo"] = "lru"
+    # Provider requests the warmer may spend per UTC day (others use the default)
+    cache_warming_daily_budgets: Dict[str, int] = Field(
+        default_factory=lambda: {"alpha_vantage": 25, "fmp": 250}
+    )
+    cache_warming_default_daily_budget: int = 1000
+    cache_warming_min_gain: float = 0.2  # Min probability a warmed value is read
+    cache_warming_lead_minutes: int = 5  # Warm for demand starting this far ahead
+    cache_warming_demand_half_life_days: float = 14.0
+    cache_warming_max_forecast_keys: int = 2000
+    cache_eviction_policy: Literal["lru", "lfu", "ttl", "fifo", "w_tinylfu"] = "lru"
     cache_max_tracked_entries: int = 10000
     cache_memory_pressure_threshold: float = 0.9  # 90%
 
+    # Cluster-wide hot key tracking (bounded top-k merged through Redis)
+    cache_hot_keys_enabled: bool = True
+    cache_hot_keys_capacity: int = 256  # Keys kept per worker flush and per Redis bucket
+    cache_hot_keys_bucket_seconds: int = 60
+    cache_hot_keys_retention_minutes: int = 60
+    cache_hot_keys_flush_interval_seconds: float = 10.0
+
+    # Generation-based invalidation (keys embed a per-symbol counter; invalidation is one INCR)
+    cache_generation_invalidation_enabled: bool = True
+    cache_generation_local_ttl_seconds: float = 1.0  # How long a worker trusts its copy
+    cache_generation_max_local_entries: int = 10000
+    cache_tag_index_enabled: bool = False  # Track keys per symbol so they can be purged eagerly
+    cache_tag_index_ttl_seconds: int = 86400  # Minimum lifetime of a tag set
+
+    # Snapshot/restore of the hot L1 working set across restarts
+    cache_snapshot_enabled: bool = False
+    cache_snapshot_path: str = "./data/cache_snapshot.bin.gz"
+    cache_snapshot_max_keys: int = 5000  # Hottest keys written per snapshot
+    cache_snapshot_interval_seconds: int = 300  # 0 to snapshot only on shutdown
+    cache_snapshot_min_ttl_seconds: int = 5  # Skip entries about to expire
+
+    # L0 Near-Cache Settings (in-process tier in front of Redis)
+    cache_l0_enabled: bool = False
+    cache_l0_max_entries: int = 1000
+    cache_l0_ttl_seconds: int = 5  # Upper bound on how long L0 may serve an entry
+    cache_l0_invalidation_channel: str = "fiml:cache:invalidate"
+
+    # Stale-While-Revalidate (soft TTL = dynamic TTL, hard TTL = soft * multiplier)
+    cache_stale_while_revalidate: bool = True
+    cache_hard_ttl_multiplier: float = 5.0
+
+    # Thundering-herd protection
+    cache_xfetch_enabled: bool = True  # Probabilistic early refresh before the soft TTL
+    cache_xfetch_beta: float = 1.0  # >1 refreshes earlier, <1 later
+    cache_ttl_jitter_fraction: float = 0.1  # Batch-written TTLs spread by +/-10%
+
+    # Negative caching (tombstones for symbols no provider can serve)
+    cache_negative_enabled: bool = True
+    cache_negative_ttl_seconds: int = 60  # Keep short so new listings show up quickly
+
+    # Cache Serialization Settings
+    cache_codec: Literal["json", "orjson", "msgpack"] = "json"
+    cache_compression: Literal["none", "zstd"] = "none"
+    cache_compression_threshold_bytes: int = 1024  # Only compress payloads this large
+    cache_compression_level: int = 3
+
+    # L2 Write-Behind Settings (batched PostgreSQL persistence)
+    cache_l2_write_behind_enabled: bool = False
+    cache_l2_write_batch_size: int = 500
+    cache_l2_write_flush_interval_ms: int = 200
+    cache_l2_write_queue_max: int = 10000  # Writers wait when the queue is full
+
+    # L2 Tier Settings (symbol/market -> assets.id index)
+    cache_l2_tier_enabled: bool = True  # Persist to PostgreSQL and read it on L1 misses
+    cache_asset_index_preload: bool = True  # Bulk load the assets table at startup
+    cache_asset_index_negative_ttl_seconds: int = 60  # Remember unknown symbols this long
+    cache_asset_index_max_negative_entries: int = 10000  # Cap on remembered unknown symbols
+
+    # OHLCV Range Cache Settings (gap-aware candle caching in L2)
+    cache_ohlcv_range_enabled: bool = True
+    cache_ohlcv_tail_tolerance_seconds: int = 60  # Refetch the latest candles after this long
+    cache_ohlcv_tail_tolerance_fraction: float = 0.05  # ...or this share of a candle, if longer
+    cache_ohlcv_max_fetch_candles: int = 5000  # Cap on a single gap fetch
+    cache_ohlcv_resample_enabled: bool = True  # Build coarse candles from cached finer ones
+    cache_ohlcv_resample_sources: List[str] = Field(default_factory=lambda: ["1m", "5m", "1h"])
+    cache_ohlcv_resample_max_source_candles: int = 20000  # Skip sources needing more rows
+    cache_ohlcv_continuous_aggregates: bool = False  # TimescaleDB ohlcv_cache_1h/_1d views
+
     # Security
     secret_key: str = "your-secret-key-change-in-production"
     api_key_header: str = "X-FIML-API-Key"
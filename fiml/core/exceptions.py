@@ -27,6 +27,18 @@ class NoProviderAvailableError(ProviderError):
     pass
 
 
+class SymbolNotFoundError(NoProviderAvailableError):
+    """Every provider answered that it has no data for the symbol"""
+
+    pass
+
+
+class ProviderSymbolNotFoundError(ProviderError):
+    """A single provider has no data for the requested symbol"""
+
+    pass
+
+
 class RateLimitError(ProviderError):
     """Provider rate limit exceeded"""
 
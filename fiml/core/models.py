@@ -103,6 +103,8 @@ class DataLineage(BaseModel):
     arbitration_score: float
     conflict_resolved: bool = False
     source_count: int
+    rejected_providers: List[str] = Field(default_factory=list)  # Outliers left out of a merge
+    quorum_reached: Optional[bool] = None  # Quorum prices only: False if too few agreed
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
@@ -117,6 +119,8 @@ class CachedData(BaseModel):
     source: str
     ttl: int  # seconds until refresh
     confidence: float = Field(ge=0, le=1)
+    age_seconds: float = 0.0  # seconds since the value was fetched
+    is_stale: bool = False  # past its TTL, served while a refresh runs
 
 
 class StructuralData(BaseModel):
@@ -269,6 +269,38 @@ def truncate_narrative(text: str, max_length: int = 1000) -> str:
     return text[: max_length - 3] + "..."
 
 
+def cache_freshness_fields(data: Dict[str, Any], default_ttl: int) -> Dict[str, Any]:
+    """
+    Build CachedData timing fields from read-through cache metadata
+
+    Args:
+        data: Read-through result; its "_cache" entry is removed
+        default_ttl: TTL to report when the cache supplied no metadata
+
+    Returns:
+        as_of, last_updated, ttl, age_seconds and is_stale keyword arguments
+    """
+    now = datetime.now(timezone.utc)
+    freshness = data.pop("_cache", None)
+    if not isinstance(freshness, dict):
+        return {
+            "as_of": now,
+            "last_updated": now,
+            "ttl": default_ttl,
+            "age_seconds": 0.0,
+            "is_stale": False,
+        }
+
+    cached_at = datetime.fromtimestamp(freshness.get("cached_at", now.timestamp()), timezone.utc)
+    return {
+        "as_of": cached_at,
+        "last_updated": cached_at,
+        "ttl": int(freshness.get("ttl_seconds", default_ttl)),
+        "age_seconds": float(freshness.get("age_seconds", 0.0)),
+        "is_stale": bool(freshness.get("is_stale", False)),
+    }
+
+
 async def search_by_symbol(
     symbol: str,
     market: Market,
@@ -378,7 +410,11 @@ async def search_by_symbol(
         cache_key = cache_manager.l1.build_key("price", asset.symbol, "any")
 
         data = await cache_manager.get_with_read_through(
-            key=cache_key, data_type=DataType.PRICE, fetch_fn=fetch_price_data, asset=asset
+            key=cache_key,
+            data_type=DataType.PRICE,
+            fetch_fn=fetch_price_data,
+            asset=asset,
+            include_freshness=True,
         )
 
         if not data:
@@ -387,6 +423,9 @@ async def search_by_symbol(
         # Extract provider info (might be from cache or fresh fetch)
         provider_name = data.pop("_source_provider", "unknown")
         confidence = data.pop("_confidence", 0.0)
+        # Set when the price is a quorum merge of several providers
+        lineage = data.pop("lineage", None)
+        freshness = cache_freshness_fields(data, default_ttl=300)  # 5 minutes
 
         # Fetch additional data based on depth
         fundamental_data = {}
@@ -429,11 +468,9 @@ async def search_by_symbol(
             price=data.get("price", 0.0),
             change=data.get("change", 0.0),
             change_percent=data.get("change_percent", 0.0),
-            as_of=datetime.now(timezone.utc),
-            last_updated=datetime.now(timezone.utc),
             source=provider_name,
-            ttl=300,  # 5 minutes
             confidence=confidence,
+            **freshness,
         )
 
         # Create structural data object
@@ -463,11 +500,15 @@ async def search_by_symbol(
         # Register task for status tracking (5 minute TTL)
         task_registry.register(task_info, ttl=300)
 
-        data_lineage = DataLineage(
-            providers=[provider_name],
-            arbitration_score=0.0,  # TODO: Get from cache metadata if possible
-            conflict_resolved=False,
-            source_count=1,
+        data_lineage = (
+            DataLineage(**lineage)
+            if lineage
+            else DataLineage(
+                providers=[provider_name],
+                arbitration_score=0.0,  # TODO: Get from cache metadata if possible
+                conflict_resolved=False,
+                source_count=1,
+            )
         )
 
         # Generate disclaimer
@@ -796,7 +837,11 @@ async def search_by_coin(
         cache_key = cache_manager.l1.build_key("price", asset.symbol, "any")
 
         data = await cache_manager.get_with_read_through(
-            key=cache_key, data_type=DataType.PRICE, fetch_fn=fetch_crypto_price, asset=asset
+            key=cache_key,
+            data_type=DataType.PRICE,
+            fetch_fn=fetch_crypto_price,
+            asset=asset,
+            include_freshness=True,
         )
 
         if not data:
@@ -805,6 +850,10 @@ async def search_by_coin(
         # Extract provider info
         provider_name = data.pop("_source_provider", "unknown")
         confidence = data.pop("_confidence", 0.0)
+        # Set when the price is a quorum merge of several providers
+        lineage = data.pop("lineage", None)
+        # 30 seconds for crypto (more volatile)
+        freshness = cache_freshness_fields(data, default_ttl=30)
 
         task_id = f"crypto-{symbol.lower()}-{uuid.uuid4().hex[:8]}"
 
@@ -812,11 +861,9 @@ async def search_by_coin(
             price=data.get("price", 0.0),
             change=data.get("change", 0.0),
             change_percent=data.get("change_percent", 0.0),
-            as_of=datetime.now(timezone.utc),
-            last_updated=datetime.now(timezone.utc),
             source=provider_name,
-            ttl=30,  # 30 seconds for crypto (more volatile)
             confidence=confidence,
+            **freshness,
         )
 
         task_info = TaskInfo(
@@ -832,11 +879,15 @@ async def search_by_coin(
         # Register task for status tracking (5 minute TTL)
         task_registry.register(task_info, ttl=300)
 
-        data_lineage = DataLineage(
-            providers=[provider_name],
-            arbitration_score=0.0,  # TODO: Get from cache metadata
-            conflict_resolved=False,
-            source_count=1,
+        data_lineage = (
+            DataLineage(**lineage)
+            if lineage
+            else DataLineage(
+                providers=[provider_name],
+                arbitration_score=0.0,  # TODO: Get from cache metadata
+                conflict_resolved=False,
+                source_count=1,
+            )
         )
 
         # Generate disclaimer for crypto
@@ -8,7 +8,7 @@ based on market conditions and automatic invalidation on significant events.
 import hashlib
 import json
 from datetime import datetime, time, timezone
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Optional, Tuple, cast
 
 from fiml.cache.manager import cache_manager
 from fiml.core.logging import get_logger
@@ -23,7 +23,7 @@ class NarrativeCache:
 
     Features:
     - Dynamic TTL based on market conditions
-    - Event-triggered cache invalidation
+    - Event-triggered cache invalidation (O(1) generation bump per symbol)
     - Cache hit rate tracking
     - Market hours awareness
     """
@@ -54,7 +54,9 @@ class NarrativeCache:
         Returns:
             Cached narrative data or None if not found
         """
-        cache_key = self._generate_cache_key(symbol, language, expertise_level, narrative_params)
+        cache_key = await self._versioned_cache_key(
+            symbol, self._generate_cache_key(symbol, language, expertise_level, narrative_params)
+        )
 
         try:
             cached_data = await self.cache_manager.l1.get(cache_key)
@@ -103,7 +105,9 @@ class NarrativeCache:
         Returns:
             True if cached successfully
         """
-        cache_key = self._generate_cache_key(symbol, language, expertise_level, narrative_params)
+        cache_key = await self._versioned_cache_key(
+            symbol, self._generate_cache_key(symbol, language, expertise_level, narrative_params)
+        )
 
         # Calculate dynamic TTL if not provided
         if ttl is None:
@@ -112,6 +116,7 @@ class NarrativeCache:
 
         try:
             await self.cache_manager.l1.set(cache_key, narrative_data, ttl)
+            await self.cache_manager.l1.index_tags([(cache_key, self._namespaces(symbol), ttl)])
             logger.info(
                 "Narrative cached",
                 symbol=symbol,
@@ -139,30 +144,31 @@ class NarrativeCache:
             expertise_level: Optional specific expertise level to invalidate
 
         Returns:
-            Number of cache entries invalidated
+            Number of cache entries (or whole-symbol generations) invalidated
         """
         # If specific language/expertise not provided, invalidate all variations
         count = 0
 
         if language and expertise_level:
             # Invalidate specific combination
-            cache_key = self._generate_cache_key(symbol, language, expertise_level)
+            cache_key = await self._versioned_cache_key(
+                symbol, self._generate_cache_key(symbol, language, expertise_level)
+            )
             try:
                 await self.cache_manager.l1.delete(cache_key)
                 count = 1
             except Exception as e:
                 logger.warning(f"Failed to invalidate cache key: {e}")
         else:
-            # Invalidate all combinations using pattern matching
-            pattern = f"narrative:{symbol.upper()}:*"
+            # Invalidate all combinations by moving to a new generation; the
+            # old entries expire through their TTL
             try:
-                # Note: This requires Redis SCAN for pattern deletion
-                # For now, we'll just mark as invalidated
-                logger.info("Invalidating narrative cache pattern", pattern=pattern)
-                # In production, implement pattern-based deletion
-                count = 1
+                generations = await self.cache_manager.l1.invalidate_namespaces(
+                    self._narrative_namespace(symbol)
+                )
+                count = len(generations)
             except Exception as e:
-                logger.warning(f"Failed to invalidate cache pattern: {e}")
+                logger.warning(f"Failed to invalidate narrative generation: {e}")
 
         logger.info(f"Invalidated {count} narrative cache entries", symbol=symbol)
         return count
@@ -252,6 +258,22 @@ class NarrativeCache:
 
         return base_key
 
+    @staticmethod
+    def _narrative_namespace(symbol: str) -> str:
+        """Generation namespace for every narrative of a symbol"""
+        return f"narrative:{symbol.upper()}"
+
+    def _namespaces(self, symbol: str) -> Tuple[str, str]:
+        """Namespaces a narrative key belongs to (symbol data and its narratives)"""
+        return (
+            self.cache_manager.l1.symbol_namespace(symbol),
+            self._narrative_namespace(symbol),
+        )
+
+    async def _versioned_cache_key(self, symbol: str, cache_key: str) -> str:
+        """Embed the symbol and narrative generations into a cache key"""
+        return await self.cache_manager.l1.versioned_key(cache_key, *self._namespaces(symbol))
+
     def _calculate_ttl(
         self,
         asset: Asset,
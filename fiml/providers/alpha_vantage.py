@@ -41,7 +41,6 @@ class AlphaVantageProvider(BaseProvider):
         )
         super().__init__(config)
         self._session: Optional[aiohttp.ClientSession] = None
-        self._request_timestamps: list = []
 
     async def initialize(self) -> None:
         """Initialize Alpha Vantage provider"""
@@ -61,30 +60,12 @@ class AlphaVantageProvider(BaseProvider):
             await self._session.close()
         self._is_initialized = False
 
-    async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limits"""
-        now = datetime.now(timezone.utc)
-
-        # Remove timestamps older than 1 minute
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if (now - ts).total_seconds() < 60
-        ]
-
-        # Check if we've exceeded the rate limit
-        if len(self._request_timestamps) >= self.config.rate_limit_per_minute:
-            wait_time = 60 - (now - self._request_timestamps[0]).total_seconds()
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
-                raise ProviderRateLimitError(
-                    f"Rate limit exceeded. Wait {wait_time:.1f}s", retry_after=int(wait_time) + 1
-                )
-
     async def _make_request(self, params: Dict[str, str]) -> Dict[str, Any]:
         """Make API request to Alpha Vantage"""
         if not self._session:
             raise ProviderError("Provider not initialized")
 
-        await self._check_rate_limit()
+        await self._acquire_rate_limit()
 
         if self.config.api_key:
             params["apikey"] = self.config.api_key
@@ -95,7 +76,6 @@ class AlphaVantageProvider(BaseProvider):
                 params=params,
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds),
             ) as response:
-                self._request_timestamps.append(datetime.now(timezone.utc))
                 self._record_request()
 
                 if response.status == 200:
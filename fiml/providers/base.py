@@ -2,13 +2,75 @@
 Base Provider Interface
 """
 
+import asyncio
+import functools
+import hashlib
+import time
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
+from fiml.core import config as fiml_config
 from fiml.core.models import Asset, DataType, ProviderHealth
+from fiml.providers.rate_limiter import RateLimitBucket, rate_limiter
+from fiml.providers.telemetry import ProviderTelemetry
+
+# fetch_* methods timed into ProviderTelemetry, and the data type each serves
+_FETCH_DATA_TYPES: Dict[str, DataType] = {
+    "fetch_price": DataType.PRICE,
+    "fetch_ohlcv": DataType.OHLCV,
+    "fetch_fundamentals": DataType.FUNDAMENTALS,
+    "fetch_news": DataType.NEWS,
+    "fetch_macro": DataType.MACRO,
+    "fetch_technical": DataType.TECHNICAL,
+    "fetch_options_chain": DataType.OPTIONS,
+}
+
+# (provider id, data type) of the fetch being timed, so that an override
+# calling super() is recorded once
+_timed_fetch: ContextVar[Optional[Tuple[int, DataType]]] = ContextVar(
+    "fiml_timed_fetch", default=None
+)
+
+
+def _with_telemetry(
+    method: Callable[..., Awaitable["ProviderResponse"]], data_type: DataType
+) -> Callable[..., Awaitable["ProviderResponse"]]:
+    """Wrap a fetch_* method to record its latency and outcome"""
+
+    @functools.wraps(method)
+    async def timed(self: "BaseProvider", asset: Asset, *args: Any, **kwargs: Any) -> Any:
+        telemetry = getattr(self, "telemetry", None)
+        if telemetry is None or _timed_fetch.get() == (id(self), data_type):
+            return await method(self, asset, *args, **kwargs)
+
+        token = _timed_fetch.set((id(self), data_type))
+        start = time.perf_counter()
+        try:
+            response = await method(self, asset, *args, **kwargs)
+        except NotImplementedError:
+            raise
+        except Exception:
+            telemetry.record(
+                data_type, (time.perf_counter() - start) * 1000, False, asset.asset_type
+            )
+            raise
+        finally:
+            _timed_fetch.reset(token)
+
+        telemetry.record(
+            data_type,
+            (time.perf_counter() - start) * 1000,
+            bool(getattr(response, "is_valid", True)),
+            asset.asset_type,
+        )
+        return response
+
+    timed.__fiml_telemetry__ = True  # type: ignore[attr-defined]
+    return timed
 
 
 class ProviderConfig(BaseModel):
@@ -43,8 +105,29 @@ class BaseProvider(ABC):
 
     All providers must implement this interface to be compatible
     with the data arbitration engine.
+
+    The fetch_* methods a subclass defines are wrapped to record latency,
+    success and freshness in self.telemetry, which the get_latency_p95,
+    get_success_rate, get_uptime_24h and get_last_update scores read.
     """
 
+    # Symbols per upstream call in fetch_prices_batch (1 = no batch endpoint)
+    price_batch_size: int = 1
+
+    # Concurrent fetch_price calls when prices are fetched one by one
+    price_batch_concurrency: int = 5
+
+    # Whether supports_asset depends only on asset.asset_type; arbitration
+    # plans are cached per asset class and re-check other providers per symbol
+    asset_support_by_type: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, data_type in _FETCH_DATA_TYPES.items():
+            method = cls.__dict__.get(name)
+            if callable(method) and not getattr(method, "__fiml_telemetry__", False):
+                setattr(cls, name, _with_telemetry(method, data_type))
+
     def __init__(self, config: ProviderConfig):
         self.config = config
         self.name = config.name
@@ -53,6 +136,11 @@ class BaseProvider(ABC):
         self._last_request_time: Optional[datetime] = None
         self._is_initialized = False
         self._cooldown_until: Optional[datetime] = None
+        self._state_version = 0
+        self.telemetry = ProviderTelemetry(
+            latency_window_seconds=fiml_config.settings.provider_latency_window_seconds,
+            outcome_window_seconds=fiml_config.settings.provider_outcome_window_seconds,
+        )
 
     @abstractmethod
     async def initialize(self) -> None:
@@ -69,6 +157,111 @@ class BaseProvider(ABC):
         """Fetch current price data"""
         pass
 
+    async def fetch_prices_batch(self, assets: List[Asset]) -> List[ProviderResponse]:
+        """
+        Fetch current prices for many assets in as few upstream calls as possible
+
+        Providers with a multi-symbol endpoint set price_batch_size and
+        implement _fetch_price_chunk; otherwise each asset goes through
+        fetch_price, price_batch_concurrency at a time.
+
+        Args:
+            assets: Assets to price
+
+        Returns:
+            One response per asset, in order. Failed assets get an invalid
+            response with the error in metadata["error"]. Every response
+            records the upstream requests the whole batch made in
+            metadata["batch_calls"].
+        """
+        batched = [a for a in assets if self._supports_batch_price(a)]
+        if self.price_batch_size <= 1 or not batched:
+            return self._record_batch_calls(
+                await self._fetch_prices_individually(assets), len(assets)
+            )
+
+        # The default _fetch_price_chunk makes one request per asset
+        chunk_is_one_call = type(self)._fetch_price_chunk is not BaseProvider._fetch_price_chunk
+
+        calls = 0
+        by_symbol: Dict[str, ProviderResponse] = {}
+        unique = list({asset.symbol: asset for asset in batched}.values())
+        for start in range(0, len(unique), self.price_batch_size):
+            chunk = unique[start : start + self.price_batch_size]
+            calls += 1 if chunk_is_one_call else len(chunk)
+            try:
+                by_symbol.update(await self._fetch_price_chunk(chunk))
+            except Exception as e:
+                for asset in chunk:
+                    by_symbol[asset.symbol] = self._price_error(asset, e)
+
+        individual = [a for a in assets if not self._supports_batch_price(a)]
+        if individual:
+            calls += len(individual)
+            for asset, response in zip(
+                individual, await self._fetch_prices_individually(individual), strict=True
+            ):
+                by_symbol[asset.symbol] = response
+
+        responses: List[ProviderResponse] = []
+        for asset in assets:
+            found: Optional[ProviderResponse] = by_symbol.get(asset.symbol)
+            if found is None:
+                found = self._price_error(asset, f"No price data available for {asset.symbol}")
+            responses.append(found)
+        return self._record_batch_calls(responses, calls)
+
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """
+        Fetch up to price_batch_size prices in one upstream call
+
+        The default fetches each asset with fetch_price; providers with a
+        multi-symbol endpoint override it.
+
+        Returns:
+            Responses keyed by asset symbol; missing symbols count as failed
+        """
+        responses = await self._fetch_prices_individually(assets)
+        return {response.asset.symbol: response for response in responses}
+
+    @staticmethod
+    def _record_batch_calls(
+        responses: List[ProviderResponse], calls: int
+    ) -> List[ProviderResponse]:
+        """Note on each response how many upstream requests its batch made"""
+        for response in responses:
+            response.metadata["batch_calls"] = calls
+        return responses
+
+    def _supports_batch_price(self, asset: Asset) -> bool:
+        """Whether asset can go through the multi-symbol endpoint"""
+        return True
+
+    async def _fetch_prices_individually(self, assets: List[Asset]) -> List[ProviderResponse]:
+        """Fetch prices one asset at a time with bounded concurrency"""
+        semaphore = asyncio.Semaphore(max(1, self.price_batch_concurrency))
+
+        async def fetch(asset: Asset) -> ProviderResponse:
+            async with semaphore:
+                try:
+                    return await self.fetch_price(asset)
+                except Exception as e:
+                    return self._price_error(asset, e)
+
+        return list(await asyncio.gather(*(fetch(asset) for asset in assets)))
+
+    def _price_error(self, asset: Asset, error: Any) -> ProviderResponse:
+        """Invalid price response recording why asset could not be priced"""
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data={},
+            timestamp=datetime.now(timezone.utc),
+            is_valid=False,
+            metadata={"error": str(error)},
+        )
+
     @abstractmethod
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
@@ -124,31 +317,90 @@ class BaseProvider(ABC):
         """Get provider health metrics"""
         pass
 
-    async def get_latency_p95(self, region: str = "US") -> float:
-        """Get 95th percentile latency for region (in ms)"""
-        # TODO: Implement actual latency tracking
-        return 100.0
+    async def get_latency_p95(
+        self, region: str = "US", data_type: Optional[DataType] = None
+    ) -> float:
+        """
+        Get 95th percentile latency (in ms) over the telemetry window
+
+        Latency is measured from this process, so region only matters to
+        providers that override this. Without samples, a neutral 100ms is
+        assumed so untried providers still get traffic.
+        """
+        p95 = self.telemetry.latency_percentile(95, data_type)
+        return p95 if p95 is not None else 100.0
 
     async def get_last_update(self, asset: Asset, data_type: DataType) -> datetime:
-        """Get timestamp of last successful update"""
-        # TODO: Implement actual tracking
-        return datetime.now(timezone.utc)
+        """
+        Get timestamp of last successful update for the asset's class
+
+        Providers that have not served this data type yet report now, so
+        they are explored rather than scored as stale.
+        """
+        last = self.telemetry.last_success(data_type, asset.asset_type)
+        if last is None:
+            last = self.telemetry.last_success(data_type)
+        if last is None:
+            return datetime.now(timezone.utc)
+        return datetime.fromtimestamp(last, timezone.utc)
 
     async def get_completeness(self, data_type: DataType) -> float:
         """Get data completeness score (0.0 - 1.0)"""
         # TODO: Implement actual completeness tracking
         return 1.0
 
-    async def get_success_rate(self) -> float:
-        """Get success rate over last N requests"""
+    async def get_success_rate(self, data_type: Optional[DataType] = None) -> float:
+        """Get success rate over the telemetry window (lifetime counts without recent calls)"""
+        rate = self.telemetry.success_rate(data_type)
+        if rate is not None:
+            return rate
         if self._request_count == 0:
             return 1.0
         return 1.0 - (self._error_count / self._request_count)
 
     async def get_uptime_24h(self) -> float:
-        """Get uptime percentage over last 24 hours"""
-        # TODO: Implement actual uptime tracking
-        return 0.99
+        """Get share of the last 24 hours' active 5-minute periods that saw a success"""
+        uptime = self.telemetry.uptime()
+        return uptime if uptime is not None else 0.99
+
+    @property
+    def state_version(self) -> int:
+        """
+        Counter that changes whenever this provider's routing inputs change
+
+        Bumped by cooldowns starting and ending and by telemetry events
+        (see ProviderTelemetry.version); cached arbitration plans built
+        against an older value are discarded.
+        """
+        return self._state_version + self.telemetry.version
+
+    def rate_limit_buckets(self) -> List[RateLimitBucket]:
+        """
+        Quotas each upstream request draws on
+
+        A quota belongs to the API key when there is one, so every worker (and
+        every provider instance) using the key shares one bucket; keyless APIs
+        are limited per provider. Override to add buckets.
+        """
+        name = self.name
+        if self.config.api_key:
+            name = f"{name}:key:{hashlib.sha256(self.config.api_key.encode()).hexdigest()[:16]}"
+        return [rate_limiter.bucket(name, self.config.rate_limit_per_minute)]
+
+    async def _acquire_rate_limit(self, cost: float = 1.0) -> float:
+        """
+        Wait for rate limit tokens before an upstream request
+
+        Args:
+            cost: Upstream calls the request counts as
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ProviderRateLimitError: If no token frees up before the deadline
+        """
+        return await rate_limiter.acquire(self.rate_limit_buckets(), cost)
 
     def _record_request(self) -> None:
         """Record a request"""
@@ -162,6 +414,7 @@ class BaseProvider(ABC):
     def set_cooldown(self, seconds: int) -> None:
         """Set provider cooldown"""
         self._cooldown_until = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+        self._state_version += 1
 
     def is_in_cooldown(self) -> bool:
         """Check if provider is in cooldown"""
@@ -170,6 +423,7 @@ class BaseProvider(ABC):
 
         if datetime.now(timezone.utc) > self._cooldown_until:
             self._cooldown_until = None
+            self._state_version += 1
             return False
 
         return True
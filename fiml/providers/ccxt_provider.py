@@ -5,13 +5,14 @@ CCXT Cryptocurrency Provider Implementation
 import asyncio
 import warnings
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import ccxt.async_support as ccxt  # type: ignore[import-untyped]
 
 from fiml.core.exceptions import (
     ProviderError,
     ProviderRateLimitError,
+    ProviderSymbolNotFoundError,
     ProviderTimeoutError,
     RegionalRestrictionError,
 )
@@ -63,6 +64,12 @@ class CCXTProvider(BaseProvider):
     - Multi-exchange support (Binance, Coinbase, Kraken, etc.)
     """
 
+    # fetch_tickers prices many markets in one request where the exchange supports it
+    price_batch_size = 500
+
+    # supports_asset checks the symbol against the exchange's markets
+    asset_support_by_type = False
+
     def __init__(self, exchange_id: str = "binance"):
         config = ProviderConfig(
             name=f"ccxt_{exchange_id}",
@@ -95,6 +102,7 @@ class CCXTProvider(BaseProvider):
             RegionalRestrictionError: If error indicates geo-blocking
             ProviderRateLimitError: If rate limit or DDoS protection triggered
             ProviderTimeoutError: If network or timeout error
+            ProviderSymbolNotFoundError: If the exchange does not list the symbol
             ProviderError: For other exchange errors
         """
         if record_error:
@@ -176,6 +184,18 @@ class CCXTProvider(BaseProvider):
             )
             raise ProviderTimeoutError(f"Network error: {exception}")
 
+        # Handle unknown symbols
+        if isinstance(exception, ccxt.BadSymbol):
+            logger.info(
+                f"Symbol not listed on {self.exchange_id}",
+                exchange=self.exchange_id,
+                operation=operation,
+                asset=asset_symbol,
+            )
+            raise ProviderSymbolNotFoundError(
+                f"Symbol {asset_symbol} not found on {self.exchange_id}"
+            )
+
         # Handle exchange errors (check for geo-blocking)
         if isinstance(exception, ccxt.ExchangeError):
             if _is_geo_blocked_error(error_msg):
@@ -278,41 +298,9 @@ class CCXTProvider(BaseProvider):
             ticker = await self._exchange.fetch_ticker(symbol)
 
             if not ticker:
-                raise ProviderError(f"No ticker data for {symbol}")
-
-            data = {
-                "price": float(ticker.get("last", 0.0)),
-                "bid": float(ticker.get("bid", 0.0)),
-                "ask": float(ticker.get("ask", 0.0)),
-                "high": float(ticker.get("high", 0.0)),
-                "low": float(ticker.get("low", 0.0)),
-                "open": float(ticker.get("open", 0.0)),
-                "close": float(ticker.get("close", 0.0)),
-                "volume": float(ticker.get("baseVolume", 0.0)),
-                "quote_volume": float(ticker.get("quoteVolume", 0.0)),
-                "change": float(ticker.get("change", 0.0) or 0.0),
-                "change_percent": float(ticker.get("percentage", 0.0) or 0.0),
-                "timestamp": ticker.get("timestamp", datetime.now(timezone.utc).timestamp() * 1000),
-                "datetime": ticker.get("datetime", datetime.now(timezone.utc).isoformat()),
-                "symbol": symbol,
-                "info": ticker.get("info", {}),
-            }
+                raise ProviderSymbolNotFoundError(f"No ticker data for {symbol}")
 
-            return ProviderResponse(
-                provider=self.name,
-                asset=asset,
-                data_type=DataType.PRICE,
-                data=data,
-                timestamp=datetime.now(timezone.utc),
-                is_valid=True,
-                is_fresh=True,
-                confidence=0.99,  # High confidence for real-time crypto data
-                metadata={
-                    "source": "ccxt",
-                    "exchange": self.exchange_id,
-                    "symbol": symbol,
-                },
-            )
+            return self._ticker_response(asset, symbol, ticker)
 
         except ProviderError:
             # Re-raise ProviderError as-is (e.g., "No ticker data")
@@ -321,6 +309,69 @@ class CCXTProvider(BaseProvider):
             self._handle_ccxt_exception(e, operation="fetch_price", asset_symbol=asset.symbol)
             raise  # This line will never be reached but satisfies mypy
 
+    def _supports_batch_price(self, asset: Asset) -> bool:
+        """Batch only on exchanges that implement fetchTickers"""
+        return bool(self._exchange is not None and self._exchange.has.get("fetchTickers"))
+
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """Fetch tickers for many markets with one fetch_tickers request"""
+        if not self._exchange:
+            raise ProviderError("Provider not initialized")
+
+        self._record_request()
+        logger.info(f"Fetching {len(assets)} tickers from {self.exchange_id}")
+
+        markets = [(asset, self._normalize_symbol(asset)) for asset in assets]
+        try:
+            tickers = await self._exchange.fetch_tickers(list({symbol for _, symbol in markets}))
+        except Exception as e:
+            self._handle_ccxt_exception(e, operation="fetch_tickers")
+            raise
+
+        return {
+            asset.symbol: self._ticker_response(asset, symbol, tickers[symbol])
+            for asset, symbol in markets
+            if tickers.get(symbol)
+        }
+
+    def _ticker_response(
+        self, asset: Asset, symbol: str, ticker: Dict[str, Any]
+    ) -> ProviderResponse:
+        """Build a price response from a CCXT ticker"""
+        data = {
+            "price": float(ticker.get("last", 0.0)),
+            "bid": float(ticker.get("bid", 0.0)),
+            "ask": float(ticker.get("ask", 0.0)),
+            "high": float(ticker.get("high", 0.0)),
+            "low": float(ticker.get("low", 0.0)),
+            "open": float(ticker.get("open", 0.0)),
+            "close": float(ticker.get("close", 0.0)),
+            "volume": float(ticker.get("baseVolume", 0.0)),
+            "quote_volume": float(ticker.get("quoteVolume", 0.0)),
+            "change": float(ticker.get("change", 0.0) or 0.0),
+            "change_percent": float(ticker.get("percentage", 0.0) or 0.0),
+            "timestamp": ticker.get("timestamp", datetime.now(timezone.utc).timestamp() * 1000),
+            "datetime": ticker.get("datetime", datetime.now(timezone.utc).isoformat()),
+            "symbol": symbol,
+            "info": ticker.get("info", {}),
+        }
+
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data=data,
+            timestamp=datetime.now(timezone.utc),
+            is_valid=True,
+            is_fresh=True,
+            confidence=0.99,  # High confidence for real-time crypto data
+            metadata={
+                "source": "ccxt",
+                "exchange": self.exchange_id,
+                "symbol": symbol,
+            },
+        )
+
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
     ) -> ProviderResponse:
@@ -350,7 +401,7 @@ class CCXTProvider(BaseProvider):
             ohlcv = await self._exchange.fetch_ohlcv(symbol, timeframe=ccxt_timeframe, limit=limit)
 
             if not ohlcv:
-                raise ProviderError(f"No OHLCV data for {symbol}")
+                raise ProviderSymbolNotFoundError(f"No OHLCV data for {symbol}")
 
             # Convert to standard format
             ohlcv_data = []
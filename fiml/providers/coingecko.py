@@ -4,11 +4,16 @@ CoinGecko Provider Implementation
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 
-from fiml.core.exceptions import ProviderError, ProviderRateLimitError, ProviderTimeoutError
+from fiml.core.exceptions import (
+    ProviderError,
+    ProviderRateLimitError,
+    ProviderSymbolNotFoundError,
+    ProviderTimeoutError,
+)
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
@@ -30,6 +35,9 @@ class CoinGeckoProvider(BaseProvider):
 
     BASE_URL = "https://api.coingecko.com/api/v3"
 
+    # simple/price accepts a comma-separated list of coin ids
+    price_batch_size = 250
+
     def __init__(self) -> None:
         config = ProviderConfig(
             name="coingecko",
@@ -103,6 +111,8 @@ class CoinGeckoProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
@@ -135,40 +145,12 @@ class CoinGeckoProvider(BaseProvider):
         try:
             coin_id = self._get_coin_id(asset.symbol)
 
-            endpoint = "/simple/price"
-            params = {
-                "ids": coin_id,
-                "vs_currencies": "usd",
-                "include_market_cap": "true",
-                "include_24hr_vol": "true",
-                "include_24hr_change": "true",
-            }
-
-            response_data = await self._make_request(endpoint, params)
+            response_data = await self._make_request("/simple/price", self._price_params([coin_id]))
 
             if coin_id not in response_data:
-                raise ProviderError(f"No price data available for {asset.symbol}")
-
-            coin_data = response_data[coin_id]
+                raise ProviderSymbolNotFoundError(f"No price data available for {asset.symbol}")
 
-            data = {
-                "price": float(coin_data.get("usd", 0.0)),
-                "market_cap": float(coin_data.get("usd_market_cap", 0.0)),
-                "volume_24h": float(coin_data.get("usd_24h_vol", 0.0)),
-                "change_24h": float(coin_data.get("usd_24h_change", 0.0)),
-            }
-
-            return ProviderResponse(
-                provider=self.name,
-                asset=asset,
-                data_type=DataType.PRICE,
-                data=data,
-                timestamp=datetime.now(timezone.utc),
-                is_valid=True,
-                is_fresh=True,
-                confidence=0.96,
-                metadata={"source": "coingecko", "coin_id": coin_id},
-            )
+            return self._price_response(asset, coin_id, response_data[coin_id])
 
         except (ProviderError, ProviderTimeoutError, ProviderRateLimitError):
             raise
@@ -177,6 +159,57 @@ class CoinGeckoProvider(BaseProvider):
             logger.error(f"Error fetching price from CoinGecko for {asset.symbol}: {e}")
             raise ProviderError(f"CoinGecko fetch failed: {e}")
 
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """Fetch prices for many coins with one simple/price request"""
+        logger.info(f"Fetching prices for {len(assets)} coins from CoinGecko")
+
+        coin_ids = {asset.symbol: self._get_coin_id(asset.symbol) for asset in assets}
+        params = self._price_params(sorted(set(coin_ids.values())))
+        response_data = await self._make_request("/simple/price", params)
+
+        responses: Dict[str, ProviderResponse] = {}
+        for asset in assets:
+            coin_id = coin_ids[asset.symbol]
+            if coin_id in response_data:
+                responses[asset.symbol] = self._price_response(
+                    asset, coin_id, response_data[coin_id]
+                )
+        return responses
+
+    @staticmethod
+    def _price_params(coin_ids: List[str]) -> Dict[str, str]:
+        """Query parameters for /simple/price"""
+        return {
+            "ids": ",".join(coin_ids),
+            "vs_currencies": "usd",
+            "include_market_cap": "true",
+            "include_24hr_vol": "true",
+            "include_24hr_change": "true",
+        }
+
+    def _price_response(
+        self, asset: Asset, coin_id: str, coin_data: Dict[str, Any]
+    ) -> ProviderResponse:
+        """Build a price response from a simple/price entry"""
+        data = {
+            "price": float(coin_data.get("usd", 0.0)),
+            "market_cap": float(coin_data.get("usd_market_cap", 0.0)),
+            "volume_24h": float(coin_data.get("usd_24h_vol", 0.0)),
+            "change_24h": float(coin_data.get("usd_24h_change", 0.0)),
+        }
+
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data=data,
+            timestamp=datetime.now(timezone.utc),
+            is_valid=True,
+            is_fresh=True,
+            confidence=0.96,
+            metadata={"source": "coingecko", "coin_id": coin_id},
+        )
+
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
     ) -> ProviderResponse:
@@ -198,7 +231,7 @@ class CoinGeckoProvider(BaseProvider):
             response_data = await self._make_request(endpoint, params)
 
             if not isinstance(response_data, list):
-                raise ProviderError(f"No OHLCV data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No OHLCV data available for {asset.symbol}")
 
             ohlcv_data = []
             for bar in response_data[:limit]:
@@ -69,6 +69,8 @@ class CoinMarketCapProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
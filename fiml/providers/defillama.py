@@ -122,6 +122,8 @@ class DefiLlamaProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
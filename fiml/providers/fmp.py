@@ -5,12 +5,17 @@ Financial Modeling Prep (FMP) Provider Implementation
 import asyncio
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 
 from fiml.core.config import settings
-from fiml.core.exceptions import ProviderError, ProviderRateLimitError, ProviderTimeoutError
+from fiml.core.exceptions import (
+    ProviderError,
+    ProviderRateLimitError,
+    ProviderSymbolNotFoundError,
+    ProviderTimeoutError,
+)
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
@@ -32,6 +37,9 @@ class FMPProvider(BaseProvider):
 
     BASE_URL = "https://financialmodelingprep.com/stable"
 
+    # batch-quote accepts a comma-separated symbol list
+    price_batch_size = 100
+
     def __init__(self, api_key: Optional[str] = None):
         config = ProviderConfig(
             name="fmp",
@@ -43,7 +51,6 @@ class FMPProvider(BaseProvider):
         )
         super().__init__(config)
         self._session: Optional[aiohttp.ClientSession] = None
-        self._request_timestamps: list = []
 
     async def initialize(self) -> None:
         """Initialize FMP provider"""
@@ -65,30 +72,12 @@ class FMPProvider(BaseProvider):
             await self._session.close()
         self._is_initialized = False
 
-    async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limits"""
-        now = datetime.now(timezone.utc)
-
-        # Remove timestamps older than 1 minute
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if (now - ts).total_seconds() < 60
-        ]
-
-        # Check if we've exceeded the rate limit
-        if len(self._request_timestamps) >= self.config.rate_limit_per_minute:
-            wait_time = 60 - (now - self._request_timestamps[0]).total_seconds()
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
-                raise ProviderRateLimitError(
-                    f"Rate limit exceeded. Wait {wait_time:.1f}s", retry_after=int(wait_time) + 1
-                )
-
     async def _make_request(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Any:
         """Make API request to FMP"""
         if not self._session:
             raise ProviderError("Provider not initialized")
 
-        await self._check_rate_limit()
+        await self._acquire_rate_limit()
 
         url = f"{self.BASE_URL}/{endpoint}"
 
@@ -102,7 +91,6 @@ class FMPProvider(BaseProvider):
             async with self._session.get(
                 url, params=params, timeout=aiohttp.ClientTimeout(total=self.config.timeout_seconds)
             ) as response:
-                self._request_timestamps.append(datetime.now(timezone.utc))
                 self._record_request()
 
                 if response.status == 200:
@@ -136,42 +124,9 @@ class FMPProvider(BaseProvider):
             response_data = await self._make_request(endpoint, params)
 
             if not response_data or len(response_data) == 0:
-                raise ProviderError(f"No quote data available for {asset.symbol}")
-
-            quote = response_data[0]
+                raise ProviderSymbolNotFoundError(f"No quote data available for {asset.symbol}")
 
-            data = {
-                "price": float(quote.get("price", 0.0)),
-                "change": float(quote.get("change", 0.0)),
-                "change_percent": float(
-                    quote.get("changesPercentage", 0.0) or quote.get("changePercentage", 0.0)
-                ),
-                "volume": int(quote.get("volume", 0)),
-                "previous_close": float(quote.get("previousClose", 0.0)),
-                "open": float(quote.get("open", 0.0)),
-                "high": float(quote.get("dayHigh", 0.0)),
-                "low": float(quote.get("dayLow", 0.0)),
-                "market_cap": int(quote.get("marketCap", 0)),
-                "pe_ratio": float(quote.get("pe", 0.0) or 0.0),
-                "eps": float(quote.get("eps", 0.0) or 0.0),
-                "shares_outstanding": int(quote.get("sharesOutstanding", 0)),
-                "timestamp": quote.get("timestamp", 0),
-            }
-
-            return ProviderResponse(
-                provider=self.name,
-                asset=asset,
-                data_type=DataType.PRICE,
-                data=data,
-                timestamp=datetime.now(timezone.utc),
-                is_valid=True,
-                is_fresh=True,
-                confidence=0.97,
-                metadata={
-                    "source": "fmp",
-                    "endpoint": "quote",
-                },
-            )
+            return self._quote_response(asset, response_data[0], endpoint)
 
         except (ProviderError, ProviderTimeoutError, ProviderRateLimitError):
             raise
@@ -180,6 +135,59 @@ class FMPProvider(BaseProvider):
             logger.error(f"Error fetching price from FMP for {asset.symbol}: {e}")
             raise ProviderError(f"FMP fetch failed: {e}")
 
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """Fetch quotes for many symbols with one batch-quote request"""
+        logger.info(f"Fetching batch quote for {len(assets)} symbols from FMP")
+
+        endpoint = "batch-quote"
+        params = {"symbols": ",".join(asset.symbol for asset in assets)}
+        response_data = await self._make_request(endpoint, params)
+
+        assets_by_symbol = {asset.symbol.upper(): asset for asset in assets}
+        responses: Dict[str, ProviderResponse] = {}
+        for quote in response_data or []:
+            asset = assets_by_symbol.get(str(quote.get("symbol", "")).upper())
+            if asset is not None:
+                responses[asset.symbol] = self._quote_response(asset, quote, endpoint)
+        return responses
+
+    def _quote_response(
+        self, asset: Asset, quote: Dict[str, Any], endpoint: str
+    ) -> ProviderResponse:
+        """Build a price response from an FMP quote object"""
+        data = {
+            "price": float(quote.get("price", 0.0)),
+            "change": float(quote.get("change", 0.0)),
+            "change_percent": float(
+                quote.get("changesPercentage", 0.0) or quote.get("changePercentage", 0.0)
+            ),
+            "volume": int(quote.get("volume", 0)),
+            "previous_close": float(quote.get("previousClose", 0.0)),
+            "open": float(quote.get("open", 0.0)),
+            "high": float(quote.get("dayHigh", 0.0)),
+            "low": float(quote.get("dayLow", 0.0)),
+            "market_cap": int(quote.get("marketCap", 0)),
+            "pe_ratio": float(quote.get("pe", 0.0) or 0.0),
+            "eps": float(quote.get("eps", 0.0) or 0.0),
+            "shares_outstanding": int(quote.get("sharesOutstanding", 0)),
+            "timestamp": quote.get("timestamp", 0),
+        }
+
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data=data,
+            timestamp=datetime.now(timezone.utc),
+            is_valid=True,
+            is_fresh=True,
+            confidence=0.97,
+            metadata={
+                "source": "fmp",
+                "endpoint": endpoint,
+            },
+        )
+
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
     ) -> ProviderResponse:
@@ -212,7 +220,9 @@ class FMPProvider(BaseProvider):
             historical = historical[:limit]
 
             if not historical:
-                raise ProviderError(f"No historical data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(
+                    f"No historical data available for {asset.symbol}"
+                )
 
             # Convert to standard format
             ohlcv_data = []
@@ -28,6 +28,9 @@ class FredProvider(BaseProvider):
 
     BASE_URL = "https://api.stlouisfed.org/fred"
 
+    # supports_asset also accepts known series symbols of any asset type
+    asset_support_by_type = False
+
     # Mapping of common macro indicators to FRED series IDs
     SERIES_MAPPING = {
         "GDP": "GDP",
@@ -77,6 +80,8 @@ class FredProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
@@ -9,7 +9,12 @@ from typing import Any, Dict, Optional
 import aiohttp
 
 from fiml.core.config import settings
-from fiml.core.exceptions import ProviderError, ProviderRateLimitError, ProviderTimeoutError
+from fiml.core.exceptions import (
+    ProviderError,
+    ProviderRateLimitError,
+    ProviderSymbolNotFoundError,
+    ProviderTimeoutError,
+)
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
@@ -72,6 +77,8 @@ class IntrinioProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
@@ -90,7 +97,7 @@ class IntrinioProvider(BaseProvider):
                 elif response.status == 401:
                     raise ProviderError("Intrinio authentication failed")
                 elif response.status == 404:
-                    raise ProviderError("Symbol not found")
+                    raise ProviderSymbolNotFoundError("Symbol not found")
                 else:
                     raise ProviderError(f"HTTP {response.status}: {await response.text()}")
 
@@ -111,7 +118,7 @@ class IntrinioProvider(BaseProvider):
             response_data = await self._make_request(endpoint)
 
             if not response_data:
-                raise ProviderError(f"No price data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No price data available for {asset.symbol}")
 
             data = {
                 "price": float(response_data.get("last_price", 0.0)),
@@ -168,7 +175,7 @@ class IntrinioProvider(BaseProvider):
 
             stock_prices = response_data.get("stock_prices", [])
             if not stock_prices:
-                raise ProviderError(f"No OHLCV data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No OHLCV data available for {asset.symbol}")
 
             ohlcv_data = []
             for bar in stock_prices[:limit]:
@@ -84,7 +84,6 @@ class NewsAPIProvider(BaseProvider):
         super().__init__(config)
 
         self._session: Optional[aiohttp.ClientSession] = None
-        self._request_times: List[datetime] = []
         self._daily_request_count = 0
         self._daily_limit = 100  # Free tier default
         self._last_reset = datetime.now(timezone.utc)
@@ -103,7 +102,7 @@ class NewsAPIProvider(BaseProvider):
         self._is_initialized = False
 
     async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting"""
+        """Check the daily quota and wait for a shared per-minute token"""
         now = datetime.now(timezone.utc)
 
         # Reset daily counter if new day
@@ -115,17 +114,9 @@ class NewsAPIProvider(BaseProvider):
         if self._daily_request_count >= self._daily_limit:
             raise RateLimitError(f"Daily limit of {self._daily_limit} requests reached for NewsAPI")
 
-        # Check per-minute limit
-        one_minute_ago = now.timestamp() - 60
-        self._request_times = [t for t in self._request_times if t.timestamp() > one_minute_ago]
+        # Per-minute limit, shared by all workers
+        await self._acquire_rate_limit()
 
-        if len(self._request_times) >= self.config.rate_limit_per_minute:
-            wait_time = 60 - (now.timestamp() - self._request_times[0].timestamp())
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached, waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-
-        self._request_times.append(now)
         self._daily_request_count += 1
 
     async def _make_request(
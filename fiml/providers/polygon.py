@@ -4,12 +4,17 @@ Polygon.io Provider Implementation
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 
 from fiml.core.config import settings
-from fiml.core.exceptions import ProviderError, ProviderRateLimitError, ProviderTimeoutError
+from fiml.core.exceptions import (
+    ProviderError,
+    ProviderRateLimitError,
+    ProviderSymbolNotFoundError,
+    ProviderTimeoutError,
+)
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
@@ -31,6 +36,9 @@ class PolygonProvider(BaseProvider):
 
     BASE_URL = "https://api.polygon.io"
 
+    # The stocks snapshot endpoint accepts a comma-separated ticker list
+    price_batch_size = 250
+
     def __init__(self, api_key: Optional[str] = None):
         config = ProviderConfig(
             name="polygon",
@@ -68,6 +76,8 @@ class PolygonProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
@@ -111,7 +121,7 @@ class PolygonProvider(BaseProvider):
 
             results = response_data.get("results", [])
             if not results:
-                raise ProviderError(f"No price data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No price data available for {asset.symbol}")
 
             result = results[0]
 
@@ -144,6 +154,59 @@ class PolygonProvider(BaseProvider):
             logger.error(f"Error fetching price from Polygon for {asset.symbol}: {e}")
             raise ProviderError(f"Polygon fetch failed: {e}")
 
+    def _supports_batch_price(self, asset: Asset) -> bool:
+        """Only US stocks are served by the stocks snapshot"""
+        return asset.asset_type in (AssetType.EQUITY, AssetType.ETF)
+
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """Fetch prices for many stocks with one snapshot request"""
+        logger.info(f"Fetching snapshot for {len(assets)} tickers from Polygon")
+
+        endpoint = "/v2/snapshot/locale/us/markets/stocks/tickers"
+        params = {"tickers": ",".join(asset.symbol for asset in assets)}
+        response_data = await self._make_request(endpoint, params)
+
+        assets_by_ticker = {asset.symbol.upper(): asset for asset in assets}
+        responses: Dict[str, ProviderResponse] = {}
+        for snapshot in response_data.get("tickers") or []:
+            asset = assets_by_ticker.get(str(snapshot.get("ticker", "")).upper())
+            if asset is None:
+                continue
+
+            day = snapshot.get("day") or {}
+            prev_day = snapshot.get("prevDay") or {}
+            last_trade = snapshot.get("lastTrade") or {}
+            price = last_trade.get("p") or day.get("c") or prev_day.get("c")
+            if not price:
+                continue
+
+            data = {
+                "price": float(price),
+                "open": float(day.get("o", 0.0)),
+                "high": float(day.get("h", 0.0)),
+                "low": float(day.get("l", 0.0)),
+                "volume": int(day.get("v", 0)),
+                "vwap": float(day.get("vw", 0.0)),
+                "previous_close": float(prev_day.get("c", 0.0)),
+                "change": float(snapshot.get("todaysChange", 0.0)),
+                "change_percent": float(snapshot.get("todaysChangePerc", 0.0)),
+                "timestamp": snapshot.get("updated", 0),
+            }
+
+            responses[asset.symbol] = ProviderResponse(
+                provider=self.name,
+                asset=asset,
+                data_type=DataType.PRICE,
+                data=data,
+                timestamp=datetime.now(timezone.utc),
+                is_valid=True,
+                is_fresh=True,
+                confidence=0.98,
+                metadata={"source": "polygon", "ticker": snapshot.get("ticker")},
+            )
+
+        return responses
+
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
     ) -> ProviderResponse:
@@ -181,7 +244,7 @@ class PolygonProvider(BaseProvider):
 
             results = response_data.get("results", [])
             if not results:
-                raise ProviderError(f"No OHLCV data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No OHLCV data available for {asset.symbol}")
 
             ohlcv_data = []
             for bar in results[:limit]:
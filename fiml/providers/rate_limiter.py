@@ -0,0 +1,325 @@
+"""
+Rate Limiter - Token buckets shared by every worker through Redis
+
+Upstream quotas belong to an API key (or, for keyless APIs, to the provider),
+not to a process, so the buckets live in Redis and are updated by one Lua
+script: refill, check and spend happen atomically on the Redis clock, and a
+request drawing on several buckets takes from all of them or none.
+
+Callers wait for a token instead of failing. Only when the wait would exceed
+their deadline is ProviderRateLimitError raised, with the time until a token
+frees up as retry_after.
+
+Background work (cache warmers, the batch scheduler) runs under
+rate_limit_priority(Priority.BACKGROUND). It may not take the share of each
+bucket reserved for interactive calls, and in this process it also yields to
+interactive calls already waiting on the same bucket.
+"""
+
+import asyncio
+import math
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from fiml.core import config
+from fiml.core.exceptions import ProviderRateLimitError
+from fiml.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# KEYS: bucket keys
+# ARGV: cost, reserve share, then (tokens per ms, capacity) per bucket
+# Returns 0 once the tokens are taken, else ms until all buckets can pay
+TOKEN_BUCKET_SCRIPT = """
+redis.replicate_commands()
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local cost = tonumber(ARGV[1])
+local reserve = tonumber(ARGV[2])
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i + 1])
+    local capacity = tonumber(ARGV[2 * i + 2])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local elapsed = math.max(0, now - (tonumber(state[2]) or now))
+    tokens = math.min(capacity, tokens + elapsed * rate)
+    levels[i] = tokens
+    local needed = math.min(capacity, cost + reserve * capacity) - tokens
+    if needed > 0 then
+        wait = math.max(wait, math.ceil(needed / rate))
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i + 1])
+    local capacity = tonumber(ARGV[2 * i + 2])
+    redis.call('HSET', key, 'tokens', tostring(levels[i] - cost), 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate) + 1000)
+end
+return 0
+"""
+
+# How long background calls back off while interactive calls are queued
+_YIELD_SECONDS = 0.05
+
+
+class Priority(IntEnum):
+    """Rate limit priority classes, most urgent first"""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "fiml_rate_limit_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def rate_limit_priority(priority: Priority) -> Iterator[None]:
+    """
+    Run provider calls made inside the block (and tasks it starts) at priority
+
+    Example:
+        with rate_limit_priority(Priority.BACKGROUND):
+            await provider.fetch_price(asset)
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """Priority of the calling context"""
+    return _priority.get()
+
+
+@dataclass(frozen=True)
+class RateLimitBucket:
+    """A quota: refills per_minute tokens a minute, holds at most capacity"""
+
+    key: str
+    per_minute: float
+    capacity: float
+
+    @property
+    def rate_per_ms(self) -> float:
+        return self.per_minute / 60_000
+
+
+class _LocalBucket:
+    """In-process token bucket used while Redis is unavailable"""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, capacity: float) -> None:
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiting shared across workers
+
+    Features:
+    - One atomic Redis script per attempt; several buckets (e.g. per key and
+      per provider) are charged together
+    - Waits up to a deadline instead of raising
+    - Interactive/background priority classes with a reserved share
+    - Per-process buckets when Redis is not connected or fails
+    """
+
+    def __init__(self, key_prefix: str = "fiml:ratelimit") -> None:
+        self.key_prefix = key_prefix
+        self._redis: Optional[Any] = None
+        self._script: Optional[Any] = None
+        self._local: Dict[str, _LocalBucket] = {}
+        # bucket key -> interactive calls waiting on it in this process
+        self._interactive_waiting: Dict[str, int] = {}
+
+        # Statistics
+        self.acquired = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.rejected = 0
+        self.errors = 0
+
+    def start(self, redis_client: Any) -> None:
+        """Share buckets through redis_client"""
+        self._redis = redis_client
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def stop(self) -> None:
+        """Fall back to per-process buckets"""
+        self._redis = None
+        self._script = None
+
+    def bucket(
+        self, name: str, per_minute: float, burst_seconds: Optional[float] = None
+    ) -> RateLimitBucket:
+        """
+        Build a bucket for a quota of per_minute requests
+
+        Args:
+            name: Quota owner, e.g. "alpha_vantage" or "alpha_vantage:key:<hash>"
+            per_minute: Sustained requests per minute
+            burst_seconds: Seconds of quota that may be spent at once
+                (default PROVIDER_RATE_LIMIT_BURST_SECONDS, at least one request)
+
+        Returns:
+            RateLimitBucket
+        """
+        if burst_seconds is None:
+            burst_seconds = config.settings.provider_rate_limit_burst_seconds
+        capacity = max(1.0, per_minute * burst_seconds / 60)
+        return RateLimitBucket(f"{self.key_prefix}:{name}", per_minute, capacity)
+
+    async def acquire(
+        self,
+        buckets: Sequence[RateLimitBucket],
+        cost: float = 1.0,
+        max_wait: Optional[float] = None,
+        priority: Optional[Priority] = None,
+    ) -> float:
+        """
+        Take cost tokens from every bucket, waiting until they are available
+
+        Args:
+            buckets: Buckets the request draws on
+            cost: Tokens per bucket (e.g. upstream calls the request makes)
+            max_wait: Seconds to wait at most (default from settings per priority)
+            priority: Priority class (default: the calling context's)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ProviderRateLimitError: If no token frees up within max_wait
+        """
+        buckets = [b for b in buckets if b.per_minute > 0]
+        if not buckets or not config.settings.provider_rate_limit_enabled:
+            return 0.0
+
+        priority = current_priority() if priority is None else priority
+        if max_wait is None:
+            max_wait = (
+                config.settings.provider_rate_limit_max_wait_seconds
+                if priority == Priority.INTERACTIVE
+                else config.settings.provider_rate_limit_background_max_wait_seconds
+            )
+        reserve = (
+            config.settings.provider_rate_limit_background_reserve
+            if priority == Priority.BACKGROUND
+            else 0.0
+        )
+
+        start = time.monotonic()
+        deadline = start + max_wait
+        slept = False
+        keys = [b.key for b in buckets]
+        if priority == Priority.INTERACTIVE:
+            for key in keys:
+                self._interactive_waiting[key] = self._interactive_waiting.get(key, 0) + 1
+        try:
+            while True:
+                if priority == Priority.BACKGROUND and self._interactive_queued(keys):
+                    wait = _YIELD_SECONDS
+                else:
+                    wait = await self._take(buckets, cost, reserve) / 1000
+                    if wait <= 0:
+                        break
+
+                remaining = deadline - time.monotonic()
+                if wait > remaining:
+                    self.rejected += 1
+                    logger.warning(
+                        "Rate limit wait exceeds deadline",
+                        buckets=keys,
+                        wait_seconds=round(wait, 3),
+                        priority=priority.name.lower(),
+                    )
+                    raise ProviderRateLimitError(
+                        f"Rate limit for {', '.join(keys)} exhausted; next token in {wait:.1f}s",
+                        retry_after=max(1, math.ceil(wait)),
+                    )
+                # Jitter so workers woken for the same token do not collide
+                await asyncio.sleep(wait + random.uniform(0, min(wait, 0.01)))
+                slept = True
+        finally:
+            if priority == Priority.INTERACTIVE:
+                for key in keys:
+                    self._interactive_waiting[key] -= 1
+                    if not self._interactive_waiting[key]:
+                        del self._interactive_waiting[key]
+
+        self.acquired += 1
+        if not slept:
+            return 0.0
+        waited = time.monotonic() - start
+        self.waited += 1
+        self.wait_seconds += waited
+        return waited
+
+    def _interactive_queued(self, keys: List[str]) -> bool:
+        return any(self._interactive_waiting.get(key) for key in keys)
+
+    async def _take(self, buckets: Sequence[RateLimitBucket], cost: float, reserve: float) -> float:
+        """Try to take the tokens; returns 0 on success, else ms to wait"""
+        if self._script is not None:
+            args: List[float] = [cost, reserve]
+            for bucket in buckets:
+                args.extend((bucket.rate_per_ms, bucket.capacity))
+            try:
+                return float(await self._script(keys=[b.key for b in buckets], args=args))
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Shared rate limit unavailable, using local buckets: {e}")
+        return self._take_local(buckets, cost, reserve)
+
+    def _take_local(self, buckets: Sequence[RateLimitBucket], cost: float, reserve: float) -> float:
+        """Same algorithm as TOKEN_BUCKET_SCRIPT on per-process buckets"""
+        now = time.monotonic()
+        wait_ms = 0.0
+        for bucket in buckets:
+            state = self._local.get(bucket.key)
+            if state is None:
+                state = self._local[bucket.key] = _LocalBucket(bucket.capacity)
+            elapsed_ms = (now - state.updated) * 1000
+            state.tokens = min(bucket.capacity, state.tokens + elapsed_ms * bucket.rate_per_ms)
+            state.updated = now
+            needed = min(bucket.capacity, cost + reserve * bucket.capacity) - state.tokens
+            if needed > 0:
+                wait_ms = max(wait_ms, math.ceil(needed / bucket.rate_per_ms))
+        if wait_ms > 0:
+            return wait_ms
+
+        for bucket in buckets:
+            self._local[bucket.key].tokens -= cost
+        return 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiting statistics"""
+        return {
+            "shared": self._script is not None,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "local_buckets": len(self._local),
+        }
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter()
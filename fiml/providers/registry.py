@@ -11,6 +11,7 @@ from fiml.core.logging import get_logger
 from fiml.core.models import Asset, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider
 from fiml.providers.mock_provider import MockProvider
+from fiml.providers.rate_limiter import rate_limiter
 from fiml.providers.yahoo_finance import YahooFinanceProvider
 
 logger = get_logger(__name__)
@@ -156,6 +157,15 @@ class ProviderRegistry:
 
         logger.info("Initializing provider registry")
 
+        # Share rate limit buckets with the other workers through the cache's Redis
+        from fiml.cache.l1_cache import l1_cache
+
+        if l1_cache.client is not None:
+            rate_limiter.start(l1_cache.client)
+            logger.info("Provider rate limits shared through Redis")
+        else:
+            logger.warning("Redis unavailable - provider rate limits are per process")
+
         # Register providers based on configuration and availability
         providers_to_register: List[BaseProvider] = []
 
@@ -328,6 +338,7 @@ class ProviderRegistry:
                 logger.error(f"Error shutting down provider {provider.name}: {e}")
 
         self.providers.clear()
+        rate_limiter.stop()
         self._initialized = False
 
     async def get_providers_for_asset(
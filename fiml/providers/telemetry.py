@@ -0,0 +1,258 @@
+"""
+Provider Telemetry - Rolling latency, success and uptime windows per provider
+
+Every fetch_* call on a provider is timed and its outcome recorded here (see
+BaseProvider.__init_subclass__). The arbitration engine reads the windows when
+scoring providers, so routing follows how providers are behaving now rather
+than static priorities.
+
+All windows are rings of time buckets: a bucket is reused, and reset, once its
+slot comes round again, so memory is fixed and old samples age out without a
+sweep.
+"""
+
+import time
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from fiml.cache.histogram import LatencyHistogram
+from fiml.core.models import AssetType, DataType
+
+T = TypeVar("T")
+
+
+class BucketRing(Generic[T]):
+    """
+    Fixed number of time buckets covering a sliding window
+
+    Args:
+        window_seconds: Span covered by the ring
+        bucket_seconds: Span of one bucket
+        factory: Creates an empty bucket value
+        clock: Time source in seconds (for testing)
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        bucket_seconds: float,
+        factory: Callable[[], T],
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.bucket_seconds = max(bucket_seconds, 0.001)
+        self.size = max(1, int(round(window_seconds / self.bucket_seconds)))
+        self._factory = factory
+        self._clock = clock
+        # slot -> (epoch the slot holds, value)
+        self._slots: List[Optional[Tuple[int, T]]] = [None] * self.size
+
+    def _epoch(self, at: Optional[float] = None) -> int:
+        return int((at if at is not None else self._clock()) // self.bucket_seconds)
+
+    def current(self, at: Optional[float] = None) -> T:
+        """Bucket for the given (or current) time, reset if it held an old epoch"""
+        epoch = self._epoch(at)
+        slot = epoch % self.size
+        held = self._slots[slot]
+        if held is None or held[0] != epoch:
+            held = (epoch, self._factory())
+            self._slots[slot] = held
+        return held[1]
+
+    def values(self, at: Optional[float] = None) -> List[T]:
+        """Buckets inside the window, oldest first"""
+        newest = self._epoch(at)
+        live = [held for held in self._slots if held is not None and newest - held[0] < self.size]
+        return [value for _, value in sorted(live, key=lambda held: held[0])]
+
+    def version(self, at: Optional[float] = None) -> int:
+        """Epoch of the newest bucket, changes whenever the window slides"""
+        return self._epoch(at)
+
+
+class ProviderTelemetry:
+    """
+    Rolling performance windows for one provider
+
+    Features:
+    - Latency histograms per data type over latency_window_seconds
+    - Success/error counts per data type over outcome_window_seconds
+    - 24h uptime from 5-minute buckets: a bucket with traffic counts as up
+      unless every call in it failed
+    - Last successful update per data type and asset class
+    - version: bumped when a data type gets its first sample or flips
+      between succeeding and failing, so cached routing decisions can
+      be discarded
+    """
+
+    UPTIME_WINDOW_SECONDS = 86400
+    UPTIME_BUCKET_SECONDS = 300
+
+    def __init__(
+        self,
+        latency_window_seconds: float = 300,
+        latency_bucket_seconds: float = 30,
+        outcome_window_seconds: float = 900,
+        outcome_bucket_seconds: float = 60,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize provider telemetry
+
+        Args:
+            latency_window_seconds: Span of the latency percentiles
+            latency_bucket_seconds: Granularity of the latency window
+            outcome_window_seconds: Span of the success rate
+            outcome_bucket_seconds: Granularity of the success window
+            clock: Time source in seconds (for testing)
+        """
+        self._clock = clock
+        self._latency_window = (latency_window_seconds, latency_bucket_seconds)
+        self._outcome_window = (outcome_window_seconds, outcome_bucket_seconds)
+
+        self._latency: Dict[DataType, BucketRing[LatencyHistogram]] = {}
+        self._outcomes: Dict[DataType, BucketRing[List[int]]] = {}
+        self._uptime: BucketRing[List[int]] = BucketRing(
+            self.UPTIME_WINDOW_SECONDS, self.UPTIME_BUCKET_SECONDS, lambda: [0, 0], clock
+        )
+        self._last_success: Dict[Tuple[DataType, Optional[AssetType]], float] = {}
+        self._last_outcome: Dict[DataType, bool] = {}
+        self.version = 0
+
+        # data_type -> ((ring version, total samples), merged histogram)
+        self._merged: Dict[Optional[DataType], Tuple[Tuple[int, int], LatencyHistogram]] = {}
+        self._samples = 0
+
+    def record(
+        self,
+        data_type: DataType,
+        latency_ms: float,
+        success: bool,
+        asset_type: Optional[AssetType] = None,
+    ) -> None:
+        """
+        Record one fetch
+
+        Args:
+            data_type: Type of data fetched
+            latency_ms: Time the call took
+            success: Whether it produced valid data
+            asset_type: Asset class of the request
+        """
+        now = self._clock()
+
+        latency = self._latency.get(data_type)
+        if latency is None:
+            latency = self._latency[data_type] = BucketRing(
+                *self._latency_window, LatencyHistogram, self._clock
+            )
+        latency.current(now).record(latency_ms)
+        self._samples += 1
+
+        outcomes = self._outcomes.get(data_type)
+        if outcomes is None:
+            outcomes = self._outcomes[data_type] = BucketRing(
+                *self._outcome_window, lambda: [0, 0], self._clock
+            )
+        outcomes.current(now)[0 if success else 1] += 1
+        self._uptime.current(now)[0 if success else 1] += 1
+
+        if success:
+            self._last_success[(data_type, asset_type)] = now
+            self._last_success[(data_type, None)] = now
+
+        if self._last_outcome.get(data_type) is not success:
+            self._last_outcome[data_type] = success
+            self.version += 1
+
+    def latency_histogram(self, data_type: Optional[DataType] = None) -> LatencyHistogram:
+        """Merged latency histogram for the window (all data types if None)"""
+        rings = _select(self._latency, data_type)
+        version = (max((ring.version() for ring in rings), default=0), self._samples)
+        cached = self._merged.get(data_type)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        merged = LatencyHistogram()
+        for ring in rings:
+            for histogram in ring.values():
+                merged.merge(histogram)
+        self._merged[data_type] = (version, merged)
+        return merged
+
+    def latency_percentile(
+        self, percentile: float, data_type: Optional[DataType] = None
+    ) -> Optional[float]:
+        """
+        Latency percentile over the window
+
+        Falls back to all data types when the given one has no samples.
+
+        Returns:
+            Latency in ms, or None without samples
+        """
+        histogram = self.latency_histogram(data_type)
+        if not histogram.count and data_type is not None:
+            histogram = self.latency_histogram(None)
+        if not histogram.count:
+            return None
+        return histogram.percentile(percentile)
+
+    def success_rate(self, data_type: Optional[DataType] = None) -> Optional[float]:
+        """
+        Share of successful calls over the window
+
+        Falls back to all data types when the given one has no calls.
+
+        Returns:
+            Success rate (0.0 - 1.0), or None without calls
+        """
+        for rings in (_select(self._outcomes, data_type), _select(self._outcomes, None)):
+            ok = errors = 0
+            for ring in rings:
+                for bucket in ring.values():
+                    ok += bucket[0]
+                    errors += bucket[1]
+            if ok + errors:
+                return ok / (ok + errors)
+        return None
+
+    def uptime(self) -> Optional[float]:
+        """Share of active 5-minute buckets in the last 24h that were up"""
+        active = [bucket for bucket in self._uptime.values() if bucket[0] or bucket[1]]
+        if not active:
+            return None
+        return sum(1 for ok, _ in active if ok) / len(active)
+
+    def last_success(
+        self, data_type: DataType, asset_type: Optional[AssetType] = None
+    ) -> Optional[float]:
+        """Time of the last successful fetch for a data type and asset class"""
+        return self._last_success.get((data_type, asset_type))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Telemetry summary per data type"""
+        by_data_type = {}
+        for data_type in self._latency:
+            histogram = self.latency_histogram(data_type)
+            success_rate = self.success_rate(data_type)
+            by_data_type[data_type.value] = {
+                "samples": histogram.count,
+                "p50_ms": round(histogram.percentile(50), 2) if histogram.count else None,
+                "p95_ms": round(histogram.percentile(95), 2) if histogram.count else None,
+                "success_rate": round(success_rate, 4) if success_rate is not None else None,
+                "last_success": self._last_success.get((data_type, None)),
+            }
+        uptime = self.uptime()
+        return {
+            "uptime_24h": round(uptime, 4) if uptime is not None else None,
+            "by_data_type": by_data_type,
+        }
+
+
+def _select(
+    rings: Dict[DataType, BucketRing[T]], data_type: Optional[DataType]
+) -> List[BucketRing[T]]:
+    """Ring for one data type, or every ring if data_type is None"""
+    if data_type is None:
+        return list(rings.values())
+    return [rings[data_type]] if data_type in rings else []
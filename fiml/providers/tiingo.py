@@ -9,7 +9,12 @@ from typing import Any, Dict, Optional
 import aiohttp
 
 from fiml.core.config import settings
-from fiml.core.exceptions import ProviderError, ProviderRateLimitError, ProviderTimeoutError
+from fiml.core.exceptions import (
+    ProviderError,
+    ProviderRateLimitError,
+    ProviderSymbolNotFoundError,
+    ProviderTimeoutError,
+)
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
@@ -69,6 +74,8 @@ class TiingoProvider(BaseProvider):
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit()
+
         if params is None:
             params = {}
 
@@ -85,7 +92,7 @@ class TiingoProvider(BaseProvider):
                 elif response.status == 429:
                     raise ProviderRateLimitError("Tiingo rate limit exceeded", retry_after=60)
                 elif response.status == 404:
-                    raise ProviderError("Symbol not found")
+                    raise ProviderSymbolNotFoundError("Symbol not found")
                 else:
                     raise ProviderError(f"HTTP {response.status}: {await response.text()}")
 
@@ -107,7 +114,7 @@ class TiingoProvider(BaseProvider):
             response_data = await self._make_request(endpoint)
 
             if not isinstance(response_data, list) or not response_data:
-                raise ProviderError(f"No price data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No price data available for {asset.symbol}")
 
             latest = response_data[0]
 
@@ -164,7 +171,7 @@ class TiingoProvider(BaseProvider):
             response_data = await self._make_request(endpoint, params)
 
             if not isinstance(response_data, list) or not response_data:
-                raise ProviderError(f"No OHLCV data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No OHLCV data available for {asset.symbol}")
 
             ohlcv_data = []
             for bar in response_data[:limit]:
@@ -4,7 +4,7 @@ Twelvedata Provider Implementation
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 
@@ -32,6 +32,9 @@ class TwelvedataProvider(BaseProvider):
 
     BASE_URL = "https://api.twelvedata.com"
 
+    # /quote accepts up to 120 comma-separated symbols (credits are still per symbol)
+    QUOTE_BATCH_MAX = 120
+
     def __init__(self, api_key: Optional[str] = None):
         config = ProviderConfig(
             name="twelvedata",
@@ -44,6 +47,11 @@ class TwelvedataProvider(BaseProvider):
         super().__init__(config)
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # A batch quote costs one credit per symbol, so a chunk may not spend
+        # more than the rate limit bucket holds
+        capacity = min(bucket.capacity for bucket in self.rate_limit_buckets())
+        self.price_batch_size = max(1, min(self.QUOTE_BATCH_MAX, int(capacity)))
+
     async def initialize(self) -> None:
         """Initialize Twelvedata provider"""
         logger.info("Initializing Twelvedata provider")
@@ -63,12 +71,14 @@ class TwelvedataProvider(BaseProvider):
         self._is_initialized = False
 
     async def _make_request(
-        self, endpoint: str, params: Optional[Dict[str, str]] = None
+        self, endpoint: str, params: Optional[Dict[str, str]] = None, cost: float = 1.0
     ) -> Dict[str, Any]:
-        """Make API request to Twelvedata"""
+        """Make API request to Twelvedata, spending cost API credits"""
         if not self._session:
             raise ProviderError("Provider not initialized")
 
+        await self._acquire_rate_limit(cost)
+
         if params is None:
             params = {}
 
@@ -153,6 +163,51 @@ class TwelvedataProvider(BaseProvider):
             logger.error(f"Error fetching price from Twelvedata for {asset.symbol}: {e}")
             raise ProviderError(f"Twelvedata fetch failed: {e}")
 
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """Fetch quotes for many symbols with one /quote request"""
+        logger.info(f"Fetching batch quote for {len(assets)} symbols from Twelvedata")
+
+        params = {"symbol": ",".join(asset.symbol for asset in assets)}
+        response_data = await self._make_request("/quote", params, cost=len(assets))
+
+        # A single symbol returns the quote itself, several return {symbol: quote}
+        if len(assets) == 1:
+            response_data = {assets[0].symbol: response_data}
+
+        responses: Dict[str, ProviderResponse] = {}
+        for asset in assets:
+            quote = response_data.get(asset.symbol)
+            if not isinstance(quote, dict) or quote.get("status") == "error":
+                continue
+            if quote.get("close") is None:
+                continue
+
+            data = {
+                "price": float(quote.get("close", 0.0)),
+                "open": float(quote.get("open", 0.0)),
+                "high": float(quote.get("high", 0.0)),
+                "low": float(quote.get("low", 0.0)),
+                "close": float(quote.get("close", 0.0)),
+                "volume": int(quote.get("volume", 0)),
+                "change": float(quote.get("change", 0.0)),
+                "change_percent": float(quote.get("percent_change", 0.0)),
+                "previous_close": float(quote.get("previous_close", 0.0)),
+            }
+
+            responses[asset.symbol] = ProviderResponse(
+                provider=self.name,
+                asset=asset,
+                data_type=DataType.PRICE,
+                data=data,
+                timestamp=datetime.now(timezone.utc),
+                is_valid=True,
+                is_fresh=True,
+                confidence=0.97,
+                metadata={"source": "twelvedata", "endpoint": "quote"},
+            )
+
+        return responses
+
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
     ) -> ProviderResponse:
@@ -2,11 +2,13 @@
 Yahoo Finance Provider Implementation
 """
 
+import asyncio
 from datetime import datetime, timezone
+from typing import Any, Dict, List
 
 import yfinance as yf  # type: ignore[import-untyped]
 
-from fiml.core.exceptions import ProviderError
+from fiml.core.exceptions import ProviderError, ProviderSymbolNotFoundError
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, ProviderHealth
 from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
@@ -21,6 +23,9 @@ class YahooFinanceProvider(BaseProvider):
     Free, reliable source for equity and ETF data
     """
 
+    # Tickers per yf.download call in fetch_prices_batch
+    price_batch_size = 200
+
     def __init__(self) -> None:
         config = ProviderConfig(
             name="yahoo_finance",
@@ -52,7 +57,7 @@ class YahooFinanceProvider(BaseProvider):
             info = ticker.info
 
             if not info or "currentPrice" not in info:
-                raise ProviderError(f"No price data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No price data available for {asset.symbol}")
 
             data = {
                 "price": info.get("currentPrice", 0.0),
@@ -75,11 +80,83 @@ class YahooFinanceProvider(BaseProvider):
                 metadata={"source": "yahoo_finance"},
             )
 
+        except ProviderSymbolNotFoundError:
+            raise
         except Exception as e:
             self._record_error()
             logger.error(f"Error fetching price from Yahoo Finance for {asset.symbol}: {e}")
             raise ProviderError(f"Yahoo Finance fetch failed: {e}")
 
+    async def _fetch_price_chunk(self, assets: List[Asset]) -> Dict[str, ProviderResponse]:
+        """Fetch prices for many tickers with one multi-ticker download"""
+        self._record_request()
+        symbols = [asset.symbol for asset in assets]
+
+        try:
+            # yfinance is blocking; keep the event loop free during the download
+            frame = await asyncio.to_thread(
+                yf.download,
+                symbols,
+                period="5d",
+                interval="1d",
+                group_by="ticker",
+                auto_adjust=False,
+                progress=False,
+                threads=True,
+            )
+        except Exception as e:
+            self._record_error()
+            logger.error(f"Error downloading {len(symbols)} tickers from Yahoo Finance: {e}")
+            raise ProviderError(f"Yahoo Finance batch download failed: {e}")
+
+        responses: Dict[str, ProviderResponse] = {}
+        if frame is None or frame.empty:
+            return responses
+
+        # Columns are (ticker, field) pairs; yfinance upper-cases tickers
+        grouped = getattr(frame.columns, "nlevels", 1) > 1
+        tickers = set(frame.columns.get_level_values(0)) if grouped else {symbols[0].upper()}
+        for asset in assets:
+            ticker = asset.symbol.upper()
+            if ticker not in tickers:
+                continue
+            history = (frame[ticker] if grouped else frame).dropna(subset=["Close"])
+            if history.empty:
+                continue
+            responses[asset.symbol] = self._history_price_response(asset, history)
+
+        return responses
+
+    def _history_price_response(self, asset: Asset, history: Any) -> ProviderResponse:
+        """Build a price response from the last rows of a daily history frame"""
+        last = history.iloc[-1]
+        price = float(last["Close"])
+        previous_close = float(history["Close"].iloc[-2]) if len(history) > 1 else price
+        change = price - previous_close
+
+        data = {
+            "price": price,
+            "change": change,
+            "change_percent": (change / previous_close * 100) if previous_close else 0.0,
+            "volume": int(last.get("Volume", 0) or 0),
+            "previous_close": previous_close,
+            "open": float(last.get("Open", 0.0)),
+            "high": float(last.get("High", 0.0)),
+            "low": float(last.get("Low", 0.0)),
+        }
+
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data=data,
+            timestamp=datetime.now(timezone.utc),
+            is_valid=True,
+            is_fresh=True,
+            confidence=0.95,
+            metadata={"source": "yahoo_finance", "endpoint": "download"},
+        )
+
     async def fetch_ohlcv(
         self, asset: Asset, timeframe: str = "1d", limit: int = 100
     ) -> ProviderResponse:
@@ -100,7 +177,7 @@ class YahooFinanceProvider(BaseProvider):
             history = ticker.history(period=period, interval=timeframe)
 
             if history.empty:
-                raise ProviderError(f"No OHLCV data available for {asset.symbol}")
+                raise ProviderSymbolNotFoundError(f"No OHLCV data available for {asset.symbol}")
 
             candles = []
             for idx, row in history.iterrows():
@@ -126,6 +203,8 @@ class YahooFinanceProvider(BaseProvider):
                 confidence=0.95,
             )
 
+        except ProviderSymbolNotFoundError:
+            raise
         except Exception as e:
             self._record_error()
             logger.error(f"Error fetching OHLCV from Yahoo Finance for {asset.symbol}: {e}")
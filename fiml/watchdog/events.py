@@ -17,6 +17,11 @@ from fiml.watchdog.models import EventFilter, WatchdogEvent
 logger = get_logger(__name__)
 
 
+def _decode(value: Any) -> Any:
+    """Decode a Redis reply value to str"""
+    return value.decode() if isinstance(value, bytes) else value
+
+
 class EventStream:
     """
     Event stream for publishing and subscribing to watchdog events
@@ -269,7 +274,7 @@ class EventStream:
         self,
         start_id: str = "-",
         count: int = 100,
-    ) -> List[WatchdogEvent]:
+    ) -> List[Dict[str, Any]]:
         """
         Get persisted events from Redis Streams
 
@@ -278,7 +283,7 @@ class EventStream:
             count: Maximum events to retrieve
 
         Returns:
-            List of events
+            List of raw event fields, decoded to str
         """
         if not self._redis_client:
             return []
@@ -294,7 +299,8 @@ class EventStream:
                 for msg_id, data in messages:
                     # Deserialize event
                     # Note: This is simplified - full implementation would properly reconstruct WatchdogEvent
-                    events.append(data)
+                    # The shared L1 client returns bytes (decode_responses=False)
+                    events.append({_decode(k): _decode(v) for k, v in data.items()})
 
             return events
         except Exception as e:
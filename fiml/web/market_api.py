@@ -269,7 +269,8 @@ async def get_historical_candles(
                 high=c.get("high", 0.0),
                 low=c.get("low", 0.0),
                 close=c.get("close", 0.0),
-                volume=c.get("volume", 0.0),
+                # Providers and the range cache report unknown volume as None
+                volume=c.get("volume") or 0.0,
             )
             for c in candles_data
         ]
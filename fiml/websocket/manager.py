@@ -14,7 +14,10 @@ from typing import Callable, Dict, List, Set
 from fastapi import WebSocket
 
 from fiml.arbitration.engine import arbitration_engine
-from fiml.core.exceptions import NoProviderAvailableError
+from fiml.cache.manager import cache_manager
+from fiml.cache.ohlcv_range import timeframe_to_seconds
+from fiml.cache.resample import can_resample, resample_candles, session_for
+from fiml.core.exceptions import NoProviderAvailableError, SymbolNotFoundError
 from fiml.core.logging import get_logger
 from fiml.core.models import Asset, AssetType, DataType, Market
 from fiml.websocket.models import (
@@ -274,13 +277,22 @@ class WebSocketManager:
                 try:
                     updates = []
 
-                    for symbol in subscription.symbols:
-                        # Create asset
-                        asset = Asset(
+                    assets = [
+                        Asset(
                             symbol=symbol,
                             asset_type=subscription.asset_type,
                             market=subscription.market,
                         )
+                        for symbol in subscription.symbols
+                    ]
+                    # Skip symbols that recently had no provider
+                    tombstones = await cache_manager.get_negative_many(assets, DataType.PRICE)
+
+                    for symbol, asset, tombstone in zip(
+                        subscription.symbols, assets, tombstones, strict=False
+                    ):
+                        if tombstone is not None:
+                            continue
 
                         try:
                             # Get arbitration plan
@@ -312,6 +324,9 @@ class WebSocketManager:
                             )
                             updates.append(update)
 
+                        except SymbolNotFoundError as e:
+                            logger.warning(f"No provider has data for {symbol}")
+                            await cache_manager.set_negative(asset, DataType.PRICE, str(e))
                         except NoProviderAvailableError:
                             logger.warning(f"No provider available for {symbol}")
                         except Exception as e:
@@ -344,21 +359,39 @@ class WebSocketManager:
         """
         Stream real-time OHLCV (candlestick) updates
 
-        Uses the arbitration engine to fetch OHLCV data
+        Uses the arbitration engine to fetch OHLCV data. Subscription params
+        may set "timeframe" (default "1d") and "source_timeframe"; with a
+        finer source (e.g. "1m") the forming candle is resampled from it, so
+        the update refreshes at the source's granularity.
         """
         try:
             interval_sec = subscription.interval_ms / 1000.0
+            timeframe = subscription.params.get("timeframe", "1d")
+            source = subscription.params.get("source_timeframe")
+            if source and not can_resample(source, timeframe):
+                logger.warning("Ignoring source_timeframe", source=source, timeframe=timeframe)
+                source = None
 
             while True:
                 try:
                     updates = []
 
-                    for symbol in subscription.symbols:
-                        asset = Asset(
+                    assets = [
+                        Asset(
                             symbol=symbol,
                             asset_type=subscription.asset_type,
                             market=subscription.market,
                         )
+                        for symbol in subscription.symbols
+                    ]
+                    # Skip symbols that recently had no provider
+                    tombstones = await cache_manager.get_negative_many(assets, DataType.OHLCV)
+
+                    for symbol, asset, tombstone in zip(
+                        subscription.symbols, assets, tombstones, strict=False
+                    ):
+                        if tombstone is not None:
+                            continue
 
                         try:
                             # Get arbitration plan
@@ -369,12 +402,34 @@ class WebSocketManager:
                             )
 
                             # Execute with fallback
-                            response = await arbitration_engine.execute_with_fallback(
-                                plan=plan, asset=asset, data_type=DataType.OHLCV
-                            )
+                            if source:
+                                # Enough source candles for the current and previous bucket
+                                ratio = timeframe_to_seconds(timeframe) // timeframe_to_seconds(
+                                    source
+                                )
+                                response = await arbitration_engine.execute_with_fallback(
+                                    plan=plan,
+                                    asset=asset,
+                                    data_type=DataType.OHLCV,
+                                    timeframe=source,
+                                    limit=2 * ratio,
+                                )
+                                candles = resample_candles(
+                                    response.data.get("candles", []),
+                                    source,
+                                    timeframe,
+                                    session_for(asset),
+                                )
+                            else:
+                                response = await arbitration_engine.execute_with_fallback(
+                                    plan=plan,
+                                    asset=asset,
+                                    data_type=DataType.OHLCV,
+                                    timeframe=timeframe,
+                                )
+                                candles = response.data.get("candles", [])
 
                             # Extract latest candle
-                            candles = response.data.get("candles", [])
                             if candles:
                                 latest = candles[-1]
                                 update = OHLCVUpdate(
@@ -384,11 +439,14 @@ class WebSocketManager:
                                     high=latest.get("high", 0.0),
                                     low=latest.get("low", 0.0),
                                     close=latest.get("close", 0.0),
-                                    volume=latest.get("volume", 0.0),
+                                    volume=latest.get("volume") or 0.0,
                                     is_closed=latest.get("is_closed", False),
                                 )
                                 updates.append(update)
 
+                        except SymbolNotFoundError as e:
+                            logger.warning(f"No provider has data for {symbol}")
+                            await cache_manager.set_negative(asset, DataType.OHLCV, str(e))
                         except NoProviderAvailableError:
                             logger.warning(f"No provider available for {symbol}")
                         except Exception as e:
@@ -62,6 +62,35 @@ CREATE TABLE IF NOT EXISTS ohlcv_cache (
 -- SELECT create_hypertable('ohlcv_cache', 'time', if_not_exists => TRUE);
 -- SELECT add_retention_policy('ohlcv_cache', INTERVAL '365 days', if_not_exists => TRUE);
 
+-- Continuous aggregates deriving 1h/1d candles from the 1m feed (TimescaleDB only).
+-- Buckets are UTC-aligned; set CACHE_OHLCV_CONTINUOUS_AGGREGATES=true to read them.
+-- Each provider's feed is aggregated separately; readers pick one provider per bucket.
+-- CREATE MATERIALIZED VIEW IF NOT EXISTS ohlcv_cache_1h WITH (timescaledb.continuous) AS
+--     SELECT asset_id, provider, time_bucket(INTERVAL '1 hour', time) AS bucket,
+--            first(open, time) AS open, max(high) AS high, min(low) AS low,
+--            last(close, time) AS close, sum(volume) AS volume
+--     FROM ohlcv_cache WHERE timeframe = '1m'
+--     GROUP BY asset_id, provider, bucket;
+-- CREATE MATERIALIZED VIEW IF NOT EXISTS ohlcv_cache_1d WITH (timescaledb.continuous) AS
+--     SELECT asset_id, provider, time_bucket(INTERVAL '1 day', time) AS bucket,
+--            first(open, time) AS open, max(high) AS high, min(low) AS low,
+--            last(close, time) AS close, sum(volume) AS volume
+--     FROM ohlcv_cache WHERE timeframe = '1m'
+--     GROUP BY asset_id, provider, bucket;
+-- SELECT add_continuous_aggregate_policy('ohlcv_cache_1h', start_offset => INTERVAL '3 days',
+--     end_offset => INTERVAL '1 minute', schedule_interval => INTERVAL '1 minute');
+-- SELECT add_continuous_aggregate_policy('ohlcv_cache_1d', start_offset => INTERVAL '30 days',
+--     end_offset => INTERVAL '1 minute', schedule_interval => INTERVAL '5 minutes');
+
+-- OHLCV range coverage: [start_time, end_time) spans of ohlcv_cache known to be complete
+CREATE TABLE IF NOT EXISTS ohlcv_coverage (
+    asset_id INTEGER NOT NULL REFERENCES assets(id),
+    timeframe VARCHAR(10) NOT NULL,
+    start_time TIMESTAMPTZ NOT NULL,
+    end_time TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (asset_id, timeframe, start_time)
+);
+
 -- Fundamentals cache
 CREATE TABLE IF NOT EXISTS fundamentals_cache (
     id SERIAL PRIMARY KEY,
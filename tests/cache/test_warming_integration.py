@@ -27,17 +27,15 @@ async def test_cache_warmer_initialization():
 async def test_warm_cache_batch():
     warmer = PredictiveCacheWarmer(None, None)
     warmer.cache_manager = AsyncMock()
-    # provider_registry should be MagicMock because get_provider_for_data_type is sync
-    warmer.provider_registry = MagicMock()
+    warmer.provider_registry = AsyncMock()
 
     # Mock provider response
     mock_provider = AsyncMock()
     mock_provider.name = "mock_provider"
-    mock_provider.get_price.return_value = {"price": 150.0}
-    mock_provider.get_fundamentals.return_value = {"pe": 30.0}
+    mock_provider.fetch_price.return_value = MagicMock(is_valid=True, data={"price": 150.0})
+    mock_provider.fetch_fundamentals.return_value = MagicMock(is_valid=True, data={"pe": 30.0})
 
-    # Configure the sync method to return the mock provider
-    warmer.provider_registry.get_provider_for_data_type.return_value = mock_provider
+    warmer.provider_registry.get_providers_for_asset.return_value = [mock_provider]
 
     symbols = ["AAPL", "MSFT"]
     results = await warmer.warm_cache_batch(symbols, concurrency=2)
@@ -48,7 +46,7 @@ async def test_warm_cache_batch():
 
     # Verify calls
     assert (
-        warmer.provider_registry.get_provider_for_data_type.call_count >= 4
+        warmer.provider_registry.get_providers_for_asset.await_count >= 4
     )  # 2 symbols * 2 data types
     assert warmer.cache_manager.set_price.call_count == 2
     assert warmer.cache_manager.set_fundamentals.call_count == 2
@@ -58,10 +56,10 @@ async def test_warm_cache_batch():
 async def test_warm_cache_batch_failure():
     warmer = PredictiveCacheWarmer(None, None)
     warmer.cache_manager = AsyncMock()
-    warmer.provider_registry = MagicMock()
+    warmer.provider_registry = AsyncMock()
 
     # Mock provider failure
-    warmer.provider_registry.get_provider_for_data_type.side_effect = Exception("Provider error")
+    warmer.provider_registry.get_providers_for_asset.side_effect = Exception("Provider error")
 
     symbols = ["FAIL"]
     results = await warmer.warm_cache_batch(symbols)
@@ -7,7 +7,12 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from fiml.core.exceptions import ProviderError, ProviderTimeoutError, RegionalRestrictionError
+from fiml.core.exceptions import (
+    ProviderError,
+    ProviderSymbolNotFoundError,
+    ProviderTimeoutError,
+    RegionalRestrictionError,
+)
 from fiml.core.models import Asset, AssetType, DataType, Market
 from fiml.providers.base import ProviderResponse
 from fiml.providers.ccxt_provider import CCXTMultiExchangeProvider, CCXTProvider
@@ -195,6 +200,9 @@ async def test_ccxt_provider_error_handling(crypto_asset):
         class MockRequestTimeout(Exception):
             pass
 
+        class MockBadSymbol(MockExchangeError):
+            pass
+
         mock_ccxt.NetworkError = MockNetworkError
         mock_ccxt.ExchangeError = MockExchangeError
         mock_ccxt.RateLimitExceeded = MockRateLimitExceeded
@@ -203,6 +211,7 @@ async def test_ccxt_provider_error_handling(crypto_asset):
         mock_ccxt.ExchangeNotAvailable = MockExchangeNotAvailable
         mock_ccxt.AuthenticationError = MockAuthenticationError
         mock_ccxt.RequestTimeout = MockRequestTimeout
+        mock_ccxt.BadSymbol = MockBadSymbol
 
         await provider.initialize()
 
@@ -216,6 +225,11 @@ async def test_ccxt_provider_error_handling(crypto_asset):
         with pytest.raises(ProviderError):
             await provider.fetch_price(crypto_asset)
 
+        # Test unknown symbol
+        mock_exchange.fetch_ticker.side_effect = MockBadSymbol("binance does not have market symbol")
+        with pytest.raises(ProviderSymbolNotFoundError):
+            await provider.fetch_price(crypto_asset)
+
         # Test Geo-blocking
         mock_exchange.fetch_ticker.side_effect = MockExchangeError("Access denied from your country")
         with pytest.raises(RegionalRestrictionError):
@@ -270,3 +284,34 @@ async def test_ccxt_multi_exchange_provider(crypto_asset):
         await multi_provider.shutdown_all()
         mock_binance.shutdown.assert_called_once()
         mock_coinbase.shutdown.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ccxt_provider_fetch_prices_batch(crypto_asset):
+    """Test batch prices use a single fetch_tickers call"""
+    provider = CCXTProvider(exchange_id="binance")
+
+    mock_exchange = AsyncMock()
+    mock_exchange.load_markets = AsyncMock()
+    mock_exchange.markets = {"BTC/USDT": {}, "ETH/USDT": {}}
+    mock_exchange.has = {"fetchTickers": True}
+    mock_exchange.fetch_tickers = AsyncMock(
+        return_value={
+            "BTC/USDT": {"last": 50000.0, "baseVolume": 100.0},
+            "ETH/USDT": {"last": 3000.0, "baseVolume": 500.0},
+        }
+    )
+
+    eth = Asset(symbol="ETH", name="Ethereum", asset_type=AssetType.CRYPTO)
+    doge = Asset(symbol="DOGE", name="Dogecoin", asset_type=AssetType.CRYPTO)
+
+    with patch("fiml.providers.ccxt_provider.ccxt") as mock_ccxt:
+        mock_ccxt.binance.return_value = mock_exchange
+        await provider.initialize()
+
+        responses = await provider.fetch_prices_batch([crypto_asset, eth, doge])
+
+        assert [r.data.get("price") for r in responses] == [50000.0, 3000.0, None]
+        assert [r.is_valid for r in responses] == [True, True, False]
+        mock_exchange.fetch_tickers.assert_called_once()
+        mock_exchange.fetch_ticker.assert_not_called()
@@ -186,3 +186,24 @@ async def test_coingecko_error_handling(crypto_asset):
 
         with pytest.raises(ProviderRateLimitError):
             await provider.fetch_price(crypto_asset)
+
+
+@pytest.mark.asyncio
+async def test_coingecko_fetch_prices_batch(crypto_asset):
+    """Test batch prices request many coin ids at once"""
+    provider = CoinGeckoProvider()
+    await provider.initialize()
+
+    eth = Asset(symbol="ETH", name="Ethereum", asset_type=AssetType.CRYPTO)
+    mock_response = {"bitcoin": {"usd": 50000.0}, "ethereum": {"usd": 3000.0}}
+
+    with patch.object(provider, "_make_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
+
+        responses = await provider.fetch_prices_batch([crypto_asset, eth])
+
+        assert [r.data["price"] for r in responses] == [50000.0, 3000.0]
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][1]["ids"] == "bitcoin,ethereum"
+
+    await provider.shutdown()
@@ -226,3 +226,28 @@ async def test_fmp_error_handling(equity_asset):
 
         with pytest.raises(ProviderRateLimitError):
             await provider.fetch_price(equity_asset)
+
+
+@pytest.mark.asyncio
+async def test_fmp_fetch_prices_batch(equity_asset):
+    """Test batch prices use the batch-quote endpoint"""
+    provider = FMPProvider(api_key="test_key")
+    await provider.initialize()
+
+    msft = Asset(symbol="MSFT", name="Microsoft", asset_type=AssetType.EQUITY)
+    unknown = Asset(symbol="ZZZZ", name="Unknown", asset_type=AssetType.EQUITY)
+    mock_response = [
+        {"symbol": "MSFT", "price": 400.0, "volume": 500000},
+        {"symbol": "AAPL", "price": 150.0, "volume": 1000000},
+    ]
+
+    with patch.object(provider, "_make_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
+
+        responses = await provider.fetch_prices_batch([equity_asset, msft, unknown])
+
+        assert [r.data.get("price") for r in responses] == [150.0, 400.0, None]
+        assert responses[2].is_valid is False
+        mock_request.assert_called_once_with("batch-quote", {"symbols": "AAPL,MSFT,ZZZZ"})
+
+    await provider.shutdown()
@@ -21,6 +21,7 @@ from fiml.arbitration.engine import DataArbitrationEngine
 from fiml.core.exceptions import ProviderError, RateLimitError
 from fiml.core.models import Asset, AssetType, DataType, Market
 from fiml.providers.newsapi import NewsAPIProvider, NewsArticle
+from fiml.providers.rate_limiter import RateLimiter
 
 # Fixtures
 
@@ -403,13 +404,19 @@ async def test_rate_limit_per_minute(newsapi_provider):
     # Set tight limit
     newsapi_provider.config.rate_limit_per_minute = 2
 
-    # Make requests up to limit
-    for _ in range(2):
-        await newsapi_provider._check_rate_limit()
+    with (
+        patch("fiml.providers.base.rate_limiter", RateLimiter()),
+        patch("fiml.core.config.settings.provider_rate_limit_max_wait_seconds", 0.1),
+    ):
+        # Make requests up to limit
+        for _ in range(2):
+            await newsapi_provider._check_rate_limit()
+
+        # Next request cannot get a token before its deadline
+        with pytest.raises(RateLimitError):
+            await newsapi_provider._check_rate_limit()
 
-    # Next request should wait or raise error
-    # Since we're checking quickly, it should still be within the minute
-    assert len(newsapi_provider._request_times) == 2
+    assert newsapi_provider._daily_request_count == 2
 
     await newsapi_provider.shutdown()
 
@@ -249,3 +249,45 @@ async def test_polygon_error_handling(equity_asset):
 
         with pytest.raises(ProviderRateLimitError):
             await provider.fetch_price(equity_asset)
+
+
+@pytest.mark.asyncio
+async def test_polygon_fetch_prices_batch(equity_asset, crypto_asset):
+    """Test batch stock prices use one snapshot request"""
+    provider = PolygonProvider(api_key="test_key")
+    await provider.initialize()
+
+    msft = Asset(symbol="MSFT", name="Microsoft", asset_type=AssetType.EQUITY)
+    snapshot = {
+        "status": "OK",
+        "tickers": [
+            {
+                "ticker": "AAPL",
+                "day": {"o": 149.0, "h": 151.0, "l": 148.0, "c": 150.0, "v": 1000000},
+                "prevDay": {"c": 148.0},
+                "lastTrade": {"p": 150.5},
+                "todaysChange": 2.5,
+                "todaysChangePerc": 1.69,
+            },
+            {"ticker": "MSFT", "day": {"c": 400.0}, "prevDay": {"c": 395.0}},
+        ],
+    }
+
+    with (
+        patch.object(provider, "_make_request", new_callable=AsyncMock) as mock_request,
+        patch.object(provider, "fetch_price", new_callable=AsyncMock) as mock_fetch_price,
+    ):
+        mock_request.return_value = snapshot
+        mock_fetch_price.side_effect = ProviderError("no crypto snapshot")
+
+        responses = await provider.fetch_prices_batch([equity_asset, msft, crypto_asset])
+
+        assert responses[0].data["price"] == 150.5
+        assert responses[1].data["price"] == 400.0
+        # Crypto is not in the stocks snapshot and goes through fetch_price
+        assert responses[2].is_valid is False
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][1] == {"tickers": "AAPL,MSFT"}
+        mock_fetch_price.assert_called_once_with(crypto_asset)
+
+    await provider.shutdown()
@@ -237,3 +237,47 @@ async def test_twelvedata_error_handling(equity_asset):
     with patch.object(provider._session, "get", mock_get_api_error):
         with pytest.raises(ProviderError):
             await provider.fetch_price(equity_asset)
+
+
+@pytest.mark.asyncio
+async def test_twelvedata_fetch_prices_batch(equity_asset):
+    """Test batch prices use one comma-separated /quote request"""
+    provider = TwelvedataProvider(api_key="test_key")
+    await provider.initialize()
+
+    msft = Asset(symbol="MSFT", name="Microsoft", asset_type=AssetType.EQUITY)
+    mock_response = {
+        "AAPL": {"symbol": "AAPL", "close": "150.0", "volume": "1000000"},
+        "MSFT": {"status": "error", "message": "not available"},
+    }
+
+    with patch.object(provider, "_make_request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
+
+        responses = await provider.fetch_prices_batch([equity_asset, msft])
+
+        assert responses[0].data["price"] == 150.0
+        assert responses[1].is_valid is False
+        mock_request.assert_called_once_with("/quote", {"symbol": "AAPL,MSFT"}, cost=2)
+
+    await provider.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_twelvedata_batch_spends_credit_per_symbol(equity_asset):
+    """Test batch quotes take one rate limit token per symbol"""
+    provider = TwelvedataProvider(api_key="test_key")
+    await provider.initialize()
+    msft = Asset(symbol="MSFT", name="Microsoft", asset_type=AssetType.EQUITY)
+
+    # Chunks never exceed the 8/minute bucket
+    assert provider.price_batch_size == 8
+
+    acquire = AsyncMock(side_effect=ProviderRateLimitError("Rate limit exhausted", retry_after=5))
+    with patch.object(provider, "_acquire_rate_limit", acquire), pytest.raises(
+        ProviderRateLimitError
+    ):
+        await provider._fetch_price_chunk([equity_asset, msft])
+
+    acquire.assert_awaited_once_with(2)
+    await provider.shutdown()
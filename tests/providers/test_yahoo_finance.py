@@ -191,3 +191,32 @@ async def test_yahoo_provider_error_handling(equity_asset):
 
         with pytest.raises(ProviderError):
             await provider.fetch_ohlcv(equity_asset)
+
+
+@pytest.mark.asyncio
+async def test_yahoo_provider_fetch_prices_batch(equity_asset):
+    """Test batch prices use one multi-ticker download"""
+    provider = YahooFinanceProvider()
+    await provider.initialize()
+
+    msft = Asset(symbol="MSFT", name="Microsoft", asset_type=AssetType.EQUITY)
+    fields = ["Open", "High", "Low", "Close", "Volume"]
+    columns = pd.MultiIndex.from_product([["AAPL", "MSFT"], fields])
+    frame = pd.DataFrame(
+        [
+            [148.0, 149.0, 147.0, 148.0, 900000, 400.0, 402.0, 398.0, 400.0, 500000],
+            [149.0, 151.0, 148.5, 150.0, 1000000, None, None, None, None, None],
+        ],
+        columns=columns,
+    )
+
+    with patch("fiml.providers.yahoo_finance.yf.download", return_value=frame) as mock_download:
+        responses = await provider.fetch_prices_batch([equity_asset, msft])
+
+        assert responses[0].data["price"] == 150.0
+        assert responses[0].data["previous_close"] == 148.0
+        assert responses[0].data["change"] == 2.0
+        # MSFT has no row for today yet; the last complete row is used
+        assert responses[1].data["price"] == 400.0
+        mock_download.assert_called_once()
+        assert mock_download.call_args[0][0] == ["AAPL", "MSFT"]
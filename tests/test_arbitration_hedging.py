@@ -0,0 +1,266 @@
+"""
+Tests for hedged requests in execute_with_fallback
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.arbitration.hedging import HedgeBudget
+from fiml.core.exceptions import NoProviderAvailableError, ProviderError, SymbolNotFoundError
+from fiml.core.models import ArbitrationPlan, Asset, AssetType, DataType
+from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
+from fiml.providers.registry import ProviderRegistry
+
+
+class DelayedProvider(BaseProvider):
+    """Provider answering fetch_price after a fixed delay"""
+
+    def __init__(self, name, delay=0.0, outcome="ok"):
+        super().__init__(ProviderConfig(name=name))
+        self._is_initialized = True
+        self.delay = delay
+        self.outcome = outcome
+        self.calls = 0
+        self.cancelled = False
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def fetch_price(self, asset):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.outcome == "raise":
+            raise ProviderError(f"{self.name} failed")
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data={"price": 100.0},
+            timestamp=datetime.now(timezone.utc),
+            is_valid=self.outcome == "ok",
+        )
+
+    async def fetch_ohlcv(self, asset, timeframe="1d", limit=100):
+        pass
+
+    async def fetch_fundamentals(self, asset):
+        pass
+
+    async def fetch_news(self, asset, limit=10):
+        await asyncio.sleep(self.delay)
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.NEWS,
+            data={"articles": []},
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    async def supports_asset(self, asset):
+        return True
+
+    async def get_health(self):
+        pass
+
+
+def make_engine(*providers):
+    registry = ProviderRegistry()
+    registry.providers = {provider.name: provider for provider in providers}
+    engine = DataArbitrationEngine()
+    engine.provider_registry = registry
+    return engine
+
+
+def plan_for(*providers):
+    return ArbitrationPlan(
+        primary_provider=providers[0].name,
+        fallback_providers=[p.name for p in providers[1:]],
+        estimated_latency_ms=100,
+    )
+
+
+@pytest.fixture
+def asset():
+    return Asset(symbol="AAPL", asset_type=AssetType.EQUITY)
+
+
+@pytest.fixture
+def hedging():
+    with (
+        patch("fiml.core.config.settings.arbitration_hedge_enabled", True),
+        patch("fiml.core.config.settings.arbitration_hedge_delay_ms", 20),
+        patch("fiml.core.config.settings.arbitration_hedge_budgets", {"price": 1.0}),
+    ):
+        yield
+
+
+class TestHedgeBudget:
+    """Test the hedging token bucket"""
+
+    def test_ratio(self):
+        budget = HedgeBudget(0.25)
+        granted = 0
+        for _ in range(100):
+            budget.deposit()
+            granted += budget.try_spend()
+
+        assert granted == 25
+
+    def test_burst_cap(self):
+        budget = HedgeBudget(1.0, burst=3)
+        for _ in range(10):
+            budget.deposit()
+
+        assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+
+@pytest.mark.usefixtures("hedging")
+class TestHedgedExecution:
+    """Test hedging in execute_with_fallback"""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self, asset):
+        slow = DelayedProvider("slow", delay=2.0)
+        fast = DelayedProvider("fast", delay=0.01)
+        engine = make_engine(slow, fast)
+
+        start = time.perf_counter()
+        response = await engine.execute_with_fallback(plan_for(slow, fast), asset, DataType.PRICE)
+        elapsed = time.perf_counter() - start
+
+        assert response.provider == "fast"
+        assert elapsed < 1.0
+        assert slow.cancelled
+        stats = engine.get_hedge_stats()
+        assert (stats["launched"], stats["wins"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, asset):
+        primary = DelayedProvider("primary", delay=0.0)
+        fallback = DelayedProvider("fallback")
+        engine = make_engine(primary, fallback)
+
+        response = await engine.execute_with_fallback(
+            plan_for(primary, fallback), asset, DataType.PRICE
+        )
+
+        assert response.provider == "primary"
+        assert fallback.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_primary_wins_when_hedge_is_invalid(self, asset):
+        primary = DelayedProvider("primary", delay=0.1)
+        fallback = DelayedProvider("fallback", outcome="invalid")
+        engine = make_engine(primary, fallback)
+
+        response = await engine.execute_with_fallback(
+            plan_for(primary, fallback), asset, DataType.PRICE
+        )
+
+        assert response.provider == "primary"
+        assert fallback.calls == 1
+        assert engine.get_hedge_stats()["wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_hedges(self, asset):
+        slow = DelayedProvider("slow", delay=0.1)
+        fast = DelayedProvider("fast")
+        engine = make_engine(slow, fast)
+
+        with patch("fiml.core.config.settings.arbitration_hedge_budgets", {"price": 0.5}):
+            for _ in range(4):
+                await engine.execute_with_fallback(plan_for(slow, fast), asset, DataType.PRICE)
+
+        stats = engine.get_hedge_stats()
+        assert stats["launched"] == 2
+        assert stats["budgets"]["price"]["denied"] == 2
+
+    @pytest.mark.asyncio
+    async def test_data_types_without_budget_do_not_hedge(self, asset):
+        slow = DelayedProvider("slow", delay=0.1)
+        fast = DelayedProvider("fast")
+        engine = make_engine(slow, fast)
+
+        response = await engine.execute_with_fallback(plan_for(slow, fast), asset, DataType.NEWS)
+
+        assert response.provider == "slow"
+        assert engine.get_hedge_stats()["launched"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_fall_back_in_order(self, asset):
+        first = DelayedProvider("first", outcome="raise")
+        second = DelayedProvider("second", outcome="raise")
+        third = DelayedProvider("third")
+        engine = make_engine(first, second, third)
+
+        response = await engine.execute_with_fallback(
+            plan_for(first, second, third), asset, DataType.PRICE
+        )
+
+        assert response.provider == "third"
+        assert engine.get_hedge_stats()["launched"] == 0
+
+        third.outcome = "raise"
+        with pytest.raises(NoProviderAvailableError):
+            await engine.execute_with_fallback(
+                plan_for(first, second, third), asset, DataType.PRICE
+            )
+
+    @pytest.mark.asyncio
+    async def test_not_found_only_when_every_provider_answered(self, asset):
+        first = DelayedProvider("first", outcome="invalid")
+        second = DelayedProvider("second", outcome="invalid")
+        engine = make_engine(first, second)
+
+        with pytest.raises(SymbolNotFoundError):
+            await engine.execute_with_fallback(plan_for(first, second), asset, DataType.PRICE)
+
+        second.outcome = "raise"
+        with pytest.raises(NoProviderAvailableError) as exc_info:
+            await engine.execute_with_fallback(plan_for(first, second), asset, DataType.PRICE)
+        assert not isinstance(exc_info.value, SymbolNotFoundError)
+
+    @pytest.mark.asyncio
+    async def test_delay_follows_observed_p95(self, asset):
+        primary = DelayedProvider("primary")
+        for _ in range(20):
+            primary.telemetry.record(DataType.PRICE, 300, True)
+        engine = make_engine(primary)
+
+        with (
+            patch("fiml.core.config.settings.arbitration_hedge_delay_ms", 0),
+            patch("fiml.core.config.settings.arbitration_hedge_min_delay_ms", 50),
+            patch("fiml.core.config.settings.arbitration_hedge_min_samples", 20),
+        ):
+            assert await engine._hedge_delay_ms(primary, DataType.PRICE) == pytest.approx(
+                300, rel=0.05
+            )
+            # Too few samples for a p95: no hedge rather than the neutral 100ms
+            assert await engine._hedge_delay_ms(DelayedProvider("new"), DataType.PRICE) is None
+            assert await engine._hedge_delay_ms(primary, DataType.OHLCV) is None
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, asset):
+        slow = DelayedProvider("slow", delay=0.1)
+        fast = DelayedProvider("fast")
+        engine = make_engine(slow, fast)
+
+        with patch("fiml.core.config.settings.arbitration_hedge_enabled", False):
+            response = await engine.execute_with_fallback(
+                plan_for(slow, fast), asset, DataType.PRICE
+            )
+
+        assert response.provider == "slow"
+        assert fast.calls == 0
@@ -0,0 +1,133 @@
+"""
+Tests for merging OHLCV series from several providers
+"""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.arbitration.ohlcv_merge import merge_candles
+from fiml.core.models import Asset, AssetType, DataType
+from fiml.providers.base import ProviderResponse
+
+MINUTE_MS = 60_000
+DAY_MS = 86_400_000
+T0 = 1_700_000_000_000 - 1_700_000_000_000 % DAY_MS
+
+
+def candle(ts, close, high=None, low=None, open_=None, volume=1000.0):
+    return {
+        "timestamp": ts,
+        "open": close if open_ is None else open_,
+        "high": close if high is None else high,
+        "low": close if low is None else low,
+        "close": close,
+        "volume": volume,
+    }
+
+
+def minutes(*closes, start=0):
+    return [candle(T0 + (start + i) * MINUTE_MS, c) for i, c in enumerate(closes)]
+
+
+class TestMergeCandles:
+    """Test the vectorized candle merge"""
+
+    def test_deduplicates_and_orders(self):
+        primary = list(reversed(minutes(1.0, 2.0, 3.0)))
+        secondary = minutes(2.0, 3.0, 4.0, start=1)
+
+        merged, stats = merge_candles([(primary, 0.9), (secondary, 0.8)], "1m")
+
+        assert [c["timestamp"] for c in merged] == [T0 + i * MINUTE_MS for i in range(4)]
+        assert stats == {"overlapping": 2, "gaps_filled": 1}
+
+    def test_fills_gaps_from_other_provider(self):
+        primary = minutes(1.0, 2.0) + minutes(5.0, start=4)
+        secondary = minutes(1.0, 2.0, 3.0, 4.0, 5.0)
+
+        merged, stats = merge_candles([(primary, 0.9), (secondary, 0.5)], "1m")
+
+        assert [c["close"] for c in merged] == pytest.approx([1.0, 2.0, 3.0, 4.0, 5.0])
+        assert stats["gaps_filled"] == 2
+
+    def test_reduces_overlapping_bars(self):
+        a = [candle(T0, 100.0, high=105.0, low=98.0, open_=99.0, volume=500.0)]
+        b = [candle(T0, 103.0, high=106.0, low=99.0, open_=101.0, volume=800.0)]
+
+        merged, _ = merge_candles([(b, 0.25), (a, 0.75)], "1m")
+
+        bar = merged[0]
+        assert bar["open"] == 99.0
+        assert bar["high"] == 106.0
+        assert bar["low"] == 98.0
+        assert bar["close"] == pytest.approx(0.75 * 100.0 + 0.25 * 103.0)
+        assert bar["volume"] == 800.0
+
+    def test_skips_unusable_candles(self):
+        bad = [{"timestamp": None, "close": 1.0}, {"timestamp": T0, "close": None}]
+
+        assert merge_candles([(bad, 1.0), ([], 1.0)], "1m") == (
+            [],
+            {"overlapping": 0, "gaps_filled": 0},
+        )
+
+    def test_daily_labels_align(self):
+        iso = [{"timestamp": "2023-11-14", "close": 10.0, "volume": None}]
+        midnight_ms = [
+            candle(int(datetime(2023, 11, 14, tzinfo=timezone.utc).timestamp() * 1000), 12.0)
+        ]
+
+        merged, stats = merge_candles([(iso, 0.5), (midnight_ms, 0.5)], "1d")
+
+        assert len(merged) == 1
+        assert merged[0]["close"] == pytest.approx(11.0)
+        assert merged[0]["volume"] == 1000.0
+        assert stats["overlapping"] == 1
+
+    def test_large_series(self):
+        n = 200_000
+        a = [candle(T0 + i * MINUTE_MS, float(i)) for i in range(n)]
+        b = [candle(T0 + i * MINUTE_MS, float(i) + 1) for i in range(0, n, 2)]
+
+        start = time.perf_counter()
+        merged, stats = merge_candles([(a, 0.5), (b, 0.5)], "1m")
+
+        assert time.perf_counter() - start < 5.0
+        assert len(merged) == n
+        assert stats["overlapping"] == n // 2
+        assert merged[2]["close"] == pytest.approx(2.5)
+
+
+class TestMergeOHLCV:
+    """Test DataArbitrationEngine._merge_ohlcv"""
+
+    @pytest.mark.asyncio
+    async def test_merges_provider_responses(self):
+        asset = Asset(symbol="BTC", asset_type=AssetType.CRYPTO)
+        responses = [
+            ProviderResponse(
+                provider=name,
+                asset=asset,
+                data_type=DataType.OHLCV,
+                data={"candles": candles, "timeframe": "1m"},
+                timestamp=datetime.now(timezone.utc),
+                confidence=confidence,
+            )
+            for name, candles, confidence in [
+                ("secondary", minutes(1.0, 2.0, 3.0), 0.6),
+                ("primary", minutes(1.0, 2.0, start=1), 0.9),
+            ]
+        ]
+
+        merged = await DataArbitrationEngine()._merge_ohlcv(responses)
+
+        assert merged.provider == "arbitration_engine"
+        assert merged.data["sources"] == ["primary", "secondary"]
+        assert merged.data["timeframe"] == "1m"
+        assert len(merged.data["candles"]) == 3
+        assert merged.data["overlapping_bars"] == 2
+        assert merged.data["gaps_filled"] == 1
+        assert merged.confidence == pytest.approx(0.75)
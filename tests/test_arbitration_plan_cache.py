@@ -0,0 +1,215 @@
+"""
+Tests for cached arbitration plans
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.core.models import Asset, AssetType, DataType, Market
+from fiml.providers.base import BaseProvider, ProviderConfig
+from fiml.providers.registry import ProviderRegistry
+
+
+class CountingProvider(BaseProvider):
+    """Provider that counts supports_asset calls"""
+
+    def __init__(self, name, priority=1, symbols=None):
+        super().__init__(ProviderConfig(name=name, priority=priority))
+        self._is_initialized = True
+        self.symbols = symbols
+        self.support_checks = 0
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def fetch_price(self, asset):
+        pass
+
+    async def fetch_ohlcv(self, asset, timeframe="1d", limit=100):
+        pass
+
+    async def fetch_fundamentals(self, asset):
+        pass
+
+    async def fetch_news(self, asset, limit=10):
+        pass
+
+    async def supports_asset(self, asset):
+        self.support_checks += 1
+        return self.symbols is None or asset.symbol in self.symbols
+
+    async def get_health(self):
+        pass
+
+
+class SymbolProvider(CountingProvider):
+    asset_support_by_type = False
+
+
+def make_engine(*providers):
+    registry = ProviderRegistry()
+    registry.providers = {provider.name: provider for provider in providers}
+    engine = DataArbitrationEngine()
+    engine.provider_registry = registry
+    return engine
+
+
+def equity(symbol="AAPL"):
+    return Asset(symbol=symbol, asset_type=AssetType.EQUITY, market=Market.US)
+
+
+class TestPlanCache:
+    """Test plan reuse and invalidation"""
+
+    @pytest.mark.asyncio
+    async def test_plan_is_reused_across_symbols(self):
+        provider = CountingProvider("alpha")
+        engine = make_engine(provider)
+
+        first = await engine.arbitrate_request(equity("AAPL"), DataType.PRICE)
+        second = await engine.arbitrate_request(equity("MSFT"), DataType.PRICE)
+
+        assert first == second
+        assert provider.support_checks == 1
+        stats = engine.get_plan_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_key_includes_data_type_and_region(self):
+        engine = make_engine(CountingProvider("alpha"))
+
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+        await engine.arbitrate_request(equity(), DataType.OHLCV)
+        await engine.arbitrate_request(equity(), DataType.PRICE, user_region="EU")
+
+        assert engine.get_plan_cache_stats()["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cooldown_invalidates(self):
+        alpha = CountingProvider("alpha", priority=2)
+        beta = CountingProvider("beta", priority=1)
+        alpha.telemetry.record(DataType.PRICE, 10, True)
+        beta.telemetry.record(DataType.PRICE, 1000, True)
+        engine = make_engine(alpha, beta)
+        assert (
+            await engine.arbitrate_request(equity(), DataType.PRICE)
+        ).primary_provider == "alpha"
+
+        alpha.set_cooldown(60)
+        plan = await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        assert plan.primary_provider == "beta"
+        assert engine.get_plan_cache_stats()["invalidations"] == 1
+
+        alpha.set_cooldown(-1)
+        plan = await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        assert plan.primary_provider == "alpha"
+
+    @pytest.mark.asyncio
+    async def test_telemetry_change_invalidates(self):
+        alpha = CountingProvider("alpha")
+        engine = make_engine(alpha)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+        assert alpha.support_checks == 1
+
+        alpha.telemetry.record(DataType.PRICE, 50, False)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        assert alpha.support_checks == 2
+
+    @pytest.mark.asyncio
+    async def test_other_providers_do_not_invalidate(self):
+        alpha = CountingProvider("alpha")
+        crypto_only = CountingProvider("crypto_only", symbols={"BTC"})
+        engine = make_engine(alpha, crypto_only)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        crypto_only.telemetry.record(DataType.PRICE, 50, False)
+        crypto_only.set_cooldown(60)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        stats = engine.get_plan_cache_stats()
+        assert (stats["hits"], stats["invalidations"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_registry_change_invalidates(self):
+        alpha = CountingProvider("alpha")
+        engine = make_engine(alpha)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        engine.provider_registry.providers["beta"] = CountingProvider("beta", priority=5)
+        plan = await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        assert set(plan.providers) == {"alpha", "beta"}
+
+        alpha._is_initialized = False
+        plan = await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        assert plan.providers == ["beta"]
+
+    @pytest.mark.asyncio
+    async def test_symbol_specific_providers_are_checked_per_request(self):
+        crypto = SymbolProvider("exchange", symbols={"BTC"})
+        general = CountingProvider("general")
+        engine = make_engine(crypto, general)
+        btc = Asset(symbol="BTC", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+        doge = Asset(symbol="DOGE", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+
+        btc_plan = await engine.arbitrate_request(btc, DataType.PRICE)
+        doge_plan = await engine.arbitrate_request(doge, DataType.PRICE)
+        await engine.arbitrate_request(btc, DataType.PRICE)
+
+        assert "exchange" in btc_plan.providers
+        assert "exchange" not in doge_plan.providers
+        assert engine.get_plan_cache_stats()["hits"] == 1
+        assert general.support_checks == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_plan_is_served_and_refreshed(self):
+        provider = CountingProvider("alpha")
+        engine = make_engine(provider)
+        await engine.arbitrate_request(equity(), DataType.PRICE)
+        key, (candidates, fingerprint, _, plan) = next(iter(engine._plan_cache.items()))
+        engine._plan_cache[key] = (candidates, fingerprint, 0.0, plan)
+
+        served = await engine.arbitrate_request(equity(), DataType.PRICE)
+        assert served == plan
+        assert provider.support_checks == 1
+
+        await asyncio.gather(*engine._plan_refresh_tasks.values())
+
+        assert provider.support_checks == 2
+        assert engine._plan_cache[key][2] > 0.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_build_once(self):
+        provider = CountingProvider("alpha")
+        engine = make_engine(provider)
+
+        plans = await asyncio.gather(
+            *(engine.arbitrate_request(equity(), DataType.PRICE) for _ in range(10))
+        )
+
+        assert len({plan.primary_provider for plan in plans}) == 1
+        assert provider.support_checks == 1
+        assert engine.get_plan_cache_stats()["coalesced_builds"] == 9
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        provider = CountingProvider("alpha")
+        engine = make_engine(provider)
+
+        with patch("fiml.core.config.settings.arbitration_plan_cache_ttl_seconds", 0):
+            await engine.arbitrate_request(equity(), DataType.PRICE)
+            await engine.arbitrate_request(equity(), DataType.PRICE)
+
+        assert provider.support_checks == 2
+        assert engine.get_plan_cache_stats()["size"] == 0
@@ -0,0 +1,239 @@
+"""
+Tests for quorum price fetches and outlier rejection
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.arbitration.quorum import largest_agreeing, mad_inliers
+from fiml.core.exceptions import NoProviderAvailableError, ProviderError
+from fiml.core.models import ArbitrationPlan, Asset, AssetType, DataLineage, DataType
+from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
+from fiml.providers.registry import ProviderRegistry
+
+
+class PriceProvider(BaseProvider):
+    """Provider quoting a fixed price after a delay"""
+
+    def __init__(self, name, price, delay=0.0, confidence=1.0, fail=False):
+        super().__init__(ProviderConfig(name=name))
+        self._is_initialized = True
+        self.price = price
+        self.delay = delay
+        self.confidence = confidence
+        self.fail = fail
+        self.cancelled = False
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def fetch_price(self, asset):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise ProviderError(f"{self.name} failed")
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data={"price": self.price, "change": 1.0},
+            timestamp=datetime.now(timezone.utc),
+            confidence=self.confidence,
+        )
+
+    async def fetch_ohlcv(self, asset, timeframe="1d", limit=100):
+        pass
+
+    async def fetch_fundamentals(self, asset):
+        pass
+
+    async def fetch_news(self, asset, limit=10):
+        pass
+
+    async def supports_asset(self, asset):
+        return True
+
+    async def get_health(self):
+        pass
+
+
+def make_engine(*providers):
+    registry = ProviderRegistry()
+    registry.providers = {provider.name: provider for provider in providers}
+    engine = DataArbitrationEngine()
+    engine.provider_registry = registry
+    return engine
+
+
+def plan_for(*providers):
+    return ArbitrationPlan(
+        primary_provider=providers[0].name,
+        fallback_providers=[p.name for p in providers[1:]],
+        estimated_latency_ms=100,
+    )
+
+
+@pytest.fixture
+def asset():
+    return Asset(symbol="AAPL", asset_type=AssetType.EQUITY)
+
+
+@pytest.fixture
+def quorum():
+    with (
+        patch("fiml.core.config.settings.arbitration_quorum_symbols", ["aapl"]),
+        patch("fiml.core.config.settings.arbitration_quorum_size", 3),
+        patch("fiml.core.config.settings.arbitration_quorum_deadline_ms", 500),
+    ):
+        yield
+
+
+class TestConsensusFilters:
+    """Test the vectorized MAD filter and agreement check"""
+
+    def test_mad_rejects_outlier(self):
+        prices = np.array([100.0, 100.2, 99.9, 100.1, 130.0])
+
+        assert mad_inliers(prices).tolist() == [True, True, True, True, False]
+
+    def test_tolerance_when_mad_is_zero(self):
+        prices = np.array([100.0, 100.0, 100.0, 100.3, 101.0])
+
+        assert mad_inliers(prices, tolerance=0.005).tolist() == [True, True, True, True, False]
+
+    def test_two_values_cannot_outvote_each_other(self):
+        assert mad_inliers(np.array([100.0, 150.0])).all()
+
+    def test_largest_agreeing(self):
+        assert largest_agreeing(np.array([100.0, 150.0, 100.4, 99.8]), tolerance=0.005) == 3
+        assert largest_agreeing(np.array([100.0, 110.0]), tolerance=0.005) == 1
+        assert largest_agreeing(np.array([])) == 0
+
+
+class TestMergePrice:
+    """Test _merge_price with outlier rejection"""
+
+    @pytest.mark.asyncio
+    async def test_outlier_is_excluded(self, asset):
+        engine = DataArbitrationEngine()
+        responses = [
+            await PriceProvider(name, price, confidence=conf).fetch_price(asset)
+            for name, price, conf in [("a", 100.0, 1.0), ("b", 101.0, 0.5), ("c", 500.0, 1.0)]
+        ]
+
+        merged = await engine._merge_price(responses)
+
+        assert merged.data["price"] == pytest.approx((100.0 + 0.5 * 101.0) / 1.5)
+        assert merged.data["sources"] == ["a", "b"]
+        assert merged.data["rejected"] == {"c": 500.0}
+        lineage = DataLineage(**merged.data["lineage"])
+        assert lineage.rejected_providers == ["c"]
+        assert lineage.conflict_resolved
+        assert lineage.source_count == 2
+
+
+@pytest.mark.usefixtures("quorum")
+class TestQuorumExecution:
+    """Test execute_quorum and its routing from execute_with_fallback"""
+
+    @pytest.mark.asyncio
+    async def test_returns_once_two_agree(self, asset):
+        fast = PriceProvider("fast", 100.0, delay=0.01)
+        medium = PriceProvider("medium", 100.1, delay=0.02)
+        slow = PriceProvider("slow", 100.2, delay=2.0)
+        engine = make_engine(fast, medium, slow)
+
+        start = time.perf_counter()
+        response = await engine.execute_with_fallback(
+            plan_for(slow, fast, medium), asset, DataType.PRICE
+        )
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0)
+
+        assert elapsed < 0.5
+        assert slow.cancelled
+        assert response.provider == "arbitration_engine"
+        assert sorted(response.data["sources"]) == ["fast", "medium"]
+        assert response.data["price"] == pytest.approx(100.05)
+        assert response.data["lineage"]["quorum_reached"]
+
+    @pytest.mark.asyncio
+    async def test_two_providers_both_must_answer(self, asset):
+        fast = PriceProvider("fast", 100.0, delay=0.01)
+        slower = PriceProvider("slower", 100.1, delay=0.05)
+        engine = make_engine(fast, slower)
+
+        response = await engine.execute_quorum(plan_for(fast, slower), asset)
+
+        assert sorted(response.data["sources"]) == ["fast", "slower"]
+        assert response.data["lineage"]["quorum_reached"]
+        assert response.metadata["lineage"]["source_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disagreement_waits_for_third_and_rejects_outlier(self, asset):
+        good = PriceProvider("good", 100.0, delay=0.01)
+        bad = PriceProvider("bad", 140.0, delay=0.01)
+        late = PriceProvider("late", 100.1, delay=0.05)
+        engine = make_engine(good, bad, late)
+
+        response = await engine.execute_quorum(plan_for(good, bad, late), asset)
+
+        assert response.data["price"] == pytest.approx(100.05)
+        assert response.data["lineage"]["rejected_providers"] == ["bad"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_merges_what_arrived(self, asset):
+        a = PriceProvider("a", 100.0, delay=0.01)
+        b = PriceProvider("b", 120.0, delay=0.01)
+        stuck = PriceProvider("stuck", 100.0, delay=5.0)
+        engine = make_engine(a, b, stuck)
+
+        with patch("fiml.core.config.settings.arbitration_quorum_deadline_ms", 100):
+            start = time.perf_counter()
+            response = await engine.execute_quorum(plan_for(a, b, stuck), asset)
+
+        assert time.perf_counter() - start < 1.0
+        assert response.data["source_count"] == 2
+        assert response.confidence < 0.95
+        assert response.data["lineage"]["quorum_reached"] is False
+
+    @pytest.mark.asyncio
+    async def test_failures_are_tolerated(self, asset):
+        ok = PriceProvider("ok", 100.0)
+        broken = PriceProvider("broken", 0.0, fail=True)
+        engine = make_engine(ok, broken)
+
+        response = await engine.execute_quorum(plan_for(broken, ok), asset)
+
+        assert response.provider == "ok"
+        assert response.data["lineage"]["providers"] == ["ok"]
+        assert response.data["lineage"]["quorum_reached"] is False
+
+        ok.fail = True
+        with pytest.raises(NoProviderAvailableError):
+            await engine.execute_quorum(plan_for(broken, ok), asset)
+
+    @pytest.mark.asyncio
+    async def test_other_symbols_use_fallback(self):
+        primary = PriceProvider("primary", 100.0)
+        other = PriceProvider("other", 100.0)
+        engine = make_engine(primary, other)
+        msft = Asset(symbol="MSFT", asset_type=AssetType.EQUITY)
+
+        response = await engine.execute_with_fallback(
+            plan_for(primary, other), msft, DataType.PRICE
+        )
+
+        assert response.provider == "primary"
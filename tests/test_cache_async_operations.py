@@ -23,6 +23,7 @@ from fiml.cache.manager import CacheManager
 from fiml.cache.scheduler import BatchUpdateScheduler, UpdateRequest
 from fiml.cache.warmer import CacheWarmer
 from fiml.cache.warming import PredictiveCacheWarmer, QueryPattern
+from fiml.core.exceptions import NoProviderAvailableError
 from fiml.core.models import Asset, AssetType, DataType, Market
 
 # ============================================================================
@@ -76,14 +77,21 @@ def mock_provider_registry():
     mock_provider = MagicMock()
     mock_provider.name = "test_provider"
     mock_provider.get_price = AsyncMock(return_value={"price": 150.0})
+    mock_provider.fetch_price = AsyncMock(
+        return_value=MagicMock(is_valid=True, data={"price": 150.0})
+    )
     mock_provider.get_prices_batch = AsyncMock(
         return_value=[{"symbol": "AAPL", "price": 150.0}, {"symbol": "GOOGL", "price": 2800.0}]
     )
     mock_provider.get_fundamentals = AsyncMock(return_value={"pe_ratio": 25.0})
+    mock_provider.fetch_fundamentals = AsyncMock(
+        return_value=MagicMock(is_valid=True, data={"pe_ratio": 25.0})
+    )
     mock_provider.supports_batch = True
 
     registry.get_provider = MagicMock(return_value=mock_provider)
     registry.get_provider_for_data_type = MagicMock(return_value=mock_provider)
+    registry.get_providers_for_asset = AsyncMock(return_value=[mock_provider])
 
     return registry
 
@@ -224,7 +232,9 @@ class TestPredictiveCacheWarmerAsync:
     async def test_warm_symbol_provider_not_found(self, mock_cache_manager):
         """Test warming when provider is not found"""
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=None)
+        mock_registry.get_providers_for_asset = AsyncMock(
+            side_effect=NoProviderAvailableError("No providers")
+        )
 
         warmer = PredictiveCacheWarmer(
             cache_manager=mock_cache_manager, provider_registry=mock_registry
@@ -239,7 +249,7 @@ class TestPredictiveCacheWarmerAsync:
     async def test_warm_symbol_exception_handling(self, mock_cache_manager, mock_provider_registry):
         """Test exception handling during warming"""
         # Make provider raise exception
-        mock_provider_registry.get_provider_for_data_type.side_effect = Exception("Provider error")
+        mock_provider_registry.get_providers_for_asset.side_effect = Exception("Provider error")
 
         warmer = PredictiveCacheWarmer(
             cache_manager=mock_cache_manager, provider_registry=mock_provider_registry
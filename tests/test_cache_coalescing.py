@@ -0,0 +1,210 @@
+"""
+Tests for single-flight request coalescing in the cache layer
+"""
+
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.coalescing import RequestCoalescer
+from fiml.cache.manager import CacheManager
+from fiml.core.models import Asset, AssetType, DataType, Market
+
+
+@pytest.fixture
+def sample_asset():
+    """Create a sample asset for testing"""
+    return Asset(
+        symbol="AAPL",
+        name="Apple Inc.",
+        asset_type=AssetType.EQUITY,
+        market=Market.US,
+        exchange="NASDAQ",
+        currency="USD",
+    )
+
+
+@pytest.fixture
+def miss_manager():
+    """CacheManager whose L1 always misses"""
+    manager = CacheManager()
+    manager.analytics = CacheAnalytics(enable_prometheus=False)
+    manager.l1._initialized = True
+
+    mock_redis = MagicMock()
+    mock_redis.get = AsyncMock(return_value=None)
+    mock_redis.setex = AsyncMock(return_value=True)
+    manager.l1._redis = mock_redis
+    return manager
+
+
+class TestRequestCoalescer:
+    """Test RequestCoalescer semantics"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        coalescer = RequestCoalescer()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"price": 150.0}
+
+        tasks = [asyncio.create_task(coalescer.run("k", fetch)) for _ in range(10)]
+        await asyncio.sleep(0)
+        assert coalescer.get_waiters("k") == 9
+
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(r == {"price": 150.0} for r in results)
+        assert not coalescer.is_inflight("k")
+
+        stats = coalescer.get_stats()
+        assert stats["leaders"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["max_waiters"] == 9
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_coalesced(self):
+        coalescer = RequestCoalescer()
+        fetch = AsyncMock(return_value=1)
+
+        await asyncio.gather(coalescer.run("a", fetch), coalescer.run("b", fetch))
+
+        assert fetch.await_count == 2
+        assert coalescer.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_callers(self):
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise RuntimeError("provider down")
+
+        tasks = [asyncio.create_task(coalescer.run("k", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not coalescer.is_inflight("k")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_fetch(self):
+        coalescer = RequestCoalescer()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(coalescer.run("k", fetch))
+        waiter = asyncio.create_task(coalescer.run("k", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await leader
+
+        release.set()
+        assert await waiter == "value"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_fetch_propagates_cancellation(self):
+        coalescer = RequestCoalescer()
+
+        async def fetch():
+            await asyncio.sleep(10)
+
+        caller = asyncio.create_task(coalescer.run("k", fetch))
+        await asyncio.sleep(0)
+        coalescer._inflight["k"].cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+    @pytest.mark.asyncio
+    async def test_new_fetch_after_completion(self):
+        coalescer = RequestCoalescer()
+        fetch = AsyncMock(side_effect=[1, 2])
+
+        assert await coalescer.run("k", fetch) == 1
+        assert await coalescer.run("k", fetch) == 2
+
+
+class TestReadThroughCoalescing:
+    """Test coalescing in CacheManager.get_with_read_through"""
+
+    @pytest.mark.asyncio
+    async def test_hot_key_fetched_once(self, miss_manager, sample_asset):
+        release = asyncio.Event()
+        fetch_fn = AsyncMock()
+
+        async def slow_fetch():
+            await fetch_fn()
+            await release.wait()
+            return {"price": 150.0}
+
+        tasks = [
+            asyncio.create_task(
+                miss_manager.get_with_read_through(
+                    "price:AAPL:any", DataType.PRICE, slow_fetch, sample_asset
+                )
+            )
+            for _ in range(20)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert fetch_fn.await_count == 1
+        assert all(r == {"price": 150.0} for r in results)
+        # Only the leader wrote to Redis
+        assert miss_manager.l1._redis.setex.await_count == 1
+        assert miss_manager.analytics.coalesced_requests == 19
+        assert miss_manager.coalescer.get_stats()["coalesced"] == 19
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_returns_none_for_all(self, miss_manager, sample_asset):
+        release = asyncio.Event()
+
+        async def failing_fetch():
+            await release.wait()
+            raise RuntimeError("provider down")
+
+        tasks = [
+            asyncio.create_task(
+                miss_manager.get_with_read_through(
+                    "price:AAPL:any", DataType.PRICE, failing_fetch, sample_asset
+                )
+            )
+            for _ in range(3)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [None, None, None]
+        assert miss_manager.analytics.total_errors == 3
+
+    @pytest.mark.asyncio
+    async def test_stats_include_coalescing(self, miss_manager):
+        miss_manager.l1._redis.info = AsyncMock(return_value={})
+
+        stats = await miss_manager.get_stats()
+
+        assert "coalescing" in stats
+        assert stats["coalescing"]["in_flight"] == 0
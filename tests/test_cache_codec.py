@@ -0,0 +1,141 @@
+"""
+Tests for the pluggable cache payload codec
+"""
+
+import json
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache import codec as cache_codec
+from fiml.cache.codec import CacheCodec
+from fiml.cache.l1_cache import L1Cache
+from fiml.core.exceptions import CacheError
+
+SAMPLE = {
+    "symbol": "AAPL",
+    "price": 185.23,
+    "volume": 51234567,
+    "candles": [{"t": i, "o": 1.0 + i, "c": 2.0 + i} for i in range(200)],
+    "tags": ["equity", "us"],
+    "active": True,
+    "note": None,
+}
+
+requires_msgpack = pytest.mark.skipif(
+    not cache_codec.MSGPACK_AVAILABLE, reason="msgpack not installed"
+)
+requires_orjson = pytest.mark.skipif(
+    not cache_codec.ORJSON_AVAILABLE, reason="orjson not installed"
+)
+requires_zstd = pytest.mark.skipif(not cache_codec.ZSTD_AVAILABLE, reason="zstandard not installed")
+
+
+class TestCacheCodec:
+    """Test CacheCodec encode/decode"""
+
+    def test_json_is_headerless(self):
+        encoded = CacheCodec().encode(SAMPLE)
+
+        assert json.loads(encoded) == SAMPLE
+
+    def test_legacy_json_text_decodes(self):
+        codec = CacheCodec()
+
+        assert codec.decode(json.dumps(SAMPLE)) == SAMPLE
+        assert codec.decode(json.dumps(SAMPLE).encode()) == SAMPLE
+
+    def test_legacy_nan_decodes(self):
+        assert math.isnan(CacheCodec().decode('{"v": NaN}')["v"])
+
+    @requires_orjson
+    def test_orjson_round_trip(self):
+        codec = CacheCodec(serializer="orjson")
+        encoded = codec.encode(SAMPLE)
+
+        assert encoded[0] == CacheCodec.MAGIC
+        assert codec.decode(encoded) == SAMPLE
+
+    @requires_msgpack
+    def test_msgpack_round_trip(self):
+        codec = CacheCodec(serializer="msgpack")
+        encoded = codec.encode(SAMPLE)
+
+        assert encoded[:4] == bytes((CacheCodec.MAGIC, CacheCodec.VERSION, 2, 0))
+        assert codec.decode(encoded) == SAMPLE
+        assert len(encoded) < len(CacheCodec().encode(SAMPLE))
+
+    @requires_msgpack
+    def test_any_codec_decodes_any_format(self):
+        """Changing the configured codec must not orphan existing entries"""
+        encoded = CacheCodec(serializer="msgpack").encode(SAMPLE)
+
+        assert CacheCodec(serializer="json").decode(encoded) == SAMPLE
+
+    @requires_msgpack
+    def test_non_serializable_values_stringified(self):
+        from datetime import datetime
+
+        codec = CacheCodec(serializer="msgpack")
+        decoded = codec.decode(codec.encode({"at": datetime(2024, 1, 2)}))
+
+        assert decoded == {"at": "2024-01-02 00:00:00"}
+
+    @requires_orjson
+    def test_falls_back_to_json_for_big_ints(self):
+        codec = CacheCodec(serializer="orjson")
+        encoded = codec.encode({"n": 2**70})
+
+        assert codec.decode(encoded) == {"n": 2**70}
+
+    @requires_zstd
+    def test_compression_above_threshold(self):
+        codec = CacheCodec(serializer="json", compression="zstd", compress_threshold=100)
+
+        small = codec.encode({"p": 1})
+        large = codec.encode(SAMPLE)
+
+        assert small[0] != CacheCodec.MAGIC
+        assert large[3] & CacheCodec.FLAG_ZSTD
+        assert codec.decode(large) == SAMPLE
+
+    def test_unknown_serializer(self):
+        with pytest.raises(CacheError):
+            CacheCodec(serializer="pickle")
+
+    def test_unsupported_version(self):
+        with pytest.raises(CacheError):
+            CacheCodec().decode(bytes((CacheCodec.MAGIC, 99, 0, 0)) + b"{}")
+
+    def test_dumps_json(self):
+        assert json.loads(CacheCodec().dumps_json(SAMPLE)) == SAMPLE
+
+
+class TestL1CacheCodec:
+    """Test L1Cache integration with the codec"""
+
+    @requires_msgpack
+    @pytest.mark.asyncio
+    async def test_set_and_get_use_codec(self):
+        cache = L1Cache(codec=CacheCodec(serializer="msgpack"))
+        cache._initialized = True
+        cache._redis = MagicMock()
+        cache._redis.setex = AsyncMock(return_value=True)
+
+        await cache.set("price:AAPL:any", SAMPLE, ttl_seconds=10)
+        stored = cache._redis.setex.await_args.args[2]
+        assert isinstance(stored, bytes)
+        assert stored[0] == CacheCodec.MAGIC
+
+        cache._redis.get = AsyncMock(return_value=stored)
+        assert await cache.get("price:AAPL:any") == SAMPLE
+
+    @pytest.mark.asyncio
+    async def test_corrupt_payload_is_a_miss(self):
+        cache = L1Cache()
+        cache._initialized = True
+        cache._redis = MagicMock()
+        cache._redis.get = AsyncMock(return_value=bytes((CacheCodec.MAGIC, 1, 2, 0)) + b"\xc1")
+
+        assert await cache.get("key") is None
@@ -58,8 +58,8 @@ class TestDataTypeMetrics:
         metrics = DataTypeMetrics(DataType.PRICE)
         metrics.record_hit(10.5)
         assert metrics.hits == 1
-        assert len(metrics.latencies) == 1
-        assert metrics.latencies[0] == 10.5
+        assert metrics.latency.count == 1
+        assert metrics.latency.max == 10.5
 
     def test_record_miss(self):
         """Test recording a cache miss"""
@@ -105,18 +105,18 @@ class TestDataTypeMetrics:
         assert stats["min"] == 10.0
         assert stats["max"] == 100.0
 
-    def test_latencies_limit(self):
-        """Test that latencies list is limited to 10000"""
+    def test_latency_memory_bounded(self):
+        """Test that latency memory does not grow with the sample count"""
         metrics = DataTypeMetrics(DataType.PRICE)
-        for i in range(10010):
-            metrics.record_hit(float(i))
+        for i in range(20000):
+            metrics.record_hit(float(i % 100))
 
-        # Should have popped old values
-        assert len(metrics.latencies) == 10000
+        assert metrics.latency.count == 20000
+        assert len(metrics.latency.snapshot()["buckets"]) < 1000
 
     def test_percentile_empty(self):
-        """Test percentile calculation with empty list"""
-        assert DataTypeMetrics._percentile([], 50) == 0.0
+        """Test percentile calculation with no data"""
+        assert DataTypeMetrics(DataType.PRICE).latency.percentile(50) == 0.0
 
 
 class TestCacheAnalyticsExtended:
@@ -725,16 +725,17 @@ class TestCacheManagerExtended:
         manager._track_l2_latency(25.5)
         manager._track_l2_latency(30.0)
 
-        assert len(manager._l2_latencies) == 2
-        assert 25.5 in manager._l2_latencies
+        assert manager._l2_latency.count == 2
+        assert manager._l2_latency.min == 25.5
 
-    def test_track_l2_latency_limit(self):
-        """Test L2 latency tracking limit"""
+    def test_track_l2_latency_keeps_all_samples(self):
+        """Test L2 latency histogram counts every sample"""
         manager = CacheManager()
         for i in range(1100):
             manager._track_l2_latency(float(i))
 
-        assert len(manager._l2_latencies) == 1000
+        assert manager._l2_latency.count == 1100
+        assert manager._l2_latency.max == 1099.0
 
     def test_get_ttl_price_crypto(self, sample_crypto_asset):
         """Test TTL for crypto prices (max 60 seconds)"""
@@ -1168,12 +1169,12 @@ class TestCacheIntegration:
         value = await manager.get("test_key")
         assert value is not None
         assert manager._l1_hits == 1
-        assert len(manager._l1_latencies) == 1
+        assert manager._l1_latency.count == 1
 
         # Test set with latency tracking
         success = await manager.set("test_key", {"data": "value"}, ttl_seconds=60)
         assert success is True
-        assert len(manager._l1_latencies) == 2
+        assert manager._l1_latency.count == 2
 
 
 class TestBatchSchedulerProcessing:
@@ -1237,7 +1238,7 @@ class TestPredictiveCacheWarmerProcessing:
     async def test_warm_symbol_no_provider(self):
         """Test warming symbol when no provider found"""
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=None)
+        mock_registry.get_providers_for_asset = AsyncMock(return_value=[])
 
         warmer = PredictiveCacheWarmer(cache_manager=MagicMock(), provider_registry=mock_registry)
 
@@ -1515,7 +1516,7 @@ class TestCacheManagerPricesAndReadThrough:
 
     @pytest.mark.asyncio
     async def test_invalidate_asset(self, sample_asset):
-        """Test invalidating all cached data for an asset"""
+        """Test invalidating all cached data for an asset by keyspace scan"""
         manager = CacheManager()
         manager._initialized = True
         manager.l1._initialized = True
@@ -1529,7 +1530,8 @@ class TestCacheManagerPricesAndReadThrough:
         mock_redis.delete = AsyncMock(return_value=2)
         manager.l1._redis = mock_redis
 
-        deleted = await manager.invalidate_asset(sample_asset)
+        with patch("fiml.core.config.settings.cache_generation_invalidation_enabled", False):
+            deleted = await manager.invalidate_asset(sample_asset)
 
         assert deleted == 2
 
@@ -1711,6 +1713,37 @@ class TestBatchSchedulerProcessBatch:
         assert stats["api_calls"] == 1
         assert stats["api_calls_saved"] == 1
 
+    @pytest.mark.asyncio
+    async def test_process_batch_price_with_base_provider(self, sample_asset, sample_crypto_asset):
+        """Test processing batch through BaseProvider.fetch_prices_batch"""
+        from fiml.providers.mock_provider import MockProvider
+
+        provider = MockProvider()
+        await provider.initialize()
+
+        mock_cache_manager = MagicMock()
+        mock_cache_manager.set_prices_batch = AsyncMock(return_value=2)
+
+        mock_registry = MagicMock()
+        mock_registry.get_provider = MagicMock(return_value=provider)
+
+        scheduler = BatchUpdateScheduler(
+            cache_manager=mock_cache_manager, provider_registry=mock_registry
+        )
+
+        batch = [
+            UpdateRequest(sample_asset, DataType.PRICE, "mock_provider"),
+            UpdateRequest(sample_crypto_asset, DataType.PRICE, "mock_provider"),
+        ]
+
+        stats = await scheduler._process_batch(batch)
+
+        # MockProvider has no batch endpoint: one request per asset
+        assert stats["success"] == 2
+        assert stats["api_calls"] == 2
+        cache_items = mock_cache_manager.set_prices_batch.call_args[0][0]
+        assert [item[2]["price"] for item in cache_items] == [100.0, 40000.0]
+
     @pytest.mark.asyncio
     async def test_process_batch_price_without_batch_support(self, sample_asset):
         """Test processing batch with provider that doesn't support batch operations"""
@@ -1884,13 +1917,15 @@ class TestPredictiveCacheWarmerWarmSymbol:
         """Test warming symbol with successful price fetch"""
         mock_provider = MagicMock()
         mock_provider.name = "test_provider"
-        mock_provider.get_price = AsyncMock(return_value={"price": 150.0})
+        mock_provider.fetch_price = AsyncMock(
+            return_value=MagicMock(is_valid=True, data={"price": 150.0})
+        )
 
         mock_cache_manager = MagicMock()
         mock_cache_manager.set_price = AsyncMock(return_value=True)
 
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=mock_provider)
+        mock_registry.get_providers_for_asset = AsyncMock(return_value=[mock_provider])
 
         warmer = PredictiveCacheWarmer(
             cache_manager=mock_cache_manager, provider_registry=mock_registry
@@ -1906,13 +1941,15 @@ class TestPredictiveCacheWarmerWarmSymbol:
         """Test warming symbol with successful fundamentals fetch"""
         mock_provider = MagicMock()
         mock_provider.name = "test_provider"
-        mock_provider.get_fundamentals = AsyncMock(return_value={"pe_ratio": 25.0})
+        mock_provider.fetch_fundamentals = AsyncMock(
+            return_value=MagicMock(is_valid=True, data={"pe_ratio": 25.0})
+        )
 
         mock_cache_manager = MagicMock()
         mock_cache_manager.set_fundamentals = AsyncMock(return_value=True)
 
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=mock_provider)
+        mock_registry.get_providers_for_asset = AsyncMock(return_value=[mock_provider])
 
         warmer = PredictiveCacheWarmer(
             cache_manager=mock_cache_manager, provider_registry=mock_registry
@@ -1926,10 +1963,10 @@ class TestPredictiveCacheWarmerWarmSymbol:
     async def test_warm_symbol_failure(self):
         """Test warming symbol when fetch fails"""
         mock_provider = MagicMock()
-        mock_provider.get_price = AsyncMock(return_value=None)
+        mock_provider.fetch_price = AsyncMock(return_value=MagicMock(is_valid=False, data={}))
 
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=mock_provider)
+        mock_registry.get_providers_for_asset = AsyncMock(return_value=[mock_provider])
 
         warmer = PredictiveCacheWarmer(cache_manager=MagicMock(), provider_registry=mock_registry)
 
@@ -1942,10 +1979,10 @@ class TestPredictiveCacheWarmerWarmSymbol:
     async def test_warm_symbol_exception(self):
         """Test warming symbol when exception occurs"""
         mock_provider = MagicMock()
-        mock_provider.get_price = AsyncMock(side_effect=Exception("API error"))
+        mock_provider.fetch_price = AsyncMock(side_effect=Exception("API error"))
 
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=mock_provider)
+        mock_registry.get_providers_for_asset = AsyncMock(return_value=[mock_provider])
 
         warmer = PredictiveCacheWarmer(cache_manager=MagicMock(), provider_registry=mock_registry)
 
@@ -1962,13 +1999,15 @@ class TestPredictiveCacheWarmerBatch:
         """Test batch warming multiple symbols"""
         mock_provider = MagicMock()
         mock_provider.name = "test_provider"
-        mock_provider.get_price = AsyncMock(return_value={"price": 150.0})
+        mock_provider.fetch_price = AsyncMock(
+            return_value=MagicMock(is_valid=True, data={"price": 150.0})
+        )
 
         mock_cache_manager = MagicMock()
         mock_cache_manager.set_price = AsyncMock(return_value=True)
 
         mock_registry = MagicMock()
-        mock_registry.get_provider_for_data_type = MagicMock(return_value=mock_provider)
+        mock_registry.get_providers_for_asset = AsyncMock(return_value=[mock_provider])
 
         warmer = PredictiveCacheWarmer(
             cache_manager=mock_cache_manager, provider_registry=mock_registry
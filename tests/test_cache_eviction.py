@@ -0,0 +1,147 @@
+"""
+Tests for O(1) LFU and W-TinyLFU eviction tracking
+"""
+
+import random
+
+from fiml.cache.eviction import EvictionPolicy, EvictionTracker
+from fiml.cache.sketch import CountMinSketch
+
+
+class TestCountMinSketch:
+    """Test the frequency sketch used for TinyLFU admission"""
+
+    def test_estimates_never_undercount(self):
+        sketch = CountMinSketch(width=64, sample_size=10_000)
+        for i in range(10):
+            for _ in range(i):
+                sketch.increment(f"k{i}")
+
+        assert all(sketch.estimate(f"k{i}") >= i for i in range(10))
+        assert sketch.estimate("k9") > sketch.estimate("k1")
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(width=64, sample_size=10_000, max_count=15)
+        for _ in range(100):
+            sketch.increment("hot")
+
+        assert sketch.estimate("hot") == 15
+
+    def test_aging_halves_counters(self):
+        sketch = CountMinSketch(width=64, sample_size=8)
+        for _ in range(8):
+            sketch.increment("hot")
+
+        assert sketch.estimate("hot") == 4
+        assert sketch._resets == 1
+
+    def test_clear(self):
+        sketch = CountMinSketch(width=64)
+        sketch.increment("k")
+        sketch.clear()
+
+        assert sketch.estimate("k") == 0
+
+
+class TestLFUBuckets:
+    """Test frequency-bucket LFU"""
+
+    def test_evicts_least_frequent_oldest_first(self):
+        tracker = EvictionTracker(policy=EvictionPolicy.LFU, max_entries=3)
+        for key in ["a", "a", "b", "c"]:
+            tracker.track_access(key)
+
+        tracker.track_access("d")
+
+        assert "b" not in tracker._lfu_tracker
+        assert set(tracker._lfu_tracker) == {"a", "c", "d"}
+        assert tracker.get_stats()["total_evictions"] == 1
+
+    def test_candidates_ordered_by_frequency(self):
+        tracker = EvictionTracker(policy=EvictionPolicy.LFU, max_entries=10)
+        for key in ["x", "x", "x", "y", "y", "z"]:
+            tracker.track_access(key)
+
+        assert tracker.get_eviction_candidates(count=3) == ["z", "y", "x"]
+
+    def test_buckets_consistent_after_removals(self):
+        rng = random.Random(7)
+        tracker = EvictionTracker(policy=EvictionPolicy.LFU, max_entries=20)
+
+        for _ in range(2000):
+            tracker.track_access(f"k{rng.randint(0, 60)}")
+            if rng.random() < 0.1 and tracker._lfu_tracker:
+                tracker.remove_key(rng.choice(list(tracker._lfu_tracker)))
+
+        bucketed = {k: f for f, bucket in tracker._freq_buckets.items() for k in bucket}
+        assert bucketed == tracker._lfu_tracker
+        assert len(tracker._lfu_tracker) <= 20
+
+
+class TestWTinyLFU:
+    """Test W-TinyLFU admission and segments"""
+
+    def test_respects_capacity(self):
+        tracker = EvictionTracker(policy=EvictionPolicy.W_TINYLFU, max_entries=100)
+        for i in range(1000):
+            tracker.track_access(f"k{i}")
+
+        stats = tracker.get_stats()
+        assert stats["tracked_keys"] == 100
+        assert stats["window_keys"] == 1
+        assert stats["total_evictions"] == 900
+
+    def test_hot_keys_survive_scan(self):
+        tracker = EvictionTracker(policy=EvictionPolicy.W_TINYLFU, max_entries=1000)
+        hot = [f"hot{i}" for i in range(50)]
+        for _ in range(5):
+            for key in hot:
+                tracker.track_access(key)
+
+        # A one-off scan of many cold keys should not flush the hot set
+        for i in range(2000):
+            tracker.track_access(f"cold{i}")
+
+        assert all(tracker.get_access_info(key) is not None for key in hot)
+        assert tracker.get_stats()["admission_rejections"] > 0
+
+    def test_promotion_to_protected(self):
+        tracker = EvictionTracker(policy=EvictionPolicy.W_TINYLFU, max_entries=100)
+        tracker.track_access("a")
+        tracker.track_access("b")  # pushes "a" out of the 1-key window into probation
+
+        assert tracker.get_access_info("a")["segment"] == "probation"
+
+        tracker.track_access("a")
+
+        info = tracker.get_access_info("a")
+        assert info["segment"] == "protected"
+        assert info["access_count"] >= 2
+
+    def test_remove_and_clear(self):
+        tracker = EvictionTracker(policy=EvictionPolicy.W_TINYLFU, max_entries=100)
+        for i in range(10):
+            tracker.track_access(f"k{i}")
+
+        tracker.remove_key("k0")
+        assert tracker.get_access_info("k0") is None
+        assert "k0" not in tracker.get_eviction_candidates(count=100)
+
+        tracker.clear()
+        assert tracker.get_stats()["tracked_keys"] == 0
+        assert tracker._sketch.estimate("k1") == 0
+
+    def test_beats_lru_on_zipf(self):
+        rng = random.Random(42)
+        weights = [1 / (rank + 1) for rank in range(2000)]
+        trace = [f"k{i}" for i in rng.choices(range(2000), weights=weights, k=20000)]
+
+        def hit_ratio(policy: EvictionPolicy) -> float:
+            tracker = EvictionTracker(policy=policy, max_entries=100)
+            hits = 0
+            for key in trace:
+                hits += tracker.get_access_info(key) is not None
+                tracker.track_access(key)
+            return hits / len(trace)
+
+        assert hit_ratio(EvictionPolicy.W_TINYLFU) > hit_ratio(EvictionPolicy.LRU)
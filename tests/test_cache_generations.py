@@ -0,0 +1,268 @@
+"""
+Tests for generation-based invalidation and the tag index
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.generations import GenerationStore
+from fiml.cache.l1_cache import L1Cache
+from fiml.cache.manager import CacheManager
+from fiml.core.models import Asset, AssetType, Market
+
+
+class FakeRedis:
+    """Minimal redis.asyncio stand-in for strings, counters and sets"""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+        self.expiries = {}
+        self.mget_calls = 0
+        self.scans = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.expiries[key] = ttl
+        return True
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            deleted += int(self.data.pop(key, None) is not None or key in self.sets)
+            self.sets.pop(key, None)
+        return deleted
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def scan_iter(self, match=None):
+        self.scans += 1
+        for key in list(self.data):
+            yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value):
+        self.ops.append(("set", key, value))
+
+    def setex(self, key, ttl, value):
+        self.ops.append(("setex", key, ttl, value))
+
+    def incr(self, key):
+        self.ops.append(("incr", key))
+
+    def sadd(self, key, member):
+        self.ops.append(("sadd", key, member))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key, seconds))
+
+    async def execute(self):
+        results = []
+        for op, key, *args in self.ops:
+            if op == "set":
+                results.append(await self.redis.set(key, args[0]))
+            elif op == "setex":
+                results.append(await self.redis.setex(key, *args))
+            elif op == "incr":
+                value = int(self.redis.data.get(key, b"0")) + 1
+                self.redis.data[key] = str(value).encode()
+                results.append(value)
+            elif op == "sadd":
+                self.redis.sets.setdefault(key, set()).add(args[0])
+                results.append(1)
+            elif op == "expire":
+                self.redis.expiries[key] = args[0]
+                results.append(True)
+        return results
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def sample_asset():
+    return Asset(symbol="AAPL", asset_type=AssetType.EQUITY, market=Market.US)
+
+
+def make_l1(redis_client):
+    l1 = L1Cache()
+    l1._redis = redis_client
+    l1._initialized = True
+    l1.generations.start(redis_client)
+    return l1
+
+
+class TestGenerationStore:
+    """Test generation counters, local copies and fallbacks"""
+
+    def test_versioned_key_format(self):
+        assert GenerationStore.versioned("price:AAPL:any", [0]) == "price:AAPL:any"
+        assert GenerationStore.versioned("price:AAPL:any", [3]) == "price:AAPL:any:g3"
+        assert GenerationStore.versioned("narrative:AAPL:en", [0, 2]) == "narrative:AAPL:en:g0.2"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_increments(self, fake_redis):
+        store = GenerationStore()
+        store.start(fake_redis)
+
+        assert await store.get("symbol:AAPL") == 0
+        assert await store.invalidate("symbol:AAPL") == {"symbol:AAPL": 1}
+        assert await store.get("symbol:AAPL") == 1
+        assert fake_redis.data["fiml:gen:symbol:AAPL"] == b"1"
+
+    @pytest.mark.asyncio
+    async def test_local_copy_avoids_round_trips(self, fake_redis):
+        store = GenerationStore(local_ttl_seconds=60)
+        store.start(fake_redis)
+
+        await store.get_many(["symbol:AAPL", "symbol:MSFT"])
+        await store.get_many(["symbol:AAPL", "symbol:MSFT"])
+
+        assert fake_redis.mget_calls == 1
+        assert store.get_stats()["local_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_other_worker_invalidation_seen_after_local_ttl(self, fake_redis):
+        reader = GenerationStore(local_ttl_seconds=0)
+        writer = GenerationStore()
+        reader.start(fake_redis)
+        writer.start(fake_redis)
+
+        assert await reader.get("symbol:AAPL") == 0
+        await writer.invalidate("symbol:AAPL")
+
+        assert await reader.get("symbol:AAPL") == 1
+
+    @pytest.mark.asyncio
+    async def test_lookup_error_uses_last_known(self, fake_redis):
+        store = GenerationStore(local_ttl_seconds=0)
+        store.start(fake_redis)
+        await store.invalidate("symbol:AAPL")
+
+        async def broken_mget(keys):
+            raise ConnectionError("redis down")
+
+        fake_redis.mget = broken_mget
+
+        assert await store.get_many(["symbol:AAPL", "symbol:MSFT"]) == {
+            "symbol:AAPL": 1,
+            "symbol:MSFT": 0,
+        }
+        assert store.errors == 1
+
+
+class TestL1TagIndex:
+    """Test eager purges through the tag index"""
+
+    @pytest.mark.asyncio
+    async def test_index_and_purge(self, fake_redis):
+        l1 = make_l1(fake_redis)
+        await l1.set("price:AAPL:yahoo", {"price": 1.0}, 10)
+        await l1.set("fundamentals:AAPL:fmp", {"pe": 20.0}, 3600)
+
+        with patch("fiml.core.config.settings.cache_tag_index_enabled", True):
+            await l1.index_tags(
+                [
+                    ("price:AAPL:yahoo", ("symbol:AAPL",), 10),
+                    ("fundamentals:AAPL:fmp", ("symbol:AAPL",), 3600),
+                ]
+            )
+
+        assert fake_redis.expiries["fiml:tag:symbol:AAPL"] == 86400
+        assert await l1.purge_tag("symbol:AAPL") == 2
+        assert fake_redis.data == {}
+        assert "fiml:tag:symbol:AAPL" not in fake_redis.sets
+
+    @pytest.mark.asyncio
+    async def test_index_disabled_by_default(self, fake_redis):
+        l1 = make_l1(fake_redis)
+
+        await l1.index_tags([("price:AAPL:yahoo", ("symbol:AAPL",), 10)])
+
+        assert fake_redis.sets == {}
+
+
+class TestCacheManagerInvalidation:
+    """Test O(1) asset invalidation through CacheManager"""
+
+    def make_manager(self, fake_redis):
+        manager = CacheManager()
+        manager._initialized = True
+        manager.l0 = None
+        manager.l1 = make_l1(fake_redis)
+        manager.analytics = CacheAnalytics(enable_prometheus=False)
+        manager._l2_enabled = lambda: False
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_invalidate_asset_is_one_incr(self, fake_redis, sample_asset):
+        manager = self.make_manager(fake_redis)
+        await manager.set_price(sample_asset, "any", {"price": 150.0})
+        assert await manager.get_price(sample_asset) == {"price": 150.0}
+
+        deleted = await manager.invalidate_asset(sample_asset)
+
+        assert deleted == 0
+        assert fake_redis.scans == 0
+        # The old entry is orphaned, not deleted, and no longer served
+        assert "price:AAPL:any" in fake_redis.data
+        assert await manager.get_price(sample_asset) is None
+
+        await manager.set_price(sample_asset, "any", {"price": 151.0})
+        assert await manager.get_price(sample_asset) == {"price": 151.0}
+        assert "price:AAPL:any:g1" in fake_redis.data
+
+    @pytest.mark.asyncio
+    async def test_batch_keys_follow_generations(self, fake_redis, sample_asset):
+        manager = self.make_manager(fake_redis)
+        msft = Asset(symbol="MSFT", asset_type=AssetType.EQUITY, market=Market.US)
+        await manager.invalidate_asset(msft)
+
+        await manager.set_prices_batch(
+            [(sample_asset, "any", {"price": 150.0}), (msft, "any", {"price": 400.0})]
+        )
+
+        assert "price:AAPL:any" in fake_redis.data
+        assert "price:MSFT:any:g1" in fake_redis.data
+
+    @pytest.mark.asyncio
+    async def test_invalidate_asset_purge_uses_tag_index(self, fake_redis, sample_asset):
+        manager = self.make_manager(fake_redis)
+
+        with patch("fiml.core.config.settings.cache_tag_index_enabled", True):
+            await manager.set_price(sample_asset, "any", {"price": 150.0})
+            deleted = await manager.invalidate_asset(sample_asset, purge=True)
+
+        assert deleted == 1
+        assert fake_redis.scans == 0
+        assert "price:AAPL:any" not in fake_redis.data
@@ -0,0 +1,142 @@
+"""
+Tests for fixed-memory, mergeable latency histograms
+"""
+
+import random
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.histogram import LatencyHistogram, merge_snapshots
+from fiml.core.models import DataType
+
+
+def exact_percentile(values, percentile):
+    """Nearest-rank percentile of raw values"""
+    ordered = sorted(values)
+    rank = max(1, -(-percentile * len(ordered) // 100))
+    return ordered[int(rank) - 1]
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram accuracy, merging and snapshots"""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.get_stats() == {
+            "count": 0,
+            "mean": 0.0,
+            "p50": 0.0,
+            "p95": 0.0,
+            "p99": 0.0,
+            "min": 0.0,
+            "max": 0.0,
+        }
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(1.5, 1.0) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (50, 90, 95, 99, 99.9):
+            expected = exact_percentile(values, percentile)
+            assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.005)
+
+        assert histogram.min == min(values)
+        assert histogram.max == max(values)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_extremes_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in (0.0, 3.0, 12.5):
+            histogram.record(value)
+
+        assert histogram.percentile(0) == 0.0
+        assert histogram.percentile(100) == 12.5
+
+    def test_memory_bounded(self):
+        histogram = LatencyHistogram()
+        for i in range(100000):
+            histogram.record(i * 0.37)
+
+        assert histogram.count == 100000
+        assert len(histogram.snapshot()["buckets"]) < 2000
+
+    def test_merge_matches_single_histogram(self):
+        rng = random.Random(3)
+        values = [rng.expovariate(0.1) for _ in range(5000)]
+        combined = LatencyHistogram()
+        parts = [LatencyHistogram() for _ in range(4)]
+        for i, value in enumerate(values):
+            combined.record(value)
+            parts[i % 4].record(value)
+
+        merged = LatencyHistogram()
+        for part in parts:
+            merged.merge(part)
+
+        assert merged.get_stats() == pytest.approx(combined.get_stats())
+
+    def test_merge_rejects_different_layout(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram().merge(LatencyHistogram(sub_bucket_bits=5))
+
+    def test_snapshot_round_trip(self):
+        first = LatencyHistogram()
+        second = LatencyHistogram()
+        for value in (1.0, 2.0, 3.0):
+            first.record(value)
+        second.record(40.0, count=3)
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+
+        assert merged is not None
+        assert merged.count == 6
+        assert merged.max == 40.0
+        assert merged.percentile(50) == pytest.approx(3.0, rel=0.005)
+        assert merge_snapshots([]) is None
+
+
+class TestAnalyticsLatency:
+    """Test per-level latency and cross-worker snapshots in CacheAnalytics"""
+
+    def test_level_latency_in_report(self):
+        analytics = CacheAnalytics(enable_prometheus=False)
+        for latency in (1.0, 2.0, 3.0, 4.0):
+            analytics.record_cache_access(DataType.PRICE, True, latency, cache_level="l1")
+        analytics.record_cache_access(DataType.PRICE, False, 50.0, cache_level="l1")
+
+        report = analytics.get_comprehensive_report()
+
+        assert report["l1_cache"]["avg_latency_ms"] == 2.5
+        assert report["l1_cache"]["latency_ms"]["count"] == 4
+        assert report["l1_cache"]["latency_ms"]["max"] == 4.0
+        assert report["l2_cache"]["latency_ms"]["count"] == 0
+        assert "price" in report["latency_histograms"]["by_data_type"]
+
+    def test_merge_snapshots_across_workers(self):
+        workers = [CacheAnalytics(enable_prometheus=False) for _ in range(3)]
+        for i, analytics in enumerate(workers):
+            for _ in range(100):
+                analytics.record_cache_access(DataType.PRICE, True, float(i + 1), cache_level="l1")
+
+        merged = CacheAnalytics.merge_latency_snapshots(
+            [analytics.get_latency_snapshot() for analytics in workers]
+        )
+
+        assert merged["by_level"]["l1"]["count"] == 300
+        assert merged["by_level"]["l1"]["p50"] == pytest.approx(2.0, rel=0.005)
+        assert merged["by_level"]["l1"]["max"] == 3.0
+        assert merged["by_data_type"]["price"]["count"] == 300
+
+    def test_reset_clears_histograms(self):
+        analytics = CacheAnalytics(enable_prometheus=False)
+        analytics.record_cache_access(DataType.PRICE, True, 5.0, cache_level="l0")
+
+        analytics.reset_stats()
+
+        assert analytics.level_latency["l0"].count == 0
+        assert analytics.data_type_metrics[DataType.PRICE].latency.count == 0
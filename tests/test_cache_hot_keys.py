@@ -0,0 +1,232 @@
+"""
+Tests for cluster-wide hot key tracking
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache.hot_keys import HotKeyTracker
+from fiml.cache.warming import PredictiveCacheWarmer
+from fiml.core.models import DataType
+
+NOW = 1_700_000_000.0
+
+
+class FakeSortedSetRedis:
+    """Minimal redis.asyncio stand-in with pipelined sorted-set commands"""
+
+    def __init__(self):
+        self.zsets = {}
+        self.expiries = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def zincrby(self, name, amount, member):
+        self.ops.append(("zincrby", name, amount, member))
+
+    def zremrangebyrank(self, name, start, end):
+        self.ops.append(("zremrangebyrank", name, start, end))
+
+    def expire(self, name, seconds):
+        self.ops.append(("expire", name, seconds))
+
+    def zrevrange(self, name, start, end, withscores=False):
+        self.ops.append(("zrevrange", name, start, end))
+
+    async def execute(self):
+        results = []
+        for op, name, *args in self.ops:
+            zset = self.redis.zsets.setdefault(name, {})
+            if op == "zincrby":
+                amount, member = args
+                zset[member.encode()] = zset.get(member.encode(), 0.0) + amount
+                results.append(zset[member.encode()])
+            elif op == "zremrangebyrank":
+                # Only the "keep the top N" form used by the tracker
+                keep = -args[1] - 1
+                ranked = sorted(zset.items(), key=lambda item: item[1], reverse=True)
+                self.redis.zsets[name] = dict(ranked[:keep])
+                results.append(max(0, len(ranked) - keep))
+            elif op == "expire":
+                self.redis.expiries[name] = args[0]
+                results.append(True)
+            elif op == "zrevrange":
+                start, end = args
+                ranked = sorted(zset.items(), key=lambda item: item[1], reverse=True)
+                results.append(ranked[start : end + 1])
+        return results
+
+
+class TestHotKeyTracker:
+    """Test bounded local counting and Redis merging"""
+
+    @pytest.mark.asyncio
+    async def test_local_top_without_redis(self):
+        tracker = HotKeyTracker(capacity=10, bucket_seconds=60)
+        for _ in range(30):
+            tracker.record("price:AAPL:any")
+        for _ in range(10):
+            tracker.record("price:MSFT:any")
+        tracker.record("price:IBM:any")
+
+        top = await tracker.top(n=2, minutes=1, now=NOW)
+
+        assert [key for key, _ in top] == ["price:AAPL:any", "price:MSFT:any"]
+        assert top[0][1] == 30.0  # accesses per minute over a 1-minute window
+
+    @pytest.mark.asyncio
+    async def test_memory_stays_bounded(self):
+        tracker = HotKeyTracker(capacity=16, retention_minutes=5)
+        for _ in range(50):
+            tracker.record("price:HOT:any")
+
+        for minute in range(20):
+            for i in range(1000):
+                tracker.record(f"price:TAIL{minute}_{i}:any")
+            await tracker.flush(now=NOW + minute * 60)
+
+        assert len(tracker._pending) == 0
+        assert len(tracker._history) <= 6
+        assert all(len(counts) <= 16 for counts in tracker._history.values())
+
+    @pytest.mark.asyncio
+    async def test_heavy_hitter_survives_long_tail(self):
+        tracker = HotKeyTracker(capacity=8)
+        for i in range(2000):
+            tracker.record(f"price:TAIL{i}:any")
+            if i % 10 == 0:
+                tracker.record("price:HOT:any")
+
+        top = await tracker.top(n=1, minutes=1, now=NOW)
+
+        assert top[0][0] == "price:HOT:any"
+        assert len(tracker._pending) == 8
+        assert len(tracker._heap) == 8
+        assert tracker._pending_min()[0] == min(tracker._pending.values())
+
+    @pytest.mark.asyncio
+    async def test_workers_merge_through_redis(self):
+        redis = FakeSortedSetRedis()
+        worker_a = HotKeyTracker(capacity=4)
+        worker_b = HotKeyTracker(capacity=4)
+        worker_a._redis = redis
+        worker_b._redis = redis
+
+        for _ in range(5):
+            worker_a.record("price:AAPL:any")
+        for _ in range(7):
+            worker_b.record("price:AAPL:any")
+        for _ in range(9):
+            worker_b.record("price:TSLA:any")
+
+        await worker_a.flush(now=NOW)
+        await worker_b.flush(now=NOW)
+
+        # Worker A never saw TSLA but reads the cluster-wide view
+        top = await worker_a.top(n=2, minutes=1, now=NOW)
+        assert top == [("price:AAPL:any", 12.0), ("price:TSLA:any", 9.0)]
+        assert redis.expiries[f"fiml:hotkeys:{int(NOW // 60)}"] == 60 * 60 + 60
+
+    @pytest.mark.asyncio
+    async def test_redis_buckets_trimmed_to_capacity(self):
+        redis = FakeSortedSetRedis()
+        tracker = HotKeyTracker(capacity=3)
+        tracker._redis = redis
+
+        for flush in range(3):
+            for i in range(3):
+                for _ in range(i + 1):
+                    tracker.record(f"k{flush}_{i}")
+            await tracker.flush(now=NOW)
+
+        assert len(redis.zsets[f"fiml:hotkeys:{int(NOW // 60)}"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_window_excludes_old_buckets(self):
+        tracker = HotKeyTracker(capacity=4)
+        tracker.record("old")
+        await tracker.flush(now=NOW - 30 * 60)
+        tracker.record("new")
+        await tracker.flush(now=NOW)
+
+        assert [key for key, _ in await tracker.top(minutes=15, now=NOW)] == ["new"]
+        assert {key for key, _ in await tracker.top(minutes=60, now=NOW)} == {"old", "new"}
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_local(self):
+        tracker = HotKeyTracker(capacity=4)
+        tracker._redis = MagicMock()
+        tracker._redis.pipeline.side_effect = ConnectionError("down")
+
+        tracker.record("price:AAPL:any")
+        assert await tracker.flush(now=NOW) == 1
+        assert tracker.flush_errors == 1
+
+        top = await tracker.top(now=NOW)
+        assert top[0][0] == "price:AAPL:any"
+
+
+class TestWarmerClusterSymbols:
+    """Test PredictiveCacheWarmer use of cluster-wide hot keys"""
+
+    @pytest.mark.asyncio
+    async def test_cluster_hot_symbols_aggregate_by_symbol(self):
+        cache_manager = MagicMock()
+        cache_manager.l1.get_hot_keys = AsyncMock(
+            return_value=[
+                ("price:AAPL:any", 4.0),
+                ("fundamentals:AAPL:fmp", 1.0),
+                ("price:MSFT:yahoo", 3.0),
+                ("session:abc", 10.0),
+            ]
+        )
+        warmer = PredictiveCacheWarmer(cache_manager=cache_manager, provider_registry=MagicMock())
+
+        symbols = await warmer.get_cluster_hot_symbols()
+
+        assert symbols == [("AAPL", 5.0), ("MSFT", 3.0)]
+
+    @pytest.mark.asyncio
+    async def test_warming_cycle_includes_cluster_hot_symbols(self):
+        cache_manager = MagicMock()
+        cache_manager.l1.get_hot_keys = AsyncMock(return_value=[("price:NVDA:any", 2.0)])
+        provider = MagicMock()
+        provider.name = "yahoo_finance"
+        registry = MagicMock()
+        registry.get_providers_for_asset = AsyncMock(return_value=[provider])
+        warmer = PredictiveCacheWarmer(
+            cache_manager=cache_manager,
+            provider_registry=registry,
+            warming_schedule=list(range(24)),
+        )
+        warmer.warm_symbol = AsyncMock(return_value=True)
+
+        await warmer.run_warming_cycle()
+
+        warmer.warm_symbol.assert_awaited_once_with("NVDA", [DataType.PRICE])
+
+    def test_query_patterns_bounded(self):
+        warmer = PredictiveCacheWarmer(
+            cache_manager=MagicMock(), provider_registry=MagicMock(), max_tracked_symbols=100
+        )
+        for _ in range(5):
+            warmer.record_cache_access("AAPL", DataType.PRICE)
+        for i in range(1000):
+            warmer.record_cache_access(f"SYM{i}", DataType.PRICE)
+
+        assert len(warmer.query_patterns) <= 100
+        assert "AAPL" in warmer.query_patterns
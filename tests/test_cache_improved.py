@@ -271,14 +271,14 @@ class TestCacheManagerMetrics:
         manager._track_l1_latency(25.3)
         manager._track_l1_latency(18.7)
 
-        assert len(manager._l1_latencies) == 3
+        assert manager._l1_latency.count == 3
 
-        # Track many latencies (test limit)
+        # Track many latencies (fixed memory, every sample counted)
         for i in range(1500):
             manager._track_l1_latency(float(i))
 
-        # Should only keep last 1000
-        assert len(manager._l1_latencies) == 1000
+        assert manager._l1_latency.count == 1503
+        assert manager._l1_latency.max == 1499.0
 
     def test_percentile_calculation(self):
         """Test percentile calculation"""
@@ -0,0 +1,264 @@
+"""
+Tests for the L0 in-process near-cache
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.l0_cache import L0Cache
+from fiml.cache.manager import CacheManager
+from fiml.core.models import Asset, AssetType, DataType, Market
+
+
+@pytest.fixture
+def sample_asset():
+    """Create a sample asset for testing"""
+    return Asset(
+        symbol="AAPL",
+        name="Apple Inc.",
+        asset_type=AssetType.EQUITY,
+        market=Market.US,
+        exchange="NASDAQ",
+        currency="USD",
+    )
+
+
+@pytest.fixture
+def l0_manager():
+    """CacheManager with L0 enabled and a mocked Redis client"""
+    manager = CacheManager()
+    manager.l0 = L0Cache(max_entries=10, max_ttl_seconds=5)
+    manager.analytics = CacheAnalytics(enable_prometheus=False)
+    manager.l1._initialized = True
+
+    mock_redis = MagicMock()
+    mock_redis.get = AsyncMock(return_value='{"price": 150.0}')
+    mock_redis.setex = AsyncMock(return_value=True)
+    mock_redis.publish = AsyncMock(return_value=1)
+    manager.l1._redis = mock_redis
+    return manager
+
+
+class TestL0Cache:
+    """Test L0Cache storage semantics"""
+
+    def test_set_and_get(self):
+        cache = L0Cache()
+        assert cache.set("price:AAPL:any", {"price": 150.0}, ttl_seconds=10)
+        assert cache.get("price:AAPL:any") == {"price": 150.0}
+        assert cache.hits == 1
+
+    def test_miss(self):
+        cache = L0Cache()
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_returns_private_copy(self):
+        """Mutating a returned value must not affect the cached entry"""
+        cache = L0Cache()
+        cache.set("key", {"price": 1.0, "_source_provider": "mock"})
+
+        first = cache.get("key")
+        first.pop("_source_provider")
+
+        assert cache.get("key") == {"price": 1.0, "_source_provider": "mock"}
+
+    def test_ttl_capped_and_expires(self):
+        cache = L0Cache(max_ttl_seconds=5)
+
+        with patch("fiml.cache.l0_cache.time.monotonic", return_value=1000.0):
+            cache.set("key", {"v": 1}, ttl_seconds=3600)
+
+        with patch("fiml.cache.l0_cache.time.monotonic", return_value=1004.0):
+            assert cache.get("key") == {"v": 1}
+
+        with patch("fiml.cache.l0_cache.time.monotonic", return_value=1005.5):
+            assert cache.get("key") is None
+
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = L0Cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_none_not_cached(self):
+        cache = L0Cache()
+        assert cache.set("key", None) is False
+        assert len(cache) == 0
+
+    def test_invalidate_keys_and_pattern(self):
+        cache = L0Cache()
+        cache.set("price:AAPL:any", 1)
+        cache.set("fundamentals:AAPL:any", 2)
+        cache.set("price:MSFT:any", 3)
+
+        assert cache.invalidate(keys=["price:MSFT:any"]) == 1
+        assert cache.invalidate(pattern="*:AAPL:*") == 2
+        assert len(cache) == 0
+        assert cache.invalidations == 3
+
+    def test_remote_invalidation_message(self):
+        local = L0Cache()
+        remote = L0Cache()
+        local.set("price:AAPL:any", 1)
+
+        message = remote.build_invalidation_message(keys=["price:AAPL:any"])
+        assert local.handle_invalidation_message(message) == 1
+        assert local.get("price:AAPL:any") is None
+
+    def test_own_invalidation_message_ignored(self):
+        cache = L0Cache()
+        cache.set("price:AAPL:any", 1)
+
+        message = cache.build_invalidation_message(keys=["price:AAPL:any"])
+        assert cache.handle_invalidation_message(message) == 0
+        assert cache.get("price:AAPL:any") == 1
+
+    def test_malformed_invalidation_message(self):
+        cache = L0Cache()
+        assert cache.handle_invalidation_message("not json{") == 0
+
+    def test_stats(self):
+        cache = L0Cache(max_entries=5)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate_percent"] == 50.0
+        assert stats["listening"] is False
+
+
+class TestCacheManagerL0:
+    """Test CacheManager integration with the L0 tier"""
+
+    def test_disabled_by_default(self):
+        assert CacheManager().l0 is None
+
+    @pytest.mark.asyncio
+    async def test_read_through_populates_l0(self, l0_manager, sample_asset):
+        fetch_fn = AsyncMock()
+
+        first = await l0_manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+        )
+        second = await l0_manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+        )
+
+        assert first == second == {"price": 150.0}
+        # Second lookup never reached Redis
+        assert l0_manager.l1._redis.get.await_count == 1
+        assert l0_manager.analytics.l0_hits == 1
+        assert l0_manager.analytics.l0_misses == 1
+        fetch_fn.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_l0_miss_not_counted_as_overall_miss(self, l0_manager, sample_asset):
+        await l0_manager.get_price(sample_asset)
+
+        overall = l0_manager.analytics.get_overall_stats()
+        assert overall["total_hits"] == 1
+        assert overall["total_misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_set_publishes_invalidation(self, l0_manager, sample_asset):
+        await l0_manager.set_price(sample_asset, "yfinance", {"price": 151.0})
+
+        l0_manager.l1._redis.publish.assert_awaited_once()
+        channel, payload = l0_manager.l1._redis.publish.await_args.args
+        assert channel == l0_manager.l0.channel
+        assert json.loads(payload)["keys"] == ["price:AAPL:yfinance"]
+
+        # Local L0 holds the new value
+        assert l0_manager.l0.get("price:AAPL:yfinance") == {"price": 151.0}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_asset_clears_l0(self, l0_manager, sample_asset):
+        l0_manager.l0.set("price:AAPL:any", {"price": 150.0})
+
+        async def mock_scan_iter(*args, **kwargs):
+            yield "price:AAPL:any"
+
+        l0_manager.l1._redis.scan_iter = mock_scan_iter
+        l0_manager.l1._redis.delete = AsyncMock(return_value=1)
+
+        await l0_manager.invalidate_asset(sample_asset)
+
+        assert l0_manager.l0.get("price:AAPL:any") is None
+        payload = json.loads(l0_manager.l1._redis.publish.await_args.args[1])
+        assert payload["pattern"] == "*:AAPL:*"
+
+    @pytest.mark.asyncio
+    async def test_prices_batch_only_fetches_l0_misses(self, l0_manager, sample_asset):
+        btc = Asset(symbol="BTC", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+        l0_manager.l0.set("price:AAPL:any", {"price": 150.0})
+
+        mock_pipe = MagicMock()
+        mock_pipe.get = MagicMock()
+        mock_pipe.execute = AsyncMock(return_value=['{"price": 50000.0}'])
+        mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+        mock_pipe.__aexit__ = AsyncMock(return_value=None)
+        l0_manager.l1._redis.pipeline = MagicMock(return_value=mock_pipe)
+
+        results = await l0_manager.get_prices_batch([sample_asset, btc])
+
+        assert results == [{"price": 150.0}, {"price": 50000.0}]
+        mock_pipe.get.assert_called_once_with("price:BTC:any")
+        assert l0_manager._l1_hits == 1
+
+
+class TestL0RedisInvalidation:
+    """Cross-replica invalidation over a real Redis pub/sub channel"""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_across_instances(self):
+        import redis.asyncio as redis
+
+        from fiml.core.config import settings
+
+        client = redis.Redis(
+            host=settings.redis_host, port=settings.redis_port, decode_responses=True
+        )
+        try:
+            await client.ping()
+        except Exception as e:
+            pytest.skip(f"Redis not available: {e}")
+
+        replica_a = L0Cache(channel="fiml:test:l0-invalidate")
+        replica_b = L0Cache(channel="fiml:test:l0-invalidate")
+        replica_a.set("price:AAPL:any", {"price": 150.0})
+
+        await replica_a.start_invalidation_listener(client)
+        try:
+            await client.publish(
+                replica_b.channel,
+                replica_b.build_invalidation_message(keys=["price:AAPL:any"]),
+            )
+
+            for _ in range(50):
+                if replica_a.get("price:AAPL:any") is None:
+                    break
+                await asyncio.sleep(0.05)
+
+            assert replica_a.get("price:AAPL:any") is None
+            assert replica_a.invalidations == 1
+        finally:
+            await replica_a.stop_invalidation_listener()
+            await client.aclose()
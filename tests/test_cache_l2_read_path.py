@@ -0,0 +1,412 @@
+"""
+Tests for the L2 read path and the symbol/market -> asset_id index
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.asset_index import AssetIndex
+from fiml.cache.l2_cache import L2Cache
+from fiml.cache.manager import CacheManager
+from fiml.core.models import Asset, AssetType, Market
+
+AAPL = Asset(symbol="AAPL", asset_type=AssetType.EQUITY, market=Market.US)
+BTC = Asset(symbol="BTC", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+
+
+def make_l2() -> MagicMock:
+    """Mock L2Cache with the asset lookup surface"""
+    l2 = MagicMock()
+    l2._initialized = True
+    l2.get_asset_id = AsyncMock(return_value=None)
+    l2.create_asset = AsyncMock(return_value=None)
+    l2.load_asset_ids = AsyncMock(return_value=[])
+    l2.get_price = AsyncMock(return_value=None)
+    l2.set_price = AsyncMock(return_value=True)
+    l2.get_fundamentals = AsyncMock(return_value=None)
+    l2.set_fundamentals = AsyncMock(return_value=True)
+    l2.get_write_behind_stats = MagicMock(return_value={"enabled": False})
+    return l2
+
+
+def make_manager(l2: MagicMock) -> CacheManager:
+    """CacheManager wired to a mock L1 and the given mock L2"""
+    manager = CacheManager()
+    manager.l0 = None
+    manager.l1 = MagicMock()
+    manager.l1.build_key = lambda *parts: "fiml:" + ":".join(parts)
+    manager.l1.versioned_key = AsyncMock(side_effect=lambda key, *namespaces: key)
+    manager.l1.versioned_keys = AsyncMock(side_effect=lambda keys, namespaces: list(keys))
+    manager.l1.index_tags = AsyncMock()
+    manager.l1.get = AsyncMock(return_value=None)
+    manager.l1.get_many = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    manager.l1.set = AsyncMock(return_value=True)
+    manager.l1.set_many = AsyncMock(side_effect=lambda items, **kwargs: len(items))
+    manager.l1.get_stats = AsyncMock(return_value={})
+    manager.l2 = l2
+    manager.asset_index = AssetIndex(l2)
+    manager.analytics = CacheAnalytics(enable_prometheus=False)
+    return manager
+
+
+class TestAssetIndex:
+    """Test AssetIndex lookups"""
+
+    @pytest.mark.asyncio
+    async def test_preload_keeps_oldest_duplicate(self):
+        l2 = make_l2()
+        l2.load_asset_ids.return_value = [
+            (1, "AAPL", "US"),
+            (2, "BTC", "CRYPTO"),
+            (7, "AAPL", "US"),
+        ]
+        index = AssetIndex(l2)
+
+        assert await index.preload() == 3
+        assert await index.get_asset_id(AAPL) == 1
+        assert await index.get_asset_id(BTC) == 2
+        l2.get_asset_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lazy_lookup_is_cached(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 42
+        index = AssetIndex(l2)
+
+        assert await index.get_asset_id(AAPL) == 42
+        assert await index.get_asset_id(AAPL) == 42
+
+        l2.get_asset_id.assert_awaited_once_with("AAPL", "US")
+        assert index.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbol_negatively_cached(self):
+        l2 = make_l2()
+        index = AssetIndex(l2, negative_ttl_seconds=60)
+
+        assert await index.get_asset_id(AAPL) is None
+        assert await index.get_asset_id(AAPL) is None
+
+        l2.get_asset_id.assert_awaited_once()
+        assert index.negative_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_negative_entry_expires(self):
+        l2 = make_l2()
+        index = AssetIndex(l2, negative_ttl_seconds=0)
+
+        await index.get_asset_id(AAPL)
+        l2.get_asset_id.return_value = 5
+        assert await index.get_asset_id(AAPL) == 5
+
+    @pytest.mark.asyncio
+    async def test_negative_entries_are_capped(self):
+        l2 = make_l2()
+        index = AssetIndex(l2, negative_ttl_seconds=60, max_negative_entries=2)
+
+        for symbol in ["AAA", "BBB", "CCC"]:
+            await index.get_asset_id(Asset(symbol=symbol, asset_type=AssetType.EQUITY))
+
+        assert list(index._missing) == [("BBB", "US"), ("CCC", "US")]
+
+    @pytest.mark.asyncio
+    async def test_expired_negative_entries_pruned_on_insert(self):
+        l2 = make_l2()
+        index = AssetIndex(l2, negative_ttl_seconds=0)
+
+        for symbol in ["AAA", "BBB", "CCC"]:
+            await index.get_asset_id(Asset(symbol=symbol, asset_type=AssetType.EQUITY))
+
+        assert index.get_stats()["negative_entries"] <= 1
+
+    @pytest.mark.asyncio
+    async def test_create_bypasses_negative_entry(self):
+        l2 = make_l2()
+        l2.create_asset.return_value = 9
+        index = AssetIndex(l2)
+
+        assert await index.get_asset_id(BTC) is None
+        assert await index.get_asset_id(BTC, create=True) == 9
+        assert await index.get_asset_id(BTC) == 9
+
+        kwargs = l2.create_asset.await_args.kwargs
+        assert kwargs["symbol"] == "BTC"
+        assert kwargs["market"] == "CRYPTO"
+        assert kwargs["asset_type"] == "crypto"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_single_flight(self):
+        l2 = make_l2()
+
+        async def slow_lookup(symbol, market):
+            await asyncio.sleep(0.01)
+            return 3
+
+        l2.get_asset_id.side_effect = slow_lookup
+        index = AssetIndex(l2)
+
+        results = await asyncio.gather(*(index.get_asset_id(AAPL) for _ in range(10)))
+
+        assert results == [3] * 10
+        l2.get_asset_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 1
+        index = AssetIndex(l2)
+
+        await index.get_asset_id(AAPL)
+        index.invalidate(AAPL)
+        assert index.get_cached(AAPL) is None
+
+
+class TestCacheManagerL2ReadPath:
+    """Test L1 -> L2 fall-through and L1 backfill"""
+
+    @pytest.mark.asyncio
+    async def test_price_l2_hit_backfills_l1(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 1
+        l2.get_price.return_value = {
+            "time": datetime.now(UTC) - timedelta(seconds=2),
+            "provider": "yahoo",
+            "price": 190.0,
+            "change": 1.0,
+            "change_percent": 0.5,
+            "volume": 100,
+            "confidence": 0.9,
+            "metadata": {"price": 190.0, "symbol": "AAPL"},
+        }
+        manager = make_manager(l2)
+        manager._get_ttl = MagicMock(return_value=30)
+
+        result = await manager.get_price(AAPL)
+
+        assert result == {"price": 190.0, "symbol": "AAPL"}
+        l2.get_price.assert_awaited_once_with(1, None, time_range_minutes=1)
+
+        key, value, ttl = manager.l1.set.await_args.args
+        assert key == "fiml:price:AAPL:any"
+        assert value == result
+        assert 25 <= ttl <= 28
+
+        stats = await manager.get_stats()
+        assert stats["l2"]["hits"] == 1
+        assert stats["l2"]["asset_index"]["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_price_built_from_columns_without_metadata(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 1
+        written_at = datetime.now(UTC)
+        l2.get_price.return_value = {
+            "time": written_at,
+            "provider": "yahoo",
+            "price": 190.0,
+            "change": None,
+            "change_percent": None,
+            "volume": None,
+            "confidence": 1.0,
+            "metadata": None,
+        }
+        manager = make_manager(l2)
+
+        result = await manager.get_price(AAPL, provider="yahoo")
+
+        assert result["price"] == 190.0
+        assert result["provider"] == "yahoo"
+        assert result["timestamp"] == written_at.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_expired_l2_row_is_a_miss(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 1
+        l2.get_price.return_value = {
+            "time": datetime.now(UTC) - timedelta(seconds=120),
+            "price": 1.0,
+            "metadata": {"price": 1.0},
+        }
+        manager = make_manager(l2)
+        manager._get_ttl = MagicMock(return_value=60)
+
+        assert await manager.get_price(AAPL) is None
+        manager.l1.set.assert_not_awaited()
+        assert manager._l2_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_asset_skips_price_query(self):
+        l2 = make_l2()
+        manager = make_manager(l2)
+
+        assert await manager.get_price(AAPL) is None
+        l2.get_price.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_l2_not_initialized_returns_none(self):
+        l2 = make_l2()
+        l2._initialized = False
+        manager = make_manager(l2)
+
+        assert await manager.get_price(AAPL) is None
+        l2.get_asset_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fall_through_not_double_counted(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 1
+        l2.get_price.return_value = {
+            "time": datetime.now(UTC),
+            "price": 1.0,
+            "metadata": {"price": 1.0},
+        }
+        manager = make_manager(l2)
+
+        await manager.get_price(AAPL)
+
+        analytics = manager.analytics
+        assert analytics.l1_misses == 1
+        assert analytics.l2_hits == 1
+        assert analytics.total_hits == 1
+        assert analytics.total_misses == 0
+
+    @pytest.mark.asyncio
+    async def test_fundamentals_l2_hit_backfills_l1(self):
+        l2 = make_l2()
+        l2.get_asset_id.return_value = 1
+        l2.get_fundamentals.return_value = {
+            "data": {"pe_ratio": 30.0},
+            "timestamp": datetime.now(UTC) - timedelta(seconds=600),
+            "ttl_seconds": 3600,
+        }
+        manager = make_manager(l2)
+
+        assert await manager.get_fundamentals(AAPL) == {"pe_ratio": 30.0}
+        ttl = manager.l1.set.await_args.args[2]
+        assert 2990 <= ttl <= 3000
+
+    @pytest.mark.asyncio
+    async def test_batch_misses_fall_through(self):
+        l2 = make_l2()
+        l2.get_asset_id.side_effect = lambda symbol, market: 1 if symbol == "AAPL" else None
+        l2.get_price.return_value = {
+            "time": datetime.now(UTC),
+            "price": 190.0,
+            "metadata": {"price": 190.0},
+        }
+        manager = make_manager(l2)
+
+        results = await manager.get_prices_batch([AAPL, BTC])
+
+        assert results == [{"price": 190.0}, None]
+        manager.l1.set.assert_awaited_once()
+
+
+class TestCacheManagerL2WritePath:
+    """Test set_price/set_fundamentals persistence to L2"""
+
+    @pytest.mark.asyncio
+    async def test_set_price_writes_l2(self):
+        l2 = make_l2()
+        l2.create_asset.return_value = 4
+        manager = make_manager(l2)
+        price_data = {"price": 190.0, "change": 1.5, "volume": 1000.0, "symbol": "AAPL"}
+
+        assert await manager.set_price(AAPL, "yahoo", price_data)
+
+        args, kwargs = l2.set_price.await_args
+        assert args == (4, "yahoo", 190.0)
+        assert kwargs["volume"] == 1000
+        assert kwargs["metadata"] == price_data
+
+    @pytest.mark.asyncio
+    async def test_set_price_without_numeric_price_skips_l2(self):
+        l2 = make_l2()
+        manager = make_manager(l2)
+
+        assert await manager.set_price(AAPL, "yahoo", {"price": "n/a"})
+        l2.create_asset.assert_not_awaited()
+        l2.set_price.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_l2_write_failure_does_not_fail_set(self):
+        l2 = make_l2()
+        l2.create_asset.side_effect = RuntimeError("db down")
+        manager = make_manager(l2)
+
+        assert await manager.set_price(AAPL, "yahoo", {"price": 1.0})
+
+    @pytest.mark.asyncio
+    async def test_set_fundamentals_writes_l2(self):
+        l2 = make_l2()
+        l2.create_asset.return_value = 4
+        manager = make_manager(l2)
+        manager._get_ttl = MagicMock(return_value=3600)
+
+        await manager.set_fundamentals(AAPL, "fmp", {"pe_ratio": 30.0})
+
+        l2.set_fundamentals.assert_awaited_once_with(4, "fmp", {"pe_ratio": 30.0}, 3600)
+
+    @pytest.mark.asyncio
+    async def test_set_prices_batch_writes_l2(self):
+        l2 = make_l2()
+        l2.create_asset.side_effect = [1, 2]
+        manager = make_manager(l2)
+
+        await manager.set_prices_batch(
+            [(AAPL, "yahoo", {"price": 1.0}), (BTC, "ccxt", {"price": 2.0})]
+        )
+
+        assert l2.set_price.await_count == 2
+
+
+class TestL2ReadPathIntegration:
+    """Round trip through the test PostgreSQL database"""
+
+    @pytest.mark.asyncio
+    async def test_price_survives_l1_loss(self):
+        l2 = L2Cache()
+        try:
+            await l2.initialize()
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        symbol = f"T{uuid.uuid4().hex[:8].upper()}"
+        asset = Asset(symbol=symbol, asset_type=AssetType.EQUITY, market=Market.US)
+        manager = make_manager(l2)
+        try:
+            await manager.set_price(asset, "test_provider", {"price": 12.5, "symbol": symbol})
+
+            # Simulate a Redis restart and a fresh process
+            manager.asset_index = AssetIndex(l2)
+            assert await manager.asset_index.preload() >= 1
+
+            result = await manager.get_price(asset)
+            assert result == {"price": 12.5, "symbol": symbol}
+            assert manager.l1.set.await_args.args[0] == f"fiml:price:{symbol}:any"
+
+            # A second create resolves to the same row
+            assert await l2.create_asset(symbol, "US", "equity") == manager.asset_index.get_cached(
+                asset
+            )
+        finally:
+            from sqlalchemy import text
+
+            async with l2._session_maker() as session:
+                await session.execute(
+                    text(
+                        "DELETE FROM price_cache WHERE asset_id IN "
+                        "(SELECT id FROM assets WHERE symbol = :symbol)"
+                    ),
+                    {"symbol": symbol},
+                )
+                await session.execute(
+                    text("DELETE FROM assets WHERE symbol = :symbol"), {"symbol": symbol}
+                )
+                await session.commit()
+            await l2.shutdown()
@@ -0,0 +1,376 @@
+"""
+Tests for negative caching of symbols no provider can serve
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.entry import CacheEntry, NegativeEntry
+from fiml.cache.l1_cache import l1_cache
+from fiml.cache.manager import CacheManager
+from fiml.core.exceptions import (
+    NoProviderAvailableError,
+    ProviderError,
+    ProviderSymbolNotFoundError,
+    SymbolNotFoundError,
+)
+from fiml.core.models import ArbitrationPlan, Asset, AssetType, DataType, Market
+from fiml.providers.fmp import FMPProvider
+from fiml.providers.registry import ProviderRegistry
+from fiml.providers.tiingo import TiingoProvider
+from fiml.websocket.manager import Subscription, WebSocketManager
+from fiml.websocket.models import StreamType
+
+
+class FakeRedis:
+    """Minimal redis.asyncio stand-in keeping values in a dict (TTLs ignored)"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.keys = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.keys.append(key)
+
+    async def execute(self):
+        return [self.redis.data.get(key) for key in self.keys]
+
+
+class FakeHTTPResponse:
+    """aiohttp response stand-in usable as `async with session.get(...)`"""
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self.body
+
+    async def text(self):
+        return json.dumps(self.body)
+
+
+def http_session(status, body):
+    session = MagicMock()
+    session.get = MagicMock(return_value=FakeHTTPResponse(status, body))
+    return session
+
+
+@pytest.fixture(autouse=True)
+def restore_l1():
+    """make_manager swaps the shared L1 client; put the original back afterwards"""
+    saved = (l1_cache._redis, l1_cache._initialized)
+    yield
+    l1_cache._redis, l1_cache._initialized = saved
+
+
+def make_manager():
+    manager = CacheManager()
+    manager.analytics = CacheAnalytics(enable_prometheus=False)
+    manager.l1._initialized = True
+    manager.l1._redis = FakeRedis()
+    return manager
+
+
+def make_asset(symbol="AAPLL"):
+    return Asset(symbol=symbol, asset_type=AssetType.EQUITY, market=Market.US)
+
+
+def stored(manager, key):
+    raw = manager.l1._redis.data.get(key)
+    return json.loads(raw) if raw is not None else None
+
+
+class TestNegativeEntry:
+    """Test the tombstone envelope"""
+
+    def test_round_trip(self):
+        payload = json.loads(json.dumps(NegativeEntry("unknown", cached_at=1000.0).to_payload()))
+        entry = NegativeEntry.from_payload(payload)
+
+        assert entry.reason == "unknown"
+        assert entry.cached_at == 1000.0
+
+    def test_distinguishable_from_data(self):
+        tombstone = NegativeEntry("unknown").to_payload()
+        envelope = CacheEntry({"price": 1.0}, soft_ttl=10, hard_ttl=50).to_payload()
+
+        assert CacheEntry.from_payload(tombstone) is None
+        assert CacheEntry.unwrap(tombstone) is None
+        assert NegativeEntry.from_payload(envelope) is None
+        assert NegativeEntry.from_payload({"price": 1.0}) is None
+
+
+class TestReadThroughNegativeCaching:
+    """Test tombstones written and honoured by get_with_read_through"""
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbol_is_fetched_once(self):
+        manager = make_manager()
+        fetch_fn = AsyncMock(side_effect=SymbolNotFoundError("No provider has data"))
+
+        for _ in range(3):
+            result = await manager.get_with_read_through(
+                "price:AAPLL:any", DataType.PRICE, fetch_fn, asset=make_asset()
+            )
+            assert result is None
+
+        assert fetch_fn.await_count == 1
+        assert NegativeEntry.is_negative(stored(manager, "price:AAPLL:any"))
+        assert manager.analytics.negative_writes == 1
+        assert manager.analytics.negative_hits == 2
+
+    @pytest.mark.asyncio
+    async def test_successful_write_replaces_tombstone(self):
+        manager = make_manager()
+        asset = make_asset()
+        await manager.set_negative(asset, DataType.PRICE, "unknown")
+
+        await manager.l1.set("price:AAPLL:any", {"price": 10.0}, 60)
+        fetch_fn = AsyncMock(return_value={"price": 11.0})
+        result = await manager.get_with_read_through(
+            "price:AAPLL:any", DataType.PRICE, fetch_fn, asset=asset
+        )
+
+        assert result == {"price": 10.0}
+        fetch_fn.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [ProviderError("timeout"), NoProviderAvailableError("All providers failed")],
+    )
+    async def test_other_errors_are_not_cached(self, error):
+        manager = make_manager()
+        fetch_fn = AsyncMock(side_effect=error)
+
+        await manager.get_with_read_through(
+            "price:AAPLL:any", DataType.PRICE, fetch_fn, asset=make_asset()
+        )
+
+        assert stored(manager, "price:AAPLL:any") is None
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        manager = make_manager()
+        fetch_fn = AsyncMock(side_effect=SymbolNotFoundError("No provider has data"))
+
+        with patch("fiml.core.config.settings.cache_negative_enabled", False):
+            for _ in range(2):
+                await manager.get_with_read_through(
+                    "price:AAPLL:any", DataType.PRICE, fetch_fn, asset=make_asset()
+                )
+
+        assert fetch_fn.await_count == 2
+        assert stored(manager, "price:AAPLL:any") is None
+
+
+class TestNegativeLookups:
+    """Test tombstone reads and writes outside read-through"""
+
+    @pytest.mark.asyncio
+    async def test_tombstone_never_replaces_data(self):
+        manager = make_manager()
+        await manager.l1.set("price:AAPL:any", {"price": 150.0}, 60)
+
+        assert not await manager.set_negative(make_asset("AAPL"), DataType.PRICE, "unknown")
+        assert stored(manager, "price:AAPL:any") == {"price": 150.0}
+
+    @pytest.mark.asyncio
+    async def test_get_negative_many(self):
+        manager = make_manager()
+        await manager.l1.set("price:AAPL:any", {"price": 150.0}, 60)
+        await manager.set_negative(make_asset("AAPLL"), DataType.PRICE, "unknown")
+        assets = [make_asset("AAPL"), make_asset("AAPLL"), make_asset("MSFT")]
+
+        results = await manager.get_negative_many(assets, DataType.PRICE)
+
+        assert [r is not None for r in results] == [False, True, False]
+        assert results[1].reason == "unknown"
+        # Tombstones are per data type
+        assert await manager.get_negative_many(assets, DataType.OHLCV) == [None, None, None]
+
+    @pytest.mark.asyncio
+    async def test_get_price_reports_no_data(self):
+        manager = make_manager()
+        await manager.set_negative(make_asset(), DataType.PRICE, "unknown")
+
+        with patch("fiml.core.config.settings.cache_l2_tier_enabled", False):
+            assert await manager.get_price(make_asset()) is None
+
+    @pytest.mark.asyncio
+    async def test_lookup_without_cache_fetches_everything(self):
+        manager = CacheManager()
+        manager.l1._initialized = False
+
+        results = await manager.get_negative_many([make_asset()], DataType.PRICE)
+
+        assert results == [None]
+
+
+class TestProviderNotFound:
+    """Test that real providers' not-found answers lead to a tombstone"""
+
+    def make_engine(self, *providers):
+        registry = ProviderRegistry()
+        registry.providers = {provider.name: provider for provider in providers}
+        engine = DataArbitrationEngine()
+        engine.provider_registry = registry
+        return engine
+
+    def plan_for(self, *providers):
+        return ArbitrationPlan(
+            primary_provider=providers[0].name,
+            fallback_providers=[p.name for p in providers[1:]],
+            estimated_latency_ms=100,
+        )
+
+    def tiingo(self, status, body):
+        provider = TiingoProvider(api_key="test_key")
+        provider._session = http_session(status, body)
+        provider._is_initialized = True
+        return provider
+
+    def fmp(self, status, body):
+        provider = FMPProvider(api_key="test_key")
+        provider._session = http_session(status, body)
+        provider._is_initialized = True
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_http_404_and_empty_quote_raise_provider_not_found(self):
+        with pytest.raises(ProviderSymbolNotFoundError):
+            await self.tiingo(404, {"detail": "Not found."}).fetch_price(make_asset())
+        with pytest.raises(ProviderSymbolNotFoundError):
+            await self.fmp(200, []).fetch_price(make_asset())
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbol_is_tombstoned(self):
+        tiingo = self.tiingo(404, {"detail": "Not found."})
+        fmp = self.fmp(200, [])
+        engine = self.make_engine(tiingo, fmp)
+        manager = make_manager()
+
+        async def fetch_fn():
+            return await engine.execute_with_fallback(
+                self.plan_for(tiingo, fmp), make_asset(), DataType.PRICE
+            )
+
+        for _ in range(2):
+            result = await manager.get_with_read_through(
+                "price:AAPLL:any", DataType.PRICE, fetch_fn, asset=make_asset()
+            )
+            assert result is None
+
+        assert NegativeEntry.is_negative(stored(manager, "price:AAPLL:any"))
+        assert tiingo._session.get.call_count == 1
+        assert fmp._session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_outage_is_not_not_found(self):
+        tiingo = self.tiingo(404, {"detail": "Not found."})
+        fmp = self.fmp(500, {"error": "Internal Server Error"})
+        engine = self.make_engine(tiingo, fmp)
+
+        with pytest.raises(NoProviderAvailableError) as exc_info:
+            await engine.execute_with_fallback(
+                self.plan_for(tiingo, fmp), make_asset(), DataType.PRICE
+            )
+        assert not isinstance(exc_info.value, SymbolNotFoundError)
+
+
+class TestStreamNegativeCaching:
+    """Test tombstones in the WebSocket price stream"""
+
+    @pytest.mark.asyncio
+    async def test_tombstoned_symbols_are_skipped(self):
+        websocket = MagicMock()
+        websocket.send_json = AsyncMock()
+        subscription = Subscription(
+            subscription_id="sub",
+            websocket=websocket,
+            stream_type=StreamType.PRICE,
+            symbols=["AAPL", "AAPLL", "XXXX", "DOWN"],
+            asset_type=AssetType.EQUITY,
+            market=Market.US,
+            interval_ms=1000,
+            data_type=DataType.PRICE,
+            params={},
+        )
+
+        async def arbitrate_request(asset, data_type, user_region):
+            if asset.symbol == "XXXX":
+                raise SymbolNotFoundError("No provider has data for XXXX")
+            if asset.symbol == "DOWN":
+                raise NoProviderAvailableError("All providers failed for DOWN")
+            return MagicMock()
+
+        cache = MagicMock()
+        cache.get_negative_many = AsyncMock(
+            return_value=[None, NegativeEntry("unknown"), None, None]
+        )
+        cache.set_negative = AsyncMock(return_value=True)
+        engine = MagicMock()
+        engine.arbitrate_request = AsyncMock(side_effect=arbitrate_request)
+        engine.execute_with_fallback = AsyncMock(
+            return_value=MagicMock(data={"price": 150.0}, provider="mock", confidence=0.9)
+        )
+
+        with (
+            patch("fiml.websocket.manager.cache_manager", cache),
+            patch("fiml.websocket.manager.arbitration_engine", engine),
+            patch(
+                "fiml.websocket.manager.asyncio.sleep",
+                AsyncMock(side_effect=asyncio.CancelledError),
+            ),
+        ):
+            await WebSocketManager()._stream_prices(subscription)
+
+        requested = [
+            call.kwargs["asset"].symbol for call in engine.arbitrate_request.call_args_list
+        ]
+        assert requested == ["AAPL", "XXXX", "DOWN"]
+        cache.set_negative.assert_awaited_once()
+        assert cache.set_negative.call_args.args[0].symbol == "XXXX"
+        websocket.send_json.assert_awaited_once()
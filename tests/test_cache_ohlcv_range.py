@@ -0,0 +1,376 @@
+"""
+Tests for the gap-aware OHLCV range cache
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache.asset_index import AssetIndex
+from fiml.cache.l2_cache import L2Cache
+from fiml.cache.manager import CacheManager
+from fiml.cache.ohlcv_range import (
+    OHLCVRangeCache,
+    merge_spans,
+    missing_spans,
+    normalize_candles,
+    parse_candle_time,
+)
+from fiml.cache.trading_calendar import calendar_for
+from fiml.core.models import Asset, AssetType, Market
+
+BTC = Asset(symbol="BTC", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+AAPL = Asset(symbol="AAPL", asset_type=AssetType.EQUITY, market=Market.US)
+NOW = datetime(2024, 3, 1, 12, 30, tzinfo=UTC)
+HOUR = timedelta(hours=1)
+
+
+def t(hours: float) -> datetime:
+    """Time relative to NOW"""
+    return NOW + timedelta(hours=hours)
+
+
+class FakeOHLCVStore:
+    """In-memory stand-in for the L2Cache OHLCV range methods"""
+
+    def __init__(self) -> None:
+        self.candles = {}
+        self.coverage = []
+        self.store_ok = True
+        self.get_asset_id = AsyncMock(return_value=1)
+        self.create_asset = AsyncMock(return_value=1)
+
+    async def get_ohlcv_coverage(self, asset_id, timeframe):
+        return list(self.coverage)
+
+    async def store_ohlcv_range(self, asset_id, provider, timeframe, candles, start, end):
+        if not self.store_ok:
+            return False
+        for candle in candles:
+            self.candles[candle["time"]] = candle
+        self.coverage = merge_spans([*self.coverage, (start, end)])
+        return True
+
+    async def get_ohlcv_range(self, asset_id, timeframe, start, end):
+        return [self.candles[k] for k in sorted(self.candles) if start <= k < end]
+
+
+def make_fetch(now: datetime, step: timedelta = HOUR):
+    """Provider fetch returning the latest `limit` hourly candles up to now"""
+    calls = []
+
+    async def fetch(limit):
+        calls.append(limit)
+        latest = now.replace(minute=0, second=0, microsecond=0)
+        candles = [
+            {
+                "timestamp": int((latest - step * i).timestamp() * 1000),
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": 1.5,
+                "volume": 10.0,
+            }
+            for i in reversed(range(limit))
+        ]
+        return "ccxt", candles
+
+    return fetch, calls
+
+
+def make_cache(store: FakeOHLCVStore) -> OHLCVRangeCache:
+    return OHLCVRangeCache(store, AssetIndex(store), tail_tolerance_seconds=60)
+
+
+class TestSpanHelpers:
+    """Test span arithmetic and candle normalization"""
+
+    def test_missing_spans(self):
+        covered = [(t(-10), t(-6)), (t(-4), t(-2))]
+
+        assert missing_spans((t(-12), t(0)), covered) == [
+            (t(-12), t(-10)),
+            (t(-6), t(-4)),
+            (t(-2), t(0)),
+        ]
+        assert missing_spans((t(-9), t(-7)), covered) == []
+        assert missing_spans((t(-12), t(-11)), []) == [(t(-12), t(-11))]
+
+    def test_merge_spans_joins_touching(self):
+        assert merge_spans([(t(-2), t(0)), (t(-5), t(-2)), (t(-9), t(-8))]) == [
+            (t(-9), t(-8)),
+            (t(-5), t(0)),
+        ]
+
+    def test_parse_candle_time_formats(self):
+        expected = datetime(2024, 3, 1, tzinfo=UTC)
+
+        assert parse_candle_time(int(expected.timestamp() * 1000)) == expected
+        assert parse_candle_time(int(expected.timestamp())) == expected
+        assert parse_candle_time("2024-03-01T00:00:00Z") == expected
+        assert parse_candle_time("2024-03-01") == expected
+        assert parse_candle_time("not a date") is None
+        assert parse_candle_time(None) is None
+
+    def test_normalize_drops_bad_rows_and_sorts(self):
+        rows = normalize_candles(
+            [
+                {"timestamp": "2024-03-02", "open": 2, "high": 2, "low": 2, "close": 2},
+                {"timestamp": "2024-03-01", "open": 1, "high": 1, "low": 1, "close": 1},
+                {"timestamp": "2024-03-01", "open": 3, "high": 3, "low": 3, "close": 3},
+                {"timestamp": "bad", "open": 1, "high": 1, "low": 1, "close": 1},
+                {"timestamp": "2024-03-03", "open": "x", "high": 1, "low": 1, "close": 1},
+            ]
+        )
+
+        assert [r["open"] for r in rows] == [3.0, 2.0]
+        assert rows[0]["volume"] is None
+
+
+class TestOHLCVRangeCache:
+    """Test covered/missing span handling"""
+
+    @pytest.mark.asyncio
+    async def test_cold_then_warm(self):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+        fetch, calls = make_fetch(NOW)
+
+        first = await cache.get_candles(BTC, "1h", 24, fetch, now=NOW)
+        second = await cache.get_candles(BTC, "1h", 24, fetch, now=NOW + timedelta(seconds=30))
+
+        assert calls == [25]
+        assert first == second
+        assert len(first) == 24
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_tail_tolerance_scales_with_timeframe(self):
+        cache = make_cache(FakeOHLCVStore())
+        start = NOW - timedelta(days=30)
+        recent = [(start, NOW - timedelta(minutes=10))]
+        old = [(start, NOW - 2 * HOUR)]
+
+        assert cache._uncovered(recent, start, NOW, 86_400) == []
+        assert cache._uncovered(recent, start, NOW, 60) == [(recent[0][1], NOW)]
+        assert cache._uncovered(old, start, NOW, 86_400) == [(old[0][1], NOW)]
+
+    @pytest.mark.asyncio
+    async def test_only_tail_gap_fetched(self):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+        fetch, calls = make_fetch(NOW)
+        await cache.get_candles(BTC, "1h", 24, fetch, now=NOW)
+
+        later = NOW + 3 * HOUR
+        fetch_later, later_calls = make_fetch(later)
+        candles = await cache.get_candles(BTC, "1h", 24, fetch_later, now=later)
+
+        assert later_calls == [4]
+        assert cache.partial_hits == 1
+        times = [c["timestamp"] for c in candles]
+        assert times == sorted(times)
+        assert all(b - a == 3_600_000 for a, b in zip(times, times[1:], strict=False))
+
+    @pytest.mark.asyncio
+    async def test_larger_request_reaches_back(self):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+        fetch, calls = make_fetch(NOW)
+
+        await cache.get_candles(BTC, "1h", 10, fetch, now=NOW)
+        candles = await cache.get_candles(BTC, "1h", 40, fetch, now=NOW)
+
+        assert calls == [11, 41]
+        assert len(candles) == 40
+
+    @pytest.mark.asyncio
+    async def test_short_answer_covers_requested_start(self):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+
+        async def sparse_fetch(limit):
+            # Market closed for most of the window
+            return "yahoo", [
+                {"timestamp": t(-1).isoformat(), "open": 1, "high": 1, "low": 1, "close": 1}
+            ]
+
+        await cache.get_candles(BTC, "1h", 24, sparse_fetch, now=NOW)
+
+        assert store.coverage == [(t(-24), NOW)]
+
+    @pytest.mark.asyncio
+    async def test_store_failure_serves_fetched_candles(self):
+        store = FakeOHLCVStore()
+        store.store_ok = False
+        cache = make_cache(store)
+        fetch, _ = make_fetch(NOW)
+
+        candles = await cache.get_candles(BTC, "1h", 5, fetch, now=NOW)
+
+        assert len(candles) == 6
+        assert store.coverage == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gap_fetch_single_flight(self):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+        fetch, calls = make_fetch(NOW)
+
+        async def slow_fetch(limit):
+            await asyncio.sleep(0.01)
+            return await fetch(limit)
+
+        results = await asyncio.gather(
+            *(cache.get_candles(BTC, "1h", 24, slow_fetch, now=NOW) for _ in range(5))
+        )
+
+        assert len(calls) == 1
+        assert all(r == results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_unsupported_timeframe(self):
+        cache = make_cache(FakeOHLCVStore())
+
+        with pytest.raises(ValueError):
+            await cache.get_candles(BTC, "3d", 10, AsyncMock(), now=NOW)
+
+
+def make_session_fetch(now: datetime, timeframe: str):
+    """Provider fetch returning the latest `limit` AAPL candles (1m or 1d) up to now"""
+    calendar = calendar_for(AAPL)
+    calls = []
+
+    async def fetch(limit):
+        calls.append(limit)
+        times = []
+        sessions = calendar.sessions(now.year - 1) + calendar.sessions(now.year)
+        for open_, close in reversed(sessions):
+            if timeframe == "1d":
+                day = open_.date()
+                if open_ <= now:
+                    times.append(datetime(day.year, day.month, day.day, tzinfo=UTC))
+            else:
+                minute = min(close, now) - timedelta(minutes=1)
+                while minute >= open_ and minute < now:
+                    times.append(minute)
+                    minute -= timedelta(minutes=1)
+                    if len(times) == limit:
+                        break
+            if len(times) >= limit:
+                break
+        candle = {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0}
+        return "yahoo", [
+            {**candle, "timestamp": int(ts.timestamp() * 1000)} for ts in reversed(times[:limit])
+        ]
+
+    return fetch, calls
+
+
+class TestTradingTimeWindow:
+    """Test that equity windows count trading time, not calendar time"""
+
+    # Saturday, and Wednesday night after the close (New York)
+    SATURDAY = datetime(2024, 3, 9, 17, 0, tzinfo=UTC)
+    OVERNIGHT = datetime(2024, 3, 7, 3, 0, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("now", [SATURDAY, OVERNIGHT])
+    @pytest.mark.parametrize("timeframe", ["1m", "1d"])
+    async def test_closed_market_returns_limit_candles(self, now, timeframe):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+        fetch, calls = make_session_fetch(now, timeframe)
+
+        candles = await cache.get_candles(AAPL, timeframe, 100, fetch, now=now)
+        provider = (await fetch(100))[1]
+
+        assert len(candles) == 100
+        assert candles == provider
+        assert calls[0] <= 102
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("timeframe", ["1m", "1d"])
+    async def test_closed_market_is_not_a_gap(self, timeframe):
+        store = FakeOHLCVStore()
+        cache = make_cache(store)
+        fetch, calls = make_session_fetch(self.SATURDAY, timeframe)
+        await cache.get_candles(AAPL, timeframe, 100, fetch, now=self.SATURDAY)
+
+        # Sunday: still no trading since the last fetch
+        sunday = self.SATURDAY + timedelta(days=1)
+        candles = await cache.get_candles(AAPL, timeframe, 100, fetch, now=sunday)
+
+        assert len(calls) == 1
+        assert len(candles) == 100
+        assert cache.get_stats()["hits"] == 1
+
+
+class TestCacheManagerOHLCV:
+    """Test CacheManager.get_ohlcv routing"""
+
+    @pytest.mark.asyncio
+    async def test_l2_unavailable_fetches_directly(self):
+        manager = CacheManager()
+        manager.l2 = MagicMock()
+        manager.l2._initialized = False
+        fetch = AsyncMock(return_value=("ccxt", [{"timestamp": 1}]))
+
+        assert await manager.get_ohlcv(BTC, "1h", fetch, limit=5) == [{"timestamp": 1}]
+        fetch.assert_awaited_once_with(5)
+
+    @pytest.mark.asyncio
+    async def test_unknown_timeframe_fetches_directly(self):
+        manager = CacheManager()
+        manager.l2 = MagicMock()
+        manager.l2._initialized = True
+        manager.ohlcv = make_cache(FakeOHLCVStore())
+        fetch = AsyncMock(return_value=("ccxt", []))
+
+        assert await manager.get_ohlcv(BTC, "3d", fetch, limit=5) == []
+        fetch.assert_awaited_once_with(5)
+
+
+class TestOHLCVRangeIntegration:
+    """L2 OHLCV range storage against the test PostgreSQL database"""
+
+    @pytest.mark.asyncio
+    async def test_store_merges_coverage_and_dedupes(self):
+        l2 = L2Cache()
+        try:
+            await l2.initialize()
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        symbol = f"T{uuid.uuid4().hex[:8].upper()}"
+        asset_id = await l2.create_asset(symbol, "CRYPTO", "crypto")
+        try:
+            candle = {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.4}
+            first = [{**candle, "time": t(-3)}, {**candle, "time": t(-2)}]
+            second = [{**candle, "time": t(-2), "close": 9.0}, {**candle, "time": t(-1)}]
+
+            assert await l2.store_ohlcv_range(asset_id, "a", "1h", first, t(-3), t(-2))
+            assert await l2.store_ohlcv_range(asset_id, "b", "1h", second, t(-2), t(0))
+
+            assert await l2.get_ohlcv_coverage(asset_id, "1h") == [(t(-3), t(0))]
+
+            rows = await l2.get_ohlcv_range(asset_id, "1h", t(-3), t(0))
+            assert [r["time"] for r in rows] == [t(-3), t(-2), t(-1)]
+            assert rows[0]["volume"] == 10
+        finally:
+            from sqlalchemy import text
+
+            async with l2._session_maker() as session:
+                for table in ("ohlcv_cache", "ohlcv_coverage"):
+                    await session.execute(
+                        text(f"DELETE FROM {table} WHERE asset_id = :asset_id"),
+                        {"asset_id": asset_id},
+                    )
+                await session.execute(
+                    text("DELETE FROM assets WHERE id = :asset_id"), {"asset_id": asset_id}
+                )
+                await session.commit()
+            await l2.shutdown()
@@ -0,0 +1,339 @@
+"""
+Tests for OHLCV timeframe resampling
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiml.cache.asset_index import AssetIndex
+from fiml.cache.l2_cache import L2Cache
+from fiml.cache.ohlcv_range import OHLCVRangeCache, merge_spans
+from fiml.cache.resample import (
+    MARKET_SESSIONS,
+    UTC_SESSION,
+    can_resample,
+    resample_candles,
+    session_for,
+)
+from fiml.core.models import Asset, AssetType, Market
+
+US = MARKET_SESSIONS[Market.US]
+BTC = Asset(symbol="BTC", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+AAPL = Asset(symbol="AAPL", asset_type=AssetType.EQUITY, market=Market.US)
+
+
+def ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def series(start: datetime, count: int, step: timedelta) -> list:
+    """Candles with open=i, high=i+1, low=i-1, close=i+0.5, volume=1"""
+    return [
+        {
+            "timestamp": ms(start + step * i),
+            "open": float(i),
+            "high": i + 1.0,
+            "low": i - 1.0,
+            "close": i + 0.5,
+            "volume": 1.0,
+        }
+        for i in range(count)
+    ]
+
+
+class TestResampleCandles:
+    """Test aggregation and bucket alignment"""
+
+    def test_aggregates_ohlcv(self):
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        out = resample_candles(series(start, 10, timedelta(minutes=1)), "1m", "5m")
+
+        assert len(out) == 2
+        assert out[0] == {
+            "timestamp": ms(start),
+            "open": 0.0,
+            "high": 5.0,
+            "low": -1.0,
+            "close": 4.5,
+            "volume": 5.0,
+            "is_closed": True,
+        }
+        assert out[1]["timestamp"] == ms(start + timedelta(minutes=5))
+        assert out[1]["is_closed"] is True
+
+    def test_forming_bucket_not_closed(self):
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        out = resample_candles(series(start, 7, timedelta(minutes=1)), "1m", "5m")
+
+        assert [c["is_closed"] for c in out] == [True, False]
+        assert out[1]["volume"] == 2.0
+
+    def test_unsorted_mixed_timestamps(self):
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        candles = series(start, 4, timedelta(minutes=1))
+        candles[1]["timestamp"] = (start + timedelta(minutes=1)).isoformat()
+        candles.reverse()
+
+        out = resample_candles(candles, "1m", "5m")
+
+        assert len(out) == 1
+        assert out[0]["open"] == 0.0
+        assert out[0]["close"] == 3.5
+
+    def test_missing_volume(self):
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        candles = series(start, 2, timedelta(minutes=1))
+        for candle in candles:
+            candle["volume"] = None
+
+        assert resample_candles(candles, "1m", "5m")[0]["volume"] is None
+
+    def test_us_equity_hours_anchor_at_open(self):
+        # 09:30 New York (EST) is 14:30 UTC
+        open_time = datetime(2024, 3, 8, 14, 30, tzinfo=UTC)
+        out = resample_candles(series(open_time, 390, timedelta(minutes=1)), "1m", "1h", US)
+
+        assert len(out) == 7
+        assert [c["timestamp"] for c in out[:2]] == [
+            ms(open_time),
+            ms(open_time + timedelta(hours=1)),
+        ]
+
+    def test_daily_buckets_follow_dst(self):
+        # US clocks spring forward on 2024-03-10
+        start = datetime(2024, 3, 9, 5, tzinfo=UTC)
+        out = resample_candles(series(start, 48, timedelta(hours=1)), "1h", "1d", US)
+
+        assert [c["timestamp"] for c in out] == [
+            ms(datetime(2024, 3, 9, 5, tzinfo=UTC)),
+            ms(datetime(2024, 3, 10, 5, tzinfo=UTC)),
+            ms(datetime(2024, 3, 11, 4, tzinfo=UTC)),
+        ]
+        assert [c["volume"] for c in out] == [24.0, 23.0, 1.0]
+        assert [c["is_closed"] for c in out] == [True, True, False]
+
+    def test_weekly_buckets_start_monday(self):
+        # 2024-03-06 is a Wednesday
+        start = datetime(2024, 3, 6, tzinfo=UTC)
+        out = resample_candles(series(start, 10, timedelta(days=1)), "1d", "1w")
+
+        assert [c["timestamp"] for c in out] == [
+            ms(datetime(2024, 3, 4, tzinfo=UTC)),
+            ms(datetime(2024, 3, 11, tzinfo=UTC)),
+        ]
+        assert [c["volume"] for c in out] == [5.0, 5.0]
+
+    def test_invalid_target(self):
+        assert can_resample("1m", "1h")
+        assert not can_resample("1h", "1m")
+        assert not can_resample("1h", "1h")
+        assert not can_resample("1m", "3d")
+
+        with pytest.raises(ValueError):
+            resample_candles([], "1h", "1m")
+
+    def test_session_for_asset(self):
+        assert session_for(AAPL) == US
+        assert session_for(BTC) == UTC_SESSION
+        assert UTC_SESSION.is_utc and not US.is_utc
+
+
+class FakeTimeframeStore:
+    """In-memory L2 with per-timeframe candles and coverage"""
+
+    def __init__(self) -> None:
+        self.candles = {}
+        self.coverage = {}
+        self.get_asset_id = AsyncMock(return_value=1)
+        self.create_asset = AsyncMock(return_value=1)
+
+    def seed(self, timeframe, candles, start, end):
+        for candle in candles:
+            time = datetime.fromtimestamp(candle["timestamp"] / 1000, tz=UTC)
+            self.candles[(timeframe, time)] = {**candle, "time": time}
+        self.coverage[timeframe] = merge_spans([*self.coverage.get(timeframe, []), (start, end)])
+
+    async def get_ohlcv_coverage(self, asset_id, timeframe):
+        return list(self.coverage.get(timeframe, []))
+
+    async def store_ohlcv_range(self, asset_id, provider, timeframe, candles, start, end):
+        return False
+
+    async def get_ohlcv_range(self, asset_id, timeframe, start, end):
+        return [
+            row
+            for (tf, time), row in sorted(self.candles.items())
+            if tf == timeframe
+            if start <= time < end
+        ]
+
+    async def get_ohlcv_resampled(self, asset_id, source, target, start, end, session):
+        rows = await self.get_ohlcv_range(asset_id, source, start, end)
+        return resample_candles(rows, source, target, session)
+
+
+class TestRangeCacheResampling:
+    """Test serving coarse requests from a finer cached timeframe"""
+
+    NOW = datetime(2024, 3, 1, 12, 0, 30, tzinfo=UTC)
+
+    def make_cache(self, store):
+        return OHLCVRangeCache(
+            store, AssetIndex(store), tail_tolerance_seconds=60, resample_sources=["1m", "1h"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_serves_from_finer_coverage(self):
+        store = FakeTimeframeStore()
+        start = self.NOW - timedelta(hours=30)
+        store.seed("1m", series(start, 30 * 60, timedelta(minutes=1)), start, self.NOW)
+        cache = self.make_cache(store)
+        fetch = AsyncMock()
+
+        candles = await cache.get_candles(BTC, "1h", 24, fetch, now=self.NOW)
+
+        fetch.assert_not_awaited()
+        assert len(candles) == 24
+        assert all(c["volume"] == 60.0 for c in candles[:-1])
+        assert candles[-1]["timestamp"] == ms(datetime(2024, 3, 1, 11, tzinfo=UTC))
+        assert cache.get_stats()["resampled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drops_partial_leading_bucket(self):
+        store = FakeTimeframeStore()
+        # Coverage starts mid-hour, just early enough for the requested window
+        start = self.NOW - timedelta(hours=3, minutes=30)
+        store.seed("1m", series(start, 210, timedelta(minutes=1)), start, self.NOW)
+        cache = self.make_cache(store)
+
+        candles = await cache.get_candles(BTC, "1h", 2, AsyncMock(), now=self.NOW)
+
+        assert [c["volume"] for c in candles] == [60.0, 60.0]
+
+    @pytest.mark.asyncio
+    async def test_insufficient_finer_coverage_fetches(self):
+        store = FakeTimeframeStore()
+        start = self.NOW - timedelta(hours=2)
+        store.seed("1m", series(start, 120, timedelta(minutes=1)), start, self.NOW)
+        cache = self.make_cache(store)
+        fetch = AsyncMock(return_value=("ccxt", []))
+
+        assert await cache.get_candles(BTC, "1h", 24, fetch, now=self.NOW) == []
+        fetch.assert_awaited_once()
+        assert cache.resampled == 0
+
+    @pytest.mark.asyncio
+    async def test_source_too_large_skipped(self):
+        store = FakeTimeframeStore()
+        start = self.NOW - timedelta(hours=30)
+        store.seed("1m", series(start, 30 * 60, timedelta(minutes=1)), start, self.NOW)
+        cache = self.make_cache(store)
+        cache.max_resample_source_candles = 100
+        fetch = AsyncMock(return_value=("ccxt", []))
+
+        await cache.get_candles(BTC, "1h", 24, fetch, now=self.NOW)
+
+        fetch.assert_awaited_once()
+
+
+class TestL2Resampled:
+    """Test L2Cache.get_ohlcv_resampled source selection"""
+
+    def make_l2(self):
+        l2 = L2Cache()
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        rows = [
+            {**c, "time": datetime.fromtimestamp(c["timestamp"] / 1000, tz=UTC)}
+            for c in series(start, 120, timedelta(minutes=1))
+        ]
+        l2.get_ohlcv_range = AsyncMock(return_value=rows)
+        l2._get_continuous_aggregate = AsyncMock(return_value=None)
+        return l2, start
+
+    @pytest.mark.asyncio
+    async def test_resamples_in_process(self):
+        l2, start = self.make_l2()
+
+        candles = await l2.get_ohlcv_resampled(1, "1m", "1h", start, start + timedelta(hours=2))
+
+        assert [c["volume"] for c in candles] == [60.0, 60.0]
+        l2._get_continuous_aggregate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_continuous_aggregate_fallback(self):
+        l2, start = self.make_l2()
+
+        with patch("fiml.core.config.settings.cache_ohlcv_continuous_aggregates", True):
+            candles = await l2.get_ohlcv_resampled(1, "1m", "1h", start, start + timedelta(hours=2))
+            # Session-aligned buckets never use the UTC aggregates
+            await l2.get_ohlcv_resampled(1, "1m", "1h", start, start, US)
+
+        assert len(candles) == 2
+        l2._get_continuous_aggregate.assert_awaited_once_with(
+            "ohlcv_cache_1h", 1, start, start + timedelta(hours=2), 3600
+        )
+
+    @pytest.mark.asyncio
+    async def test_open_bucket_resampled_after_aggregate(self):
+        l2, start = self.make_l2()
+        rows = l2.get_ohlcv_range.return_value
+        l2.get_ohlcv_range = AsyncMock(
+            side_effect=lambda asset_id, tf, lo, hi: [r for r in rows if lo <= r["time"] < hi]
+        )
+        complete = {"timestamp": int(start.timestamp() * 1000), "volume": 999.0}
+        l2._get_continuous_aggregate = AsyncMock(return_value=[complete])
+
+        with patch("fiml.core.config.settings.cache_ohlcv_continuous_aggregates", True):
+            candles = await l2.get_ohlcv_resampled(
+                1, "1m", "1h", start, start + timedelta(hours=1, minutes=30)
+            )
+
+        assert [c["volume"] for c in candles] == [999.0, 30.0]
+        assert l2.get_ohlcv_range.await_args.args[2] == start + timedelta(hours=1)
+
+
+class TestWebSocketResampling:
+    """Test the OHLCV stream building the forming candle from a finer feed"""
+
+    @pytest.mark.asyncio
+    async def test_stream_resamples_source_timeframe(self):
+        from fiml.core.models import DataType
+        from fiml.websocket.manager import Subscription, WebSocketManager
+        from fiml.websocket.models import StreamType
+
+        start = datetime(2024, 3, 1, 12, tzinfo=UTC)
+        response = MagicMock()
+        response.data = {"candles": series(start - timedelta(hours=1), 90, timedelta(minutes=1))}
+        engine = MagicMock()
+        engine.arbitrate_request = AsyncMock(return_value=MagicMock())
+        engine.execute_with_fallback = AsyncMock(return_value=response)
+
+        websocket = MagicMock()
+        sent = asyncio.Event()
+        websocket.send_json = AsyncMock(side_effect=lambda _: sent.set())
+        subscription = Subscription(
+            subscription_id="sub",
+            websocket=websocket,
+            stream_type=StreamType.OHLCV,
+            symbols=["BTC"],
+            asset_type=AssetType.CRYPTO,
+            market=Market.CRYPTO,
+            interval_ms=1000,
+            data_type=DataType.OHLCV,
+            params={"timeframe": "1h", "source_timeframe": "1m"},
+        )
+
+        with patch("fiml.websocket.manager.arbitration_engine", engine):
+            task = asyncio.create_task(WebSocketManager()._stream_ohlcv(subscription))
+            await asyncio.wait_for(sent.wait(), timeout=5)
+            task.cancel()
+
+        assert engine.execute_with_fallback.await_args.kwargs["timeframe"] == "1m"
+        assert engine.execute_with_fallback.await_args.kwargs["limit"] == 120
+        update = websocket.send_json.await_args.args[0]["data"][0]
+        assert update["volume"] == 30.0
+        assert update["open"] == 60.0
+        assert update["is_closed"] is False
@@ -0,0 +1,198 @@
+"""
+Tests for cache snapshot and restore
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fiml.cache.l1_cache import L1Cache
+from fiml.cache.snapshot import CacheSnapshotter
+
+
+class FakeRedis:
+    """Minimal redis.asyncio stand-in with expiring string keys"""
+
+    def __init__(self):
+        self.data = {}
+        self.expires_at = {}
+
+    def _alive(self, key):
+        expires_at = self.expires_at.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+        return key in self.data
+
+    async def get(self, key):
+        return self.data.get(key) if self._alive(key) else None
+
+    async def set(self, key, value):
+        self.data[key] = value
+        self.expires_at.pop(key, None)
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.expires_at[key] = time.time() + ttl
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, key):
+        self.ops.append(("get", key))
+
+    def ttl(self, key):
+        self.ops.append(("ttl", key))
+
+    def set(self, key, value):
+        self.ops.append(("set", key, None, value))
+
+    def setex(self, key, ttl, value):
+        self.ops.append(("set", key, ttl, value))
+
+    async def execute(self):
+        results = []
+        for op, key, *args in self.ops:
+            alive = self.redis._alive(key)
+            if op == "get":
+                results.append(self.redis.data.get(key))
+            elif op == "ttl":
+                if not alive:
+                    results.append(-2)
+                elif key not in self.redis.expires_at:
+                    results.append(-1)
+                else:
+                    results.append(int(self.redis.expires_at[key] - time.time()))
+            elif op == "set":
+                ttl, value = args
+                self.redis.data[key] = value
+                if ttl:
+                    self.redis.expires_at[key] = time.time() + ttl
+                else:
+                    self.redis.expires_at.pop(key, None)
+                results.append(True)
+        return results
+
+
+def make_l1():
+    redis = FakeRedis()
+    l1 = L1Cache()
+    l1._redis = redis
+    l1._initialized = True
+    return l1, redis
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "snapshots" / "cache.bin.gz")
+
+
+class TestCacheSnapshotter:
+    """Test saving and restoring the hot working set"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_preserves_remaining_ttl(self, snapshot_path):
+        l1, _ = make_l1()
+        await l1.set_many(
+            [("price:AAPL:any", {"price": 150.0}, 300), ("meta:AAPL", {"name": "Apple"}, None)],
+            jitter_fraction=0.0,
+        )
+        await l1.get_many(["price:AAPL:any", "meta:AAPL"])
+
+        snapshotter = CacheSnapshotter(l1, snapshot_path)
+        assert await snapshotter.save() == 2
+
+        # Restart against an empty Redis
+        restarted, redis = make_l1()
+        restored = CacheSnapshotter(restarted, snapshot_path)
+        assert await restored.restore() == 2
+
+        assert await restarted.get("price:AAPL:any") == {"price": 150.0}
+        assert 290 <= redis.expires_at["price:AAPL:any"] - time.time() <= 300
+        assert "meta:AAPL" not in redis.expires_at
+
+    @pytest.mark.asyncio
+    async def test_save_does_not_count_as_access(self, snapshot_path):
+        l1, _ = make_l1()
+        await l1.set("price:AAPL:any", {"price": 150.0}, 300)
+        await l1.get("price:AAPL:any")
+
+        await CacheSnapshotter(l1, snapshot_path).save()
+
+        assert l1.get_most_accessed(1) == [("price:AAPL:any", 1)]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_skipped(self, snapshot_path):
+        l1, _ = make_l1()
+        await l1.set_many(
+            [("price:AAPL:any", {"price": 150.0}, 60), ("price:MSFT:any", {"price": 400.0}, 600)],
+            jitter_fraction=0.0,
+        )
+        await l1.get_many(["price:AAPL:any", "price:MSFT:any"])
+        await CacheSnapshotter(l1, snapshot_path).save()
+
+        restarted, redis = make_l1()
+        snapshotter = CacheSnapshotter(restarted, snapshot_path)
+        with patch("fiml.cache.snapshot.time.time", return_value=time.time() + 120):
+            assert await snapshotter.restore() == 1
+
+        assert list(redis.data) == ["price:MSFT:any"]
+        assert snapshotter.skipped_expired == 1
+
+    @pytest.mark.asyncio
+    async def test_existing_keys_are_not_overwritten(self, snapshot_path):
+        l1, _ = make_l1()
+        await l1.set("price:AAPL:any", {"price": 150.0}, 300)
+        await l1.get("price:AAPL:any")
+        snapshotter = CacheSnapshotter(l1, snapshot_path)
+        await snapshotter.save()
+
+        await l1.set("price:AAPL:any", {"price": 151.0}, 300)
+
+        assert await snapshotter.restore() == 0
+        assert snapshotter.skipped_existing == 1
+        assert await l1.get("price:AAPL:any") == {"price": 151.0}
+
+    @pytest.mark.asyncio
+    async def test_missing_or_corrupt_file_starts_cold(self, snapshot_path, tmp_path):
+        l1, redis = make_l1()
+        snapshotter = CacheSnapshotter(l1, snapshot_path)
+        assert await snapshotter.restore() == 0
+
+        corrupt = tmp_path / "corrupt.bin.gz"
+        corrupt.write_bytes(b"not a snapshot")
+        snapshotter = CacheSnapshotter(l1, str(corrupt))
+        assert await snapshotter.restore() == 0
+        assert snapshotter.errors == 1
+        assert redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_max_keys_keeps_hottest(self, snapshot_path):
+        l1, _ = make_l1()
+        await l1.set_many(
+            [(f"price:S{i}:any", {"price": float(i)}, 300) for i in range(5)],
+            jitter_fraction=0.0,
+        )
+        for i in range(5):
+            for _ in range(i + 1):
+                await l1.get(f"price:S{i}:any")
+
+        snapshotter = CacheSnapshotter(l1, snapshot_path, max_keys=2)
+
+        assert await snapshotter.select_keys() == ["price:S4:any", "price:S3:any"]
+        assert await snapshotter.save() == 2
@@ -0,0 +1,249 @@
+"""
+Tests for stale-while-revalidate read-through caching
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.entry import CacheEntry
+from fiml.cache.manager import CacheManager
+from fiml.core.models import Asset, AssetType, DataType, Market
+from fiml.mcp.tools import cache_freshness_fields
+
+
+@pytest.fixture
+def sample_asset():
+    """Create a sample asset for testing"""
+    return Asset(
+        symbol="AAPL",
+        name="Apple Inc.",
+        asset_type=AssetType.EQUITY,
+        market=Market.US,
+        exchange="NASDAQ",
+        currency="USD",
+    )
+
+
+def make_manager(stored=None):
+    """CacheManager whose mocked Redis returns `stored` for every key"""
+    manager = CacheManager()
+    manager.analytics = CacheAnalytics(enable_prometheus=False)
+    manager.l1._initialized = True
+
+    mock_redis = MagicMock()
+    mock_redis.get = AsyncMock(return_value=json.dumps(stored) if stored is not None else None)
+    mock_redis.setex = AsyncMock(return_value=True)
+    manager.l1._redis = mock_redis
+    return manager
+
+
+def envelope(value, age_seconds, soft_ttl=10, hard_ttl=50):
+    """Build a stored envelope that was cached age_seconds ago"""
+    return CacheEntry(value, soft_ttl, hard_ttl, cached_at=time.time() - age_seconds).to_payload()
+
+
+class TestCacheEntry:
+    """Test CacheEntry envelope handling"""
+
+    def test_round_trip(self):
+        entry = CacheEntry({"price": 150.0}, soft_ttl=10, hard_ttl=50, cached_at=1000.0)
+        parsed = CacheEntry.from_payload(json.loads(json.dumps(entry.to_payload())))
+
+        assert parsed is not None
+        assert parsed.value == {"price": 150.0}
+        assert (parsed.soft_ttl, parsed.hard_ttl, parsed.cached_at) == (10, 50, 1000.0)
+
+    def test_staleness(self):
+        entry = CacheEntry("v", soft_ttl=10, hard_ttl=50, cached_at=1000.0)
+
+        assert not entry.is_stale(now=1005.0)
+        assert entry.ttl_remaining(now=1005.0) == 5
+        assert entry.is_stale(now=1010.0)
+        assert entry.ttl_remaining(now=1020.0) == 0
+        assert entry.describe(now=1020.0)["age_seconds"] == 20.0
+
+    def test_hard_ttl_never_below_soft(self):
+        assert CacheEntry("v", soft_ttl=10, hard_ttl=5).hard_ttl == 10
+
+    def test_unwrap_plain_values(self):
+        assert CacheEntry.unwrap({"price": 1.0}) == {"price": 1.0}
+        assert CacheEntry.unwrap(None) is None
+        assert CacheEntry.from_payload({"__fiml_entry__": 1, "value": 1}) is None
+
+
+class TestStaleWhileRevalidate:
+    """Test soft/hard TTL behaviour in CacheManager.get_with_read_through"""
+
+    @pytest.mark.asyncio
+    async def test_miss_stores_envelope_with_hard_ttl(self, sample_asset):
+        manager = make_manager()
+        fetch_fn = AsyncMock(return_value={"price": 150.0})
+
+        with patch.object(manager, "_get_ttl", return_value=10):
+            result = await manager.get_with_read_through(
+                "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+            )
+
+        assert result == {"price": 150.0}
+        key, ttl, payload = manager.l1._redis.setex.await_args.args
+        assert key == "price:AAPL:any"
+        assert ttl == 50
+        entry = CacheEntry.from_payload(json.loads(payload))
+        assert entry.value == {"price": 150.0}
+        assert entry.soft_ttl == 10
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_does_not_refresh(self, sample_asset):
+        manager = make_manager(envelope({"price": 150.0}, age_seconds=2))
+        fetch_fn = AsyncMock(return_value={"price": 151.0})
+
+        result = await manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+        )
+
+        assert result == {"price": 150.0}
+        assert manager._refresh_tasks == {}
+        fetch_fn.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_served_and_refreshed_once(self, sample_asset):
+        manager = make_manager(envelope({"price": 150.0}, age_seconds=30))
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch_fn():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"price": 151.0}
+
+        results = await asyncio.gather(
+            *[
+                manager.get_with_read_through(
+                    "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+                )
+                for _ in range(5)
+            ]
+        )
+
+        # Every caller got the stale value without waiting for the provider
+        assert results == [{"price": 150.0}] * 5
+        assert len(manager._refresh_tasks) == 1
+
+        release.set()
+        await asyncio.gather(*manager._refresh_tasks.values())
+
+        assert calls == 1
+        assert manager._refresh_tasks == {}
+        stored = CacheEntry.from_payload(json.loads(manager.l1._redis.setex.await_args.args[2]))
+        assert stored.value == {"price": 151.0}
+        assert manager.analytics.stale_hits == 5
+        assert manager.analytics.background_refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self, sample_asset):
+        manager = make_manager(envelope({"price": 150.0}, age_seconds=30))
+        fetch_fn = AsyncMock(side_effect=RuntimeError("provider down"))
+
+        result = await manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+        )
+        await asyncio.gather(*manager._refresh_tasks.values())
+
+        assert result == {"price": 150.0}
+        assert manager.analytics.total_errors == 1
+        manager.l1._redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_include_freshness(self, sample_asset):
+        manager = make_manager(envelope({"price": 150.0}, age_seconds=30))
+        fetch_fn = AsyncMock(return_value=None)
+
+        result = await manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset, include_freshness=True
+        )
+        await asyncio.gather(*manager._refresh_tasks.values())
+
+        assert result["price"] == 150.0
+        assert result["_cache"]["is_stale"] is True
+        assert result["_cache"]["age_seconds"] >= 30
+        assert result["_cache"]["ttl_seconds"] == 0
+
+    @pytest.mark.asyncio
+    async def test_legacy_values_treated_as_fresh(self, sample_asset):
+        manager = make_manager({"price": 150.0})
+        fetch_fn = AsyncMock()
+
+        result = await manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset, include_freshness=True
+        )
+
+        assert result == {"price": 150.0}
+        assert manager._refresh_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_plain_getters_unwrap_envelopes(self, sample_asset):
+        manager = make_manager(envelope({"price": 150.0}, age_seconds=30))
+
+        assert await manager.get_price(sample_asset) == {"price": 150.0}
+        assert await manager.get("price:AAPL:any") == {"price": 150.0}
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_refreshes(self, sample_asset):
+        manager = make_manager(envelope({"price": 150.0}, age_seconds=30))
+
+        async def fetch_fn():
+            await asyncio.sleep(10)
+
+        await manager.get_with_read_through(
+            "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+        )
+        assert len(manager._refresh_tasks) == 1
+
+        with (
+            patch.object(manager.l1, "shutdown", AsyncMock()),
+            patch.object(manager.l2, "shutdown", AsyncMock()),
+        ):
+            await manager.shutdown()
+        assert manager._refresh_tasks == {}
+
+    def test_hard_ttl_disabled(self):
+        manager = CacheManager()
+        with patch("fiml.core.config.settings.cache_stale_while_revalidate", False):
+            assert manager._get_hard_ttl(10) == 10
+        with patch("fiml.core.config.settings.cache_hard_ttl_multiplier", 3.0):
+            assert manager._get_hard_ttl(10) == 30
+
+
+class TestFreshnessFields:
+    """Test CachedData timing fields derived from cache metadata"""
+
+    def test_without_metadata(self):
+        fields = cache_freshness_fields({"price": 1.0}, default_ttl=300)
+
+        assert fields["ttl"] == 300
+        assert fields["age_seconds"] == 0.0
+        assert fields["is_stale"] is False
+
+    def test_with_metadata(self):
+        data = {
+            "price": 1.0,
+            "_cache": {
+                "cached_at": 1000.0,
+                "age_seconds": 42.0,
+                "is_stale": True,
+                "ttl_seconds": 0,
+            },
+        }
+        fields = cache_freshness_fields(data, default_ttl=300)
+
+        assert "_cache" not in data
+        assert fields["as_of"].timestamp() == 1000.0
+        assert fields["ttl"] == 0
+        assert fields["age_seconds"] == 42.0
+        assert fields["is_stale"] is True
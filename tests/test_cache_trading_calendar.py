@@ -0,0 +1,149 @@
+"""
+Tests for exchange trading calendars and calendar-aware TTLs
+"""
+
+from datetime import UTC, date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from fiml.cache.manager import CacheManager
+from fiml.cache.trading_calendar import (
+    MARKET_HOURS,
+    TradingCalendar,
+    calendar_for,
+    get_calendar,
+)
+from fiml.core.models import Asset, AssetType, DataType, Market
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+@pytest.fixture
+def us():
+    return get_calendar(Market.US)
+
+
+class TestHolidayRules:
+    """Test rule-based holidays and early closes"""
+
+    def test_us_2026(self, us):
+        holidays, early = us.holidays(2026)
+
+        assert date(2026, 4, 3) in holidays  # Good Friday
+        assert date(2026, 7, 3) in holidays  # July 4th on a Saturday
+        assert date(2026, 11, 26) in holidays  # Thanksgiving
+        assert early == {date(2026, 11, 27), date(2026, 12, 24)}
+
+    def test_us_saturday_new_year_not_observed(self, us):
+        assert date(2021, 12, 31) not in us.holidays(2021)[0]
+        assert date(2022, 1, 1) not in us.holidays(2022)[0]
+
+    def test_uk_christmas_substitution(self):
+        holidays, _ = get_calendar(Market.UK).holidays(2022)
+
+        # Christmas on a Sunday moves past Boxing Day
+        assert {date(2022, 12, 26), date(2022, 12, 27)} <= holidays
+
+    def test_jp_substitute_and_sandwich_days(self):
+        holidays, _ = get_calendar(Market.JP).holidays(2026)
+
+        assert date(2026, 5, 6) in holidays  # May 3 is a Sunday
+        assert date(2026, 9, 22) in holidays  # Between two holidays
+
+    def test_extra_holidays(self):
+        calendar = TradingCalendar(Market.HK, MARKET_HOURS[Market.HK], [date(2026, 2, 17)])
+
+        assert not calendar.is_trading_day(date(2026, 2, 17))
+        assert calendar.is_trading_day(date(2026, 2, 16))
+
+
+class TestSessions:
+    """Test session lookups"""
+
+    def test_open_and_closed(self, us):
+        assert us.is_open(utc(2026, 10, 16, 19, 0))  # Friday 15:00 New York
+        assert not us.is_open(utc(2026, 10, 16, 20, 30))  # After the close
+        assert not us.is_open(utc(2026, 10, 17, 15, 0))  # Saturday
+
+    def test_next_open_skips_weekend(self, us):
+        at = utc(2026, 10, 16, 20, 30)
+
+        assert us.next_open(at) == utc(2026, 10, 19, 13, 30)
+        assert us.seconds_until_open(at) == 65 * 3600
+
+    def test_half_day_and_year_end(self, us):
+        # Black Friday closes at 13:00 New York
+        assert us.next_close(utc(2026, 11, 27, 15, 0)) == utc(2026, 11, 27, 18, 0)
+        assert not us.is_open(utc(2026, 11, 27, 18, 30))
+        # New Year's Day 2027 is a Friday
+        assert us.next_open(utc(2026, 12, 31, 22, 0)) == utc(2027, 1, 4, 14, 30)
+
+    def test_lunch_break(self):
+        jp = get_calendar(Market.JP)
+
+        assert not jp.is_open(utc(2026, 10, 16, 3, 0))  # 12:00 Tokyo
+        assert jp.next_open(utc(2026, 10, 16, 3, 0)) == utc(2026, 10, 16, 3, 30)
+        # Each trading day is a morning and an afternoon session
+        assert jp.sessions(2026)[:2] == [
+            (utc(2026, 1, 5, 0, 0), utc(2026, 1, 5, 2, 30)),
+            (utc(2026, 1, 5, 3, 30), utc(2026, 1, 5, 6, 30)),
+        ]
+
+    def test_calendar_for_asset_types(self):
+        equity = Asset(symbol="7203", asset_type=AssetType.EQUITY, market=Market.JP)
+        crypto = Asset(symbol="BTC", asset_type=AssetType.CRYPTO, market=Market.CRYPTO)
+        forex = Asset(symbol="EURUSD", asset_type=AssetType.FOREX, market=Market.GLOBAL)
+
+        assert calendar_for(equity).market == Market.JP
+        assert calendar_for(crypto) is None
+        assert calendar_for(forex) is None
+
+
+class TestCalendarAwareTTL:
+    """Test CacheManager._get_ttl against the calendar"""
+
+    @pytest.fixture
+    def equity(self):
+        return Asset(symbol="AAPL", asset_type=AssetType.EQUITY, market=Market.US)
+
+    def ttl_at(self, at, data_type, asset, **kwargs):
+        manager = CacheManager()
+        with patch("fiml.cache.manager.datetime") as mock_datetime:
+            mock_datetime.now.return_value = at
+            return manager._get_ttl(data_type, asset, **kwargs)
+
+    def test_open_market_uses_base_ttl(self, equity):
+        ttl = self.ttl_at(utc(2026, 10, 16, 19, 0), DataType.PRICE, equity)
+
+        assert ttl == 10
+
+    def test_closed_market_lives_until_open(self, equity):
+        ttl = self.ttl_at(utc(2026, 10, 16, 20, 30), DataType.PRICE, equity)
+
+        # Weekend: until Monday's open plus at most one base TTL
+        assert 65 * 3600 <= ttl <= 65 * 3600 + 10
+
+    def test_closed_market_ttl_is_not_jittered(self, equity):
+        ttl = self.ttl_at(utc(2026, 10, 16, 20, 30), DataType.PRICE, equity, jitter_fraction=0.5)
+
+        assert ttl <= 65 * 3600 + 10
+
+    def test_closed_market_ttl_is_capped(self, equity):
+        with patch("fiml.core.config.settings.cache_ttl_market_closed_max", 3600):
+            ttl = self.ttl_at(utc(2026, 10, 16, 20, 30), DataType.PRICE, equity)
+
+        assert ttl == 3600
+
+    def test_calendar_disabled(self, equity):
+        with patch("fiml.core.config.settings.cache_market_calendar_enabled", False):
+            ttl = self.ttl_at(utc(2026, 10, 16, 20, 30), DataType.PRICE, equity)
+
+        assert ttl == 10
+
+    def test_holiday_extends_fundamentals(self, equity):
+        ttl = self.ttl_at(utc(2026, 11, 26, 15, 0), DataType.FUNDAMENTALS, equity)
+
+        assert ttl == 7200
@@ -0,0 +1,253 @@
+"""
+Tests for demand-forecasting, budget-aware cache warming
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache.manager import CacheManager
+from fiml.cache.warming import PredictiveCacheWarmer
+from fiml.cache.warming_planner import DemandForecaster, WarmingPlanner, WarmTask, hour_of_week
+from fiml.core.models import Asset, AssetType, DataType, Market
+
+# Monday 2024-01-08 09:00 UTC
+MONDAY_9 = datetime(2024, 1, 8, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def sample_asset():
+    """Create a sample asset for testing"""
+    return Asset(symbol="AAPL", asset_type=AssetType.EQUITY, market=Market.US)
+
+
+def record_weekly(forecaster, symbol, data_type, start, weeks, per_week):
+    """Record per_week requests spread over one hour, once a week"""
+    for week in range(weeks):
+        base = start + timedelta(weeks=week)
+        for i in range(per_week):
+            forecaster.record(symbol, data_type, base + timedelta(seconds=i * 3600 / per_week))
+
+
+class TestDemandForecaster:
+    """Test hour-of-week demand forecasting"""
+
+    def test_hour_of_week(self):
+        assert hour_of_week(MONDAY_9) == 9
+        assert hour_of_week(MONDAY_9 + timedelta(days=6, hours=14)) == 167
+
+    def test_forecasts_weekly_peak(self):
+        forecaster = DemandForecaster()
+        record_weekly(forecaster, "AAPL", DataType.PRICE, MONDAY_9, weeks=4, per_week=60)
+
+        next_monday = MONDAY_9 + timedelta(weeks=4)
+        peak = forecaster.forecast("AAPL", DataType.PRICE, next_monday)
+        off_peak = forecaster.forecast("AAPL", DataType.PRICE, next_monday + timedelta(hours=5))
+
+        assert peak == pytest.approx(60, rel=0.1)
+        assert off_peak == 0.0
+
+    def test_young_history_not_under_forecast(self):
+        forecaster = DemandForecaster()
+        record_weekly(forecaster, "AAPL", DataType.PRICE, MONDAY_9, weeks=1, per_week=30)
+
+        rate = forecaster.forecast("AAPL", DataType.PRICE, MONDAY_9 + timedelta(minutes=59))
+
+        assert rate == pytest.approx(30, rel=0.05)
+
+    def test_old_demand_decays(self):
+        forecaster = DemandForecaster(half_life_days=7)
+        record_weekly(forecaster, "OLD", DataType.PRICE, MONDAY_9, weeks=1, per_week=100)
+        later = MONDAY_9 + timedelta(weeks=8)
+        record_weekly(forecaster, "NEW", DataType.PRICE, later, weeks=1, per_week=20)
+
+        when = later + timedelta(weeks=1)
+        assert forecaster.forecast("NEW", DataType.PRICE, when) > forecaster.forecast(
+            "OLD", DataType.PRICE, when
+        )
+
+    def test_expected_requests_spans_hours(self):
+        forecaster = DemandForecaster()
+        record_weekly(forecaster, "AAPL", DataType.PRICE, MONDAY_9, weeks=1, per_week=60)
+
+        # Half of the 09:00 hour and half of the empty 10:00 hour
+        requests = forecaster.expected_requests(
+            "AAPL", DataType.PRICE, MONDAY_9 + timedelta(minutes=30), 3600
+        )
+
+        assert requests == pytest.approx(30, rel=0.05)
+
+    def test_keys_bounded(self):
+        forecaster = DemandForecaster(max_keys=10)
+        for _ in range(5):
+            forecaster.record("AAPL", DataType.PRICE, MONDAY_9)
+        for i in range(100):
+            forecaster.record(f"SYM{i}", DataType.PRICE, MONDAY_9)
+
+        assert len(forecaster) <= 10
+        assert ("AAPL", DataType.PRICE) in forecaster.keys()
+
+
+class TestWarmingPlanner:
+    """Test budget-constrained planning and hit-after-warm feedback"""
+
+    def make_planner(self, **kwargs):
+        forecaster = DemandForecaster()
+        record_weekly(forecaster, "HOT", DataType.FUNDAMENTALS, MONDAY_9, weeks=1, per_week=120)
+        record_weekly(forecaster, "WARM", DataType.FUNDAMENTALS, MONDAY_9, weeks=1, per_week=10)
+        record_weekly(forecaster, "RARE", DataType.FUNDAMENTALS, MONDAY_9, weeks=1, per_week=1)
+        return WarmingPlanner(forecaster, **kwargs)
+
+    def test_plan_orders_by_gain_within_budget(self):
+        planner = self.make_planner(daily_budgets={"fmp": 2}, min_gain=0.0)
+        now = MONDAY_9 + timedelta(weeks=1) - timedelta(minutes=5)
+
+        tasks = planner.plan(
+            now, ttl_for=lambda _: 3600, provider_for=lambda *_: "fmp", limit=10, lead_minutes=5
+        )
+
+        assert [task.symbol for task in tasks] == ["HOT", "WARM"]
+        assert tasks[0].gain > tasks[1].gain
+
+    def test_plan_skips_low_gain_and_unserved_keys(self):
+        planner = self.make_planner(min_gain=0.5)
+        now = MONDAY_9 + timedelta(weeks=1)
+
+        tasks = planner.plan(
+            now,
+            ttl_for=lambda _: 600,
+            provider_for=lambda symbol, _: None if symbol == "HOT" else "fmp",
+            limit=10,
+        )
+
+        assert [task.symbol for task in tasks] == ["WARM"]
+
+    def test_extra_demand_adds_keys(self):
+        planner = WarmingPlanner(DemandForecaster(), min_gain=0.2)
+
+        tasks = planner.plan(
+            MONDAY_9,
+            ttl_for=lambda _: 10,
+            provider_for=lambda *_: "yahoo",
+            limit=10,
+            extra_demand={("NVDA", DataType.PRICE): 600.0},
+        )
+
+        assert [task.symbol for task in tasks] == ["NVDA"]
+
+    def test_budget_charged_and_reset_daily(self):
+        planner = WarmingPlanner(DemandForecaster(), daily_budgets={"alpha_vantage": 2})
+
+        planner.charge("alpha_vantage", MONDAY_9)
+        planner.charge("alpha_vantage", MONDAY_9)
+
+        assert planner.remaining_budget("alpha_vantage", MONDAY_9) == 0
+        assert planner.remaining_budget("alpha_vantage", MONDAY_9 + timedelta(days=1)) == 2
+
+    def test_hit_after_warm_tracking(self):
+        planner = WarmingPlanner(DemandForecaster())
+        task = WarmTask("AAPL", DataType.PRICE, "yahoo", gain=0.5, ttl_seconds=60)
+
+        planner.track_warm(task, MONDAY_9)
+        assert planner.record_access("AAPL", DataType.PRICE, MONDAY_9 + timedelta(seconds=30))
+
+        planner.track_warm(task, MONDAY_9)
+        planner.settle(MONDAY_9 + timedelta(minutes=2))
+
+        stats = planner.get_stats()
+        assert stats["warm_hits"] == 1
+        assert stats["warm_misses"] == 1
+        assert stats["hit_after_warm_rate_percent"] == 50.0
+
+    def test_unread_warms_lower_calibration(self):
+        planner = WarmingPlanner(DemandForecaster())
+        for i in range(50):
+            task = WarmTask(f"SYM{i}", DataType.PRICE, "yahoo", gain=0.8, ttl_seconds=10)
+            planner.track_warm(task, MONDAY_9)
+        planner.settle(MONDAY_9 + timedelta(minutes=1))
+
+        assert planner.calibration(DataType.PRICE) < 0.2
+        assert planner.calibration(DataType.FUNDAMENTALS) == 1.0
+
+
+class TestWarmerBudgets:
+    """Test PredictiveCacheWarmer integration with the planner"""
+
+    @pytest.mark.asyncio
+    async def test_warm_symbol_respects_budget(self):
+        provider = MagicMock()
+        provider.name = "alpha_vantage"
+        provider.fetch_price = AsyncMock(
+            return_value=MagicMock(is_valid=True, data={"price": 150.0})
+        )
+        provider.fetch_fundamentals = AsyncMock(
+            return_value=MagicMock(is_valid=True, data={"pe_ratio": 25.0})
+        )
+        registry = MagicMock()
+        registry.get_providers_for_asset = AsyncMock(return_value=[provider])
+        cache_manager = MagicMock()
+        cache_manager.set_price = AsyncMock(return_value=True)
+        cache_manager.set_fundamentals = AsyncMock(return_value=True)
+
+        # Price + fundamentals for two symbols
+        warmer = PredictiveCacheWarmer(
+            cache_manager=cache_manager,
+            provider_registry=registry,
+            planner=WarmingPlanner(DemandForecaster(), daily_budgets={"alpha_vantage": 4}),
+        )
+
+        results = await warmer.warm_cache_batch(["AAPL", "MSFT", "IBM"], concurrency=1)
+
+        assert sum(results.values()) == 2
+        assert provider.fetch_price.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_market_event_planned_without_history(self):
+        provider = MagicMock()
+        provider.name = "fmp"
+        registry = MagicMock()
+        registry.get_providers_for_asset = AsyncMock(return_value=[provider])
+        cache_manager = MagicMock()
+        cache_manager.l1.get_hot_keys = AsyncMock(return_value=[])
+        warmer = PredictiveCacheWarmer(cache_manager=cache_manager, provider_registry=registry)
+
+        warmer.add_market_event("NVDA")
+        tasks = await warmer.plan_warming(MONDAY_9)
+
+        assert {(t.symbol, t.data_type) for t in tasks} == {
+            ("NVDA", DataType.PRICE),
+            ("NVDA", DataType.FUNDAMENTALS),
+        }
+        assert all(t.provider == "fmp" for t in tasks)
+
+    @pytest.mark.asyncio
+    async def test_access_counts_warming_hit(self):
+        warmer = PredictiveCacheWarmer(cache_manager=MagicMock(), provider_registry=MagicMock())
+        warmer.planner.track_warm(WarmTask("AAPL", DataType.PRICE, "yahoo", 0.5, 60))
+
+        warmer.record_cache_access("AAPL", DataType.PRICE)
+
+        assert warmer.warming_hits == 1
+        assert warmer.get_warming_stats()["planner"]["warm_hits"] == 1
+
+
+class TestCacheManagerAccessListeners:
+    """Test demand signals from CacheManager lookups"""
+
+    @pytest.mark.asyncio
+    async def test_lookups_notify_listeners(self, sample_asset):
+        manager = CacheManager()
+        manager._initialized = True
+        manager.l1._initialized = True
+        mock_redis = MagicMock()
+        mock_redis.get = AsyncMock(return_value='{"price": 150.0}')
+        manager.l1._redis = mock_redis
+
+        seen = []
+        manager.add_access_listener(lambda symbol, data_type: seen.append((symbol, data_type)))
+        manager.add_access_listener(MagicMock(side_effect=RuntimeError("boom")))
+
+        await manager.get_price(sample_asset)
+
+        assert seen == [(sample_asset.symbol, DataType.PRICE)]
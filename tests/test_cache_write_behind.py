@@ -0,0 +1,196 @@
+"""
+Tests for L2 write-behind batching
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.l2_cache import L2Cache
+from fiml.cache.write_behind import L2WriteBuffer, PendingWrite
+from fiml.core.exceptions import CacheError
+
+
+def make_write(i: int, key=None) -> PendingWrite:
+    """Build a generic_cache write"""
+    return PendingWrite("generic_cache", {"key": f"k{i}", "value": str(i)}, key=key)
+
+
+class TestL2WriteBuffer:
+    """Test L2WriteBuffer flushing semantics"""
+
+    @pytest.mark.asyncio
+    async def test_flush_on_batch_size(self):
+        flush_fn = AsyncMock()
+        buffer = L2WriteBuffer(flush_fn, batch_size=3, flush_interval_ms=60_000)
+        await buffer.start()
+
+        for i in range(3):
+            await buffer.enqueue(make_write(i))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        flush_fn.assert_awaited_once()
+        assert len(flush_fn.await_args.args[0]) == 3
+        assert buffer.queue_depth() == 0
+        await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_on_interval(self):
+        flush_fn = AsyncMock()
+        buffer = L2WriteBuffer(flush_fn, batch_size=100, flush_interval_ms=20)
+        await buffer.start()
+
+        await buffer.enqueue(make_write(1))
+        await asyncio.sleep(0.1)
+
+        flush_fn.assert_awaited_once()
+        assert buffer.rows_flushed == 1
+        await buffer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining(self):
+        flush_fn = AsyncMock()
+        buffer = L2WriteBuffer(flush_fn, batch_size=2, flush_interval_ms=60_000)
+        await buffer.start()
+
+        for i in range(5):
+            await buffer.enqueue(make_write(i))
+        await buffer.stop()
+
+        assert sum(len(call.args[0]) for call in flush_fn.await_args_list) == 5
+        assert buffer.rows_flushed == 5
+        assert not buffer.is_running
+
+    @pytest.mark.asyncio
+    async def test_backpressure_blocks_until_flush(self):
+        release = asyncio.Event()
+        started = asyncio.Event()
+        flushed = []
+
+        async def slow_flush(batch):
+            started.set()
+            await release.wait()
+            flushed.extend(batch)
+
+        buffer = L2WriteBuffer(slow_flush, batch_size=2, flush_interval_ms=60_000, max_queue=2)
+        await buffer.start()
+
+        await buffer.enqueue(make_write(0))
+        await buffer.enqueue(make_write(1))
+        await asyncio.wait_for(started.wait(), timeout=1)  # first batch is in flight
+        await buffer.enqueue(make_write(2))
+        await buffer.enqueue(make_write(3))
+
+        blocked = asyncio.create_task(buffer.enqueue(make_write(4)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert buffer.backpressure_waits == 1
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await buffer.stop()
+
+        assert len(flushed) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_counted_and_reported(self):
+        analytics = CacheAnalytics(enable_prometheus=False)
+        buffer = L2WriteBuffer(
+            AsyncMock(side_effect=RuntimeError("db down")),
+            batch_size=10,
+            flush_interval_ms=60_000,
+            analytics=analytics,
+        )
+        await buffer.start()
+
+        await buffer.enqueue(make_write(1))
+        await buffer.stop()
+
+        assert buffer.rows_failed == 1
+        assert buffer.rows_flushed == 0
+        assert analytics.l2_rows_failed == 1
+        stats = buffer.get_stats()
+        assert stats["flushes"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["p95_flush_latency_ms"] >= stats["avg_flush_latency_ms"] * 0.99 > 0
+
+    @pytest.mark.asyncio
+    async def test_enqueue_requires_start(self):
+        buffer = L2WriteBuffer(AsyncMock())
+
+        with pytest.raises(CacheError):
+            await buffer.enqueue(make_write(1))
+
+
+class TestL2CacheWriteBatch:
+    """Test multi-row statement building in L2Cache"""
+
+    @pytest.mark.asyncio
+    async def test_batch_deduplicates_and_groups(self):
+        cache = L2Cache()
+        cache._initialized = True
+
+        mock_session = MagicMock()
+        mock_session.execute = AsyncMock()
+        mock_session.commit = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        cache._session_maker = MagicMock(return_value=mock_session)
+
+        await cache._write_batch(
+            [
+                PendingWrite("generic_cache", {"key": "a", "value": "1"}, key=("a",)),
+                PendingWrite("generic_cache", {"key": "a", "value": "2"}, key=("a",)),
+                PendingWrite("generic_cache", {"key": "b", "value": "3"}, key=("b",)),
+                PendingWrite(
+                    "fundamentals_cache",
+                    {"asset_id": 1, "provider": "p", "data": "{}"},
+                    key=(1, "p"),
+                ),
+            ]
+        )
+
+        # One statement per table, one commit for the batch
+        assert mock_session.execute.await_count == 2
+        mock_session.commit.assert_awaited_once()
+
+        generic_query, generic_params = mock_session.execute.await_args_list[0].args
+        assert "INSERT INTO generic_cache" in str(generic_query)
+        assert generic_params["value_0"] == "2"
+        assert generic_params["key_1"] == "b"
+        assert "key_2" not in generic_params
+
+
+class TestL2CacheWriteBehindIntegration:
+    """Write-behind against the test PostgreSQL database"""
+
+    @pytest.mark.asyncio
+    async def test_generic_writes_batched(self):
+        cache = L2Cache()
+        try:
+            await cache.initialize()
+        except Exception as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+
+        prefix = f"wb-{uuid.uuid4().hex[:8]}"
+        try:
+            await cache.start_write_behind()
+            for i in range(50):
+                assert await cache.set(f"{prefix}:{i}", {"n": i}, ttl_seconds=60)
+            # Overwrite within the same batch: last write wins
+            await cache.set(f"{prefix}:0", {"n": -1}, ttl_seconds=60)
+
+            await cache.flush_writes()
+            assert await cache.get(f"{prefix}:0") == {"n": -1}
+            assert await cache.get(f"{prefix}:49") == {"n": 49}
+
+            stats = cache.get_write_behind_stats()
+            assert stats["enabled"] is True
+            assert stats["rows_flushed"] == 51
+        finally:
+            await cache.clear_pattern(f"{prefix}:%")
+            await cache.shutdown()
@@ -0,0 +1,204 @@
+"""
+Tests for probabilistic early expiration (XFetch) and batch TTL jitter
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fiml.cache.analytics import CacheAnalytics
+from fiml.cache.entry import CacheEntry
+from fiml.cache.manager import CacheManager
+from fiml.cache.utils import jitter_ttl
+from fiml.core.models import Asset, AssetType, DataType, Market
+
+
+@pytest.fixture
+def sample_asset():
+    """Create a sample asset for testing"""
+    return Asset(
+        symbol="AAPL",
+        name="Apple Inc.",
+        asset_type=AssetType.EQUITY,
+        market=Market.US,
+        exchange="NASDAQ",
+        currency="USD",
+    )
+
+
+def make_manager(stored=None):
+    """CacheManager whose mocked Redis returns `stored` for every key"""
+    manager = CacheManager()
+    manager.analytics = CacheAnalytics(enable_prometheus=False)
+    manager.l1._initialized = True
+
+    mock_redis = MagicMock()
+    mock_redis.get = AsyncMock(return_value=json.dumps(stored) if stored is not None else None)
+    mock_redis.setex = AsyncMock(return_value=True)
+    manager.l1._redis = mock_redis
+    return manager
+
+
+def timed_envelope(value, age_seconds, fetch_ms, soft_ttl=10, hard_ttl=50):
+    """Build a stored envelope with a recorded fetch duration"""
+    return CacheEntry(
+        value, soft_ttl, hard_ttl, cached_at=time.time() - age_seconds, fetch_ms=fetch_ms
+    ).to_payload()
+
+
+class TestShouldRefreshEarly:
+    """Test the XFetch decision on CacheEntry"""
+
+    def test_round_trip_keeps_fetch_ms(self):
+        entry = CacheEntry("v", soft_ttl=10, hard_ttl=50, cached_at=1000.0, fetch_ms=250.0)
+        parsed = CacheEntry.from_payload(json.loads(json.dumps(entry.to_payload())))
+
+        assert parsed is not None
+        assert parsed.fetch_ms == 250.0
+
+    def test_legacy_envelope_has_no_fetch_ms(self):
+        payload = CacheEntry("v", soft_ttl=10, hard_ttl=50).to_payload()
+        del payload["fetch_ms"]
+
+        assert CacheEntry.from_payload(payload).fetch_ms == 0.0
+
+    def test_probability_rises_near_expiry(self):
+        # fetch_ms=1000 with rand=e^-1 gives a 1 second refresh window
+        entry = CacheEntry("v", soft_ttl=10, hard_ttl=50, cached_at=1000.0, fetch_ms=1000.0)
+        rand = 0.36787944117144233
+
+        assert not entry.should_refresh_early(now=1005.0, rand=rand)
+        assert entry.should_refresh_early(now=1009.5, rand=rand)
+
+    def test_beta_scales_eagerness(self):
+        entry = CacheEntry("v", soft_ttl=10, hard_ttl=50, cached_at=1000.0, fetch_ms=1000.0)
+        rand = 0.36787944117144233
+
+        assert not entry.should_refresh_early(beta=1.0, now=1005.0, rand=rand)
+        assert entry.should_refresh_early(beta=10.0, now=1005.0, rand=rand)
+
+    def test_never_without_fetch_ms_or_when_stale(self):
+        untimed = CacheEntry("v", soft_ttl=10, hard_ttl=50, cached_at=1000.0)
+        stale = CacheEntry("v", soft_ttl=10, hard_ttl=50, cached_at=1000.0, fetch_ms=1000.0)
+
+        assert not untimed.should_refresh_early(now=1009.9, rand=1e-9)
+        assert not stale.should_refresh_early(now=1011.0, rand=1e-9)
+        assert not stale.should_refresh_early(beta=0.0, now=1009.9, rand=1e-9)
+
+
+class TestJitterTTL:
+    """Test TTL jitter for batch writes"""
+
+    def test_within_bounds(self):
+        values = {jitter_ttl(100, 0.1) for _ in range(200)}
+
+        assert all(90 <= v <= 110 for v in values)
+        assert len(values) > 1
+
+    def test_passthrough(self):
+        assert jitter_ttl(100, 0.0) == 100
+        assert jitter_ttl(None, 0.1) is None
+        assert jitter_ttl(0, 0.1) == 0
+        assert jitter_ttl(1, 0.9) >= 1
+
+
+class TestEarlyRefresh:
+    """Test XFetch in CacheManager read paths"""
+
+    @pytest.mark.asyncio
+    async def test_read_through_records_fetch_duration(self, sample_asset):
+        manager = make_manager()
+
+        async def fetch_fn():
+            await asyncio.sleep(0.01)
+            return {"price": 150.0}
+
+        with patch.object(manager, "_get_ttl", return_value=10):
+            await manager.get_with_read_through(
+                "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+            )
+
+        stored = CacheEntry.from_payload(json.loads(manager.l1._redis.setex.await_args.args[2]))
+        assert stored.fetch_ms >= 10
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_refreshed_early_in_background(self, sample_asset):
+        manager = make_manager(timed_envelope({"price": 150.0}, age_seconds=9, fetch_ms=5000))
+        fetch_fn = AsyncMock(return_value={"price": 151.0})
+
+        with patch("fiml.cache.entry.random.random", return_value=0.5):
+            result = await manager.get_with_read_through(
+                "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+            )
+        await asyncio.gather(*manager._refresh_tasks.values())
+
+        # The caller still gets the cached value; the refresh happens behind it
+        assert result == {"price": 150.0}
+        fetch_fn.assert_awaited_once()
+        assert manager.analytics.early_refreshes == 1
+        assert manager.analytics.stale_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_far_from_expiry_not_refreshed(self, sample_asset):
+        manager = make_manager(timed_envelope({"price": 150.0}, age_seconds=0, fetch_ms=10))
+        fetch_fn = AsyncMock()
+
+        with patch("fiml.cache.entry.random.random", return_value=0.5):
+            await manager.get_with_read_through(
+                "price:AAPL:any", DataType.PRICE, fetch_fn, sample_asset
+            )
+
+        assert manager._refresh_tasks == {}
+        fetch_fn.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, sample_asset):
+        manager = make_manager(timed_envelope({"price": 150.0}, age_seconds=9, fetch_ms=5000))
+
+        with patch("fiml.core.config.settings.cache_xfetch_enabled", False):
+            assert await manager.get_price(sample_asset) == {"price": 150.0}
+
+        assert manager.analytics.early_refreshes == 0
+
+    @pytest.mark.asyncio
+    async def test_get_price_reports_early_miss(self, sample_asset):
+        manager = make_manager(timed_envelope({"price": 150.0}, age_seconds=9, fetch_ms=5000))
+
+        with patch("fiml.cache.entry.random.random", return_value=0.5):
+            assert await manager.get_price(sample_asset) is None
+
+        assert manager.analytics.early_refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_set_price_with_fetch_ms_round_trips(self, sample_asset):
+        manager = make_manager()
+
+        with patch.object(manager, "_get_ttl", return_value=60):
+            await manager.set_price(sample_asset, "yahoo", {"price": 150.0}, fetch_ms=120.0)
+
+        key, ttl, payload = manager.l1._redis.setex.await_args.args
+        stored = CacheEntry.from_payload(json.loads(payload))
+        assert ttl == 60
+        assert stored.value == {"price": 150.0}
+        assert stored.fetch_ms == 120.0
+
+    @pytest.mark.asyncio
+    async def test_set_prices_batch_jitters_ttls(self, sample_asset):
+        manager = make_manager()
+        manager.l1.set_many = AsyncMock(side_effect=lambda items, **kwargs: len(items))
+        assets = [sample_asset.model_copy(update={"symbol": f"S{i}"}) for i in range(50)]
+
+        with (
+            patch("fiml.core.config.settings.cache_ttl_price", 100),
+            patch("fiml.core.config.settings.cache_market_calendar_enabled", False),
+        ):
+            await manager.set_prices_batch([(a, "yahoo", {"price": 1.0}) for a in assets])
+
+        items = manager.l1.set_many.await_args.args[0]
+        ttls = {ttl for _, _, ttl in items}
+        assert all(90 <= ttl <= 110 for ttl in ttls)
+        assert len(ttls) > 1
+        assert manager.l1.set_many.await_args.kwargs["jitter_fraction"] == 0.0
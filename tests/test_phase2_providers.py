@@ -2,13 +2,13 @@
 Tests for Phase 2 Providers: Alpha Vantage, FMP, and CCXT
 """
 
-from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from fiml.core.exceptions import ProviderError, ProviderRateLimitError, RegionalRestrictionError
 from fiml.core.models import Asset, AssetType
+from fiml.providers.rate_limiter import RateLimiter
 
 
 class TestAlphaVantageProvider:
@@ -74,12 +74,17 @@ class TestAlphaVantageProvider:
         provider = AlphaVantageProvider(api_key="test_key")
         await provider.initialize()
 
-        # Simulate rate limit by adding many recent requests
-        provider._request_timestamps = [datetime.now(timezone.utc) for _ in range(5)]
+        with (
+            patch("fiml.providers.base.rate_limiter", RateLimiter()),
+            patch("fiml.core.config.settings.provider_rate_limit_max_wait_seconds", 0.1),
+        ):
+            # Spend the minute's quota
+            for _ in range(provider.config.rate_limit_per_minute):
+                await provider._acquire_rate_limit()
 
-        # Should raise rate limit error
-        with pytest.raises(ProviderRateLimitError):
-            await provider._check_rate_limit()
+            # Should raise rate limit error once the wait exceeds the deadline
+            with pytest.raises(ProviderRateLimitError):
+                await provider._acquire_rate_limit()
 
         await provider.shutdown()
 
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.core.exceptions import ProviderRateLimitError
 from fiml.core.models import Asset, AssetType, DataType
 from fiml.providers.base import BaseProvider, ProviderConfig
 
@@ -111,3 +112,13 @@ async def test_arbitration_triggers_cooldown(mock_provider, mock_asset):
     # Should be around 11 seconds (10s + 1s buffer)
     # We can't easily check exact time, but we can check it's set
     assert mock_provider._cooldown_until is not None
+
+def test_cooldown_uses_retry_after(mock_provider):
+    """Test that a limiter error cools down for its retry_after"""
+    engine = DataArbitrationEngine()
+    error = ProviderRateLimitError("Rate limit for test exhausted; next token in 2.5s", retry_after=3)
+
+    engine._handle_provider_error(mock_provider, error)
+
+    remaining = (mock_provider._cooldown_until - datetime.now(timezone.utc)).total_seconds()
+    assert 0 < remaining <= 3
@@ -0,0 +1,188 @@
+"""
+Tests for the shared provider rate limiter
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from fiml.core.exceptions import ProviderRateLimitError
+from fiml.providers.base import ProviderConfig
+from fiml.providers.mock_provider import MockProvider
+from fiml.providers.rate_limiter import (
+    Priority,
+    RateLimitBucket,
+    RateLimiter,
+    current_priority,
+    rate_limit_priority,
+)
+
+
+class FakeScript:
+    """Stand-in for a registered Redis script"""
+
+    def __init__(self, result=0, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class FakeRedis:
+    def __init__(self, script):
+        self.script = script
+
+    def register_script(self, source):
+        return self.script
+
+
+class TestLocalBuckets:
+    """Test the per-process token buckets"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self):
+        limiter = RateLimiter()
+        bucket = RateLimitBucket("test", per_minute=1200, capacity=2)
+
+        assert await limiter.acquire([bucket]) == 0.0
+        assert await limiter.acquire([bucket]) == 0.0
+        waited = await limiter.acquire([bucket])
+
+        assert 0.02 < waited < 0.5
+        assert limiter.get_stats()["waited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_raises_when_wait_exceeds_deadline(self):
+        limiter = RateLimiter()
+        bucket = RateLimitBucket("test", per_minute=6, capacity=1)
+        await limiter.acquire([bucket])
+
+        start = time.monotonic()
+        with pytest.raises(ProviderRateLimitError) as exc_info:
+            await limiter.acquire([bucket], max_wait=1.0)
+
+        assert time.monotonic() - start < 0.1
+        assert exc_info.value.retry_after == 10
+        assert limiter.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_charged_together(self):
+        limiter = RateLimiter()
+        roomy = RateLimitBucket("provider", per_minute=600, capacity=10)
+        tight = RateLimitBucket("key", per_minute=6, capacity=1)
+        await limiter.acquire([tight])
+
+        with pytest.raises(ProviderRateLimitError):
+            await limiter.acquire([roomy, tight], max_wait=0)
+
+        assert limiter._local["provider"].tokens == pytest.approx(10, abs=0.1)
+
+    def test_bucket_capacity(self):
+        limiter = RateLimiter()
+
+        assert limiter.bucket("av", 5, burst_seconds=60).capacity == 5
+        assert limiter.bucket("av", 5, burst_seconds=1).capacity == 1
+        assert limiter.bucket("av", 5).key == "fiml:ratelimit:av"
+
+
+class TestPriority:
+    """Test interactive and background priority classes"""
+
+    def test_context(self):
+        assert current_priority() == Priority.INTERACTIVE
+        with rate_limit_priority(Priority.BACKGROUND):
+            assert current_priority() == Priority.BACKGROUND
+        assert current_priority() == Priority.INTERACTIVE
+
+    @pytest.mark.asyncio
+    async def test_background_leaves_reserve(self):
+        limiter = RateLimiter()
+        bucket = RateLimitBucket("test", per_minute=60, capacity=10)
+        for _ in range(8):
+            await limiter.acquire([bucket])
+
+        with rate_limit_priority(Priority.BACKGROUND), pytest.raises(ProviderRateLimitError):
+            await limiter.acquire([bucket], max_wait=0)
+
+        await limiter.acquire([bucket], max_wait=0)
+
+    @pytest.mark.asyncio
+    async def test_background_yields_to_waiting_interactive(self):
+        limiter = RateLimiter()
+        bucket = RateLimitBucket("test", per_minute=1200, capacity=1)
+        await limiter.acquire([bucket])
+        order = []
+
+        async def call(priority):
+            await limiter.acquire([bucket], priority=priority)
+            order.append(priority)
+
+        interactive = asyncio.create_task(call(Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+        await asyncio.gather(call(Priority.BACKGROUND), interactive)
+
+        assert order == [Priority.INTERACTIVE, Priority.BACKGROUND]
+
+
+class TestSharedBuckets:
+    """Test the Redis script path"""
+
+    @pytest.mark.asyncio
+    async def test_uses_script(self):
+        script = FakeScript(result=0)
+        limiter = RateLimiter()
+        limiter.start(FakeRedis(script))
+        bucket = RateLimitBucket("fiml:ratelimit:av", per_minute=60, capacity=5)
+
+        await limiter.acquire([bucket], cost=2)
+
+        assert script.calls == [(["fiml:ratelimit:av"], [2, 0.0, 0.001, 5])]
+        assert limiter.get_stats()["shared"]
+        assert not limiter._local
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_buckets(self):
+        limiter = RateLimiter()
+        limiter.start(FakeRedis(FakeScript(error=ConnectionError("down"))))
+        bucket = RateLimitBucket("test", per_minute=60, capacity=5)
+
+        await limiter.acquire([bucket])
+
+        assert limiter.get_stats()["errors"] == 1
+        assert limiter._local["test"].tokens == pytest.approx(4, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_lua_script(self):
+        pytest.importorskip("lupa")
+        fakeredis = pytest.importorskip("fakeredis")
+        workers = [RateLimiter(), RateLimiter()]
+        client = fakeredis.FakeAsyncRedis()
+        for limiter in workers:
+            limiter.start(client)
+        bucket = RateLimitBucket("fiml:ratelimit:test", per_minute=6, capacity=3)
+
+        for i in range(3):
+            await workers[i % 2].acquire([bucket], max_wait=0)
+        with pytest.raises(ProviderRateLimitError):
+            await workers[1].acquire([bucket], max_wait=0)
+
+
+class TestProviderBuckets:
+    """Test the buckets providers draw on"""
+
+    def test_keyed_and_keyless(self):
+        keyless = MockProvider()
+        first = MockProvider()
+        first.config = ProviderConfig(name="mock_provider", api_key="secret")
+        second = MockProvider()
+        second.config = ProviderConfig(name="mock_provider", api_key="secret")
+
+        assert keyless.rate_limit_buckets()[0].key == "fiml:ratelimit:mock_provider"
+        assert first.rate_limit_buckets() == second.rate_limit_buckets()
+        assert "secret" not in first.rate_limit_buckets()[0].key
@@ -0,0 +1,248 @@
+"""
+Tests for rolling provider telemetry and telemetry-driven arbitration
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from fiml.arbitration.engine import DataArbitrationEngine
+from fiml.core.exceptions import ProviderError
+from fiml.core.models import Asset, AssetType, DataType
+from fiml.providers.base import BaseProvider, ProviderConfig, ProviderResponse
+from fiml.providers.telemetry import BucketRing, ProviderTelemetry
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TelemetryProvider(BaseProvider):
+    """Provider whose fetch_price succeeds, fails or raises on demand"""
+
+    def __init__(self, name="telemetry_provider"):
+        super().__init__(ProviderConfig(name=name))
+        self._is_initialized = True
+        self.outcome = "ok"
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def fetch_price(self, asset):
+        if self.outcome == "raise":
+            raise ProviderError("upstream down")
+        return ProviderResponse(
+            provider=self.name,
+            asset=asset,
+            data_type=DataType.PRICE,
+            data={"price": 1.0},
+            timestamp=datetime.now(timezone.utc),
+            is_valid=self.outcome == "ok",
+        )
+
+    async def fetch_ohlcv(self, asset, timeframe="1d", limit=100):
+        pass
+
+    async def fetch_fundamentals(self, asset):
+        pass
+
+    async def fetch_news(self, asset, limit=10):
+        pass
+
+    async def fetch_technical(self, asset):
+        raise NotImplementedError
+
+    async def supports_asset(self, asset):
+        return True
+
+    async def get_health(self):
+        pass
+
+
+class SubclassedProvider(TelemetryProvider):
+    async def fetch_price(self, asset):
+        return await super().fetch_price(asset)
+
+
+@pytest.fixture
+def equity():
+    return Asset(symbol="AAPL", asset_type=AssetType.EQUITY)
+
+
+class TestBucketRing:
+    """Test the sliding bucket window"""
+
+    def test_old_buckets_expire(self):
+        clock = FakeClock(0.0)
+        ring = BucketRing(60, 10, lambda: [0], clock)
+
+        ring.current()[0] += 1
+        clock.now = 30
+        ring.current()[0] += 2
+        assert ring.values() == [[1], [2]]
+
+        clock.now = 65
+        assert ring.values() == [[2]]
+
+    def test_reused_slot_is_reset(self):
+        clock = FakeClock(0.0)
+        ring = BucketRing(60, 10, lambda: [0], clock)
+
+        ring.current()[0] += 5
+        clock.now = 60  # Same slot, next lap
+
+        assert ring.current() == [0]
+
+
+class TestProviderTelemetry:
+    """Test latency, success, uptime and freshness windows"""
+
+    def test_latency_percentile_per_data_type(self):
+        telemetry = ProviderTelemetry(clock=FakeClock())
+        for ms in range(1, 101):
+            telemetry.record(DataType.PRICE, ms, True)
+        telemetry.record(DataType.NEWS, 2000, True)
+
+        assert telemetry.latency_percentile(95, DataType.PRICE) == pytest.approx(95, rel=0.05)
+        assert telemetry.latency_percentile(95, DataType.NEWS) == pytest.approx(2000, rel=0.05)
+        # Unseen data types fall back to every sample
+        assert telemetry.latency_percentile(50, DataType.OHLCV) == pytest.approx(51, rel=0.05)
+        assert ProviderTelemetry().latency_percentile(95) is None
+
+    def test_latency_window_slides(self):
+        clock = FakeClock()
+        telemetry = ProviderTelemetry(
+            latency_window_seconds=60, latency_bucket_seconds=10, clock=clock
+        )
+        telemetry.record(DataType.PRICE, 3000, True)
+        assert telemetry.latency_percentile(95, DataType.PRICE) == pytest.approx(3000, rel=0.05)
+
+        clock.now += 30
+        telemetry.record(DataType.PRICE, 50, True)
+        clock.now += 40
+
+        assert telemetry.latency_percentile(95, DataType.PRICE) == pytest.approx(50, rel=0.05)
+
+    def test_success_rate(self):
+        clock = FakeClock()
+        telemetry = ProviderTelemetry(outcome_window_seconds=120, clock=clock)
+        for success in (True, True, True, False):
+            telemetry.record(DataType.PRICE, 10, success)
+
+        assert telemetry.success_rate(DataType.PRICE) == 0.75
+        assert telemetry.success_rate(DataType.NEWS) == 0.75
+
+        clock.now += 180
+        assert telemetry.success_rate(DataType.PRICE) is None
+
+    def test_uptime(self):
+        clock = FakeClock(0.0)
+        telemetry = ProviderTelemetry(clock=clock)
+        for ok in (True, False, True, True):
+            telemetry.record(DataType.PRICE, 10, ok)
+            clock.now += 300
+        # Idle periods do not count as downtime
+        clock.now += 3600
+
+        assert telemetry.uptime() == 0.75
+
+    def test_last_success_per_asset_class(self):
+        clock = FakeClock()
+        telemetry = ProviderTelemetry(clock=clock)
+        telemetry.record(DataType.PRICE, 10, True, AssetType.EQUITY)
+        clock.now += 60
+        telemetry.record(DataType.PRICE, 10, True, AssetType.CRYPTO)
+        telemetry.record(DataType.PRICE, 10, False, AssetType.EQUITY)
+
+        assert telemetry.last_success(DataType.PRICE, AssetType.EQUITY) == clock.now - 60
+        assert telemetry.last_success(DataType.PRICE, AssetType.CRYPTO) == clock.now
+        assert telemetry.last_success(DataType.PRICE) == clock.now
+        assert telemetry.last_success(DataType.NEWS) is None
+
+
+class TestAutomaticRecording:
+    """Test fetch_* wrapping in BaseProvider"""
+
+    @pytest.mark.asyncio
+    async def test_fetches_are_recorded(self, equity):
+        provider = TelemetryProvider()
+
+        await provider.fetch_price(equity)
+        provider.outcome = "invalid"
+        await provider.fetch_price(equity)
+        provider.outcome = "raise"
+        with pytest.raises(ProviderError):
+            await provider.fetch_price(equity)
+
+        stats = provider.telemetry.get_stats()["by_data_type"]["price"]
+        assert stats["samples"] == 3
+        assert await provider.get_success_rate(DataType.PRICE) == pytest.approx(1 / 3)
+        assert provider.telemetry.last_success(DataType.PRICE, AssetType.EQUITY) is not None
+
+    @pytest.mark.asyncio
+    async def test_not_implemented_is_not_recorded(self, equity):
+        provider = TelemetryProvider()
+
+        with pytest.raises(NotImplementedError):
+            await provider.fetch_technical(equity)
+
+        assert provider.telemetry.get_stats()["by_data_type"] == {}
+
+    @pytest.mark.asyncio
+    async def test_super_call_recorded_once(self, equity):
+        provider = SubclassedProvider()
+
+        await provider.fetch_price(equity)
+
+        assert provider.telemetry.get_stats()["by_data_type"]["price"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_defaults_without_samples(self, equity):
+        provider = TelemetryProvider()
+
+        assert await provider.get_latency_p95() == 100.0
+        assert await provider.get_uptime_24h() == 0.99
+        assert await provider.get_success_rate() == 1.0
+        age = datetime.now(timezone.utc) - await provider.get_last_update(equity, DataType.PRICE)
+        assert age.total_seconds() < 1
+
+
+class TestTelemetryArbitration:
+    """Test that scoring follows live telemetry"""
+
+    @pytest.mark.asyncio
+    async def test_faster_provider_scores_higher(self, equity):
+        engine = DataArbitrationEngine()
+        fast = TelemetryProvider("fast")
+        slow = TelemetryProvider("slow")
+        for _ in range(20):
+            fast.telemetry.record(DataType.PRICE, 40, True, AssetType.EQUITY)
+            slow.telemetry.record(DataType.PRICE, 2500, True, AssetType.EQUITY)
+
+        fast_score = await engine._score_provider(fast, equity, DataType.PRICE, "US", 300)
+        slow_score = await engine._score_provider(slow, equity, DataType.PRICE, "US", 300)
+
+        assert fast_score.latency > slow_score.latency
+        assert fast_score.total > slow_score.total
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_scores_lower(self, equity):
+        engine = DataArbitrationEngine()
+        healthy = TelemetryProvider("healthy")
+        failing = TelemetryProvider("failing")
+        for i in range(10):
+            healthy.telemetry.record(DataType.PRICE, 100, True, AssetType.EQUITY)
+            failing.telemetry.record(DataType.PRICE, 100, i == 0, AssetType.EQUITY)
+
+        healthy_score = await engine._score_provider(healthy, equity, DataType.PRICE, "US", 300)
+        failing_score = await engine._score_provider(failing, equity, DataType.PRICE, "US", 300)
+
+        assert failing_score.reliability == pytest.approx(10)
+        assert healthy_score.total > failing_score.total
@@ -57,3 +57,30 @@ async def test_yahoo_finance_provider_health():
     assert health.is_healthy is True
 
     await provider.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_fetch_prices_batch_falls_back_per_asset(mock_asset):
+    """Providers without a batch endpoint fetch each asset and report failures"""
+    provider = MockProvider()
+    await provider.initialize()
+
+    failing = Asset(symbol="FAIL", asset_type=AssetType.EQUITY, market=Market.US)
+    original = provider.fetch_price
+
+    async def fetch_price(asset):
+        if asset.symbol == "FAIL":
+            raise RuntimeError("upstream error")
+        return await original(asset)
+
+    provider.fetch_price = fetch_price
+
+    responses = await provider.fetch_prices_batch([mock_asset, failing])
+
+    assert [r.asset.symbol for r in responses] == [mock_asset.symbol, "FAIL"]
+    assert responses[0].is_valid
+    assert responses[1].is_valid is False
+    assert responses[1].metadata["error"] == "upstream error"
+    assert [r.metadata["batch_calls"] for r in responses] == [2, 2]
+
+    await provider.shutdown()
@@ -724,3 +724,18 @@ async def test_watchdog_graceful_degradation():
 
     await watchdog.stop()
     await event_stream.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_event_stream_decodes_persisted_events():
+    """Test reading events through the L1 cache's bytes client"""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis(decode_responses=False)
+    await client.xadd("watchdog:events", {"type": "price_anomaly", "severity": "high"})
+
+    stream = EventStream(enable_persistence=False, enable_websocket=False)
+    stream._redis_client = client
+
+    events = await stream.get_persisted_events()
+
+    assert events == [{"type": "price_anomaly", "severity": "high"}]